@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark invoice matching throughput with logging enabled and disabled.
+
+Matches synthetic remittance lines against synthetic invoice numbers under
+several logging setups. Log output goes to /dev/null, so the numbers show the
+cost of producing and handing off records rather than terminal speed.
+
+Usage:
+    poetry run python benchmark_matching.py [payment_count] [invoice_count]
+"""
+
+import asyncio
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from typing import IO, Callable, List
+
+from src.core.logs import configure_logging, shutdown_logging
+from src.domains.remittances.matching.strategies import match_payments_concurrent
+
+RUNS = 10
+
+
+def build_dataset(
+    payment_count: int, invoice_count: int
+) -> tuple[List[str], List[str]]:
+    """Invoice numbers and remittance lines hitting every match pass."""
+    rng = random.Random(42)
+    invoices = [f"INV-{i:06d}" for i in range(invoice_count)]
+
+    payments = []
+    for _ in range(payment_count):
+        number = rng.randrange(invoice_count * 2)  # About half match nothing
+        payments.append(
+            rng.choice(
+                [
+                    f"INV-{number:06d}",  # exact
+                    f"inv {number:06d}",  # relaxed
+                    f"Invoice #{number:06d}",  # numeric
+                ]
+            )
+        )
+    return payments, invoices
+
+
+def synchronous_stderr(devnull: IO[str]) -> None:
+    """Previous behaviour: every line written and flushed inline."""
+    shutdown_logging()
+    root = logging.getLogger()
+    root.handlers = [logging.StreamHandler(devnull)]
+    root.setLevel(logging.DEBUG)
+
+
+async def time_matching(payments: List[str], invoices: List[str]) -> List[float]:
+    """Run the matcher RUNS times and return lines matched per second."""
+    throughput = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        await match_payments_concurrent(payments, invoices)
+        throughput.append(len(payments) / (time.perf_counter() - started))
+    return throughput
+
+
+async def main() -> None:
+    payment_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    invoice_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+    payments, invoices = build_dataset(payment_count, invoice_count)
+    print(f"⏱️ Matching {payment_count} lines against {invoice_count} invoices")
+
+    with open(os.devnull, "w") as devnull:
+        setups: List[tuple[str, Callable[[], None]]] = [
+            ("disabled", lambda: configure_logging("WARNING", stream=devnull)),
+            ("info", lambda: configure_logging("INFO", stream=devnull)),
+            (
+                "debug 1%",
+                lambda: configure_logging("DEBUG", sample_rate=0.01, stream=devnull),
+            ),
+            (
+                "debug all",
+                lambda: configure_logging("DEBUG", sample_rate=1.0, stream=devnull),
+            ),
+            ("sync stderr", lambda: synchronous_stderr(devnull)),
+        ]
+
+        for label, configure in setups:
+            configure()
+            throughput = await time_matching(payments, invoices)
+            shutdown_logging()
+            print(
+                f"  {label:<12} median={statistics.median(throughput):10.0f} lines/s "
+                f"min={min(throughput):10.0f} lines/s"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
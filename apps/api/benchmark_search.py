@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark invoice search on a seeded organization.
+
+Seeds a dedicated organization with synthetic invoices (100k by default) and
+times the trigram-ranked search against the previous ``contains`` OR filter.
+
+Usage:
+    poetry run python benchmark_search.py [invoice_count] [--reseed]
+"""
+
+import asyncio
+import random
+import statistics
+import sys
+import time
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, List
+
+from prisma.enums import InvoiceStatus
+
+from prisma import Prisma
+from src.shared.search import INVOICE_SEARCH, build_search_query, search_ranked_ids
+
+BENCHMARK_ORG_ID = "5e4c1b3a-7d2f-4a9e-9c8b-0b1e2d3c4f5a"
+BATCH_SIZE = 5000
+RUNS_PER_TERM = 20
+SEARCH_TERMS = ["INV-0421", "acme", "Pacific Traders", "PO-77", "zzz-no-match"]
+
+CONTACTS = [
+    "Acme Corporation",
+    "Pacific Traders Ltd",
+    "Northwind Supplies",
+    "Kiwi Hardware",
+    "Southern Cross Logistics",
+    "Harbour Foods",
+]
+
+
+async def seed_invoices(prisma: Prisma, count: int, reseed: bool) -> None:
+    """Create the benchmark organization and its invoices."""
+    existing_org = await prisma.organization.find_unique(where={"id": BENCHMARK_ORG_ID})
+    if not existing_org:
+        await prisma.organization.create(
+            data={"id": BENCHMARK_ORG_ID, "name": "Search Benchmark Organization"}
+        )
+        print(f"✅ Created organization: {BENCHMARK_ORG_ID}")
+
+    existing = await prisma.invoice.count(where={"organizationId": BENCHMARK_ORG_ID})
+    if existing >= count and not reseed:
+        print(f"ℹ️ Reusing {existing} seeded invoices")
+        return
+
+    await prisma.invoice.delete_many(where={"organizationId": BENCHMARK_ORG_ID})
+
+    rng = random.Random(42)
+    for start in range(0, count, BATCH_SIZE):
+        await prisma.invoice.create_many(
+            data=[
+                {
+                    "organizationId": BENCHMARK_ORG_ID,
+                    "invoiceId": f"bench-{i}",
+                    "invoiceNumber": f"INV-{i:06d}",
+                    "contactName": f"{rng.choice(CONTACTS)} #{rng.randint(1, 500)}",
+                    "reference": f"PO-{rng.randint(1, 99999)}",
+                    "status": InvoiceStatus.AUTHORISED,
+                    "total": Decimal(rng.randint(100, 100000)) / 100,
+                }
+                for i in range(start, min(start + BATCH_SIZE, count))
+            ]
+        )
+        print(f"🌱 Seeded {min(start + BATCH_SIZE, count)}/{count} invoices")
+
+    await prisma.execute_raw('ANALYZE "Invoice"')
+
+
+async def time_query(run: Callable[[], Awaitable[Any]]) -> List[float]:
+    """Run a query RUNS_PER_TERM times and return durations in milliseconds."""
+    durations = []
+    for _ in range(RUNS_PER_TERM):
+        started = time.perf_counter()
+        await run()
+        durations.append((time.perf_counter() - started) * 1000)
+    return durations
+
+
+def summarize(label: str, durations: List[float]) -> None:
+    """Print p50/p95 for a set of durations."""
+    ordered = sorted(durations)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"  {label:<10} p50={statistics.median(ordered):8.2f}ms p95={p95:8.2f}ms")
+
+
+async def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 and sys.argv[1].isdigit() else 100000
+    reseed = "--reseed" in sys.argv
+
+    prisma = Prisma()
+    await prisma.connect()
+
+    try:
+        await seed_invoices(prisma, count, reseed)
+
+        plan = await prisma.query_raw(
+            f"EXPLAIN {build_search_query(INVOICE_SEARCH)}",
+            BENCHMARK_ORG_ID,
+            "%acme%",
+            "acme",
+            50,
+            0,
+        )
+        print("🔍 Query plan for 'acme':")
+        for row in plan:
+            print(f"  {row['QUERY PLAN']}")
+
+        for term in SEARCH_TERMS:
+            print(f"⏱️ '{term}'")
+
+            async def ranked() -> Any:
+                return await search_ranked_ids(
+                    prisma, INVOICE_SEARCH, BENCHMARK_ORG_ID, term
+                )
+
+            async def contains() -> Any:
+                return await prisma.invoice.find_many(
+                    where={
+                        "organizationId": BENCHMARK_ORG_ID,
+                        "OR": [
+                            {
+                                "invoiceNumber": {
+                                    "contains": term,
+                                    "mode": "insensitive",
+                                }
+                            },
+                            {"contactName": {"contains": term, "mode": "insensitive"}},
+                            {"reference": {"contains": term, "mode": "insensitive"}},
+                        ],
+                    },
+                    take=50,
+                    order={"createdAt": "desc"},
+                )
+
+            summarize("trigram", await time_query(ranked))
+            summarize("contains", await time_query(contains))
+
+    finally:
+        await prisma.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
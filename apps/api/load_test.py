@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Load test a running API with a realistic mix of remittance traffic.
+
+Signs in as the user created by ``seed.py`` with a token signed by
+JWT_SECRET (the development auth path), then runs ``concurrency`` workers
+for ``duration`` seconds. Each worker repeatedly picks a scenario by weight:
+uploading the example remittance, browsing remittances and invoices,
+searching, approving a remittance that awaits approval, or triggering an
+invoice sync. Uploads and approvals reach OpenAI and Xero through whatever
+the server is configured with.
+
+Reports throughput and p50/p95/p99 latency per route, and the server's
+event loop lag over the run, taken from the event_loop_lag_seconds
+histogram at /metrics. Run against a single worker process so the scraped
+lag belongs to the process that served the load.
+
+Usage:
+    poetry run python load_test.py [--base-url URL] [--concurrency N]
+        [--duration SECONDS] [--mix upload=1,browse=6,search=3,approve=1,sync=0.2]
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import re
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+import jwt
+
+from prisma import Prisma
+from src.core.settings import settings
+
+SEED_ORG_ID = "42f929b1-8fdb-45b1-a7cf-34fae2314561"
+SEED_EMAIL = "test@example.com"
+SAMPLE_PDF = Path(__file__).with_name("example-remittance.pdf")
+
+DEFAULT_MIX = "upload=1,browse=6,search=3,approve=1,sync=0.2"
+SEARCH_TERMS = ["INV", "acme", "0042", "PO-", "zzz-no-match"]
+STATUS_FILTERS = [None, "Awaiting_Approval", "Exported_Unreconciled", "Unmatched"]
+
+LAG_METRIC = "event_loop_lag_seconds"
+
+
+class LoadTest:
+    """Shared client, stats and scenarios for one load test run."""
+
+    def __init__(self, client: httpx.AsyncClient, org_id: str, seed: int) -> None:
+        self.client = client
+        self.org_id = org_id
+        self.rng = random.Random(seed)
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Counter[int]] = defaultdict(Counter)
+        self.pdf = SAMPLE_PDF.read_bytes()
+
+    async def request(
+        self, route: str, method: str, url: str, **kwargs: Any
+    ) -> Optional[httpx.Response]:
+        """Send a request, recording its latency and status under ``route``."""
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.statuses[route][0] += 1
+            return None
+        finally:
+            self.latencies[route].append((time.perf_counter() - started) * 1000)
+        self.statuses[route][response.status_code] += 1
+        return response
+
+    async def upload(self) -> None:
+        """Upload the example remittance for processing."""
+        await self.request(
+            "POST /remittances/{org_id}",
+            "POST",
+            f"/api/v1/remittances/{self.org_id}",
+            files={"file": (SAMPLE_PDF.name, self.pdf, "application/pdf")},
+        )
+
+    async def browse(self) -> None:
+        """Page through remittances or invoices as the dashboard does."""
+        if self.rng.random() < 0.7:
+            params: Dict[str, Any] = {"page_size": 50}
+            status_filter = self.rng.choice(STATUS_FILTERS)
+            if status_filter:
+                params["status_filter"] = status_filter
+            await self.request(
+                "GET /remittances/{org_id}",
+                "GET",
+                f"/api/v1/remittances/{self.org_id}",
+                params=params,
+            )
+        else:
+            await self.request(
+                "GET /invoices/{org_id}",
+                "GET",
+                f"/api/v1/invoices/{self.org_id}",
+                params={"limit": 50},
+            )
+
+    async def search(self) -> None:
+        """Search remittances or invoices for a term."""
+        term = self.rng.choice(SEARCH_TERMS)
+        if self.rng.random() < 0.5:
+            await self.request(
+                "GET /remittances/{org_id}?search",
+                "GET",
+                f"/api/v1/remittances/{self.org_id}",
+                params={"search": term, "page_size": 50},
+            )
+        else:
+            await self.request(
+                "GET /invoices/{org_id}?search",
+                "GET",
+                f"/api/v1/invoices/{self.org_id}",
+                params={"search": term, "limit": 50},
+            )
+
+    async def approve(self) -> None:
+        """Open a remittance awaiting approval and approve it."""
+        response = await self.request(
+            "GET /remittances/{org_id}",
+            "GET",
+            f"/api/v1/remittances/{self.org_id}",
+            params={"status_filter": "Awaiting_Approval", "page_size": 20},
+        )
+        if response is None or response.status_code != 200:
+            return
+        remittances = response.json()["remittances"]
+        if not remittances:
+            return
+
+        remittance_id = self.rng.choice(remittances)["id"]
+        await self.request(
+            "GET /remittances/{org_id}/{remittance_id}",
+            "GET",
+            f"/api/v1/remittances/{self.org_id}/{remittance_id}",
+        )
+        await self.request(
+            "PATCH /remittances/{org_id}/{remittance_id}",
+            "PATCH",
+            f"/api/v1/remittances/{self.org_id}/{remittance_id}",
+            json={"status": "Exporting"},
+        )
+
+    async def sync(self) -> None:
+        """Trigger an incremental invoice sync from the accounting system."""
+        await self.request(
+            "POST /external-accounting/invoices/{org_id}",
+            "POST",
+            f"/api/v1/external-accounting/invoices/{self.org_id}",
+            params={"incremental": "true"},
+        )
+
+    async def worker(
+        self,
+        scenarios: List[Callable[[], Awaitable[None]]],
+        weights: List[float],
+        deadline: float,
+    ) -> None:
+        """Run weighted scenarios back to back until the deadline."""
+        while time.perf_counter() < deadline:
+            scenario = self.rng.choices(scenarios, weights)[0]
+            await scenario()
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """Parse ``name=weight`` pairs, e.g. ``upload=1,browse=6``."""
+    weights = {}
+    for pair in mix.split(","):
+        name, _, weight = pair.partition("=")
+        weights[name.strip()] = float(weight or 1)
+    return weights
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Percentile of the samples, interpolating between closest ranks."""
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def lag_buckets(metrics: str) -> Dict[float, float]:
+    """Cumulative event loop lag bucket counts from a /metrics scrape."""
+    pattern = re.compile(rf'^{LAG_METRIC}_bucket\{{le="([^"]+)"\}} (\S+)$', re.M)
+    return {float(bound): float(count) for bound, count in pattern.findall(metrics)}
+
+
+def bucket_quantile(buckets: List[Tuple[float, float]], q: float) -> float:
+    """
+    Estimate a quantile from cumulative histogram buckets.
+
+    Interpolates linearly within the bucket the quantile falls in, as
+    Prometheus' histogram_quantile does; values past the last finite bound
+    are reported as that bound.
+    """
+    total = buckets[-1][1]
+    target = q * total
+    lower_bound, lower_count = 0.0, 0.0
+    for bound, count in buckets:
+        if count >= target:
+            if math.isinf(bound):
+                return lower_bound
+            share = (target - lower_count) / (count - lower_count or 1)
+            return lower_bound + (bound - lower_bound) * share
+        lower_bound, lower_count = bound, count
+    return lower_bound
+
+
+async def scrape_lag(client: httpx.AsyncClient) -> Dict[float, float]:
+    """Current event loop lag buckets, or none if /metrics is unavailable."""
+    try:
+        headers = (
+            {"Authorization": f"Bearer {settings.METRICS_TOKEN}"}
+            if settings.METRICS_TOKEN
+            else {}
+        )
+        response = await client.get("/metrics", headers=headers)
+    except httpx.HTTPError:
+        return {}
+    return lag_buckets(response.text) if response.status_code == 200 else {}
+
+
+def report_lag(before: Dict[float, float], after: Dict[float, float]) -> None:
+    """Print event loop lag percentiles over the run."""
+    delta = sorted(
+        (bound, count - before.get(bound, 0.0)) for bound, count in after.items()
+    )
+    if not delta or delta[-1][1] <= 0:
+        print("⚠️ No event loop lag samples (is /metrics enabled?)")
+        return
+    p50, p95, p99 = (bucket_quantile(delta, q) * 1000 for q in (0.5, 0.95, 0.99))
+    print(
+        f"🔁 Event loop lag over {delta[-1][1]:.0f} samples: "
+        f"p50={p50:.1f}ms p95={p95:.1f}ms p99={p99:.1f}ms"
+    )
+
+
+def report_routes(load: LoadTest, elapsed: float) -> None:
+    """Print throughput, latency percentiles and statuses per route."""
+    print(
+        f"  {'route':<46} {'reqs':>6} {'req/s':>7} "
+        f"{'p50':>8} {'p95':>8} {'p99':>8}  statuses"
+    )
+    for route in sorted(load.latencies):
+        latencies = load.latencies[route]
+        statuses = ", ".join(
+            f"{code or 'error'}×{count}"
+            for code, count in sorted(load.statuses[route].items())
+        )
+        print(
+            f"  {route:<46} {len(latencies):>6} {len(latencies) / elapsed:>7.1f} "
+            f"{percentile(latencies, 50):>6.0f}ms {percentile(latencies, 95):>6.0f}ms "
+            f"{percentile(latencies, 99):>6.0f}ms  {statuses}"
+        )
+    total = sum(len(latencies) for latencies in load.latencies.values())
+    print(f"  {'total':<46} {total:>6} {total / elapsed:>7.1f}")
+
+
+async def seeded_auth_id() -> str:
+    """Auth ID of the user created by seed.py."""
+    prisma = Prisma()
+    await prisma.connect()
+    try:
+        profile = await prisma.profile.find_unique(where={"email": SEED_EMAIL})
+        auth_link = (
+            await prisma.authlink.find_first(where={"profileId": profile.id})
+            if profile
+            else None
+        )
+    finally:
+        await prisma.disconnect()
+
+    if not auth_link or not auth_link.authId:
+        raise SystemExit(f"❌ No seeded user {SEED_EMAIL}; run seed.py first")
+    return auth_link.authId
+
+
+def dev_token(auth_id: str) -> str:
+    """Token for the development auth path, signed with JWT_SECRET."""
+    if not settings.JWT_SECRET:
+        raise SystemExit("❌ JWT_SECRET must be set to sign load test tokens")
+    payload = {
+        "sub": auth_id,
+        "email": SEED_EMAIL,
+        "iat": datetime.now(timezone.utc),
+        "aud": "authenticated",
+        "iss": "supabase",
+    }
+    return jwt.encode(payload, settings.JWT_SECRET, algorithm="HS256")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default=settings.APP_BASE_URL)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=60.0)
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--org-id", default=SEED_ORG_ID)
+    parser.add_argument("--auth-id", help="Defaults to the seeded user's auth ID")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    unknown = set(mix) - {"upload", "browse", "search", "approve", "sync"}
+    if unknown:
+        raise SystemExit(f"❌ Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    auth_id = args.auth_id or await seeded_auth_id()
+    headers = {"Authorization": f"Bearer {dev_token(auth_id)}"}
+    limits = httpx.Limits(max_connections=args.concurrency)
+
+    async with httpx.AsyncClient(
+        base_url=args.base_url, headers=headers, limits=limits, timeout=120.0
+    ) as client:
+        load = LoadTest(client, args.org_id, args.seed)
+        scenarios = [getattr(load, name) for name in mix]
+
+        print(
+            f"🚀 {args.concurrency} workers for {args.duration:.0f}s against "
+            f"{args.base_url} (mix {args.mix})"
+        )
+        lag_before = await scrape_lag(client)
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(
+            *(
+                load.worker(scenarios, list(mix.values()), deadline)
+                for _ in range(args.concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - started
+        lag_after = await scrape_lag(client)
+
+    print(f"📊 Results over {elapsed:.1f}s")
+    report_routes(load, elapsed)
+    report_lag(lag_before, lag_after)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,40 @@
+# apps/api/partial_types.py
+"""
+Partial model definitions, run by `prisma generate` (see partial_type_generator
+in schema.prisma). Querying through a partial selects only its fields, so hot
+paths avoid fetching and validating columns they never read.
+"""
+
+from prisma.models import Invoice, Remittance
+
+# Invoice fields read by the three-pass matcher
+Invoice.create_partial(
+    "InvoiceMatchFields",
+    include={"id", "invoiceNumber", "total"},
+)
+
+# Remittance columns shown in listings
+Remittance.create_partial(
+    "RemittanceListItem",
+    include={
+        "id",
+        "organizationId",
+        "filename",
+        "filePath",
+        "status",
+        "paymentDate",
+        "totalAmount",
+        "reference",
+        "confidenceScore",
+        "openaiThreadId",
+        "xeroBatchId",
+        "createdAt",
+        "updatedAt",
+    },
+)
+
+# Remittance fields needed to check a Xero batch payment's status
+Remittance.create_partial(
+    "RemittanceStatusFields",
+    include={"id", "organizationId", "status", "xeroBatchId", "lastStatusCheck"},
+)
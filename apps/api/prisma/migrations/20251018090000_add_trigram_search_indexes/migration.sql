@@ -0,0 +1,18 @@
+-- Trigram indexes backing the invoice and remittance text search.
+-- gin_trgm_ops lets ILIKE '%term%' use an index scan and provides the
+-- word_similarity() ranking used by src/shared/search.py.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Invoice search: invoice number, contact name, reference
+CREATE INDEX IF NOT EXISTS "idx_invoices_invoice_number_trgm"
+  ON "Invoice" USING GIN ("invoiceNumber" gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS "idx_invoices_contact_name_trgm"
+  ON "Invoice" USING GIN ("contactName" gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS "idx_invoices_reference_trgm"
+  ON "Invoice" USING GIN ("reference" gin_trgm_ops);
+
+-- Remittance search: filename, reference
+CREATE INDEX IF NOT EXISTS "idx_remittances_filename_trgm"
+  ON "Remittance" USING GIN ("filename" gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS "idx_remittances_reference_trgm"
+  ON "Remittance" USING GIN ("reference" gin_trgm_ops);
@@ -0,0 +1,25 @@
+-- Composite indexes matching the hot query shapes, so each is served by an
+-- index range scan instead of a per-organization scan and sort.
+
+-- MatchingService._get_organization_invoices:
+--   WHERE organizationId = ? AND status = ? AND invoiceNumber <> ''
+CREATE INDEX IF NOT EXISTS "idx_invoices_org_status_number"
+  ON "Invoice" ("organizationId", "status", "invoiceNumber");
+
+-- Invoice listings: WHERE organizationId = ? ORDER BY createdAt DESC, id DESC
+CREATE INDEX IF NOT EXISTS "idx_invoices_org_created_at"
+  ON "Invoice" ("organizationId", "createdAt" DESC, "id" DESC);
+
+-- SyncOrchestrator._get_last_sync_time:
+--   WHERE organizationId = ? ORDER BY lastSyncedAt DESC LIMIT 1
+CREATE INDEX IF NOT EXISTS "idx_invoices_org_last_synced_at"
+  ON "Invoice" ("organizationId", "lastSyncedAt" DESC);
+
+-- Remittance listings: WHERE organizationId = ? ORDER BY createdAt DESC, id DESC
+CREATE INDEX IF NOT EXISTS "idx_remittances_org_created_at"
+  ON "Remittance" ("organizationId", "createdAt" DESC, "id" DESC);
+
+-- Remittance listings filtered by status:
+--   WHERE organizationId = ? AND status = ? ORDER BY createdAt DESC
+CREATE INDEX IF NOT EXISTS "idx_remittances_org_status_created_at"
+  ON "Remittance" ("organizationId", "status", "createdAt" DESC);
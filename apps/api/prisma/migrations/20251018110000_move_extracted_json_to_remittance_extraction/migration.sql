@@ -0,0 +1,28 @@
+-- Move the raw AI extraction output off the hot Remittance row into its own
+-- table, loaded only by the remittance detail (on request) and debug endpoints.
+
+-- CreateTable
+CREATE TABLE "RemittanceExtraction" (
+    "id" UUID NOT NULL DEFAULT gen_random_uuid(),
+    "remittanceId" UUID NOT NULL,
+    "rawJson" JSONB NOT NULL,
+    "createdAt" TIMESTAMPTZ(6) DEFAULT CURRENT_TIMESTAMP,
+    "updatedAt" TIMESTAMPTZ(6) DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "RemittanceExtraction_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE UNIQUE INDEX "RemittanceExtraction_remittanceId_key" ON "RemittanceExtraction"("remittanceId");
+
+-- AddForeignKey
+ALTER TABLE "RemittanceExtraction" ADD CONSTRAINT "RemittanceExtraction_remittanceId_fkey" FOREIGN KEY ("remittanceId") REFERENCES "Remittance"("id") ON DELETE CASCADE ON UPDATE NO ACTION;
+
+-- Backfill existing extraction output
+INSERT INTO "RemittanceExtraction" ("remittanceId", "rawJson", "createdAt", "updatedAt")
+SELECT "id", "extractedRawJson", "updatedAt", "updatedAt"
+FROM "Remittance"
+WHERE "extractedRawJson" IS NOT NULL;
+
+-- AlterTable
+ALTER TABLE "Remittance" DROP COLUMN "extractedRawJson";
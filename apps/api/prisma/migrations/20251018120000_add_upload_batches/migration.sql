@@ -0,0 +1,29 @@
+-- Bulk uploads: one UploadBatch row per request, linked from each Remittance
+-- created by it so clients can poll the batch's progress.
+
+-- CreateTable
+CREATE TABLE "UploadBatch" (
+    "id" UUID NOT NULL DEFAULT gen_random_uuid(),
+    "organizationId" UUID NOT NULL,
+    "createdBy" UUID,
+    "fileCount" INTEGER NOT NULL,
+    "rejected" JSONB,
+    "createdAt" TIMESTAMPTZ(6) DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "UploadBatch_pkey" PRIMARY KEY ("id")
+);
+
+-- AlterTable
+ALTER TABLE "Remittance" ADD COLUMN "uploadBatchId" UUID;
+
+-- CreateIndex
+CREATE INDEX "idx_upload_batches_org_created_at" ON "UploadBatch"("organizationId", "createdAt" DESC);
+
+-- CreateIndex
+CREATE INDEX "idx_remittances_upload_batch_status" ON "Remittance"("uploadBatchId", "status");
+
+-- AddForeignKey
+ALTER TABLE "UploadBatch" ADD CONSTRAINT "UploadBatch_organizationId_fkey" FOREIGN KEY ("organizationId") REFERENCES "Organization"("id") ON DELETE CASCADE ON UPDATE NO ACTION;
+
+-- AddForeignKey
+ALTER TABLE "Remittance" ADD CONSTRAINT "Remittance_uploadBatchId_fkey" FOREIGN KEY ("uploadBatchId") REFERENCES "UploadBatch"("id") ON DELETE SET NULL ON UPDATE NO ACTION;
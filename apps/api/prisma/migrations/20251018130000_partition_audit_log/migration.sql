@@ -0,0 +1,83 @@
+-- Partition AuditLog by month on "timestamp" so inserts only maintain the
+-- current month's indexes and old months can be archived and dropped whole
+-- (see src/core/audit_retention.py). The seven single-column indexes are
+-- replaced by two composites serving organization and remittance audit views.
+
+-- The partition key must be part of the primary key and cannot be null
+ALTER TABLE "AuditLog" RENAME TO "AuditLog_legacy";
+ALTER TABLE "AuditLog_legacy" RENAME CONSTRAINT "AuditLog_pkey" TO "AuditLog_legacy_pkey";
+
+-- CreateTable
+CREATE TABLE "AuditLog" (
+    "id" UUID NOT NULL DEFAULT gen_random_uuid(),
+    "remittanceId" UUID NOT NULL,
+    "userId" UUID,
+    "organizationId" UUID NOT NULL,
+    "action" "AuditAction" NOT NULL,
+    "outcome" "AuditOutcome" NOT NULL,
+    "timestamp" TIMESTAMPTZ(6) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "fieldChanged" TEXT,
+    "oldValue" TEXT,
+    "newValue" TEXT,
+    "reason" TEXT,
+    "errorMessage" TEXT,
+    "metadata" JSONB,
+    "createdAt" TIMESTAMPTZ(6) DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "AuditLog_pkey" PRIMARY KEY ("id", "timestamp")
+) PARTITION BY RANGE ("timestamp");
+
+-- Catches rows no monthly partition covers; emptied as partitions are created
+CREATE TABLE "AuditLog_default" PARTITION OF "AuditLog" DEFAULT;
+
+-- One partition per UTC month, from the oldest row to three months ahead
+DO $$
+DECLARE
+    month TIMESTAMPTZ := date_trunc(
+        'month',
+        COALESCE(
+            (SELECT min(COALESCE("timestamp", "createdAt")) FROM "AuditLog_legacy"),
+            now()
+        ),
+        'UTC'
+    );
+    last_month TIMESTAMPTZ := date_trunc('month', now(), 'UTC') + interval '3 months';
+BEGIN
+    WHILE month <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF "AuditLog" FOR VALUES FROM (%L) TO (%L)',
+            'AuditLog_' || to_char(month AT TIME ZONE 'UTC', 'YYYY_MM'),
+            month,
+            month + interval '1 month'
+        );
+        month := month + interval '1 month';
+    END LOOP;
+END $$;
+
+-- Copy existing rows, filling the timestamp of any that lack one
+INSERT INTO "AuditLog" (
+    "id", "remittanceId", "userId", "organizationId", "action", "outcome",
+    "timestamp", "fieldChanged", "oldValue", "newValue", "reason",
+    "errorMessage", "metadata", "createdAt"
+)
+SELECT
+    "id", "remittanceId", "userId", "organizationId", "action", "outcome",
+    COALESCE("timestamp", "createdAt", now()), "fieldChanged", "oldValue",
+    "newValue", "reason", "errorMessage", "metadata", "createdAt"
+FROM "AuditLog_legacy";
+
+DROP TABLE "AuditLog_legacy";
+
+-- Organization audit views: WHERE organizationId = ? ORDER BY timestamp DESC
+CREATE INDEX "idx_audit_logs_org_timestamp"
+  ON "AuditLog" ("organizationId", "timestamp" DESC);
+
+-- Remittance history: WHERE remittanceId = ? ORDER BY timestamp DESC
+CREATE INDEX "idx_audit_logs_remittance_timestamp"
+  ON "AuditLog" ("remittanceId", "timestamp" DESC);
+
+-- AddForeignKey
+ALTER TABLE "AuditLog" ADD CONSTRAINT "AuditLog_organizationId_fkey" FOREIGN KEY ("organizationId") REFERENCES "Organization"("id") ON DELETE CASCADE ON UPDATE NO ACTION;
+
+-- AddForeignKey
+ALTER TABLE "AuditLog" ADD CONSTRAINT "AuditLog_remittanceId_fkey" FOREIGN KEY ("remittanceId") REFERENCES "Remittance"("id") ON DELETE CASCADE ON UPDATE NO ACTION;
@@ -0,0 +1,304 @@
+"""
+Batched audit log writes.
+
+Audit rows describe a state change that has already been made, so they are
+kept off the request path where possible. Inside a transaction a row is
+created with the transaction, committing or rolling back with the change it
+describes. Otherwise it is buffered and inserted with ``create_many`` once
+AUDIT_LOG_BATCH_SIZE rows are waiting or every
+AUDIT_LOG_FLUSH_INTERVAL_SECONDS. Each row is stamped when it is written, so
+a late flush does not move it in the history.
+
+A batch the database rejects is retried row by row, and rows rejected for
+their data are moved to AUDIT_LOG_DEAD_LETTER_PATH instead of blocking the
+rows behind them. Rows that cannot be inserted by shutdown, or arrive while
+AUDIT_LOG_MAX_BUFFERED rows are already waiting, are appended to
+AUDIT_LOG_FALLBACK_PATH and inserted on the next start. Both files get the
+process ID in their name, so worker processes never share one. File writes
+run in a worker thread, so a slow disk or a held lock never stalls the event
+loop. A restored file is kept until its rows are inserted; if its worker
+dies first, the next start restores it again.
+"""
+
+import asyncio
+import fcntl
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from prisma.errors import DataError
+from prisma.fields import Json
+
+from src.core.settings import settings
+
+if TYPE_CHECKING:
+    from prisma import Prisma
+
+logger = logging.getLogger(__name__)
+
+AuditRow = Dict[str, Any]
+
+
+def _to_record(row: AuditRow) -> Dict[str, Any]:
+    record = dict(row)
+    record["timestamp"] = row["timestamp"].isoformat()
+    if isinstance(row.get("metadata"), Json):
+        record["metadata"] = row["metadata"].data
+    return record
+
+
+def _from_record(record: Dict[str, Any]) -> AuditRow:
+    row = dict(record)
+    row["timestamp"] = datetime.fromisoformat(record["timestamp"])
+    if record.get("metadata") is not None:
+        row["metadata"] = Json(record["metadata"])
+    return row
+
+
+def _process_path(path: Path) -> Path:
+    """``path`` with this process's ID before the suffix."""
+    return path.with_name(f"{path.stem}.{os.getpid()}{path.suffix}")
+
+
+def _append(path: Path, rows: List[AuditRow]) -> None:
+    """Append rows to a file under an exclusive lock."""
+    while True:
+        with path.open("a", encoding="utf-8") as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            # The file may have been claimed for restoring while we waited
+            # for the lock; write to a fresh one at the same path instead
+            try:
+                current = os.stat(path).st_ino == os.fstat(file.fileno()).st_ino
+            except FileNotFoundError:
+                current = False
+            if current:
+                for row in rows:
+                    file.write(json.dumps(_to_record(row)) + "\n")
+                return
+
+
+def _take(path: Path) -> Optional[Tuple[Path, List[str]]]:
+    """
+    Claim a file written by ``_append`` and read it, or None if taken.
+
+    The file is renamed to ``<name>.<pid>.restoring``, not deleted; the
+    caller removes it once the rows are inserted.
+    """
+    claimed = path.with_name(f"{path.name}.{os.getpid()}.restoring")
+    try:
+        path.rename(claimed)
+    except FileNotFoundError:
+        return None
+    with claimed.open("r", encoding="utf-8") as file:
+        # Wait for a writer that opened the file before the rename
+        fcntl.flock(file, fcntl.LOCK_EX)
+        lines = file.read().splitlines()
+    return claimed, lines
+
+
+def _abandoned(path: Path) -> bool:
+    """Whether a ``.restoring`` file was claimed by a process that has exited."""
+    try:
+        pid = int(path.name.rsplit(".", 2)[1])
+    except (IndexError, ValueError):
+        return False
+    if pid == os.getpid():
+        # Left by an earlier run that had this process's ID
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        return False
+    return False
+
+
+class AuditLogWriter:
+    """
+    Writes audit rows in the caller's transaction or in background batches.
+
+    Until ``start`` is called, for example in scripts and tests, rows are
+    created immediately.
+    """
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        fallback_path: Optional[str] = None,
+        max_buffered: Optional[int] = None,
+        dead_letter_path: Optional[str] = None,
+    ) -> None:
+        self.batch_size = batch_size or settings.AUDIT_LOG_BATCH_SIZE
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else settings.AUDIT_LOG_FLUSH_INTERVAL_SECONDS
+        )
+        self.fallback_path = Path(fallback_path or settings.AUDIT_LOG_FALLBACK_PATH)
+        self.max_buffered = max_buffered or settings.AUDIT_LOG_MAX_BUFFERED
+        self.dead_letter_path = Path(
+            dead_letter_path or settings.AUDIT_LOG_DEAD_LETTER_PATH
+        )
+        self._db: Optional["Prisma"] = None
+        self._buffer: List[AuditRow] = []
+        self._full = asyncio.Event()
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._stopping = False
+        self._overflowing = False
+        self._restoring: List[Path] = []
+
+    @property
+    def pending(self) -> int:
+        """Number of rows waiting to be inserted."""
+        return len(self._buffer)
+
+    async def write(self, db: "Prisma", data: AuditRow) -> None:
+        """
+        Record an audit row.
+
+        Args:
+            db: Client that made the state change; a transaction client
+                creates the row within its transaction
+            data: AuditLog fields, as for ``db.auditlog.create``
+        """
+        row = {"timestamp": datetime.now(timezone.utc), **data}
+        if self._db is None or db.is_transaction():
+            await db.auditlog.create(data=row)  # type: ignore[arg-type]
+            return
+
+        if len(self._buffer) >= self.max_buffered:
+            # The database is not keeping up; keep the row on disk instead
+            if not self._overflowing:
+                logger.warning(
+                    f"Audit log buffer full, saving rows to {self.fallback_path}"
+                )
+            self._overflowing = True
+            await asyncio.to_thread(_append, _process_path(self.fallback_path), [row])
+            return
+
+        self._overflowing = False
+        self._buffer.append(row)
+        if len(self._buffer) >= self.batch_size:
+            self._full.set()
+
+    async def start(self, db: "Prisma") -> None:
+        """Insert rows left from the last shutdown, then start batching."""
+        if self._task is not None:
+            return
+        self._db = db
+        self._stopping = False
+        await self._restore()
+        self._task = asyncio.create_task(self._flush_periodically(), name="audit-log")
+
+    async def stop(self) -> None:
+        """Flush waiting rows, keeping any that fail in the fallback file."""
+        if self._task is None:
+            return
+        # Let the flusher finish its current batch rather than cancelling it
+        # mid-insert, which could write the batch twice
+        self._stopping = True
+        self._full.set()
+        await self._task
+        self._task = None
+
+        if self._buffer:
+            await self._spill(self._buffer)
+            self._buffer = []
+        self._release_restored()
+        self._db = None
+
+    async def flush(self) -> None:
+        """
+        Insert waiting rows in batches.
+
+        A failed batch is retried row by row. Rows the database rejects are
+        dead-lettered; if the database itself fails, the remaining rows are
+        kept for the next flush.
+        """
+        self._full.clear()
+        while self._buffer and self._db is not None:
+            batch: Any = self._buffer[: self.batch_size]
+            try:
+                await self._db.auditlog.create_many(data=batch)
+            except Exception as e:
+                logger.error(f"Failed to write {len(batch)} audit log rows: {e}")
+                written = await self._write_each(self._db, batch)
+                del self._buffer[:written]
+                if written < len(batch):
+                    return
+                continue
+            del self._buffer[: len(batch)]
+        self._release_restored()
+
+    async def _write_each(self, db: "Prisma", rows: List[AuditRow]) -> int:
+        """Insert rows one at a time; returns how many were handled."""
+        rejected: List[AuditRow] = []
+        handled = 0
+        for row in rows:
+            try:
+                await db.auditlog.create(data=row)  # type: ignore[arg-type]
+            except DataError as e:
+                logger.error(f"Audit log row rejected: {e}")
+                rejected.append(row)
+            except Exception:
+                break
+            handled += 1
+
+        if rejected:
+            path = _process_path(self.dead_letter_path)
+            await asyncio.to_thread(_append, path, rejected)
+            logger.error(f"Moved {len(rejected)} rejected audit log rows to {path}")
+        return handled
+
+    async def _flush_periodically(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._full.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    async def _spill(self, rows: List[AuditRow]) -> None:
+        path = _process_path(self.fallback_path)
+        await asyncio.to_thread(_append, path, rows)
+        logger.warning(f"Saved {len(rows)} audit log rows to {path}")
+
+    def _release_restored(self) -> None:
+        """Remove restored files once their rows are inserted or spilled."""
+        if self._buffer:
+            return
+        for path in self._restoring:
+            path.unlink(missing_ok=True)
+        self._restoring = []
+
+    async def _restore(self) -> None:
+        directory = self.fallback_path.parent
+        pattern = f"{self.fallback_path.stem}*{self.fallback_path.suffix}"
+        paths = sorted(directory.glob(pattern))
+        # Files claimed by a worker that died before inserting their rows
+        paths += sorted(
+            path
+            for path in directory.glob(f"{pattern}.*.restoring")
+            if _abandoned(path)
+        )
+        for path in paths:
+            # Workers starting together each restore a file only once
+            taken = await asyncio.to_thread(_take, path)
+            if taken is None:
+                continue
+            claimed, lines = taken
+            self._restoring.append(claimed)
+            self._buffer.extend(
+                _from_record(json.loads(line)) for line in lines if line
+            )
+            logger.info(f"Restored {len(lines)} audit log rows from {path}")
+        await self.flush()
+
+
+# Global audit log writer, started and stopped with the application
+audit_log = AuditLogWriter()
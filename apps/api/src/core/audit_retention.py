@@ -0,0 +1,317 @@
+"""
+Monthly AuditLog partitions and their retention.
+
+AuditLog is range partitioned on ``timestamp`` into one table per UTC month
+(``AuditLog_2025_01``), plus ``AuditLog_default`` for rows no monthly
+partition covers. Inserts only touch the current month's small indexes, so
+their cost stays flat as history grows.
+
+``ensure_partitions`` creates partitions AUDIT_LOG_PARTITIONS_AHEAD months
+ahead. ``apply_retention`` archives partitions older than
+AUDIT_LOG_RETENTION_MONTHS as gzipped JSON lines in the
+AUDIT_LOG_ARCHIVE_BUCKET storage bucket, then detaches and drops them; rows
+that old in the default partition are archived and deleted the same way.
+Both run from the retention job, which should run monthly, e.g. from cron:
+
+    poetry run python -m src.core.audit_retention
+"""
+
+import asyncio
+import json
+import logging
+import re
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional
+
+from src.core.settings import settings
+from src.core.storage import StorageBackend, create_storage_backend
+
+if TYPE_CHECKING:
+    from prisma import Prisma
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "AuditLog"
+DEFAULT_PARTITION = "AuditLog_default"
+PARTITION_PATTERN = re.compile(r"^AuditLog_(\d{4})_(\d{2})$")
+ARCHIVE_PREFIX = "audit-archive"
+EXPORT_PAGE_SIZE = 5000
+
+
+@dataclass(frozen=True)
+class Partition:
+    """A monthly AuditLog partition."""
+
+    name: str
+    month: datetime
+
+    @property
+    def end(self) -> datetime:
+        """Start of the following month, where the partition's range ends."""
+        return add_months(self.month, 1)
+
+    @property
+    def archive_path(self) -> str:
+        return f"{ARCHIVE_PREFIX}/{self.name}.jsonl.gz"
+
+
+def month_start(value: datetime) -> datetime:
+    """First instant of the UTC month containing ``value``."""
+    value = value.astimezone(timezone.utc)
+    return datetime(value.year, value.month, 1, tzinfo=timezone.utc)
+
+
+def add_months(month: datetime, count: int) -> datetime:
+    """The month ``count`` months after (or before) a month start."""
+    index = month.year * 12 + month.month - 1 + count
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def partition_for(month: datetime) -> Partition:
+    """The partition holding rows from a month."""
+    return Partition(f"{PARENT_TABLE}_{month:%Y_%m}", month)
+
+
+async def list_partitions(db: "Prisma") -> List[Partition]:
+    """Monthly partitions currently attached to AuditLog, oldest first."""
+    rows = await db.query_raw(
+        "SELECT child.relname AS name FROM pg_inherits "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+        "WHERE parent.relname = $1",
+        PARENT_TABLE,
+    )
+    partitions = []
+    for row in rows:
+        match = PARTITION_PATTERN.match(row["name"])
+        if match:
+            year, month = int(match.group(1)), int(match.group(2))
+            partitions.append(
+                Partition(row["name"], datetime(year, month, 1, tzinfo=timezone.utc))
+            )
+    return sorted(partitions, key=lambda partition: partition.month)
+
+
+async def create_partition(db: "Prisma", partition: Partition) -> None:
+    """
+    Create and attach a monthly partition.
+
+    Rows for the month that already landed in the default partition are
+    moved into it in the same transaction, as Postgres will not attach a
+    range the default partition holds rows for. An advisory lock keeps
+    application instances starting together from racing to create it.
+    """
+    start, end = partition.month.isoformat(), partition.end.isoformat()
+    async with db.tx() as tx:
+        await tx.query_raw(
+            "SELECT pg_advisory_xact_lock(hashtext($1))::text AS locked", PARENT_TABLE
+        )
+        found = await tx.query_raw(
+            "SELECT to_regclass($1)::text AS name", f'"{partition.name}"'
+        )
+        if found and found[0]["name"]:
+            return
+
+        await tx.execute_raw(
+            f'CREATE TABLE "{partition.name}" '
+            f'(LIKE "{PARENT_TABLE}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+        )
+        await tx.execute_raw(
+            f'WITH moved AS (DELETE FROM "{DEFAULT_PARTITION}" '
+            'WHERE "timestamp" >= $1::timestamptz AND "timestamp" < $2::timestamptz '
+            f'RETURNING *) INSERT INTO "{partition.name}" SELECT * FROM moved',
+            start,
+            end,
+        )
+        await tx.execute_raw(
+            f'ALTER TABLE "{PARENT_TABLE}" ATTACH PARTITION "{partition.name}" '
+            f"FOR VALUES FROM ('{start}') TO ('{end}')"
+        )
+
+
+async def ensure_partitions(
+    db: "Prisma",
+    months_ahead: Optional[int] = None,
+    now: Optional[datetime] = None,
+) -> List[Partition]:
+    """
+    Create any missing partitions from the current month onwards.
+
+    Args:
+        db: Connected client
+        months_ahead: Months after the current one to cover; defaults to
+            AUDIT_LOG_PARTITIONS_AHEAD
+        now: Current time, for tests
+
+    Returns:
+        The partitions created
+    """
+    if months_ahead is None:
+        months_ahead = settings.AUDIT_LOG_PARTITIONS_AHEAD
+    current = month_start(now or datetime.now(timezone.utc))
+    existing = {partition.name for partition in await list_partitions(db)}
+
+    created = []
+    for offset in range(months_ahead + 1):
+        partition = partition_for(add_months(current, offset))
+        if partition.name not in existing:
+            await create_partition(db, partition)
+            logger.info(f"Created audit log partition {partition.name}")
+            created.append(partition)
+    return created
+
+
+async def _export_rows(db: "Prisma", table: str, end: datetime) -> AsyncIterator[bytes]:
+    """Gzipped JSON lines of a table's rows before ``end``, read page by page."""
+    compressor = zlib.compressobj(wbits=31)  # gzip container
+    last_timestamp, last_id = "-infinity", None
+    while True:
+        rows = await db.query_raw(
+            f'SELECT row_to_json(a)::text AS row FROM "{table}" a '
+            'WHERE ("timestamp", "id") > ($1::timestamptz, $2::uuid) '
+            'AND "timestamp" < $3::timestamptz '
+            'ORDER BY "timestamp", "id" LIMIT $4',
+            last_timestamp,
+            last_id or "00000000-0000-0000-0000-000000000000",
+            end.isoformat(),
+            EXPORT_PAGE_SIZE,
+        )
+        if not rows:
+            break
+        chunk = "".join(row["row"] + "\n" for row in rows).encode()
+        yield compressor.compress(chunk)
+
+        last = json.loads(rows[-1]["row"])
+        last_timestamp, last_id = last["timestamp"], last["id"]
+        if len(rows) < EXPORT_PAGE_SIZE:
+            break
+    yield compressor.flush()
+
+
+async def archive_partition(
+    db: "Prisma", storage: StorageBackend, partition: Partition
+) -> None:
+    """Upload a partition's rows to cold storage, then detach and drop it."""
+    await storage.upload(
+        partition.archive_path,
+        _export_rows(db, partition.name, partition.end),
+        content_type="application/gzip",
+        upsert=True,
+    )
+    async with db.tx() as tx:
+        await tx.execute_raw(
+            f'ALTER TABLE "{PARENT_TABLE}" DETACH PARTITION "{partition.name}"'
+        )
+        await tx.execute_raw(f'DROP TABLE "{partition.name}"')
+
+
+async def sweep_default_partition(
+    db: "Prisma", storage: StorageBackend, cutoff: datetime, now: datetime
+) -> int:
+    """
+    Archive rows older than ``cutoff`` from the default partition, then
+    delete them.
+
+    Each sweep gets its own archive, named after the cutoff and the time it
+    ran, so a later sweep never overwrites rows an earlier one deleted.
+
+    Returns:
+        Number of rows archived
+    """
+    found = await db.query_raw(
+        f'SELECT count(*)::int AS count FROM "{DEFAULT_PARTITION}" '
+        'WHERE "timestamp" < $1::timestamptz',
+        cutoff.isoformat(),
+    )
+    count = int(found[0]["count"]) if found else 0
+    if not count:
+        return 0
+
+    path = (
+        f"{ARCHIVE_PREFIX}/{DEFAULT_PARTITION}_before_{cutoff:%Y_%m}"
+        f"_{now.astimezone(timezone.utc):%Y%m%dT%H%M%SZ}.jsonl.gz"
+    )
+    await storage.upload(
+        path,
+        _export_rows(db, DEFAULT_PARTITION, cutoff),
+        content_type="application/gzip",
+    )
+    # New audit rows are stamped when written, so none arrive this far back
+    # between the export and the delete
+    await db.execute_raw(
+        f'DELETE FROM "{DEFAULT_PARTITION}" WHERE "timestamp" < $1::timestamptz',
+        cutoff.isoformat(),
+    )
+    logger.info(f"Archived {count} audit log rows from {DEFAULT_PARTITION} to {path}")
+    return count
+
+
+def archive_storage() -> StorageBackend:
+    """Storage backend for the audit log archive bucket."""
+    return create_storage_backend(
+        settings.model_copy(
+            update={"STORAGE_BUCKET": settings.AUDIT_LOG_ARCHIVE_BUCKET}
+        )
+    )
+
+
+async def apply_retention(
+    db: "Prisma",
+    storage: StorageBackend,
+    retention_months: Optional[int] = None,
+    now: Optional[datetime] = None,
+) -> List[Partition]:
+    """
+    Archive and drop partitions older than the retention period, and
+    archive and delete default partition rows that old.
+
+    Args:
+        db: Connected client
+        storage: Backend to write archives to
+        retention_months: Whole months kept before the current one; defaults
+            to AUDIT_LOG_RETENTION_MONTHS
+        now: Current time, for tests
+
+    Returns:
+        The partitions archived
+    """
+    if retention_months is None:
+        retention_months = settings.AUDIT_LOG_RETENTION_MONTHS
+    now = now or datetime.now(timezone.utc)
+    cutoff = add_months(month_start(now), -retention_months)
+
+    archived = []
+    for partition in await list_partitions(db):
+        if partition.month >= cutoff:
+            break
+        await archive_partition(db, storage, partition)
+        logger.info(
+            f"Archived audit log partition {partition.name} to "
+            f"{partition.archive_path}"
+        )
+        archived.append(partition)
+
+    await sweep_default_partition(db, storage, cutoff, now)
+    return archived
+
+
+async def main() -> None:
+    from src.core.database import prisma
+    from src.core.logs import configure_logging, shutdown_logging
+
+    configure_logging()
+    await prisma.connect()
+    storage = archive_storage()
+    try:
+        await ensure_partitions(prisma)
+        await apply_retention(prisma, storage)
+    finally:
+        await storage.aclose()
+        await prisma.disconnect()
+        shutdown_logging()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
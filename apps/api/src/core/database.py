@@ -1,10 +1,82 @@
 # apps/api/src/core/database.py
+"""
+Prisma clients for the primary database and an optional read replica.
+
+Pool sizing is passed to the query engine as ``connection_limit`` and
+``pool_timeout`` parameters on the datasource URL. Read-only listings and
+lookups depend on ``get_read_db``, which returns the replica client when
+DATABASE_READ_REPLICA_URL is set and the primary client otherwise. Replicas
+can lag slightly behind the primary, so anything that writes, or must see a
+write it just made, depends on ``get_db``.
+"""
+
+from datetime import timedelta
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from prisma.types import DatasourceOverride, HttpConfig
+
 from prisma import Prisma
+from src.core.settings import settings
+
+
+def pooled_url(
+    url: str, connection_limit: Optional[int], pool_timeout: Optional[int]
+) -> str:
+    """Set query engine pool parameters on a database URL, keeping the others."""
+    parts = urlsplit(url)
+    params = dict(parse_qsl(parts.query))
+    if connection_limit is not None:
+        params["connection_limit"] = str(connection_limit)
+    if pool_timeout is not None:
+        params["pool_timeout"] = str(pool_timeout)
+    return urlunsplit(parts._replace(query=urlencode(params)))
+
 
-# Global Prisma instance
-prisma = Prisma()
+def create_client(url: Optional[str], connection_limit: Optional[int]) -> Prisma:
+    """
+    Prisma client with the configured pool and timeout settings.
+
+    Args:
+        url: Database URL; None uses DATABASE_URL from the environment with
+            the default pool
+        connection_limit: Maximum connections in the client's pool
+    """
+    datasource: Optional[DatasourceOverride] = None
+    if url:
+        datasource = {
+            "url": pooled_url(
+                url, connection_limit, settings.DATABASE_POOL_TIMEOUT_SECONDS
+            )
+        }
+    http: Optional[HttpConfig] = None
+    if settings.DATABASE_QUERY_TIMEOUT_SECONDS is not None:
+        http = {"timeout": settings.DATABASE_QUERY_TIMEOUT_SECONDS}
+
+    return Prisma(
+        datasource=datasource,
+        connect_timeout=timedelta(seconds=settings.DATABASE_CONNECT_TIMEOUT_SECONDS),
+        http=http,
+    )
+
+
+# Global Prisma instances; the read client is the primary without a replica
+prisma = create_client(settings.DATABASE_URL, settings.DATABASE_CONNECTION_LIMIT)
+read_prisma = (
+    create_client(
+        settings.DATABASE_READ_REPLICA_URL,
+        settings.DATABASE_READ_REPLICA_CONNECTION_LIMIT,
+    )
+    if settings.DATABASE_READ_REPLICA_URL
+    else prisma
+)
 
 
 async def get_db() -> Prisma:
     """Database dependency for FastAPI dependency injection."""
     return prisma
+
+
+async def get_read_db() -> Prisma:
+    """Database dependency for read-only endpoints, served by the replica if set."""
+    return read_prisma
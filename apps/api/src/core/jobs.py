@@ -0,0 +1,126 @@
+import asyncio
+import contextvars
+import itertools
+import logging
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.core.queries import record_queries, track_queries
+from src.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class JobPriority(IntEnum):
+    """Job priorities; lower values run first."""
+
+    HIGH = 0
+    NORMAL = 5
+    LOW = 10
+
+
+@dataclass(order=True)
+class _Job:
+    priority: int
+    sequence: int
+    func: Callable[..., Awaitable[Any]] = field(compare=False)
+    args: Tuple[Any, ...] = field(compare=False)
+    kwargs: Dict[str, Any] = field(compare=False)
+    context: contextvars.Context = field(compare=False)
+
+
+class JobQueue:
+    """
+    In-process priority queue for background jobs.
+
+    A fixed pool of worker tasks runs queued coroutine functions, highest
+    priority first and in submission order within a priority, so large bulk
+    uploads cannot monopolise processing. Each job runs in a copy of the
+    context it was queued from, keeping log correlation fields, and its
+    database queries are recorded per job function. Jobs live in memory
+    only; anything still queued at shutdown is dropped and logged, and bulk
+    uploads are re-queued from the database at startup.
+    """
+
+    def __init__(self, workers: Optional[int] = None) -> None:
+        self.workers = workers if workers is not None else settings.JOB_QUEUE_WORKERS
+        self._queue: "asyncio.PriorityQueue[_Job]" = asyncio.PriorityQueue()
+        self._sequence = itertools.count()
+        self._tasks: List["asyncio.Task[None]"] = []
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs waiting for a worker."""
+        return self._queue.qsize()
+
+    def enqueue(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        priority: int = JobPriority.NORMAL,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Queue a coroutine function to run on a worker.
+
+        Args:
+            func: Coroutine function to run
+            *args: Positional arguments for ``func``
+            priority: Job priority; lower values run first
+            **kwargs: Keyword arguments for ``func``
+        """
+        self._queue.put_nowait(
+            _Job(
+                int(priority),
+                next(self._sequence),
+                func,
+                args,
+                kwargs,
+                contextvars.copy_context(),
+            )
+        )
+
+    async def start(self) -> None:
+        """Start the worker tasks."""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._work(), name=f"job-worker-{number}")
+            for number in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """Cancel the workers, dropping any jobs still queued."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        if self.pending:
+            logger.warning(f"Dropping {self.pending} queued jobs on shutdown")
+
+    async def join(self) -> None:
+        """Wait until every queued job has finished."""
+        await self._queue.join()
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await asyncio.create_task(self._run(job), context=job.context)
+            except Exception:
+                logger.exception(f"Background job {job.func.__name__} failed")
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: _Job) -> None:
+        with track_queries() as stats:
+            try:
+                await job.func(*job.args, **job.kwargs)
+            finally:
+                record_queries("job", job.func.__name__, stats)
+
+
+# Global job queue, started and stopped with the application
+job_queue = JobQueue()
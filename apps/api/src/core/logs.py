@@ -0,0 +1,171 @@
+"""
+Structured application logging.
+
+Log calls only enqueue a record; a background listener thread formats and
+writes it, so logging never blocks the event loop on I/O. Records carry the
+correlation fields bound with ``log_context`` (request ID, remittance ID,
+organization ID), and high-volume per-line events can be sampled.
+"""
+
+import json
+import logging
+import queue
+import random
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import IO, Any, Dict, Iterator, Optional
+
+from opentelemetry import trace
+
+from src.core.settings import settings
+
+# Pass as ``extra`` on per-line events to keep only LOG_SAMPLE_RATE of them
+SAMPLED = {"sampled": True}
+
+_log_context: ContextVar[Dict[str, str]] = ContextVar("log_context", default={})
+_listener: Optional[QueueListener] = None
+
+
+@contextmanager
+def log_context(**fields: Any) -> Iterator[None]:
+    """
+    Add correlation fields to every record logged within the block.
+
+    Fields are stored in a context variable, so they follow the current task
+    and any task it creates. None values are ignored.
+    """
+    context = {**_log_context.get()}
+    context.update({key: str(value) for key, value in fields.items() if value})
+    token = _log_context.set(context)
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+def get_log_context() -> Dict[str, str]:
+    """Correlation fields bound in the current context."""
+    return _log_context.get()
+
+
+def _trace_fields() -> Dict[str, str]:
+    context = trace.get_current_span().get_span_context()
+    if not context.is_valid:
+        return {}
+    return {
+        "trace_id": trace.format_trace_id(context.trace_id),
+        "span_id": trace.format_span_id(context.span_id),
+    }
+
+
+class ContextQueueHandler(QueueHandler):
+    """
+    Queue handler that captures the correlation context of the caller,
+    including the active trace and span when tracing is enabled.
+
+    The message and traceback are rendered before the record is queued, as
+    arguments may not be safe to format later from another thread.
+    """
+
+    def __init__(self, log_queue: "queue.SimpleQueue[Any]", sample_rate: float):
+        super().__init__(log_queue)
+        self.sample_rate = sample_rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "sampled", False) and random.random() >= self.sample_rate:
+            return False
+        return bool(super().filter(record))
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.context = {**get_log_context(), **_trace_fields()}
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(
+                record.created, tz=timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            **getattr(record, "context", {}),
+        }
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Human-readable format with correlation fields appended as key=value."""
+
+    def __init__(self) -> None:
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        message = super().formatMessage(record)
+        context = getattr(record, "context", {})
+        if context:
+            message += " " + " ".join(f"{k}={v}" for k, v in context.items())
+        return message
+
+
+def configure_logging(
+    level: Optional[str] = None,
+    log_format: Optional[str] = None,
+    sample_rate: Optional[float] = None,
+    stream: Optional[IO[str]] = None,
+) -> None:
+    """
+    Route the root logger through a queue to a background writer.
+
+    Args:
+        level: Minimum level to log; defaults to LOG_LEVEL
+        log_format: "json" or "text"; defaults to LOG_FORMAT
+        sample_rate: Share of sampled events to keep; defaults to LOG_SAMPLE_RATE
+        stream: Where to write logs; defaults to stderr
+    """
+    global _listener
+    shutdown_logging()
+
+    output = logging.StreamHandler(stream or sys.stderr)
+    output.setFormatter(
+        JsonFormatter()
+        if (log_format or settings.LOG_FORMAT) == "json"
+        else TextFormatter()
+    )
+
+    log_queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+    handler = ContextQueueHandler(
+        log_queue,
+        settings.LOG_SAMPLE_RATE if sample_rate is None else sample_rate,
+    )
+
+    root = logging.getLogger()
+    for existing in [h for h in root.handlers if isinstance(h, ContextQueueHandler)]:
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel((level or settings.LOG_LEVEL).upper())
+
+    _listener = QueueListener(log_queue, output)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Stop the background writer, flushing any queued records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,124 @@
+"""
+Application metrics, served at /metrics in the Prometheus text format.
+
+Metrics are prometheus_client collectors in an application registry.
+Values are kept per process; with several workers, each is scraped
+separately. The endpoint is off unless METRICS_ENABLED is set, and
+requires METRICS_TOKEN as a bearer token when one is configured.
+"""
+
+from src.core.settings import settings
+
+from .event_loop import EventLoopMonitor
+from .registry import Counter, Histogram, MetricsRegistry
+
+registry = MetricsRegistry()
+
+# Remittance pipeline stages
+REMITTANCE_PROCESSING_SECONDS = registry.histogram(
+    "remittance_processing_seconds",
+    "Time to process an uploaded remittance from extraction to final status",
+)
+PDF_PARSE_SECONDS = registry.histogram(
+    "remittance_pdf_parse_seconds", "Time to extract text from a remittance PDF"
+)
+AI_EXTRACTION_SECONDS = registry.histogram(
+    "remittance_ai_extraction_seconds",
+    "Time for the OpenAI assistant to extract remittance data",
+    ["outcome"],
+)
+MATCHING_SECONDS = registry.histogram(
+    "remittance_matching_seconds", "Time to match remittance payments to invoices"
+)
+DB_WRITE_SECONDS = registry.histogram(
+    "remittance_db_write_seconds",
+    "Time spent writing remittance processing results to the database",
+    ["operation"],
+)
+MATCH_OUTCOMES = registry.counter(
+    "remittance_match_outcomes_total",
+    "Remittance payments by the matching pass that matched them",
+    ["match_type"],
+)
+
+# External accounting
+XERO_REQUEST_SECONDS = registry.histogram(
+    "xero_request_seconds",
+    "Xero API request duration per attempt",
+    ["method", "endpoint", "status"],
+)
+INTEGRATION_SYNC_SECONDS = registry.histogram(
+    "integration_sync_seconds",
+    "Time to sync records from the accounting system",
+    ["object_type", "outcome"],
+)
+
+# In-process caches
+CACHE_REQUESTS = registry.counter(
+    "cache_requests_total", "Cache lookups by cache and result", ["cache", "result"]
+)
+
+# Database queries per request and background job
+DB_QUERIES = registry.histogram(
+    "db_queries",
+    "Database queries sent per request or background job",
+    ["kind", "name"],
+    buckets=[1, 2, 5, 10, 20, 50, 100, 200, 500, 1000],
+)
+DB_QUERY_SECONDS = registry.histogram(
+    "db_query_seconds",
+    "Total database query time per request or background job",
+    ["kind", "name"],
+)
+
+# Event loop health; lag is sampled while the application runs, blocking
+# calls are only caught with EVENT_LOOP_BLOCKING_DETECTION
+EVENT_LOOP_LAG_SECONDS = registry.histogram(
+    "event_loop_lag_seconds",
+    "Delay between when a loop monitor timer was due and when it ran",
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+)
+EVENT_LOOP_BLOCKED = registry.counter(
+    "event_loop_blocked_total",
+    "Calls that blocked the event loop past the detection threshold",
+    ["location"],
+)
+event_loop_monitor = EventLoopMonitor(
+    EVENT_LOOP_LAG_SECONDS,
+    settings.EVENT_LOOP_LAG_INTERVAL_SECONDS,
+    blocked=EVENT_LOOP_BLOCKED,
+    blocking_threshold=(
+        settings.EVENT_LOOP_BLOCKING_THRESHOLD_SECONDS
+        if settings.EVENT_LOOP_BLOCKING_DETECTION
+        else 0.0
+    ),
+)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """Count a cache lookup as a hit or a miss."""
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+__all__ = [
+    "AI_EXTRACTION_SECONDS",
+    "CACHE_REQUESTS",
+    "DB_QUERIES",
+    "DB_QUERY_SECONDS",
+    "DB_WRITE_SECONDS",
+    "EVENT_LOOP_BLOCKED",
+    "EVENT_LOOP_LAG_SECONDS",
+    "INTEGRATION_SYNC_SECONDS",
+    "MATCHING_SECONDS",
+    "MATCH_OUTCOMES",
+    "PDF_PARSE_SECONDS",
+    "REMITTANCE_PROCESSING_SECONDS",
+    "XERO_REQUEST_SECONDS",
+    "Counter",
+    "EventLoopMonitor",
+    "Histogram",
+    "MetricsRegistry",
+    "event_loop_monitor",
+    "record_cache_lookup",
+    "registry",
+]
@@ -0,0 +1,131 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from types import FrameType
+from typing import Optional
+
+from .registry import Counter, Histogram
+
+logger = logging.getLogger(__name__)
+
+# Blocking calls are attributed to the innermost frame in application code
+APP_ROOT = Path(__file__).resolve().parents[3]
+SRC_ROOT = APP_ROOT / "src"
+
+
+def _location(frame: FrameType) -> str:
+    """``path:function`` of the innermost application frame on a stack."""
+    stack = traceback.extract_stack(frame)
+    for entry in reversed(stack):
+        path = Path(entry.filename)
+        if path.is_relative_to(SRC_ROOT):
+            return f"{path.relative_to(APP_ROOT)}:{entry.name}"
+    return f"{Path(stack[-1].filename).name}:{stack[-1].name}"
+
+
+class EventLoopMonitor:
+    """
+    Samples event loop lag into a histogram, and optionally catches blocking
+    calls in the act.
+
+    A background task sleeps for a fixed interval and records how much later
+    than requested it woke up. Any lag is time the loop spent running
+    something else without yielding, such as blocking I/O or CPU-bound
+    parsing, and every request in flight was held up by the same amount.
+
+    With a blocking threshold set, a watchdog thread also pings the loop. If
+    a ping is not answered within the threshold, the loop thread's stack is
+    captured while it is still blocked, counted by application location and
+    logged with how long the loop stayed blocked. Meant for debugging, as
+    the watchdog wakes the loop every threshold.
+    """
+
+    def __init__(
+        self,
+        histogram: Histogram,
+        interval: float,
+        blocked: Optional[Counter] = None,
+        blocking_threshold: float = 0.0,
+    ) -> None:
+        self.histogram = histogram
+        self.interval = interval
+        self.blocked = blocked
+        self.blocking_threshold = blocking_threshold
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    async def start(self) -> None:
+        """Start sampling; each part does nothing if its setting is not positive."""
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(self._sample(), name="event-loop-monitor")
+
+        if (
+            self._watchdog is None
+            and self.blocked is not None
+            and self.blocking_threshold > 0
+        ):
+            self._stopping.clear()
+            self._watchdog = threading.Thread(
+                target=self._watch,
+                args=(asyncio.get_running_loop(), threading.get_ident()),
+                name="event-loop-watchdog",
+                daemon=True,
+            )
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._watchdog is not None:
+            self._stopping.set()
+            await asyncio.to_thread(self._watchdog.join, 1.0)
+            self._watchdog = None
+
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _sample(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(loop.time() - expected, 0.0)
+            self.histogram.observe(lag)
+            if lag >= 1.0:
+                logger.warning(f"Event loop blocked for {lag:.2f}s")
+
+    def _watch(self, loop: asyncio.AbstractEventLoop, loop_thread_id: int) -> None:
+        while not self._stopping.wait(self.blocking_threshold):
+            answered = threading.Event()
+            sent = time.perf_counter()
+            try:
+                loop.call_soon_threadsafe(answered.set)
+            except RuntimeError:  # Loop closed
+                return
+            if answered.wait(self.blocking_threshold):
+                continue
+
+            frame = sys._current_frames().get(loop_thread_id)
+            if frame is None:
+                continue
+            location = _location(frame)
+            stack = "".join(traceback.format_stack(frame))
+            del frame
+
+            while not answered.wait(0.5):
+                if self._stopping.is_set():
+                    return
+            self._report(location, stack, time.perf_counter() - sent)
+
+    def _report(self, location: str, stack: str, seconds: float) -> None:
+        if self.blocked is not None:
+            self.blocked.inc(location=location)
+        logger.warning(
+            f"Event loop blocked for {seconds * 1000:.0f}ms at {location}\n{stack}"
+        )
@@ -0,0 +1,205 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Generic, Iterator, Optional, Sequence, TypeVar, Union
+
+import prometheus_client
+from prometheus_client import CollectorRegistry, generate_latest
+
+# Seconds; spans cache lookups through OpenAI runs and full syncs
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+
+# Skip the *_created series; dashboards only use the values themselves
+prometheus_client.disable_created_metrics()
+
+P = TypeVar("P", prometheus_client.Counter, prometheus_client.Histogram)
+
+
+class Metric(Generic[P]):
+    """
+    A prometheus_client metric with keyword labels and read-back helpers.
+
+    Call sites pass labels as keyword arguments instead of going through
+    ``labels()``, and tests and benchmarks read recorded values back per
+    label set.
+    """
+
+    def __init__(
+        self,
+        registry: CollectorRegistry,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._registry = registry
+        self._lock = threading.Lock()
+        self._metric = self._create()
+
+    def _create(self) -> P:
+        raise NotImplementedError
+
+    def _check_labels(self, labels: Dict[str, str]) -> None:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {list(self.labelnames)}, "
+                f"got {sorted(labels)}"
+            )
+
+    def _child(self, labels: Dict[str, str]) -> P:
+        self._check_labels(labels)
+        if not self.labelnames:
+            return self._metric
+        return self._metric.labels(**labels)
+
+    def _sample(self, suffix: str, labels: Dict[str, str]) -> Optional[float]:
+        self._check_labels(labels)
+        return self._registry.get_sample_value(
+            f"{self.name}{suffix}", {key: str(value) for key, value in labels.items()}
+        )
+
+    def clear(self) -> None:
+        """Drop every recorded value."""
+        with self._lock:
+            self._registry.unregister(self._metric)
+            self._metric = self._create()
+
+
+class Counter(Metric[prometheus_client.Counter]):
+    """Monotonically increasing count."""
+
+    def _create(self) -> prometheus_client.Counter:
+        return prometheus_client.Counter(
+            self.name, self.documentation, self.labelnames, registry=self._registry
+        )
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the count for a label set."""
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        self._child(labels).inc(amount)
+
+    def value(self, **labels: str) -> float:
+        """Current count for a label set."""
+        return self._sample("", labels) or 0.0
+
+
+class Histogram(Metric[prometheus_client.Histogram]):
+    """Distribution of observed values in cumulative buckets."""
+
+    def __init__(
+        self,
+        registry: CollectorRegistry,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(registry, name, documentation, labelnames)
+
+    def _create(self) -> prometheus_client.Histogram:
+        return prometheus_client.Histogram(
+            self.name,
+            self.documentation,
+            self.labelnames,
+            registry=self._registry,
+            buckets=self.buckets,
+        )
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation for a label set."""
+        self._child(labels).observe(value)
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the duration of a block in seconds, even if it raises."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: str) -> int:
+        """Number of observations for a label set."""
+        return int(self._sample("_count", labels) or 0)
+
+    def sum(self, **labels: str) -> float:
+        """Sum of observations for a label set."""
+        return self._sample("_sum", labels) or 0.0
+
+
+M = TypeVar("M", bound=Union[Counter, Histogram])
+
+
+class MetricsRegistry:
+    """
+    Collection of metrics rendered together for scraping.
+
+    Each registry has its own prometheus_client CollectorRegistry, so tests
+    can build throwaway registries without touching the global one.
+    """
+
+    def __init__(self) -> None:
+        self._collector = CollectorRegistry(auto_describe=True)
+        self._metrics: Dict[str, Union[Counter, Histogram]] = {}
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Create and register a counter."""
+        self._check_name(name)
+        return self._register(Counter(self._collector, name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Optional[Sequence[float]] = None,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        self._check_name(name)
+        return self._register(
+            Histogram(
+                self._collector,
+                name,
+                documentation,
+                labelnames,
+                buckets or DEFAULT_BUCKETS,
+            )
+        )
+
+    def render(self) -> str:
+        """Every metric in the Prometheus text exposition format."""
+        return generate_latest(self._collector).decode()
+
+    def clear(self) -> None:
+        """Drop every recorded value, keeping the metrics registered."""
+        for metric in self._metrics.values():
+            metric.clear()
+
+    def _check_name(self, name: str) -> None:
+        if name in self._metrics:
+            raise ValueError(f"Metric {name} is already registered")
+
+    def _register(self, metric: M) -> M:
+        self._metrics[metric.name] = metric
+        return metric
@@ -0,0 +1,44 @@
+import hmac
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import PlainTextResponse
+
+from src.core.settings import settings
+
+from . import registry
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+async def verify_metrics_token(authorization: str = Header(None)) -> None:
+    """
+    Require the METRICS_TOKEN bearer token when one is configured.
+
+    Without a token the endpoint is open, so only enable metrics that way
+    behind a network boundary that keeps /metrics internal.
+    """
+    if not settings.METRICS_TOKEN:
+        return
+
+    expected = f"Bearer {settings.METRICS_TOKEN}"
+    if not authorization or not hmac.compare_digest(
+        authorization.encode(), expected.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token"
+        )
+
+
+router = APIRouter(tags=["Metrics"], dependencies=[Depends(verify_metrics_token)])
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="Application metrics",
+    description="Pipeline, Xero and cache metrics in the Prometheus text format",
+    include_in_schema=False,
+)
+async def get_metrics() -> PlainTextResponse:
+    """Render every registered metric for scraping."""
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,98 @@
+"""
+Database query counts per request and background job.
+
+``instrument_queries`` wraps a connected Prisma client's query engine, which
+every model action, raw query and batch goes through, including those from
+transactions sharing the engine. Queries are then added to every
+``QueryStats`` being tracked in the current context, so the request
+middleware and job queue can report how many queries each unit of work sent
+and how long they took.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterator, Tuple
+
+from src.core.metrics import DB_QUERIES, DB_QUERY_SECONDS
+from src.core.settings import settings
+
+if TYPE_CHECKING:
+    from prisma import Prisma
+
+logger = logging.getLogger(__name__)
+
+_tracked: ContextVar[Tuple["QueryStats", ...]] = ContextVar(
+    "tracked_queries", default=()
+)
+
+
+@dataclass
+class QueryStats:
+    """Queries sent while tracking, and their total time in seconds."""
+
+    count: int = 0
+    seconds: float = 0.0
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Count queries sent within the block.
+
+    Tracking follows the current task and any task it creates. Blocks can be
+    nested; queries count towards every enclosing block.
+    """
+    stats = QueryStats()
+    token = _tracked.set((*_tracked.get(), stats))
+    try:
+        yield stats
+    finally:
+        _tracked.reset(token)
+
+
+def instrument_queries(db: "Prisma") -> None:
+    """Count queries from a connected client; safe to call more than once."""
+    engine = db._engine
+    query = engine.query
+    if getattr(query, "counts_queries", False) is True:
+        return
+
+    async def counted(*args: Any, **kwargs: Any) -> Any:
+        tracked = _tracked.get()
+        if not tracked:
+            return await query(*args, **kwargs)
+
+        started = time.perf_counter()
+        try:
+            return await query(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            for stats in tracked:
+                stats.count += 1
+                stats.seconds += elapsed
+
+    counted.counts_queries = True  # type: ignore[attr-defined]
+    engine.query = counted  # type: ignore[method-assign]
+
+
+def record_queries(kind: str, name: str, stats: QueryStats) -> None:
+    """
+    Record the queries of a request or job as metrics.
+
+    Args:
+        kind: "request" or "job"
+        name: Route template or job function name
+        stats: Queries tracked for the unit of work
+    """
+    DB_QUERIES.observe(stats.count, kind=kind, name=name)
+    DB_QUERY_SECONDS.observe(stats.seconds, kind=kind, name=name)
+
+    if settings.QUERY_BUDGET_WARNING and stats.count > settings.QUERY_BUDGET_WARNING:
+        logger.warning(
+            f"{kind.capitalize()} {name} sent {stats.count} database queries "
+            f"({stats.seconds * 1000:.0f}ms), over the budget of "
+            f"{settings.QUERY_BUDGET_WARNING}"
+        )
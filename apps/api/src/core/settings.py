@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -12,6 +14,22 @@ class Settings(BaseSettings):
     SUPABASE_ANON_KEY: str | None = None
     JWT_SECRET: str | None = None
 
+    # Prisma connection pools; unset values keep the Prisma defaults
+    DATABASE_CONNECTION_LIMIT: int | None = None  # Default is 2 * CPUs + 1
+    DATABASE_POOL_TIMEOUT_SECONDS: int | None = None  # Wait for a free connection
+    DATABASE_CONNECT_TIMEOUT_SECONDS: int = 10  # Query engine startup
+    DATABASE_QUERY_TIMEOUT_SECONDS: float | None = None  # Requests to the engine
+
+    # Optional read replica for read-only listings and lookups
+    DATABASE_READ_REPLICA_URL: str | None = None
+    DATABASE_READ_REPLICA_CONNECTION_LIMIT: int | None = None
+
+    # JWT verification caches
+    JWKS_REFRESH_INTERVAL_SECONDS: int = 600
+    JWT_CLAIMS_CACHE_SIZE: int = 1024  # 0 disables the verified claims cache
+    AUTH_ACCESS_CACHE_TTL_SECONDS: int = 30  # Profile/membership cache, 0 disables
+    AUTH_ACCESS_CACHE_SIZE: int = 4096  # Entries per profile/membership map
+
     # Application URLs
     APP_BASE_URL: str = "http://localhost:8001"  # Default for development
     FRONTEND_URL: str | None = None
@@ -32,6 +50,78 @@ class Settings(BaseSettings):
     OPENAI_TIMEOUT: int = 300  # 5 minutes
     OPENAI_MAX_RETRIES: int = 3
 
+    # File storage backend: "supabase", "local" (disk) or "s3" (S3/MinIO)
+    STORAGE_BACKEND: Literal["supabase", "local", "s3"] = "supabase"
+    STORAGE_BUCKET: str = "remittances"
+    STORAGE_DEDUPLICATE: bool = True  # Store identical uploads once per org
+    STORAGE_LOCAL_ROOT: str = "./storage"
+    STORAGE_LOCAL_SIGNING_KEY: str | None = None  # Defaults to JWT_SECRET
+    STORAGE_S3_ENDPOINT_URL: str | None = None
+    STORAGE_S3_REGION: str = "us-east-1"
+    STORAGE_S3_ACCESS_KEY_ID: str | None = None
+    STORAGE_S3_SECRET_ACCESS_KEY: str | None = None
+
+    # Storage API client
+    STORAGE_TIMEOUT_SECONDS: float = 60.0
+    STORAGE_MAX_CONNECTIONS: int = 20
+
+    # Signed file URL cache (re-signed once less than the margin is left)
+    STORAGE_SIGNED_URL_EXPIRY_SECONDS: int = 3600
+    STORAGE_SIGNED_URL_REFRESH_MARGIN_SECONDS: int = 300
+    STORAGE_SIGNED_URL_CACHE_SIZE: int = 2048  # 0 disables the cache
+
+    # Logging ("json" or "text"); sampled per-line events keep this share
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: Literal["json", "text"] = "json"
+    LOG_SAMPLE_RATE: float = 0.01
+
+    # Serve pipeline metrics at /metrics; scrapers send the token as a bearer
+    METRICS_ENABLED: bool = False
+    METRICS_TOKEN: str | None = None
+    EVENT_LOOP_LAG_INTERVAL_SECONDS: float = 0.25  # Lag sampling, 0 disables
+
+    # Debugging: capture stacks of calls that block the event loop this long
+    EVENT_LOOP_BLOCKING_DETECTION: bool = False
+    EVENT_LOOP_BLOCKING_THRESHOLD_SECONDS: float = 0.1
+
+    # Database queries per request and job; warn above the budget (0 disables)
+    QUERY_STATS_HEADERS: bool = False  # X-DB-Query-* response headers, dev only
+    QUERY_BUDGET_WARNING: int = 100
+
+    # Tracing: export spans to an OTLP collector or a JSON-lines file
+    TRACING_EXPORTER: Literal["none", "otlp", "file"] = "none"
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    TRACING_FILE_PATH: str = "traces.jsonl"
+    TRACING_SERVICE_NAME: str = "remitmatch-api"
+
+    # Audit log rows outside transactions are inserted in batches
+    AUDIT_LOG_BATCH_SIZE: int = 100
+    AUDIT_LOG_FLUSH_INTERVAL_SECONDS: float = 1.0
+    AUDIT_LOG_MAX_BUFFERED: int = 10000  # Further rows go to the fallback file
+    AUDIT_LOG_FALLBACK_PATH: str = "audit-log-fallback.jsonl"  # Unwritten at shutdown
+    AUDIT_LOG_DEAD_LETTER_PATH: str = "audit-log-dead-letter.jsonl"  # Rejected rows
+
+    # Monthly audit log partitions: created ahead, archived after retention
+    AUDIT_LOG_PARTITIONS_AHEAD: int = 3
+    AUDIT_LOG_RETENTION_MONTHS: int = 24
+    AUDIT_LOG_ARCHIVE_BUCKET: str = "audit-archive"
+
+    # Background job queue
+    JOB_QUEUE_WORKERS: int = 4
+
+    # Bulk remittance uploads
+    BULK_UPLOAD_MAX_FILES: int = 500
+    BULK_UPLOAD_CONCURRENCY: int = 8  # Files streamed to storage at once
+
+    # Listing totals cache (seconds, 0 disables caching)
+    LIST_COUNT_CACHE_TTL_SECONDS: int = 30
+
+    # Text search (maximum ranked matches considered per query)
+    SEARCH_MAX_RESULTS: int = 500
+
+    # Integration service cache (seconds, 0 disables caching)
+    INTEGRATION_SERVICE_CACHE_TTL_SECONDS: int = 60
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
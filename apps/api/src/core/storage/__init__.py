@@ -0,0 +1,84 @@
+"""File storage for remittance documents.
+
+A single ``StorageBackend`` interface with Supabase, local-disk and
+S3-compatible implementations. ``STORAGE_BACKEND`` selects the one behind the
+shared ``storage_service`` instance.
+"""
+
+from src.core.settings import Settings, settings
+
+from .base import (
+    StorageBackend,
+    StorageContent,
+    StorageError,
+    StorageObjectNotFound,
+    StoredObject,
+    content_address,
+)
+from .local import LocalStorage
+from .s3 import S3Storage
+from .signed_urls import SignedUrlCache
+from .supabase import SupabaseStorage
+
+LOCAL_FILES_PATH = "/api/v1/storage/files"
+
+
+def create_storage_backend(config: Settings = settings) -> StorageBackend:
+    """
+    Create the storage backend selected by STORAGE_BACKEND.
+
+    Args:
+        config: Settings to read the backend configuration from
+
+    Returns:
+        The configured storage backend
+
+    Raises:
+        StorageError: If the backend is unknown
+    """
+    if config.STORAGE_BACKEND == "supabase":
+        return SupabaseStorage(
+            config.SUPABASE_URL or "",
+            config.SUPABASE_SERVICE_ROLE_KEY or "",
+            bucket_name=config.STORAGE_BUCKET,
+        )
+
+    if config.STORAGE_BACKEND == "local":
+        return LocalStorage(
+            config.STORAGE_LOCAL_ROOT,
+            public_url=f"{config.APP_BASE_URL.rstrip('/')}{LOCAL_FILES_PATH}",
+            signing_key=config.STORAGE_LOCAL_SIGNING_KEY or config.JWT_SECRET,
+        )
+
+    if config.STORAGE_BACKEND == "s3":
+        return S3Storage(
+            config.STORAGE_S3_ENDPOINT_URL or "",
+            config.STORAGE_BUCKET,
+            config.STORAGE_S3_ACCESS_KEY_ID or "",
+            config.STORAGE_S3_SECRET_ACCESS_KEY or "",
+            region=config.STORAGE_S3_REGION,
+        )
+
+    raise StorageError(f"Unsupported storage backend: {config.STORAGE_BACKEND}")
+
+
+# Global storage instances; HTTP clients are created on first use
+storage_service = create_storage_backend()
+signed_url_cache = SignedUrlCache(storage_service)
+
+__all__ = [
+    "LOCAL_FILES_PATH",
+    "LocalStorage",
+    "S3Storage",
+    "SignedUrlCache",
+    "StorageBackend",
+    "StorageContent",
+    "StorageError",
+    "StorageObjectNotFound",
+    "StoredObject",
+    "SupabaseStorage",
+    "content_address",
+    "create_storage_backend",
+    "signed_url_cache",
+    "storage_service",
+]
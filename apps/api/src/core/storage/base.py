@@ -0,0 +1,287 @@
+import asyncio
+import hashlib
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import AsyncIterable, AsyncIterator, Dict, List, Optional, Union
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+StorageContent = Union[bytes, AsyncIterable[bytes]]
+
+
+class StorageError(Exception):
+    """Raised when a storage operation fails."""
+
+
+class StorageObjectNotFound(StorageError):
+    """Raised when a stored object does not exist."""
+
+
+@dataclass
+class StoredObject:
+    """Result of a content-addressed upload."""
+
+    path: str
+    sha256: str
+    size: int
+    created: bool
+
+
+def content_address(prefix: str, sha256: str) -> str:
+    """Object path for content with the given SHA-256 digest."""
+    return f"{prefix}/sha256/{sha256[:2]}/{sha256}"
+
+
+class StorageBackend(ABC):
+    """
+    Interface for the file storage used by remittances.
+
+    Backends store objects under bucket-relative paths. Writes accept bytes or
+    an async byte stream and reads can be streamed in chunks, optionally
+    limited to a byte range.
+    """
+
+    @abstractmethod
+    async def upload(
+        self,
+        path: str,
+        content: StorageContent,
+        content_type: str = "application/pdf",
+        upsert: bool = False,
+    ) -> str:
+        """
+        Upload a file.
+
+        Args:
+            path: Object path within the bucket
+            content: File content, or an async iterator of chunks to stream
+            content_type: MIME type of the file
+            upsert: Whether to overwrite an existing object
+
+        Returns:
+            The stored object path
+
+        Raises:
+            StorageError: If the upload fails
+        """
+
+    @abstractmethod
+    def stream(
+        self,
+        path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        start: int = 0,
+        length: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream a file in chunks.
+
+        Args:
+            path: Object path within the bucket
+            chunk_size: Maximum chunk size in bytes
+            start: Offset of the first byte to read
+            length: Number of bytes to read, or None to read to the end
+
+        Yields:
+            Chunks of file content
+
+        Raises:
+            StorageObjectNotFound: If the object does not exist
+            StorageError: If the download fails
+        """
+
+    @abstractmethod
+    async def get_size(self, path: str) -> int:
+        """
+        Get the size of a stored file.
+
+        Args:
+            path: Object path within the bucket
+
+        Returns:
+            Size in bytes
+
+        Raises:
+            StorageObjectNotFound: If the object does not exist
+            StorageError: If the lookup fails
+        """
+
+    @abstractmethod
+    async def remove(self, paths: List[str]) -> None:
+        """
+        Delete files. Missing files are ignored.
+
+        Args:
+            paths: Object paths within the bucket
+
+        Raises:
+            StorageError: If the deletion fails
+        """
+
+    @abstractmethod
+    async def move(self, source: str, destination: str) -> None:
+        """
+        Move a file to a new path.
+
+        Args:
+            source: Current object path within the bucket
+            destination: New object path within the bucket
+
+        Raises:
+            StorageObjectNotFound: If the source does not exist
+            StorageError: If the move fails
+        """
+
+    @abstractmethod
+    async def create_signed_url(self, path: str, expires_in: int = 3600) -> str:
+        """
+        Create a temporary URL for downloading a file.
+
+        Args:
+            path: Object path within the bucket
+            expires_in: URL lifetime in seconds
+
+        Returns:
+            Absolute signed URL
+
+        Raises:
+            StorageError: If signing fails
+        """
+
+    async def create_signed_urls(
+        self, paths: List[str], expires_in: int = 3600
+    ) -> Dict[str, str]:
+        """
+        Create temporary URLs for several files.
+
+        Args:
+            paths: Object paths within the bucket
+            expires_in: URL lifetime in seconds
+
+        Returns:
+            Absolute signed URLs keyed by path; paths that could not be signed
+            are left out
+
+        Raises:
+            StorageError: If signing fails
+        """
+        urls = await asyncio.gather(
+            *(self.create_signed_url(path, expires_in) for path in paths)
+        )
+        return dict(zip(paths, urls))
+
+    async def download(self, path: str) -> bytes:
+        """
+        Download a whole file.
+
+        Args:
+            path: Object path within the bucket
+
+        Returns:
+            The file content
+
+        Raises:
+            StorageObjectNotFound: If the object does not exist
+            StorageError: If the download fails
+        """
+        return b"".join([chunk async for chunk in self.stream(path)])
+
+    async def read_range(self, path: str, start: int, length: int) -> bytes:
+        """
+        Read part of a file.
+
+        Args:
+            path: Object path within the bucket
+            start: Offset of the first byte to read
+            length: Number of bytes to read
+
+        Returns:
+            Up to ``length`` bytes starting at ``start``
+
+        Raises:
+            StorageObjectNotFound: If the object does not exist
+            StorageError: If the download fails
+        """
+        return b"".join(
+            [chunk async for chunk in self.stream(path, start=start, length=length)]
+        )
+
+    async def exists(self, path: str) -> bool:
+        """Check whether a file exists."""
+        try:
+            await self.get_size(path)
+        except StorageObjectNotFound:
+            return False
+        return True
+
+    async def upload_deduplicated(
+        self,
+        prefix: str,
+        content: StorageContent,
+        content_type: str = "application/pdf",
+    ) -> StoredObject:
+        """
+        Store content under a path derived from its SHA-256 digest.
+
+        Identical content uploaded under the same prefix is stored once; later
+        uploads return the existing object with ``created`` set to False.
+        Streamed content is hashed as it is written to a staging path, then
+        moved to its content address or discarded if that already exists.
+
+        Args:
+            prefix: Path prefix that scopes deduplication, e.g. the org ID
+            content: File content, or an async iterator of chunks to stream
+            content_type: MIME type of the file
+
+        Returns:
+            The stored object
+
+        Raises:
+            StorageError: If the upload fails
+        """
+        if isinstance(content, bytes):
+            sha256 = hashlib.sha256(content).hexdigest()
+            path = content_address(prefix, sha256)
+            if await self.exists(path):
+                return StoredObject(path, sha256, len(content), created=False)
+            await self.upload(path, content, content_type, upsert=True)
+            return StoredObject(path, sha256, len(content), created=True)
+
+        hasher = hashlib.sha256()
+        size = 0
+
+        async def hashed() -> AsyncIterator[bytes]:
+            nonlocal size
+            async for chunk in content:
+                hasher.update(chunk)
+                size += len(chunk)
+                yield chunk
+
+        staging_path = f"{prefix}/staging/{uuid.uuid4()}"
+        try:
+            await self.upload(staging_path, hashed(), content_type)
+            sha256 = hasher.hexdigest()
+            path = content_address(prefix, sha256)
+            if await self.exists(path):
+                await self.remove([staging_path])
+                return StoredObject(path, sha256, size, created=False)
+            try:
+                await self.move(staging_path, path)
+            except StorageError:
+                # A concurrent upload of the same content may have won the race
+                if not await self.exists(path):
+                    raise
+                await self.remove([staging_path])
+                return StoredObject(path, sha256, size, created=False)
+        except BaseException:
+            try:
+                await self.remove([staging_path])
+            except StorageError:
+                pass  # Keep the original error; staging objects are disposable
+            raise
+
+        return StoredObject(path, sha256, size, created=True)
+
+    async def aclose(self) -> None:
+        """Release any resources held by the backend."""
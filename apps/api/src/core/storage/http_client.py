@@ -0,0 +1,130 @@
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+from src.core.settings import settings
+
+from .base import StorageBackend, StorageContent, StorageError, StorageObjectNotFound
+
+
+class HttpStorageBackend(StorageBackend):
+    """
+    Base for backends that talk to a storage REST API.
+
+    Requests share a pooled ``httpx.AsyncClient`` created on first use. Pass
+    ``transport`` to serve requests from a local stand-in instead.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = (
+            timeout if timeout is not None else settings.STORAGE_TIMEOUT_SECONDS
+        )
+        self.max_connections = (
+            max_connections
+            if max_connections is not None
+            else settings.STORAGE_MAX_CONNECTIONS
+        )
+        self._headers = headers or {}
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, created on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._headers,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                transport=self._transport,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        content: Optional[StorageContent] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        try:
+            return await self.client.request(
+                method, url, content=content, json=json, headers=headers
+            )
+        except httpx.HTTPError as e:
+            raise StorageError(f"Storage {method} {url} failed: {e}") from e
+
+    async def _stream_get(
+        self,
+        url: str,
+        action: str,
+        chunk_size: int,
+        start: int = 0,
+        length: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream a GET response body, honouring a byte range."""
+        if length == 0:
+            return
+        request_headers = {**(headers or {}), **self._range_header(start, length)}
+        try:
+            async with self.client.stream(
+                "GET", url, headers=request_headers
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                self._raise_for_status(response, action)
+
+                # Servers may ignore the Range header and send the whole body
+                skip = start if response.status_code != 206 else 0
+                remaining = length
+                async for chunk in response.aiter_bytes(chunk_size):
+                    if skip:
+                        dropped = min(skip, len(chunk))
+                        chunk, skip = chunk[dropped:], skip - dropped
+                    if remaining is not None:
+                        chunk = chunk[:remaining]
+                        remaining -= len(chunk)
+                    if chunk:
+                        yield chunk
+                    if remaining == 0:
+                        break
+        except httpx.HTTPError as e:
+            raise StorageError(f"Storage {action} failed: {e}") from e
+
+    def _is_not_found(self, response: httpx.Response) -> bool:
+        return response.status_code == 404
+
+    def _raise_for_status(self, response: httpx.Response, action: str) -> None:
+        if not response.is_error:
+            return
+        message = f"Storage {action} failed ({response.status_code}): {response.text}"
+        if self._is_not_found(response):
+            raise StorageObjectNotFound(message)
+        raise StorageError(message)
+
+    @staticmethod
+    def _range_header(start: int, length: Optional[int]) -> Dict[str, str]:
+        if start == 0 and length is None:
+            return {}
+        end = "" if length is None else str(start + length - 1)
+        return {"Range": f"bytes={start}-{end}"}
@@ -0,0 +1,153 @@
+import asyncio
+import hashlib
+import hmac
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import IO, AsyncIterator, List, Optional
+from urllib.parse import quote, urlencode
+
+from .base import (
+    DEFAULT_CHUNK_SIZE,
+    StorageBackend,
+    StorageContent,
+    StorageError,
+    StorageObjectNotFound,
+)
+
+
+class LocalStorage(StorageBackend):
+    """
+    Local filesystem storage backend.
+
+    Objects are files under ``root``. Blocking file I/O runs in worker threads
+    and writes go through a temporary file that is renamed into place, so
+    readers never see a partial file. Signed URLs point at the API's file
+    route and carry an HMAC signature over the path and expiry time.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        public_url: str,
+        signing_key: Optional[str] = None,
+    ) -> None:
+        self.root = Path(root).resolve()
+        self.public_url = public_url.rstrip("/")
+        self.signing_key = signing_key
+
+    async def upload(
+        self,
+        path: str,
+        content: StorageContent,
+        content_type: str = "application/pdf",
+        upsert: bool = False,
+    ) -> str:
+        target = self._resolve(path)
+        if not upsert and await asyncio.to_thread(target.exists):
+            raise StorageError(f"Storage upload {path} failed: object exists")
+
+        await asyncio.to_thread(target.parent.mkdir, parents=True, exist_ok=True)
+        handle = await asyncio.to_thread(
+            tempfile.NamedTemporaryFile,
+            dir=target.parent,
+            prefix=f".{target.name}.",
+            delete=False,
+        )
+        try:
+            if isinstance(content, bytes):
+                await asyncio.to_thread(handle.write, content)
+            else:
+                async for chunk in content:
+                    await asyncio.to_thread(handle.write, chunk)
+            await asyncio.to_thread(handle.close)
+            await asyncio.to_thread(os.replace, handle.name, target)
+        except BaseException:
+            await asyncio.to_thread(self._discard, handle)
+            raise
+        return path
+
+    async def stream(
+        self,
+        path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        start: int = 0,
+        length: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        target = self._resolve(path)
+        try:
+            handle = await asyncio.to_thread(target.open, "rb")
+        except FileNotFoundError as e:
+            raise StorageObjectNotFound(f"Storage object {path} not found") from e
+        except OSError as e:
+            raise StorageError(f"Storage download {path} failed: {e}") from e
+
+        try:
+            if start:
+                await asyncio.to_thread(handle.seek, start)
+            remaining = length
+            while remaining is None or remaining > 0:
+                size = chunk_size if remaining is None else min(chunk_size, remaining)
+                chunk = await asyncio.to_thread(handle.read, size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            await asyncio.to_thread(handle.close)
+
+    async def get_size(self, path: str) -> int:
+        target = self._resolve(path)
+        try:
+            stat = await asyncio.to_thread(target.stat)
+        except FileNotFoundError as e:
+            raise StorageObjectNotFound(f"Storage object {path} not found") from e
+        return stat.st_size
+
+    async def remove(self, paths: List[str]) -> None:
+        for path in paths:
+            await asyncio.to_thread(self._resolve(path).unlink, missing_ok=True)
+
+    async def move(self, source: str, destination: str) -> None:
+        source_path, target = self._resolve(source), self._resolve(destination)
+        await asyncio.to_thread(target.parent.mkdir, parents=True, exist_ok=True)
+        try:
+            await asyncio.to_thread(os.replace, source_path, target)
+        except FileNotFoundError as e:
+            raise StorageObjectNotFound(f"Storage object {source} not found") from e
+
+    async def create_signed_url(self, path: str, expires_in: int = 3600) -> str:
+        expires = int(time.time()) + expires_in
+        query = urlencode({"expires": expires, "signature": self.sign(path, expires)})
+        return f"{self.public_url}/{quote(path)}?{query}"
+
+    def sign(self, path: str, expires: int) -> str:
+        """
+        Sign an object path and expiry time.
+
+        Raises:
+            StorageError: If no signing key is configured
+        """
+        if not self.signing_key:
+            raise StorageError("Local storage has no signing key configured")
+        message = f"{path}:{expires}".encode()
+        return hmac.new(self.signing_key.encode(), message, hashlib.sha256).hexdigest()
+
+    def verify_signature(self, path: str, expires: int, signature: str) -> bool:
+        """Check a signed URL's signature and that it has not expired."""
+        if expires < time.time() or not self.signing_key:
+            return False
+        return hmac.compare_digest(self.sign(path, expires), signature)
+
+    def _resolve(self, path: str) -> Path:
+        target = (self.root / path).resolve()
+        if not target.is_relative_to(self.root) or target == self.root:
+            raise StorageError(f"Invalid storage path: {path}")
+        return target
+
+    @staticmethod
+    def _discard(handle: IO[bytes]) -> None:
+        handle.close()
+        Path(handle.name).unlink(missing_ok=True)
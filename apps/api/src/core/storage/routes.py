@@ -0,0 +1,100 @@
+import re
+from typing import Optional, Tuple
+
+from fastapi import APIRouter, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from . import storage_service
+from .base import StorageObjectNotFound
+from .local import LocalStorage
+
+router = APIRouter(prefix="/storage", tags=["Storage"])
+
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range Range header.
+
+    Args:
+        header: Range header value, e.g. "bytes=0-1023" or "bytes=-500"
+        size: Size of the file in bytes
+
+    Returns:
+        Inclusive (start, end) offsets, or None if the header is not a
+        satisfiable single byte range
+    """
+    match = RANGE_PATTERN.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+
+    first, last = match.groups()
+    if not first:
+        # Suffix range: the last N bytes
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+
+    if start > end or start >= size:
+        return None
+    return start, end
+
+
+@router.get(
+    "/files/{path:path}",
+    summary="Download a locally stored file",
+    description="Serve a file from local disk storage through a signed URL",
+)
+async def get_local_file(
+    path: str,
+    expires: int = Query(..., description="URL expiry as a Unix timestamp"),
+    signature: str = Query(..., description="URL signature"),
+    range_header: Optional[str] = Header(None, alias="Range"),
+) -> StreamingResponse:
+    """
+    Stream a file from the local storage backend.
+
+    Only available when STORAGE_BACKEND is "local". The URL must carry a valid,
+    unexpired signature from LocalStorage.create_signed_url. Single byte
+    ranges are supported.
+    """
+    if not isinstance(storage_service, LocalStorage):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+
+    if not storage_service.verify_signature(path, expires, signature):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Invalid or expired URL"
+        )
+
+    try:
+        size = await storage_service.get_size(path)
+    except StorageObjectNotFound:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="File not found"
+        )
+
+    headers = {"Accept-Ranges": "bytes"}
+    if range_header:
+        byte_range = parse_range(range_header, size)
+        if byte_range is None:
+            raise HTTPException(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                detail="Requested range not satisfiable",
+                headers={"Content-Range": f"bytes */{size}"},
+            )
+        start, end = byte_range
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        headers["Content-Length"] = str(end - start + 1)
+        return StreamingResponse(
+            storage_service.stream(path, start=start, length=end - start + 1),
+            status_code=status.HTTP_206_PARTIAL_CONTENT,
+            media_type="application/pdf",
+            headers=headers,
+        )
+
+    headers["Content-Length"] = str(size)
+    return StreamingResponse(
+        storage_service.stream(path), media_type="application/pdf", headers=headers
+    )
@@ -0,0 +1,132 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from src.core.metrics import record_cache_lookup
+from src.core.settings import settings
+
+from .base import StorageBackend
+
+
+@dataclass
+class _SignedUrl:
+    url: str
+    expires_at: float
+
+
+class SignedUrlCache:
+    """
+    Per-path cache of signed download URLs.
+
+    A cached URL is handed out while it has more than ``refresh_margin``
+    seconds of lifetime left, after which the path is re-signed. The cache is
+    bounded and evicts the least recently used paths; a size of 0 disables it.
+    """
+
+    def __init__(
+        self,
+        storage: StorageBackend,
+        expires_in: Optional[int] = None,
+        refresh_margin: Optional[int] = None,
+        max_size: Optional[int] = None,
+    ) -> None:
+        self.storage = storage
+        self.expires_in = (
+            expires_in
+            if expires_in is not None
+            else settings.STORAGE_SIGNED_URL_EXPIRY_SECONDS
+        )
+        self.refresh_margin = (
+            refresh_margin
+            if refresh_margin is not None
+            else settings.STORAGE_SIGNED_URL_REFRESH_MARGIN_SECONDS
+        )
+        self.max_size = (
+            max_size if max_size is not None else settings.STORAGE_SIGNED_URL_CACHE_SIZE
+        )
+        self._urls: OrderedDict[str, _SignedUrl] = OrderedDict()
+
+    async def get(self, path: str) -> Tuple[str, int]:
+        """
+        Get a signed URL for a file, signing it if needed.
+
+        Args:
+            path: Object path within the bucket
+
+        Returns:
+            The signed URL and its remaining lifetime in seconds
+
+        Raises:
+            StorageError: If signing fails
+        """
+        cached = self._lookup(path)
+        if cached is not None:
+            return cached
+
+        signed_at = time.monotonic()
+        url = await self.storage.create_signed_url(path, expires_in=self.expires_in)
+        self._store(path, url, signed_at)
+        return url, self.expires_in
+
+    async def get_many(self, paths: List[str]) -> Dict[str, Tuple[str, int]]:
+        """
+        Get signed URLs for several files, signing the missing ones together.
+
+        Args:
+            paths: Object paths within the bucket
+
+        Returns:
+            Signed URLs and their remaining lifetime keyed by path; paths that
+            could not be signed are left out
+
+        Raises:
+            StorageError: If the signing request fails
+        """
+        results: Dict[str, Tuple[str, int]] = {}
+        missing: List[str] = []
+        for path in dict.fromkeys(paths):
+            cached = self._lookup(path)
+            if cached is not None:
+                results[path] = cached
+            else:
+                missing.append(path)
+
+        if missing:
+            signed_at = time.monotonic()
+            signed = await self.storage.create_signed_urls(
+                missing, expires_in=self.expires_in
+            )
+            for path, url in signed.items():
+                self._store(path, url, signed_at)
+                results[path] = (url, self.expires_in)
+
+        return results
+
+    def invalidate(self, path: str) -> None:
+        """Drop the cached URL for a path."""
+        self._urls.pop(path, None)
+
+    def clear(self) -> None:
+        """Drop every cached URL."""
+        self._urls.clear()
+
+    def _lookup(self, path: str) -> Optional[Tuple[str, int]]:
+        entry = self._urls.get(path)
+        remaining = entry.expires_at - time.monotonic() if entry else 0.0
+        if entry is None or remaining <= self.refresh_margin:
+            self._urls.pop(path, None)
+            record_cache_lookup("signed_url", hit=False)
+            return None
+
+        record_cache_lookup("signed_url", hit=True)
+        self._urls.move_to_end(path)
+        return entry.url, int(remaining)
+
+    def _store(self, path: str, url: str, signed_at: float) -> None:
+        if self.max_size <= 0:
+            return
+        self._urls[path] = _SignedUrl(url, signed_at + self.expires_in)
+        self._urls.move_to_end(path)
+        while len(self._urls) > self.max_size:
+            self._urls.popitem(last=False)
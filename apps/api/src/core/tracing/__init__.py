@@ -0,0 +1,146 @@
+"""
+OpenTelemetry tracing for the remittance pipeline.
+
+Spans are created through the OpenTelemetry API and cost almost nothing until
+``configure_tracing`` installs an SDK tracer provider, which only happens when
+TRACING_EXPORTER is set. The active span lives in a context variable, so work
+started with ``asyncio.create_task``, FastAPI background tasks and the job
+queue continues the trace it was started from.
+
+Every span is tagged with the correlation fields bound by ``log_context``
+(request, remittance and organization IDs), so the spans of one remittance
+can be found across the upload request and its background processing.
+"""
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Mapping, Optional
+
+from opentelemetry import propagate, trace
+from opentelemetry.trace import Span, SpanKind
+
+from src.core.logs import get_log_context
+from src.core.settings import settings
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SpanExporter
+
+TRACER_NAME = "remitmatch"
+
+tracer = trace.get_tracer(TRACER_NAME)
+_provider: Optional["TracerProvider"] = None
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """
+    Run the block in a new span, a child of the current one.
+
+    The span is tagged with the current log context and ``attributes``;
+    None values are ignored. Exceptions raised in the block are recorded on
+    the span and mark it as failed.
+
+    Args:
+        name: Span name, e.g. "xero.request"
+        **attributes: Extra span attributes
+    """
+    with tracer.start_as_current_span(name, attributes=_tags(attributes)) as current:
+        yield current
+
+
+@contextmanager
+def server_span(
+    name: str, headers: Mapping[str, str], **attributes: Any
+) -> Iterator[Span]:
+    """
+    Run the block in a span for an incoming request.
+
+    Continues the caller's trace when the request carries a W3C
+    ``traceparent`` header, otherwise starts a new one.
+
+    Args:
+        name: Span name, e.g. "POST /api/v1/remittances/{org_id}"
+        headers: Request headers
+        **attributes: Extra span attributes
+    """
+    with tracer.start_as_current_span(
+        name,
+        context=propagate.extract(headers),
+        kind=SpanKind.SERVER,
+        attributes=_tags(attributes),
+    ) as current:
+        yield current
+
+
+def _tags(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    tags: Dict[str, Any] = {**get_log_context()}
+    tags.update({key: value for key, value in attributes.items() if value is not None})
+    return tags
+
+
+def _configured_exporter() -> "SpanExporter":
+    if settings.TRACING_EXPORTER == "file":
+        from .exporters import FileSpanExporter
+
+        return FileSpanExporter(settings.TRACING_FILE_PATH)
+
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+        OTLPSpanExporter,
+    )
+
+    return OTLPSpanExporter(endpoint=settings.TRACING_OTLP_ENDPOINT)
+
+
+def configure_tracing(
+    exporter: Optional["SpanExporter"] = None, batch: bool = True
+) -> None:
+    """
+    Start recording spans and exporting them to TRACING_EXPORTER.
+
+    Does nothing when TRACING_EXPORTER is "none" and no exporter is given.
+    Spans are exported from a background thread, so exporting never blocks
+    the event loop.
+
+    Args:
+        exporter: Exporter to use instead of the configured one
+        batch: Whether to export in batches; tests pass False to export each
+            span as it ends
+    """
+    global tracer, _provider
+    if exporter is None and settings.TRACING_EXPORTER == "none":
+        return
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
+
+    shutdown_tracing()
+    exporter = exporter or _configured_exporter()
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": settings.TRACING_SERVICE_NAME})
+    )
+    provider.add_span_processor(
+        BatchSpanProcessor(exporter) if batch else SimpleSpanProcessor(exporter)
+    )
+
+    # The global provider can only be set once per process, so the module
+    # tracer is rebound instead, letting tests and restarts reconfigure it
+    _provider = provider
+    tracer = provider.get_tracer(TRACER_NAME)
+
+
+def shutdown_tracing() -> None:
+    """Export any buffered spans and stop recording."""
+    global tracer, _provider
+    if _provider is not None:
+        _provider.shutdown()
+        _provider = None
+        tracer = trace.get_tracer(TRACER_NAME)
+
+
+__all__ = [
+    "configure_tracing",
+    "server_span",
+    "shutdown_tracing",
+    "span",
+]
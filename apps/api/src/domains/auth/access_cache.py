@@ -0,0 +1,131 @@
+# apps/api/src/domains/auth/access_cache.py
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+from prisma.models import OrganizationMember, Profile
+
+from prisma import Prisma
+from src.core.metrics import record_cache_lookup
+from src.core.settings import settings
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+
+
+@dataclass
+class _CacheEntry(Generic[T]):
+    """Cached value bound to the database client it was loaded with."""
+
+    db: Prisma
+    value: T
+    expires_at: float
+
+
+class AccessCache:
+    """
+    Short-lived cache of authenticated profiles and active memberships.
+
+    Profiles are keyed by auth ID and memberships by (profile ID, organization
+    ID), so a warm authorization check needs no queries. Only successful
+    lookups are cached; denials always go back to the database. Entries must be
+    invalidated when a profile or membership changes.
+
+    Each map is a bounded LRU of ``max_size`` entries, and expired entries are
+    dropped when looked up, so memory does not grow with every user and
+    organization the process has seen.
+    """
+
+    def __init__(
+        self, ttl_seconds: Optional[float] = None, max_size: Optional[int] = None
+    ):
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else settings.AUTH_ACCESS_CACHE_TTL_SECONDS
+        )
+        self.max_size = (
+            max_size if max_size is not None else settings.AUTH_ACCESS_CACHE_SIZE
+        )
+        self._profiles: OrderedDict[str, _CacheEntry[Profile]] = OrderedDict()
+        self._memberships: OrderedDict[
+            Tuple[str, str], _CacheEntry[OrganizationMember]
+        ] = OrderedDict()
+
+    def get_profile(self, db: Prisma, auth_id: str) -> Optional[Profile]:
+        """Get the cached profile linked to an auth ID."""
+        return self._lookup(self._profiles, auth_id, db, "auth_profile")
+
+    def set_profile(self, db: Prisma, auth_id: str, profile: Profile) -> None:
+        """Cache the profile linked to an auth ID."""
+        self._store(self._profiles, auth_id, _CacheEntry(db, profile, self._expiry()))
+
+    def get_membership(
+        self, db: Prisma, profile_id: str, organization_id: str
+    ) -> Optional[OrganizationMember]:
+        """Get a cached active membership."""
+        return self._lookup(
+            self._memberships, (profile_id, organization_id), db, "auth_membership"
+        )
+
+    def set_membership(
+        self,
+        db: Prisma,
+        profile_id: str,
+        organization_id: str,
+        membership: OrganizationMember,
+    ) -> None:
+        """Cache an active membership."""
+        self._store(
+            self._memberships,
+            (profile_id, organization_id),
+            _CacheEntry(db, membership, self._expiry()),
+        )
+
+    def invalidate_profile(self, profile_id: str) -> None:
+        """Drop the cached profile for a profile ID."""
+        for auth_id, entry in list(self._profiles.items()):
+            if entry.value.id == profile_id:
+                self._profiles.pop(auth_id, None)
+
+    def invalidate_membership(self, profile_id: str, organization_id: str) -> None:
+        """Drop a cached membership."""
+        self._memberships.pop((profile_id, organization_id), None)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._profiles.clear()
+        self._memberships.clear()
+
+    def _expiry(self) -> float:
+        return time.monotonic() + self.ttl_seconds
+
+    @staticmethod
+    def _lookup(
+        entries: "OrderedDict[K, _CacheEntry[T]]", key: K, db: Prisma, cache: str
+    ) -> Optional[T]:
+        entry = entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            entries.pop(key, None)
+            entry = None
+
+        fresh = entry is not None and entry.db is db
+        record_cache_lookup(cache, fresh)
+        if entry is None or not fresh:
+            return None
+        entries.move_to_end(key)
+        return entry.value
+
+    def _store(
+        self, entries: "OrderedDict[K, _CacheEntry[T]]", key: K, entry: _CacheEntry[T]
+    ) -> None:
+        if self.ttl_seconds <= 0 or self.max_size <= 0:
+            return
+        entries[key] = entry
+        entries.move_to_end(key)
+        while len(entries) > self.max_size:
+            entries.popitem(last=False)
+
+
+access_cache = AccessCache()
@@ -1,7 +1,7 @@
 # apps/api/src/domains/auth/dependencies.py
 import jwt
 from fastapi import Depends, Header, HTTPException, status
-from jwt import PyJWKClient
+from prisma.enums import MemberStatus
 from prisma.models import Profile
 
 from prisma import Prisma
@@ -9,18 +9,44 @@ from src.core.database import get_db
 from src.core.settings import settings
 from src.shared.exceptions import UnlinkedProfileError
 
+from .access_cache import access_cache
+from .jwks import JwksKeyCache, TokenClaimsCache
 from .types import SupabaseJwtPayload
 
 JWKS_URL = f"{settings.SUPABASE_URL}/auth/v1/jwks" if settings.SUPABASE_URL else None
 
-_jwks_client = PyJWKClient(JWKS_URL) if JWKS_URL else None
+_jwks_cache = (
+    JwksKeyCache(JWKS_URL, refresh_interval=settings.JWKS_REFRESH_INTERVAL_SECONDS)
+    if JWKS_URL
+    else None
+)
+_claims_cache = TokenClaimsCache(max_size=settings.JWT_CLAIMS_CACHE_SIZE)
 
 
-def decode_supabase_jwt(token: str) -> SupabaseJwtPayload:
+async def start_jwks_refresh() -> None:
+    """Load the Supabase signing keys and keep them refreshed in the background."""
+    if _jwks_cache:
+        await _jwks_cache.start()
+
+
+async def stop_jwks_refresh() -> None:
+    """Stop the background signing key refresh."""
+    if _jwks_cache:
+        await _jwks_cache.stop()
+
+
+async def decode_supabase_jwt(token: str) -> SupabaseJwtPayload:
     """
     Verifies JWT token. Uses JWT_SECRET for development mode if available,
     otherwise falls back to Supabase JWKS for production.
+
+    Verified claims are cached until the token's ``exp``, so repeat requests
+    with the same token skip signature verification.
     """
+    cached_payload = _claims_cache.get(token)
+    if cached_payload is not None:
+        return cached_payload
+
     # Development mode: prefer JWT_SECRET if available
     if settings.JWT_SECRET:
         try:
@@ -30,7 +56,9 @@ def decode_supabase_jwt(token: str) -> SupabaseJwtPayload:
                 algorithms=["HS256"],
                 options={"verify_aud": False},
             )
-            return SupabaseJwtPayload(**dict(payload))
+            jwt_payload = SupabaseJwtPayload(**dict(payload))
+            _claims_cache.set(token, jwt_payload)
+            return jwt_payload
         except jwt.PyJWTError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -38,13 +66,17 @@ def decode_supabase_jwt(token: str) -> SupabaseJwtPayload:
             )
 
     # Production mode: use Supabase JWKS
-    if not _jwks_client:
+    if not _jwks_cache:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Supabase not configured",
         )
     try:
-        signing_key = _jwks_client.get_signing_key_from_jwt(token).key
+        kid = jwt.get_unverified_header(token).get("kid")
+        if not kid:
+            raise jwt.InvalidTokenError("Token header has no kid")
+
+        signing_key = await _jwks_cache.get_signing_key(kid)
         payload = jwt.decode(
             token,
             signing_key,
@@ -52,7 +84,9 @@ def decode_supabase_jwt(token: str) -> SupabaseJwtPayload:
             options={"verify_aud": False},
         )
         # Create typed Pydantic model for JWT payload
-        return SupabaseJwtPayload(**dict(payload))
+        jwt_payload = SupabaseJwtPayload(**dict(payload))
+        _claims_cache.set(token, jwt_payload)
+        return jwt_payload
     except jwt.PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -60,7 +94,7 @@ def decode_supabase_jwt(token: str) -> SupabaseJwtPayload:
         )
 
 
-def get_auth_id(authorization: str = Header(None)) -> str:
+async def get_auth_id(authorization: str = Header(None)) -> str:
     """
     Extracts and validates the Supabase JWT from the Authorization header.
     Returns the user's UUID (from the `sub` claim).
@@ -71,7 +105,7 @@ def get_auth_id(authorization: str = Header(None)) -> str:
         )
 
     token = authorization.split(" ")[1]
-    payload = decode_supabase_jwt(token)
+    payload = await decode_supabase_jwt(token)
     return payload.sub or ""
 
 
@@ -80,14 +114,38 @@ async def get_current_profile(
 ) -> Profile:
     """
     Finds the linked profile for the authenticated user.
+
+    The profile's active memberships are loaded in the same query and cached
+    with it, so the organization access check that usually follows needs no
+    further queries.
     """
+    cached_profile = access_cache.get_profile(db, auth_id)
+    if cached_profile:
+        return cached_profile
+
     # Use direct dictionary for complex Prisma types to avoid TypedDict conflicts
     where_dict = {"authId": auth_id}
-    include_dict = {"profile": True}
+    include_dict = {
+        "profile": {
+            "include": {"memberships": {"where": {"status": MemberStatus.active}}}
+        }
+    }
     link = await db.authlink.find_first(
         where=where_dict,  # type: ignore[arg-type]
         include=include_dict,  # type: ignore[arg-type]
     )
     if not link or not link.profile:
         raise UnlinkedProfileError()
-    return link.profile
+
+    profile = link.profile
+    access_cache.set_profile(db, auth_id, profile)
+
+    # Memberships are only populated when included in the query
+    if isinstance(profile.memberships, list):
+        for membership in profile.memberships:
+            if membership.organizationId:
+                access_cache.set_membership(
+                    db, profile.id, membership.organizationId, membership
+                )
+
+    return profile
@@ -0,0 +1,200 @@
+# apps/api/src/domains/auth/jwks.py
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import httpx
+import jwt
+from jwt import PyJWK
+
+from src.core.metrics import record_cache_lookup
+
+from .types import SupabaseJwtPayload
+
+logger = logging.getLogger(__name__)
+
+
+class JwksKeyCache:
+    """
+    Async cache of JWKS signing keys keyed by ``kid``.
+
+    Keys are fetched once and then refreshed in the background, so verifying a
+    token never waits on the network unless it carries an unknown ``kid``.
+    Unknown ``kid`` refetches are throttled to ``min_refetch_interval``.
+    """
+
+    def __init__(
+        self,
+        jwks_url: str,
+        refresh_interval: float = 600.0,
+        min_refetch_interval: float = 30.0,
+        timeout: float = 10.0,
+    ):
+        self.jwks_url = jwks_url
+        self.refresh_interval = refresh_interval
+        self.min_refetch_interval = min_refetch_interval
+        self.timeout = timeout
+
+        self._keys: Dict[str, Any] = {}
+        self._last_fetch: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task[None]] = None
+
+    async def get_signing_key(self, kid: str) -> Any:
+        """
+        Get the signing key for a ``kid``, refetching the JWKS on a miss.
+
+        Args:
+            kid: Key ID from the token header
+
+        Returns:
+            Public key usable with ``jwt.decode``
+
+        Raises:
+            jwt.PyJWKClientError: If no key matches the ``kid``
+        """
+        key = self._keys.get(kid)
+        if key is not None:
+            return key
+
+        await self._refetch()
+
+        key = self._keys.get(kid)
+        if key is None:
+            raise jwt.PyJWKClientError(f"Unable to find a signing key for kid {kid}")
+        return key
+
+    async def refresh(self) -> None:
+        """Fetch the JWKS and replace the cached keys."""
+        # Failed attempts count too, so an unreachable endpoint is not retried
+        # on every kid miss
+        self._last_fetch = time.monotonic()
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            response = await client.get(self.jwks_url)
+            response.raise_for_status()
+            jwks = response.json()
+
+        keys: Dict[str, Any] = {}
+        for jwk_dict in jwks.get("keys", []):
+            kid = jwk_dict.get("kid")
+            if not kid:
+                continue
+            try:
+                keys[kid] = PyJWK(jwk_dict).key
+            except jwt.PyJWTError as e:
+                logger.warning(f"Skipping unusable JWKS key {kid}: {e}")
+
+        self._keys = keys
+
+    async def start(self) -> None:
+        """Load the keys and start the background refresh task."""
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.warning(f"Initial JWKS fetch failed: {e}")
+
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        """Stop the background refresh task."""
+        if self._refresh_task is None:
+            return
+
+        self._refresh_task.cancel()
+        try:
+            await self._refresh_task
+        except asyncio.CancelledError:
+            pass
+        self._refresh_task = None
+
+    async def _refetch(self) -> None:
+        """Refetch the JWKS after a ``kid`` miss, coalescing concurrent misses."""
+        last_fetch = self._last_fetch
+        async with self._lock:
+            # Another request refreshed the keys while we waited for the lock
+            if self._last_fetch != last_fetch:
+                return
+
+            if (
+                self._last_fetch is not None
+                and time.monotonic() - self._last_fetch < self.min_refetch_interval
+            ):
+                return
+
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"JWKS refetch failed: {e}")
+
+    async def _refresh_loop(self) -> None:
+        """Periodically refresh the keys until cancelled."""
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                async with self._lock:
+                    await self.refresh()
+            except Exception as e:
+                logger.warning(f"Background JWKS refresh failed: {e}")
+
+
+class TokenClaimsCache:
+    """
+    Bounded LRU of verified tokens to their claims.
+
+    Entries expire at the token's ``exp`` claim; tokens without ``exp`` are
+    never cached. Tokens are stored as SHA-256 digests.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._entries: OrderedDict[str, SupabaseJwtPayload] = OrderedDict()
+
+    def get(self, token: str) -> Optional[SupabaseJwtPayload]:
+        """
+        Get cached claims for a token that has not yet expired.
+
+        Args:
+            token: Raw JWT
+
+        Returns:
+            Verified claims, or None if not cached or expired
+        """
+        key = self._key(token)
+        payload = self._entries.get(key)
+        if payload is not None and (payload.exp is None or payload.exp <= time.time()):
+            self._entries.pop(key, None)
+            payload = None
+
+        record_cache_lookup("jwt_claims", payload is not None)
+        if payload is not None:
+            self._entries.move_to_end(key)
+        return payload
+
+    def set(self, token: str, payload: SupabaseJwtPayload) -> None:
+        """
+        Cache verified claims for a token.
+
+        Args:
+            token: Raw JWT
+            payload: Claims verified for the token
+        """
+        if self.max_size <= 0 or payload.exp is None:
+            return
+
+        key = self._key(token)
+        self._entries[key] = payload
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached token."""
+        self._entries.clear()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
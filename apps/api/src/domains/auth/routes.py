@@ -18,7 +18,10 @@ router = APIRouter(prefix="/session", tags=["Sessions"])
     operation_id="getSessionState",  # Explicit, clean function name for Orval
 )
 async def get_session_state(
-    profile: Profile = Depends(get_current_profile), db: Prisma = Depends(get_db)
+    profile: Profile = Depends(get_current_profile),
+    # Clients call this right after switching organization or joining one,
+    # so it must not read a lagging replica
+    db: Prisma = Depends(get_db),
 ) -> SessionState:
     service = SessionService(db)
     return await service.get_session_state(profile)
@@ -4,6 +4,7 @@ from prisma.models import OrganizationMember, Profile
 from prisma.types import OrganizationMemberWhereInput
 
 from prisma import Prisma
+from src.domains.auth.access_cache import access_cache
 from src.domains.auth.models import OrganizationMembership, SessionState
 
 
@@ -104,6 +105,10 @@ async def validate_organization_access(
     Raises:
         HTTPException: If user doesn't have access to organization
     """
+    cached_membership = access_cache.get_membership(db, profile_id, organization_id)
+    if cached_membership:
+        return cached_membership
+
     where_input: OrganizationMemberWhereInput = {
         "profileId": profile_id,
         "organizationId": organization_id,
@@ -117,4 +122,5 @@ async def validate_organization_access(
             detail="Access denied to organization",
         )
 
+    access_cache.set_membership(db, profile_id, organization_id, membership)
     return membership
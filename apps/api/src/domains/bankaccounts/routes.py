@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends
 from prisma.models import OrganizationMember
 
 from prisma import Prisma
-from src.core.database import get_db
+from src.core.database import get_db, get_read_db
 from src.domains.bankaccounts.models import (
     BankAccountResponse,
     BankAccountSaveResponse,
@@ -29,7 +29,7 @@ async def get_bank_accounts(
     membership: OrganizationMember = Depends(
         require_permission(Permission.VIEW_BANK_ACCOUNTS)
     ),
-    db: Prisma = Depends(get_db),
+    db: Prisma = Depends(get_read_db),
 ) -> List[BankAccountResponse]:
     """
     Get bank accounts for a specific organization
@@ -1,6 +1,7 @@
 from .data_service import BaseIntegrationDataService
 from .factory import IntegrationFactory, IntegrationProvider
 from .models import SyncResult
+from .registry import IntegrationServiceRegistry, integration_registry
 from .sync_orchestrator import SyncOrchestrator
 
 __all__ = [
@@ -9,4 +10,6 @@ __all__ = [
     "SyncOrchestrator",
     "IntegrationFactory",
     "IntegrationProvider",
+    "IntegrationServiceRegistry",
+    "integration_registry",
 ]
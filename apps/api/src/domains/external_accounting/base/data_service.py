@@ -43,6 +43,37 @@ class BaseIntegrationDataService(
         """
         pass
 
+    async def get_invoices_by_ids(
+        self, org_id: str, invoice_ids: List[str]
+    ) -> List[InvoiceType]:
+        """
+        Get a specific set of invoices from provider.
+
+        Providers with a bulk lookup should override this. The default
+        implementation fetches each invoice individually.
+
+        Args:
+            org_id: Organization ID
+            invoice_ids: Provider invoice IDs to fetch
+
+        Returns:
+            List of typed invoice objects from the provider
+        """
+        filters = BaseInvoiceFilters(
+            modified_since=None,
+            status=None,
+            date_from=None,
+            date_to=None,
+            invoice_id=None,
+        )
+
+        invoices: List[InvoiceType] = []
+        for invoice_id in invoice_ids:
+            invoices.extend(
+                await self.get_invoices(org_id, filters, invoice_id=invoice_id)
+            )
+        return invoices
+
     @abstractmethod
     async def get_accounts(
         self, org_id: str, filters: BaseAccountFilters
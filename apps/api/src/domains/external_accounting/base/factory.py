@@ -6,6 +6,7 @@ from prisma import Prisma
 from src.shared.exceptions import IntegrationConnectionError
 
 from .data_service import BaseIntegrationDataService
+from .registry import integration_registry
 
 
 class IntegrationProvider(str, Enum):
@@ -21,9 +22,26 @@ class IntegrationFactory:
         self.db = db
 
     async def get_data_service(self, org_id: str) -> BaseIntegrationDataService:
-        """Get the data service for an organization's integration."""
+        """
+        Get the data service for an organization's integration.
+
+        Resolved services are cached per organization for a short time, so
+        repeated calls skip the connection lookup.
+        """
+        cached_service = integration_registry.get(self.db, org_id)
+        if cached_service:
+            return cached_service
+
         provider = await self._get_organization_provider(org_id)
+        data_service = self._create_data_service(provider)
+        integration_registry.set(self.db, org_id, provider.value, data_service)
+
+        return data_service
 
+    def _create_data_service(
+        self, provider: IntegrationProvider
+    ) -> BaseIntegrationDataService:
+        """Create the data service for an integration provider."""
         if provider == IntegrationProvider.XERO:
             from src.domains.external_accounting.xero.data_service import (
                 XeroDataService,
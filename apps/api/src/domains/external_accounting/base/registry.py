@@ -0,0 +1,103 @@
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from prisma import Prisma
+from src.core.metrics import record_cache_lookup
+from src.core.settings import settings
+
+from .data_service import BaseIntegrationDataService
+
+
+@dataclass
+class _RegistryEntry:
+    """Resolved data service for an organization."""
+
+    db: Prisma
+    provider: str
+    data_service: BaseIntegrationDataService
+    expires_at: float
+
+
+class IntegrationServiceRegistry:
+    """
+    Short-lived cache of resolved integration data services per organization.
+
+    Entries expire after INTEGRATION_SERVICE_CACHE_TTL_SECONDS and must be
+    invalidated whenever an organization's connection changes (connected,
+    tokens refreshed or disconnected).
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else settings.INTEGRATION_SERVICE_CACHE_TTL_SECONDS
+        )
+        self._entries: Dict[str, _RegistryEntry] = {}
+
+    def get(self, db: Prisma, org_id: str) -> Optional[BaseIntegrationDataService]:
+        """
+        Get the cached data service for an organization.
+
+        Args:
+            db: Database instance the service must be bound to
+            org_id: Organization ID
+
+        Returns:
+            Cached data service, or None if missing, expired or bound to
+            another database client
+        """
+        entry = self._entries.get(org_id)
+        if entry and entry.expires_at <= time.monotonic():
+            self._entries.pop(org_id, None)
+            entry = None
+
+        if entry is None or entry.db is not db:
+            record_cache_lookup("integration_service", hit=False)
+            return None
+
+        record_cache_lookup("integration_service", hit=True)
+        return entry.data_service
+
+    def set(
+        self,
+        db: Prisma,
+        org_id: str,
+        provider: str,
+        data_service: BaseIntegrationDataService,
+    ) -> None:
+        """
+        Cache the resolved data service for an organization.
+
+        Args:
+            db: Database instance the service is bound to
+            org_id: Organization ID
+            provider: Integration provider name
+            data_service: Resolved data service
+        """
+        if self.ttl_seconds <= 0:
+            return
+
+        self._entries[org_id] = _RegistryEntry(
+            db=db,
+            provider=provider,
+            data_service=data_service,
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+
+    def invalidate(self, org_id: str) -> None:
+        """
+        Drop the cached data service for an organization.
+
+        Args:
+            org_id: Organization ID
+        """
+        self._entries.pop(org_id, None)
+
+    def clear(self) -> None:
+        """Drop every cached data service."""
+        self._entries.clear()
+
+
+integration_registry = IntegrationServiceRegistry()
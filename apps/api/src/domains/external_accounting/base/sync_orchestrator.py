@@ -1,9 +1,12 @@
+import logging
 import re
 import time
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any, List, Optional, cast
 
+from opentelemetry import trace
+from opentelemetry.trace import StatusCode
 from prisma.enums import InvoiceStatus
 from prisma.types import (
     BankAccountCreateInput,
@@ -13,6 +16,9 @@ from prisma.types import (
 )
 
 from prisma import Prisma
+from src.core.metrics import INTEGRATION_SYNC_SECONDS
+from src.core.tracing import span
+from src.shared.pagination import count_cache
 
 from .data_service import BaseIntegrationDataService
 from .models import SyncResult
@@ -21,6 +27,8 @@ from .types import (
     BaseInvoiceFilters,
 )
 
+logger = logging.getLogger(__name__)
+
 
 def _parse_xero_date(date_str: str) -> Optional[datetime]:
     """
@@ -84,36 +92,41 @@ class SyncOrchestrator:
         Returns:
             SyncResult with sync metrics and status
         """
-        start_time = time.time()
+        with span("integration.sync", object_type="invoices", org_id=org_id):
+            start_time = time.time()
 
-        try:
-            filters = await self._build_invoice_filters(
-                org_id, incremental, invoice_types, months_back
-            )
+            try:
+                filters = await self._build_invoice_filters(
+                    org_id, incremental, invoice_types, months_back
+                )
 
-            invoices = await data_service.get_invoices(org_id, filters)
+                invoices = await data_service.get_invoices(org_id, filters)
 
-            count = await self._upsert_invoices(org_id, invoices)
+                count = await self._upsert_invoices(org_id, invoices)
 
-            duration = time.time() - start_time
+                duration = time.time() - start_time
 
-            return SyncResult(
-                object_type="invoices",
-                success=True,
-                count=count,
-                duration_seconds=duration,
-                last_modified=datetime.now(),
-            )
+                return self._record(
+                    SyncResult(
+                        object_type="invoices",
+                        success=True,
+                        count=count,
+                        duration_seconds=duration,
+                        last_modified=datetime.now(),
+                    )
+                )
 
-        except Exception as e:
-            duration = time.time() - start_time
-            return SyncResult(
-                object_type="invoices",
-                success=False,
-                count=0,
-                duration_seconds=duration,
-                error=str(e),
-            )
+            except Exception as e:
+                duration = time.time() - start_time
+                return self._record(
+                    SyncResult(
+                        object_type="invoices",
+                        success=False,
+                        count=0,
+                        duration_seconds=duration,
+                        error=str(e),
+                    )
+                )
 
     async def sync_accounts(
         self,
@@ -132,38 +145,57 @@ class SyncOrchestrator:
         Returns:
             SyncResult with sync metrics and status
         """
-        start_time = time.time()
+        with span("integration.sync", object_type="accounts", org_id=org_id):
+            start_time = time.time()
 
-        try:
-            filters = (
-                BaseAccountFilters(types=account_types, modified_since=None)
-                if account_types
-                else self._build_account_filters()
-            )
+            try:
+                filters = (
+                    BaseAccountFilters(types=account_types, modified_since=None)
+                    if account_types
+                    else self._build_account_filters()
+                )
 
-            accounts = await data_service.get_accounts(org_id, filters)
+                accounts = await data_service.get_accounts(org_id, filters)
 
-            count = await self._upsert_accounts(org_id, accounts)
+                count = await self._upsert_accounts(org_id, accounts)
 
-            duration = time.time() - start_time
+                duration = time.time() - start_time
 
-            return SyncResult(
-                object_type="accounts",
-                success=True,
-                count=count,
-                duration_seconds=duration,
-                last_modified=datetime.now(),
-            )
+                return self._record(
+                    SyncResult(
+                        object_type="accounts",
+                        success=True,
+                        count=count,
+                        duration_seconds=duration,
+                        last_modified=datetime.now(),
+                    )
+                )
 
-        except Exception as e:
-            duration = time.time() - start_time
-            return SyncResult(
-                object_type="accounts",
-                success=False,
-                count=0,
-                duration_seconds=duration,
-                error=str(e),
-            )
+            except Exception as e:
+                duration = time.time() - start_time
+                return self._record(
+                    SyncResult(
+                        object_type="accounts",
+                        success=False,
+                        count=0,
+                        duration_seconds=duration,
+                        error=str(e),
+                    )
+                )
+
+    @staticmethod
+    def _record(result: SyncResult) -> SyncResult:
+        """Record a finished sync in the metrics and on the current span."""
+        INTEGRATION_SYNC_SECONDS.observe(
+            result.duration_seconds,
+            object_type=result.object_type,
+            outcome="success" if result.success else "error",
+        )
+        current = trace.get_current_span()
+        current.set_attribute("sync.count", result.count)
+        if not result.success:
+            current.set_status(StatusCode.ERROR, result.error)
+        return result
 
     async def _build_invoice_filters(
         self,
@@ -242,11 +274,49 @@ class SyncOrchestrator:
                 )
                 count += 1
             except Exception as e:
-                print(f"Failed to upsert invoice {invoice_data.get('InvoiceID')}: {e}")
+                logger.warning(
+                    f"Failed to upsert invoice {invoice_data.InvoiceID}: {e}"
+                )
                 continue
 
+        if count:
+            count_cache.invalidate("invoice")
         return count
 
+    async def _batch_upsert_invoices(self, org_id: str, invoices: List[Any]) -> int:
+        """
+        Upsert invoices to database in a single batched transaction.
+
+        Falls back to row-by-row upserts if the batch fails, so one bad
+        invoice cannot block the rest.
+        """
+        if not invoices:
+            return 0
+
+        try:
+            async with self.db.batch_() as batcher:
+                for invoice_data in invoices:
+                    batcher.invoice.upsert(
+                        where={
+                            "organizationId_invoiceId": {
+                                "organizationId": org_id,
+                                "invoiceId": invoice_data.InvoiceID,
+                            }
+                        },
+                        data={
+                            "create": self._map_invoice_create_data(
+                                org_id, invoice_data
+                            ),
+                            "update": self._map_invoice_update_data(invoice_data),
+                        },
+                    )
+        except Exception as e:
+            logger.warning(f"Batched invoice upsert failed, retrying individually: {e}")
+            return await self._upsert_invoices(org_id, invoices)
+
+        count_cache.invalidate("invoice")
+        return len(invoices)
+
     async def _upsert_accounts(self, org_id: str, accounts: List[Any]) -> int:
         """Batch upsert accounts to database."""
         count = 0
@@ -267,7 +337,9 @@ class SyncOrchestrator:
                 )
                 count += 1
             except Exception as e:
-                print(f"Failed to upsert account {account_data.AccountID}: {e}")
+                logger.warning(
+                    f"Failed to upsert account {account_data.AccountID}: {e}"
+                )
                 continue
 
         return count
@@ -1,4 +1,5 @@
 # apps/api/src/domains/external_accounting/xero/service.py
+import logging
 import secrets
 from datetime import datetime, timedelta, timezone
 
@@ -12,6 +13,7 @@ from prisma.models import XeroConnection
 
 from prisma import Prisma
 from src.core.settings import settings
+from src.domains.external_accounting.base.registry import integration_registry
 from src.shared.exceptions import (
     IntegrationAuthenticationError,
     IntegrationConnectionError,
@@ -32,6 +34,8 @@ from .models import (
     XeroTokenResponse,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class XeroService:
     """Service for managing Xero OAuth connections and token operations."""
@@ -188,6 +192,8 @@ class XeroService:
                 }
             )
 
+        integration_registry.invalidate(org_id)
+
         return XeroConnectionResponse(
             message="Xero connection established successfully",
             connected_at=datetime.now(),
@@ -226,7 +232,7 @@ class XeroService:
                 )
         except Exception as e:
             # Log error but don't fail disconnection
-            print(f"Failed to revoke Xero connection: {e}")
+            logger.warning(f"Failed to revoke Xero connection: {e}")
 
         # Update connection status to revoked
         disconnected_at = datetime.now()
@@ -238,6 +244,8 @@ class XeroService:
             },
         )
 
+        integration_registry.invalidate(org_id)
+
         return XeroDisconnectResponse(
             message="Xero connection disconnected successfully",
             disconnected_at=disconnected_at,
@@ -422,6 +430,7 @@ class XeroService:
                         "lastError": None,
                     },
                 )
+                integration_registry.invalidate(connection.organizationId)
 
                 return token_response.access_token
             except httpx.HTTPStatusError as e:
@@ -436,6 +445,7 @@ class XeroService:
                         "refreshAttempts": (connection.refreshAttempts or 0) + 1,
                     },
                 )
+                integration_registry.invalidate(connection.organizationId)
 
                 raise IntegrationTokenExpiredError(error_msg)
             except httpx.RequestError as e:
@@ -479,7 +489,7 @@ class XeroService:
                     )
             except Exception as e:
                 # Log error but don't raise - disconnection should still succeed
-                print(f"Failed to revoke Xero connection: {e}")
+                logger.warning(f"Failed to revoke Xero connection: {e}")
 
     def _is_connection_active(self, connection: XeroConnection) -> bool:
         """Check if a connection is currently active."""
@@ -1,11 +1,17 @@
 import asyncio
+import logging
+import time
+import weakref
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union, cast
+from urllib.parse import urlsplit
 
 import httpx
 from prisma.enums import XeroConnectionStatus
 
 from prisma import Prisma
+from src.core.metrics import XERO_REQUEST_SECONDS
+from src.core.tracing import span
 from src.domains.external_accounting.xero.auth.service import XeroService
 from src.shared.exceptions import (
     IntegrationConnectionError,
@@ -41,6 +47,93 @@ from .types import (
     XeroPaymentsResponse,
 )
 
+logger = logging.getLogger(__name__)
+
+# Xero allows at most 5 concurrent API calls per tenant
+XERO_MAX_CONCURRENT_REQUESTS = 5
+
+# Xero returns at most 100 invoices per page
+XERO_PAGE_SIZE = 100
+
+# Keep the IDs query parameter well inside Xero's URL length limit
+XERO_MAX_IDS_PARAM_LENGTH = 2000
+
+# Batch payment GUIDs OR'ed into a single BatchPayments where clause
+XERO_BATCH_PAYMENT_IDS_PER_QUERY = 25
+
+# Concurrent bulk requests per organization, shared across calls and services.
+# Calls hold their semaphore while running, so an organization's entry is
+# dropped once it has no requests in flight.
+_tenant_semaphores: "weakref.WeakValueDictionary[str, asyncio.Semaphore]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _tenant_semaphore(org_id: str) -> asyncio.Semaphore:
+    """Semaphore limiting an organization's concurrent bulk Xero requests."""
+    semaphore = _tenant_semaphores.get(org_id)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(XERO_MAX_CONCURRENT_REQUESTS)
+        _tenant_semaphores[org_id] = semaphore
+    return semaphore
+
+
+def _endpoint_label(url: str) -> str:
+    """
+    Endpoint name for metrics, with record IDs replaced by a placeholder.
+
+    ".../api.xro/2.0/Invoices/<id>/Attachments/<name>" becomes
+    "Invoices/{id}/Attachments/{id}", keeping label cardinality bounded.
+    """
+    path = urlsplit(url).path.split("/api.xro/2.0/", 1)[-1]
+    segments = [segment for segment in path.split("/") if segment]
+    return "/".join(
+        segment if index % 2 == 0 else "{id}" for index, segment in enumerate(segments)
+    )
+
+
+def _chunk_ids(
+    ids: List[str],
+    max_param_length: int = XERO_MAX_IDS_PARAM_LENGTH,
+    max_chunk_size: int = XERO_PAGE_SIZE,
+) -> List[List[str]]:
+    """
+    Split IDs into chunks that fit into a single IDs query parameter.
+
+    Separators are counted in their URL-encoded form ("%2C") so the limit
+    holds for the final request URL.
+
+    Args:
+        ids: IDs to split
+        max_param_length: Maximum encoded length of the joined IDs
+        max_chunk_size: Maximum number of IDs per chunk
+
+    Returns:
+        List of ID chunks, preserving the input order
+    """
+    chunks: List[List[str]] = []
+    current: List[str] = []
+    current_length = 0
+
+    for id_ in ids:
+        added_length = len(id_) + (3 if current else 0)
+        if current and (
+            current_length + added_length > max_param_length
+            or len(current) >= max_chunk_size
+        ):
+            chunks.append(current)
+            current = []
+            current_length = 0
+            added_length = len(id_)
+
+        current.append(id_)
+        current_length += added_length
+
+    if current:
+        chunks.append(current)
+
+    return chunks
+
 
 class XeroDataService(
     BaseIntegrationDataService[
@@ -88,7 +181,7 @@ class XeroDataService(
         page = 1
 
         while True:
-            params = HttpParams(page=page, where=None, order=None)
+            params = HttpParams(page=page, where=None, order=None, IDs=None)
 
             where_clauses = []
             if filters.status:
@@ -154,6 +247,73 @@ class XeroDataService(
 
         return all_invoices
 
+    async def get_invoices_by_ids(
+        self, org_id: str, invoice_ids: List[str]
+    ) -> List[XeroInvoice]:
+        """
+        Get a set of invoices from Xero using the IDs filter.
+
+        IDs are chunked so each request URL stays within Xero's length limit,
+        and chunks are fetched concurrently up to XERO_MAX_CONCURRENT_REQUESTS
+        per organization. A chunk that fails is logged and left out, so the
+        invoices from the other chunks are still returned.
+
+        Args:
+            org_id: Organization ID
+            invoice_ids: Xero invoice IDs to fetch
+
+        Returns:
+            List of typed Xero invoice objects
+
+        Raises:
+            Exception: The first chunk's error if every chunk failed
+        """
+        unique_ids = list(dict.fromkeys(invoice_ids))
+        if not unique_ids:
+            return []
+
+        semaphore = _tenant_semaphore(org_id)
+
+        async def fetch_chunk(chunk: List[str]) -> List[XeroInvoice]:
+            # page=1 keeps line items in the response, chunks never exceed a page
+            params = HttpParams(page=1, where=None, order=None, IDs=",".join(chunk))
+            async with semaphore:
+                response = await self._make_xero_request(
+                    "GET",
+                    f"{self.base_url}/Invoices",
+                    org_id,
+                    params=params,
+                )
+
+            response_dict = cast(dict, response)
+            return [
+                XeroInvoice.model_validate(invoice_dict)
+                for invoice_dict in response_dict["Invoices"]
+            ]
+
+        chunks = _chunk_ids(unique_ids)
+        chunk_results = await asyncio.gather(
+            *(fetch_chunk(chunk) for chunk in chunks), return_exceptions=True
+        )
+
+        invoices: List[XeroInvoice] = []
+        errors: List[Exception] = []
+        for chunk, result in zip(chunks, chunk_results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"Failed to fetch {len(chunk)} invoices for org {org_id}: "
+                    f"{result} (IDs: {', '.join(chunk)})"
+                )
+                errors.append(result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                invoices.extend(result)
+
+        if errors and len(errors) == len(chunks):
+            raise errors[0]
+        return invoices
+
     async def get_accounts(
         self, org_id: str, filters: BaseAccountFilters
     ) -> List[XeroAccount]:
@@ -167,7 +327,7 @@ class XeroDataService(
         Returns:
             List of typed Xero account objects (filtered to BANK accounts)
         """
-        params = HttpParams(page=None, where=None, order=None)
+        params = HttpParams(page=None, where=None, order=None, IDs=None)
 
         where_clauses = ['Type=="BANK"']
         # Note: We only sync BANK type accounts as specified in PRD
@@ -341,8 +501,10 @@ class XeroDataService(
             raise IntegrationConnectionError("No active Xero connection found")
 
         tenant_id = connection.xeroTenantId
+        endpoint = _endpoint_label(url)
 
         for attempt in range(max_retries):
+            started = time.perf_counter()
             try:
                 request_headers: HttpHeaders = {
                     "Authorization": f"Bearer {access_token}",
@@ -374,35 +536,47 @@ class XeroDataService(
                         request_headers["Content-Type"] = "application/json"
 
                     # Debug logging for HTTP requests
-                    import logging
-
-                    logger = logging.getLogger(__name__)
 
                     # Only log debug details for Batch Payment and Bank Transaction ops
                     if "BatchPayments" in url or "BankTransactions" in url:
-                        logger.info("[XERO_HTTP_DEBUG] Making HTTP request")
-                        logger.info(f"[XERO_HTTP_DEBUG] Method: {method}")
-                        logger.info(f"[XERO_HTTP_DEBUG] URL: {url}")
-                        logger.info(
+                        logger.debug("[XERO_HTTP_DEBUG] Making HTTP request")
+                        logger.debug(f"[XERO_HTTP_DEBUG] Method: {method}")
+                        logger.debug(f"[XERO_HTTP_DEBUG] URL: {url}")
+                        logger.debug(
                             f"[XERO_HTTP_DEBUG] Headers: {dict(request_headers)}"
                         )
                         if json:
-                            logger.info(f"[XERO_HTTP_DEBUG] JSON Payload: {json}")
-
-                    response = await client.request(method, url, **kwargs_dict)
+                            logger.debug(f"[XERO_HTTP_DEBUG] JSON Payload: {json}")
+
+                    with span(
+                        "xero.request",
+                        method=method,
+                        endpoint=endpoint,
+                        attempt=attempt + 1,
+                    ) as request_span:
+                        response = await client.request(method, url, **kwargs_dict)
+                        request_span.set_attribute(
+                            "http.response.status_code", response.status_code
+                        )
+                    XERO_REQUEST_SECONDS.observe(
+                        time.perf_counter() - started,
+                        method=method,
+                        endpoint=endpoint,
+                        status=str(response.status_code),
+                    )
 
                     # Log response details for Batch Payment and Bank Transaction ops
                     if "BatchPayments" in url or "BankTransactions" in url:
-                        logger.info(
+                        logger.debug(
                             f"[XERO_HTTP_DEBUG] Response Status: {response.status_code}"
                         )
                         try:
                             headers_dict = dict(response.headers)
-                            logger.info(
+                            logger.debug(
                                 f"[XERO_HTTP_DEBUG] Response Headers: {headers_dict}"
                             )
                         except (TypeError, AttributeError):
-                            logger.info(
+                            logger.debug(
                                 "[XERO_HTTP_DEBUG] Response Headers: (unable to read)"
                             )
 
@@ -410,11 +584,11 @@ class XeroDataService(
                             response_text = response.text
                             if len(response_text) > 2000:
                                 response_text = response_text[:2000] + "... (truncated)"
-                            logger.info(
+                            logger.debug(
                                 f"[XERO_HTTP_DEBUG] Response Body: {response_text}"
                             )
                         except Exception:
-                            logger.info(
+                            logger.debug(
                                 "[XERO_HTTP_DEBUG] Response Body: (unable to read)"
                             )
 
@@ -446,6 +620,12 @@ class XeroDataService(
                 await asyncio.sleep(2**attempt)
 
             except httpx.RequestError as e:
+                XERO_REQUEST_SECONDS.observe(
+                    time.perf_counter() - started,
+                    method=method,
+                    endpoint=endpoint,
+                    status="error",
+                )
                 if attempt == max_retries - 1:
                     raise IntegrationConnectionError(
                         f"Xero API request error: {str(e)}"
@@ -542,7 +722,7 @@ class XeroDataService(
         try:
             # First, try to get batch payment directly
             where_clause = f'BatchPaymentID=guid("{batch_payment_id}")'
-            params = HttpParams(page=None, where=where_clause, order=None)
+            params = HttpParams(page=None, where=where_clause, order=None, IDs=None)
 
             response = await self._make_xero_request(
                 "GET",
@@ -569,7 +749,7 @@ class XeroDataService(
             # If not found via BatchPayments, try BankTransactions (fallback)
             # Query bank transactions that are part of this batch payment
             where_clause = f'BatchPayment.BatchPaymentID=guid("{batch_payment_id}")'
-            params = HttpParams(page=None, where=where_clause, order=None)
+            params = HttpParams(page=None, where=where_clause, order=None, IDs=None)
 
             response = await self._make_xero_request(
                 "GET",
@@ -612,6 +792,82 @@ class XeroDataService(
                 found=False,
             )
 
+    async def get_batch_payment_statuses(
+        self, org_id: str, batch_payment_ids: List[str]
+    ) -> Dict[str, BatchPaymentStatusResult]:
+        """
+        Get the status of several batch payments from Xero.
+
+        Batch payments are listed in bulk through the BatchPayments API, with
+        the IDs OR'ed into the where clause. Any ID missing from the listing
+        falls back to get_batch_payment_status, which also checks
+        BankTransactions. Requests run concurrently up to
+        XERO_MAX_CONCURRENT_REQUESTS per organization.
+
+        Args:
+            org_id: Organization ID
+            batch_payment_ids: Xero batch payment IDs
+
+        Returns:
+            Mapping of batch payment ID to its status result
+        """
+        unique_ids = list(dict.fromkeys(batch_payment_ids))
+        results: Dict[str, BatchPaymentStatusResult] = {}
+        if not unique_ids:
+            return results
+
+        semaphore = _tenant_semaphore(org_id)
+
+        async def list_chunk(chunk: List[str]) -> None:
+            where_clause = " OR ".join(
+                f'BatchPaymentID=guid("{batch_id}")' for batch_id in chunk
+            )
+            params = HttpParams(page=None, where=where_clause, order=None, IDs=None)
+            try:
+                async with semaphore:
+                    response = await self._make_xero_request(
+                        "GET",
+                        f"{self.base_url}/BatchPayments",
+                        org_id,
+                        params=params,
+                    )
+            except Exception:
+                # Leave the chunk to the per-payment fallback
+                return
+
+            response_dict = cast(dict, response)
+            for batch_payment in response_dict.get("BatchPayments", []):
+                batch_id = batch_payment.get("BatchPaymentID", "")
+                results[batch_id] = BatchPaymentStatusResult(
+                    batch_id=batch_id,
+                    status=batch_payment.get("Status", ""),
+                    is_reconciled=batch_payment.get("IsReconciled", False),
+                    last_updated=batch_payment.get("UpdatedDateUTC", ""),
+                    found=True,
+                )
+
+        await asyncio.gather(
+            *(
+                list_chunk(chunk)
+                for chunk in _chunk_ids(
+                    unique_ids, max_chunk_size=XERO_BATCH_PAYMENT_IDS_PER_QUERY
+                )
+            )
+        )
+
+        missing_ids = [batch_id for batch_id in unique_ids if batch_id not in results]
+
+        async def fetch_single(batch_id: str) -> BatchPaymentStatusResult:
+            async with semaphore:
+                return await self.get_batch_payment_status(org_id, batch_id)
+
+        for status_result in await asyncio.gather(
+            *(fetch_single(batch_id) for batch_id in missing_ids)
+        ):
+            results[status_result.batch_id] = status_result
+
+        return {batch_id: results[batch_id] for batch_id in unique_ids}
+
     async def update_batch_payment(
         self, org_id: str, batch_payment_id: str, updates: Dict[str, Any]
     ) -> BatchPaymentUpdateResult:
@@ -629,30 +885,20 @@ class XeroDataService(
         Returns:
             BatchPaymentUpdateResult with success status and any error message
         """
-        import logging
-
-        logger = logging.getLogger(__name__)
 
         try:
             # Debug logging - log the exact request details
             request_url = f"{self.base_url}/BatchPayments"
-            print("[XERO_DEBUG] Updating batch payment with Xero API")
-            print(f"[XERO_DEBUG] Organization ID: {org_id}")
-            print(f"[XERO_DEBUG] Batch Payment ID: {batch_payment_id}")
-            print("[XERO_DEBUG] Request Method: POST")
-            print(f"[XERO_DEBUG] Request URL: {request_url}")
-            print(f"[XERO_DEBUG] Original Updates: {updates}")
-            logger.info("[XERO_DEBUG] Updating batch payment with Xero API")
-            logger.info(f"[XERO_DEBUG] Organization ID: {org_id}")
-            logger.info(f"[XERO_DEBUG] Batch Payment ID: {batch_payment_id}")
-            logger.info("[XERO_DEBUG] Request Method: POST")
-            logger.info(f"[XERO_DEBUG] Request URL: {request_url}")
-            logger.info(f"[XERO_DEBUG] Original Updates: {updates}")
+            logger.debug("[XERO_DEBUG] Updating batch payment with Xero API")
+            logger.debug(f"[XERO_DEBUG] Organization ID: {org_id}")
+            logger.debug(f"[XERO_DEBUG] Batch Payment ID: {batch_payment_id}")
+            logger.debug("[XERO_DEBUG] Request Method: POST")
+            logger.debug(f"[XERO_DEBUG] Request URL: {request_url}")
+            logger.debug(f"[XERO_DEBUG] Original Updates: {updates}")
 
             # Prepare the request payload with BatchPaymentID
             request_payload = {"BatchPaymentID": batch_payment_id, **updates}
-            print(f"[XERO_DEBUG] Final Request Payload: {request_payload}")
-            logger.info(f"[XERO_DEBUG] Final Request Payload: {request_payload}")
+            logger.debug(f"[XERO_DEBUG] Final Request Payload: {request_payload}")
 
             # Get access token and tenant ID for direct curl debugging
             access_token = await self.xero_service.get_valid_access_token(org_id)
@@ -674,9 +920,7 @@ class XeroDataService(
   -H "Accept: application/json" \\
   -d '{{"BatchPaymentID": "{batch_payment_id}", "Status": "DELETED"}}\'"""
 
-            print("[XERO_DEBUG] Exact curl command:")
-            print(curl_command)
-            logger.info(f"[XERO_DEBUG] Exact curl command: {curl_command}")
+            logger.debug(f"[XERO_DEBUG] Exact curl command: {curl_command}")
 
             # Make POST request to update the batch payment using correct endpoint
             response = await self._make_xero_request(
@@ -687,10 +931,8 @@ class XeroDataService(
             )
 
             # Debug logging - log the response
-            print("[XERO_DEBUG] Response received from Xero API")
-            print(f"[XERO_DEBUG] Response data: {response}")
-            logger.info("[XERO_DEBUG] Response received from Xero API")
-            logger.info(f"[XERO_DEBUG] Response data: {response}")
+            logger.debug("[XERO_DEBUG] Response received from Xero API")
+            logger.debug(f"[XERO_DEBUG] Response data: {response}")
 
             # Parse response to verify success
             response_dict = cast(dict, response)
@@ -707,9 +949,9 @@ class XeroDataService(
             # Log the updated batch payment details
             first_batch_payment = batch_payments[0]
             status = first_batch_payment.get("Status", "unknown")
-            logger.info(f"[XERO_DEBUG] Updated batch payment status: {status}")
+            logger.debug(f"[XERO_DEBUG] Updated batch payment status: {status}")
             batch_id = first_batch_payment.get("BatchPaymentID", "unknown")
-            logger.info(f"[XERO_DEBUG] Updated batch payment ID: {batch_id}")
+            logger.debug(f"[XERO_DEBUG] Updated batch payment ID: {batch_id}")
 
             return BatchPaymentUpdateResult(
                 success=True,
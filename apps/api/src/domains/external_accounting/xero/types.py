@@ -199,6 +199,7 @@ class HttpParams(BaseModel):
     page: Optional[int] = Field(None, description="Page number for pagination")
     where: Optional[str] = Field(None, description="Filter conditions")
     order: Optional[str] = Field(None, description="Sort order specification")
+    IDs: Optional[str] = Field(None, description="Comma-separated IDs to fetch")
 
 
 # HTTP Headers type - using dict due to hyphenated header names
@@ -77,10 +77,11 @@ class PaginationMetadata(BaseModel):
 
     page: int
     limit: int
-    total: int
-    pages: int
+    total: Optional[int] = None
+    pages: Optional[int] = None
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None
 
 
 class InvoiceListResponse(BaseModel):
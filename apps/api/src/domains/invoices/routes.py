@@ -7,7 +7,7 @@ from prisma.enums import InvoiceStatus
 from prisma.models import Profile
 
 from prisma import Prisma
-from src.core.database import get_db
+from src.core.database import get_db, get_read_db
 from src.domains.auth.dependencies import get_current_profile
 from src.domains.auth.service import validate_organization_access
 from src.domains.invoices.models import InvoiceListResponse
@@ -25,7 +25,8 @@ router = APIRouter(prefix="/invoices", tags=["Invoices"])
 async def get_invoices(
     org_id: str,
     profile: Profile = Depends(get_current_profile),
-    db: Prisma = Depends(get_db),
+    primary_db: Prisma = Depends(get_db),
+    db: Prisma = Depends(get_read_db),
     page: int = Query(1, description="Page number for pagination", ge=1, le=1000),
     limit: int = Query(50, description="Number of records per page", ge=1, le=500),
     status: Optional[InvoiceStatus] = Query(
@@ -44,7 +45,17 @@ async def get_invoices(
         None, description="Filter by specific contact ID"
     ),
     search: Optional[str] = Query(
-        None, description="Search in invoice number, contact name, or reference"
+        None,
+        description=(
+            "Search in invoice number, contact name, or reference; "
+            "results are ranked by relevance"
+        ),
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from the previous page (overrides page)"
+    ),
+    include_total: bool = Query(
+        True, description="Include the total count in the pagination metadata"
     ),
 ) -> InvoiceListResponse:
     """
@@ -52,8 +63,9 @@ async def get_invoices(
 
     Requires active membership in the specified organization.
     """
-    # Validate user has access to the organization
-    await validate_organization_access(profile.id, org_id, db)
+    # Validate user has access to the organization; permissions are checked on
+    # the primary, and only the listing itself reads the replica
+    await validate_organization_access(profile.id, org_id, primary_db)
 
     # Get invoices using the service
     return await get_invoices_by_organization(
@@ -67,4 +79,6 @@ async def get_invoices(
         modified_since=modified_since,
         contact_id=contact_id,
         search=search,
+        cursor=cursor,
+        include_total=include_total,
     )
@@ -1,7 +1,8 @@
 # apps/api/src/domains/invoices/service.py
 import math
 from datetime import date, datetime
-from typing import Optional
+from functools import partial
+from typing import Any, Awaitable, Callable, Optional, cast
 
 from prisma.enums import InvoiceStatus
 from prisma.types import InvoiceWhereInput
@@ -12,6 +13,19 @@ from src.domains.invoices.models import (
     InvoiceResponse,
     PaginationMetadata,
 )
+from src.shared.exceptions import InvalidDataError
+from src.shared.pagination import (
+    KEYSET_ORDER,
+    count_cache,
+    encode_cursor,
+    keyset_where,
+)
+from src.shared.search import (
+    INVOICE_SEARCH,
+    count_search_matches,
+    order_by_rank,
+    search_ranked_ids,
+)
 
 
 async def get_invoices_by_organization(
@@ -25,6 +39,8 @@ async def get_invoices_by_organization(
     modified_since: Optional[datetime] = None,
     contact_id: Optional[str] = None,
     search: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
 ) -> InvoiceListResponse:
     """
     Get invoices for an organization with filtering and pagination
@@ -39,13 +55,15 @@ async def get_invoices_by_organization(
         date_to: Filter invoices to this date
         modified_since: Only return invoices modified since this date
         contact_id: Filter by specific contact ID
-        search: Search in invoice number, contact name, or reference
+        search: Search in invoice number, contact name, or reference; matches
+            are ordered by relevance and paged by page
+        cursor: Cursor from a previous page; switches to keyset pagination on
+            (createdAt, id) and ignores page. Not supported with search
+        include_total: Whether to include the (cached) total count
 
     Returns:
         InvoiceListResponse with invoices and pagination metadata
     """
-    # Calculate offset for pagination
-    offset = (page - 1) * limit
 
     # Build where clause
     where_input: InvoiceWhereInput = {
@@ -80,29 +98,78 @@ async def get_invoices_by_organization(
     if contact_id:
         where_input["contactId"] = contact_id
 
+    count_filters: dict = cast(dict, where_input)
+    count: Callable[[], Awaitable[int]] = partial(db.invoice.count, where=where_input)
+
     if search:
-        # Search across multiple fields using OR condition
-        where_input["OR"] = [
-            {"invoiceNumber": {"contains": search, "mode": "insensitive"}},
-            {"contactName": {"contains": search, "mode": "insensitive"}},
-            {"reference": {"contains": search, "mode": "insensitive"}},
-        ]
-
-    # Get invoices with pagination
-    invoices = await db.invoice.find_many(
-        where=where_input,
-        skip=offset,
-        take=limit,
-        order={"createdAt": "desc"},  # Consistent ordering
-    )
+        if cursor:
+            raise InvalidDataError("Cursor pagination is not supported with search")
+
+        # Trigram-indexed search over invoice number, contact name and
+        # reference, ranked within the listing filters and paged in SQL
+        ranked_ids = await search_ranked_ids(
+            db,
+            INVOICE_SEARCH,
+            organization_id,
+            search,
+            where=where_input,
+            limit=limit if include_total else limit + 1,
+            offset=(page - 1) * limit,
+        )
+        invoices = (
+            order_by_rank(
+                await db.invoice.find_many(
+                    where={**where_input, "id": {"in": ranked_ids}}
+                ),
+                ranked_ids,
+            )
+            if ranked_ids
+            else []
+        )
+        count_filters = {**count_filters, "search": search}
+        count = partial(
+            count_search_matches,
+            db,
+            INVOICE_SEARCH,
+            organization_id,
+            search,
+            where_input,
+        )
+    elif cursor:
+        # Keyset pagination: seek past the cursor instead of skipping rows
+        invoices = await db.invoice.find_many(
+            where=cast(InvoiceWhereInput, {"AND": [where_input, keyset_where(cursor)]}),
+            take=limit + 1,
+            order=cast(Any, KEYSET_ORDER),
+        )
+    else:
+        # Offset pagination; fetch one extra row when the total is skipped so
+        # has_next can still be derived
+        invoices = await db.invoice.find_many(
+            where=where_input,
+            skip=(page - 1) * limit,
+            take=limit if include_total else limit + 1,
+            # Same total order as keyset pages, so next_cursor resumes here
+            order=cast(Any, KEYSET_ORDER),
+        )
+
+    total: Optional[int] = None
+    total_pages: Optional[int] = None
+    if include_total:
+        total = await count_cache.get_or_count(db, "invoice", count_filters, count)
+        total_pages = math.ceil(total / limit) if total > 0 else 1
 
-    # Get total count for pagination metadata
-    total = await db.invoice.count(where=where_input)
+    if cursor or not include_total:
+        has_next = len(invoices) > limit
+        invoices = invoices[:limit]
+    else:
+        has_next = page * limit < (total or 0)
+    has_prev = bool(cursor) or page > 1
 
-    # Calculate pagination metadata
-    total_pages = math.ceil(total / limit) if total > 0 else 1
-    has_next = page * limit < total
-    has_prev = page > 1
+    # Relevance-ordered search pages have no keyset position
+    next_cursor = None
+    if has_next and invoices and not search:
+        next_cursor = encode_cursor(invoices[-1].createdAt, invoices[-1].id)
 
     pagination = PaginationMetadata(
         page=page,
@@ -111,6 +178,7 @@ async def get_invoices_by_organization(
         pages=total_pages,
         has_next=has_next,
         has_prev=has_prev,
+        next_cursor=next_cursor,
     )
 
     # Convert to response models
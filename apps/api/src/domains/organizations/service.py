@@ -6,6 +6,7 @@ from prisma.enums import MemberStatus, OrganizationRole
 from prisma.models import OrganizationMember, Profile
 
 from prisma import Prisma
+from src.domains.auth.access_cache import access_cache
 from src.domains.auth.models import SessionState
 from src.domains.auth.service import SessionService, validate_organization_access
 from src.domains.organizations.models import (
@@ -81,6 +82,7 @@ class OrganizationService:
             where={"id": profile_id},
             data={"lastAccessedOrg": {"connect": {"id": organization_id}}},
         )
+        access_cache.invalidate_profile(profile_id)
 
         updated_profile = await self.db.profile.find_unique(where={"id": profile_id})
         if not updated_profile:
@@ -184,6 +186,8 @@ class OrganizationService:
             data={"status": MemberStatus.removed},
             include={"profile": True, "invitedByProfile": True},
         )
+        if member.profileId:
+            access_cache.invalidate_membership(member.profileId, organization_id)
 
         if not updated_member:
             raise HTTPException(
@@ -3,11 +3,14 @@ AI extraction service for processing remittance PDFs using OpenAI.
 """
 
 import logging
+import time
 from io import BytesIO
 from uuid import UUID
 
 import PyPDF2
 
+from src.core.metrics import AI_EXTRACTION_SECONDS, PDF_PARSE_SECONDS
+from src.core.tracing import span
 from src.domains.remittances.exceptions import ExtractionFailedError
 from src.domains.remittances.types import ExtractedPayment, ExtractedRemittanceData
 from src.shared.ai import openai_client
@@ -42,35 +45,30 @@ class AIExtractionService:
         """
         try:
             # Extract text from PDF
-            pdf_text = self._extract_text_from_pdf(pdf_content)
+            with span("pdf.parse", bytes=len(pdf_content)), PDF_PARSE_SECONDS.time():
+                pdf_text = self._extract_text_from_pdf(pdf_content)
 
             if not pdf_text.strip():
                 raise ExtractionFailedError("No text found in PDF")
 
-            import sys
-
-            print(
-                f"📖 Extracted {len(pdf_text)} characters from PDF",
-                file=sys.stderr,
-                flush=True,
-            )
-            print(f"📝 First 500 chars: {pdf_text[:500]}", file=sys.stderr, flush=True)
             logger.info(f"Extracted {len(pdf_text)} characters from PDF")
+            logger.debug("PDF text starts: %r", pdf_text[:500])
 
             # Use OpenAI to extract structured data
-            print(
-                "🔥 NOW CALLING OPENAI API - This is the critical point!",
-                file=sys.stderr,
-                flush=True,
-            )
-            ai_result = await self.client.extract_remittance_data(
-                pdf_text=pdf_text, organization_id=str(organization_id)
-            )
-            print(
-                "✅ OpenAI API call completed successfully!",
-                file=sys.stderr,
-                flush=True,
-            )
+            with span("openai.extract", characters=len(pdf_text)):
+                started = time.perf_counter()
+                try:
+                    ai_result = await self.client.extract_remittance_data(
+                        pdf_text=pdf_text, organization_id=str(organization_id)
+                    )
+                except Exception:
+                    AI_EXTRACTION_SECONDS.observe(
+                        time.perf_counter() - started, outcome="error"
+                    )
+                    raise
+                AI_EXTRACTION_SECONDS.observe(
+                    time.perf_counter() - started, outcome="success"
+                )
 
             # Convert to domain model with proper type conversion
             # Handle both old format (snake_case) and new format
@@ -131,15 +129,9 @@ class AIExtractionService:
             )
 
         except AIException as e:
-            logger.error(f"AI extraction failed: {e}")
             # Check if the exception has a thread_id for debugging
             thread_id = getattr(e, "thread_id", None)
-            if thread_id:
-                print(
-                    f"🔍 AI extraction failed but thread ID available: {thread_id}",
-                    file=sys.stderr,
-                    flush=True,
-                )
+            logger.error(f"AI extraction failed (thread {thread_id}): {e}")
             error = ExtractionFailedError(f"AI extraction failed: {str(e)}")
             if thread_id:
                 error.thread_id = thread_id  # type: ignore
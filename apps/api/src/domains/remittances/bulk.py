@@ -0,0 +1,337 @@
+"""
+Bulk remittance uploads: many PDFs or ZIP archives in one request.
+"""
+
+import asyncio
+import logging
+import uuid
+import zipfile
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+from typing import List, Union, cast
+
+from fastapi import HTTPException, UploadFile, status
+from prisma.enums import AuditAction, AuditOutcome, RemittanceStatus
+
+from prisma import Json, Prisma
+from src.core.jobs import JobPriority, job_queue
+from src.core.settings import settings
+from src.domains.remittances.models import (
+    BulkUploadItem,
+    BulkUploadRejection,
+    BulkUploadResponse,
+    UploadBatchResponse,
+)
+from src.domains.remittances.service import (
+    ALLOWED_TYPES,
+    generate_file_path,
+    process_remittance_background,
+    remove_unreferenced_files,
+    store_file_content,
+)
+from src.domains.remittances.upload import (
+    MAX_FILE_SIZE,
+    AsyncReadable,
+    UploadStream,
+    ZipMemberReader,
+    file_too_large_error,
+    is_zip_upload,
+    open_zip,
+    zip_pdf_members,
+)
+from src.shared.pagination import count_cache
+
+logger = logging.getLogger(__name__)
+
+# Statuses of remittances whose processing has not finished yet
+PENDING_STATUSES = {
+    RemittanceStatus.Uploaded,
+    RemittanceStatus.Processing,
+    RemittanceStatus.Data_Retrieved,
+}
+
+
+@dataclass
+class _BulkFile:
+    filename: str
+    reader: AsyncReadable
+
+
+@dataclass
+class _StoredFile:
+    filename: str
+    path: str
+    created: bool
+
+
+async def _expand_uploads(
+    files: List[UploadFile], archives: List[zipfile.ZipFile]
+) -> tuple[List[_BulkFile], List[BulkUploadRejection]]:
+    """Split uploads into PDFs to store, unpacking ZIP archives."""
+    entries: List[_BulkFile] = []
+    rejected: List[BulkUploadRejection] = []
+
+    for file in files:
+        filename = file.filename or "upload"
+
+        if is_zip_upload(file):
+            try:
+                archive = await open_zip(file)
+            except HTTPException as e:
+                rejected.append(BulkUploadRejection(filename=filename, reason=e.detail))
+                continue
+            archives.append(archive)
+
+            for info in zip_pdf_members(archive):
+                member_name = PurePosixPath(info.filename).name
+                if info.file_size > MAX_FILE_SIZE:
+                    rejected.append(
+                        BulkUploadRejection(
+                            filename=member_name,
+                            reason=file_too_large_error(MAX_FILE_SIZE).detail,
+                        )
+                    )
+                    continue
+                entries.append(_BulkFile(member_name, ZipMemberReader(archive, info)))
+            continue
+
+        if file.content_type not in ALLOWED_TYPES:
+            rejected.append(
+                BulkUploadRejection(
+                    filename=filename, reason="Only PDF and ZIP files are allowed"
+                )
+            )
+            continue
+        if file.size is not None and file.size > MAX_FILE_SIZE:
+            rejected.append(
+                BulkUploadRejection(
+                    filename=filename,
+                    reason=file_too_large_error(MAX_FILE_SIZE).detail,
+                )
+            )
+            continue
+        entries.append(_BulkFile(filename, file))
+
+    return entries, rejected
+
+
+async def _store_file(
+    org_id: str, entry: _BulkFile, semaphore: asyncio.Semaphore
+) -> Union[_StoredFile, BulkUploadRejection]:
+    """Validate and stream one file to storage."""
+    async with semaphore:
+        try:
+            upload = UploadStream(entry.reader)
+            await upload.open()
+            file_path, _ = generate_file_path(org_id)
+            path, created = await store_file_content(
+                org_id, upload.chunks(), file_path, "application/pdf"
+            )
+        except HTTPException as e:
+            return BulkUploadRejection(filename=entry.filename, reason=e.detail)
+
+    return _StoredFile(entry.filename, path, created)
+
+
+async def create_remittances_bulk(
+    db: Prisma,
+    org_id: str,
+    user_id: str,
+    files: List[UploadFile],
+    priority: int = JobPriority.LOW,
+) -> BulkUploadResponse:
+    """
+    Create remittances for many uploaded PDFs and ZIP archives of PDFs.
+
+    Files are validated and streamed to storage concurrently, up to
+    BULK_UPLOAD_CONCURRENCY at a time. Files that fail validation or upload
+    are reported as rejected rather than failing the request. The
+    UploadBatch, Remittance and AuditLog rows are written in a single
+    batched transaction, and processing jobs are queued at ``priority``.
+
+    Returns:
+        The batch ID to poll, with accepted and rejected files
+
+    Raises:
+        HTTPException: If no files or too many files were sent, or the
+            database write fails
+    """
+    archives: List[zipfile.ZipFile] = []
+    try:
+        entries, rejected = await _expand_uploads(files, archives)
+
+        file_count = len(entries) + len(rejected)
+        if file_count == 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="No files uploaded"
+            )
+        if file_count > settings.BULK_UPLOAD_MAX_FILES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=(
+                    f"Too many files: {file_count} "
+                    f"(maximum {settings.BULK_UPLOAD_MAX_FILES})"
+                ),
+            )
+
+        semaphore = asyncio.Semaphore(settings.BULK_UPLOAD_CONCURRENCY)
+        results = await asyncio.gather(
+            *(_store_file(org_id, entry, semaphore) for entry in entries)
+        )
+    finally:
+        for archive in archives:
+            archive.close()
+
+    stored = [result for result in results if isinstance(result, _StoredFile)]
+    rejected.extend(r for r in results if isinstance(r, BulkUploadRejection))
+
+    batch_id = str(uuid.uuid4())
+    remittance_ids = [str(uuid.uuid4()) for _ in stored]
+
+    try:
+        async with db.batch_() as batcher:
+            batcher.uploadbatch.create(
+                data={
+                    "id": batch_id,
+                    "organizationId": org_id,
+                    "createdBy": user_id or None,
+                    "fileCount": file_count,
+                    "rejected": Json([r.model_dump() for r in rejected]),
+                }
+            )
+            if stored:
+                batcher.remittance.create_many(
+                    data=[
+                        {
+                            "id": remittance_id,
+                            "organizationId": org_id,
+                            "filename": file.filename,
+                            "filePath": file.path,
+                            "status": RemittanceStatus.Uploaded,
+                            "uploadBatchId": batch_id,
+                        }
+                        for remittance_id, file in zip(remittance_ids, stored)
+                    ]
+                )
+                batcher.auditlog.create_many(
+                    data=[
+                        {
+                            "remittanceId": remittance_id,
+                            "userId": user_id or None,
+                            "organizationId": org_id,
+                            "action": AuditAction.created,
+                            "outcome": AuditOutcome.success,
+                            "newValue": RemittanceStatus.Uploaded.value,
+                            "metadata": Json({"uploadBatchId": batch_id}),
+                        }
+                        for remittance_id in remittance_ids
+                    ]
+                )
+    except Exception as e:
+        await remove_unreferenced_files(db, [f.path for f in stored if f.created])
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create remittance records: {str(e)}",
+        )
+
+    count_cache.invalidate("remittance")
+
+    for remittance_id, file in zip(remittance_ids, stored):
+        job_queue.enqueue(
+            process_remittance_background,
+            db,
+            remittance_id,
+            file.path,
+            org_id,
+            user_id,
+            priority=priority,
+        )
+
+    return BulkUploadResponse(
+        batch_id=batch_id,
+        accepted=[
+            BulkUploadItem(remittance_id=remittance_id, filename=file.filename)
+            for remittance_id, file in zip(remittance_ids, stored)
+        ],
+        rejected=rejected,
+    )
+
+
+async def requeue_pending_uploads(db: Prisma, priority: int = JobPriority.LOW) -> int:
+    """
+    Re-queue processing for bulk uploads that never started.
+
+    Jobs live in the in-memory queue only, so remittances still waiting when
+    the process stopped are left Uploaded. Called at startup; each job claims
+    its remittance before processing, so workers re-queuing the same rows do
+    not process them twice.
+
+    Returns:
+        Number of jobs queued
+    """
+    remittances = await db.remittance.find_many(
+        where={
+            "status": RemittanceStatus.Uploaded,
+            "uploadBatchId": {"not": None},
+            "filePath": {"not": None},
+        },
+        include={"uploadBatch": True},
+        order={"createdAt": "asc"},
+    )
+
+    for remittance in remittances:
+        batch = remittance.uploadBatch
+        job_queue.enqueue(
+            process_remittance_background,
+            db,
+            remittance.id,
+            cast(str, remittance.filePath),
+            remittance.organizationId,
+            (batch.createdBy if batch else None) or "",
+            priority=priority,
+        )
+
+    if remittances:
+        logger.info(f"Re-queued {len(remittances)} pending bulk upload remittances")
+    return len(remittances)
+
+
+async def get_upload_batch(
+    db: Prisma, org_id: str, batch_id: str
+) -> UploadBatchResponse:
+    """
+    Get the progress of a bulk upload.
+
+    Raises:
+        HTTPException: If the batch does not exist in the organization
+    """
+    batch = await db.uploadbatch.find_first(
+        where={"id": batch_id, "organizationId": org_id}
+    )
+    if not batch:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Upload batch not found"
+        )
+
+    groups = await db.remittance.group_by(
+        by=["status"], where={"uploadBatchId": batch_id}, count=True
+    )
+    status_counts = {
+        RemittanceStatus(group["status"]).value: group["_count"]["_all"]
+        for group in groups
+    }
+    pending = sum(
+        count
+        for name, count in status_counts.items()
+        if RemittanceStatus(name) in PENDING_STATUSES
+    )
+
+    return UploadBatchResponse(
+        id=batch.id,
+        file_count=batch.fileCount,
+        created_at=batch.createdAt,
+        rejected=[BulkUploadRejection(**item) for item in batch.rejected or []],
+        status_counts=status_counts,
+        pending=pending,
+        complete=pending == 0,
+    )
@@ -9,9 +9,12 @@ from typing import List
 from uuid import UUID
 
 from prisma.enums import InvoiceStatus
-from prisma.models import Invoice
+from prisma.partials import InvoiceMatchFields
 
 from prisma import Prisma
+from src.core.logs import SAMPLED
+from src.core.metrics import MATCH_OUTCOMES, MATCHING_SECONDS
+from src.core.tracing import span
 from src.domains.remittances.exceptions import MatchingFailedError
 from src.domains.remittances.matching.confidence import calculate_match_confidence
 
@@ -57,10 +60,13 @@ class MatchingService:
 
         try:
             # Get organization invoices for matching
-            invoices = await self._get_organization_invoices(organization_id)
+            with span("db.find_invoices"):
+                invoices = await self._get_organization_invoices(organization_id)
 
             if not invoices:
                 logger.warning(f"No invoices found for organization {organization_id}")
+                if payments:
+                    MATCH_OUTCOMES.inc(len(payments), match_type="unmatched")
                 return self._create_empty_results(payments, remittance_id)
 
             # Prepare invoice data for new async matching system
@@ -74,21 +80,15 @@ class MatchingService:
                 "for concurrent matching"
             )
 
-            # Debug: Show what invoices we're working with
-            import sys
-
-            print(
-                f"🗂️ INVOICE DEBUG: {len(invoice_map)} invoices available:",
-                file=sys.stderr,
-                flush=True,
-            )
-            for inv_num in sorted(invoice_map.keys())[:10]:  # Show first 10
-                print(f"  - '{inv_num}'", file=sys.stderr, flush=True)
-            if len(invoice_map) > 10:
-                print(
-                    f"  ... and {len(invoice_map) - 10} more",
-                    file=sys.stderr,
-                    flush=True,
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Invoices available: %s%s",
+                    ", ".join(sorted(invoice_map)[:10]),
+                    (
+                        f" and {len(invoice_map) - 10} more"
+                        if len(invoice_map) > 10
+                        else ""
+                    ),
                 )
 
             # Process each payment
@@ -113,7 +113,12 @@ class MatchingService:
                     match_stats["unmatched"] += 1
 
             # Calculate processing time
-            processing_time_ms = int((time.time() - start_time) * 1000)
+            elapsed = time.time() - start_time
+            processing_time_ms = int(elapsed * 1000)
+            MATCHING_SECONDS.observe(elapsed)
+            for match_type, count in match_stats.items():
+                if count:
+                    MATCH_OUTCOMES.inc(count, match_type=match_type)
 
             # Create summary
             summary = RemittanceSummary(
@@ -152,7 +157,7 @@ class MatchingService:
         remittance_id: UUID,
         line_number: int,
         invoice_numbers: List[str],
-        invoice_map: dict[str, Invoice],
+        invoice_map: dict[str, InvoiceMatchFields],
     ) -> MatchResult:
         """
         Match a single payment against invoices using new async concurrent strategy.
@@ -202,8 +207,12 @@ class MatchingService:
         )
 
         logger.debug(
-            f"Matched '{payment.invoice_number}' to '{matched_invoice_number}' "
-            f"via {match_type.value} with confidence {confidence}"
+            "Matched %r to %r via %s with confidence %s",
+            payment.invoice_number,
+            matched_invoice_number,
+            match_type.value,
+            confidence,
+            extra=SAMPLED,
         )
 
         return MatchResult(
@@ -217,7 +226,7 @@ class MatchingService:
     def _check_amount_match(
         self,
         payment_amount: Decimal,
-        invoice: Invoice,
+        invoice: InvoiceMatchFields,
         tolerance: Decimal = Decimal("0.01"),
     ) -> bool:
         """
@@ -237,10 +246,14 @@ class MatchingService:
         difference = abs(payment_amount - invoice.total)
         return difference <= tolerance
 
-    async def _get_organization_invoices(self, organization_id: UUID) -> list[Invoice]:
+    async def _get_organization_invoices(
+        self, organization_id: UUID
+    ) -> list[InvoiceMatchFields]:
         """
         Get all active invoices for an organization.
 
+        Only the columns the matcher reads are selected.
+
         Args:
             organization_id: Organization ID
 
@@ -248,7 +261,7 @@ class MatchingService:
             List of organization invoices
         """
         try:
-            invoices = await self.db.invoice.find_many(
+            invoices = await InvoiceMatchFields.prisma(self.db).find_many(
                 where={
                     "organizationId": str(organization_id),
                     "invoiceNumber": {"not": ""},  # Only invoices with numbers
@@ -1,8 +1,12 @@
 import asyncio
+import logging
 import re
-import sys
 from typing import Dict, List, Optional, Tuple
 
+from src.core.logs import SAMPLED
+
+logger = logging.getLogger(__name__)
+
 
 def exact_normalize(invoice_number: str) -> str:
     """
@@ -142,12 +146,6 @@ async def find_best_match_concurrent(
     Returns:
         Tuple of (match_type, matched_invoice) or None if no match
     """
-    print(
-        f"🔍 ASYNC MATCHING DEBUG: Searching for '{target_number}'",
-        file=sys.stderr,
-        flush=True,
-    )
-
     # Start all three match types concurrently
     exact_task = asyncio.create_task(try_exact_match(target_number, exact_lookup))
     relaxed_task = asyncio.create_task(try_relaxed_match(target_number, relaxed_lookup))
@@ -160,34 +158,24 @@ async def find_best_match_concurrent(
 
     # Return first successful match in priority order (exact > relaxed > numeric)
     if exact_result:
-        print(
-            f"  ✅ EXACT match found: '{target_number}' → '{exact_result}'",
-            file=sys.stderr,
-            flush=True,
+        logger.debug(
+            "Exact match: %r -> %r", target_number, exact_result, extra=SAMPLED
         )
         return ("exact", exact_result)
 
     if relaxed_result:
-        print(
-            f"  ✅ RELAXED match found: '{target_number}' → '{relaxed_result}'",
-            file=sys.stderr,
-            flush=True,
+        logger.debug(
+            "Relaxed match: %r -> %r", target_number, relaxed_result, extra=SAMPLED
         )
         return ("relaxed", relaxed_result)
 
     if numeric_result:
-        print(
-            f"  ✅ NUMERIC match found: '{target_number}' → '{numeric_result}'",
-            file=sys.stderr,
-            flush=True,
+        logger.debug(
+            "Numeric match: %r -> %r", target_number, numeric_result, extra=SAMPLED
         )
         return ("numeric", numeric_result)
 
-    print(
-        f"  ❌ No match found for '{target_number}'",
-        file=sys.stderr,
-        flush=True,
-    )
+    logger.debug("No match for %r", target_number, extra=SAMPLED)
     return None
 
 
@@ -205,11 +193,10 @@ async def match_payments_concurrent(
         List of tuples: (payment_invoice_number, match_result)
         where match_result is (match_type, matched_invoice) or None
     """
-    print(
-        f"🚀 Starting concurrent matching for {len(payment_invoice_numbers)} "
-        f"payments against {len(invoice_numbers)} invoices",
-        file=sys.stderr,
-        flush=True,
+    logger.debug(
+        "Matching %d payments against %d invoices",
+        len(payment_invoice_numbers),
+        len(invoice_numbers),
     )
 
     # Build all lookup tables concurrently
@@ -221,11 +208,11 @@ async def match_payments_concurrent(
         exact_task, relaxed_task, numeric_task
     )
 
-    print(
-        f"📊 Built lookups: exact={len(exact_lookup)}, "
-        f"relaxed={len(relaxed_lookup)}, numeric={len(numeric_lookup)}",
-        file=sys.stderr,
-        flush=True,
+    logger.debug(
+        "Built lookups: exact=%d relaxed=%d numeric=%d",
+        len(exact_lookup),
+        len(relaxed_lookup),
+        len(numeric_lookup),
     )
 
     # Match all payments concurrently
@@ -251,11 +238,12 @@ async def match_payments_concurrent(
     numeric_count = sum(1 for _, result in results if result and result[0] == "numeric")
     no_match_count = sum(1 for _, result in results if result is None)
 
-    print(
-        f"🎉 Matching complete: {exact_count} exact, {relaxed_count} relaxed, "
-        f"{numeric_count} numeric, {no_match_count} no match",
-        file=sys.stderr,
-        flush=True,
+    logger.info(
+        "Matching complete: %d exact, %d relaxed, %d numeric, %d no match",
+        exact_count,
+        relaxed_count,
+        numeric_count,
+        no_match_count,
     )
 
     return results
@@ -269,11 +257,9 @@ def find_potential_matches(
     Legacy function - converts old format to new concurrent approach.
     This maintains backwards compatibility while using the new async system.
     """
-    print(
-        "⚠️ Using legacy find_potential_matches - "
-        "consider migrating to match_payments_concurrent",
-        file=sys.stderr,
-        flush=True,
+    logger.warning(
+        "Using legacy find_potential_matches - "
+        "consider migrating to match_payments_concurrent"
     )
 
     # Extract invoice numbers from the old combined lookup table
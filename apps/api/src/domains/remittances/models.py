@@ -1,6 +1,6 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from prisma.enums import RemittanceStatus
 from pydantic import BaseModel, ConfigDict, Field
@@ -42,18 +42,30 @@ class RemittanceResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
+class RemittanceExtractionResponse(BaseModel):
+    remittance_id: str = Field(alias="remittanceId")
+    raw_json: Any = Field(alias="rawJson")
+    created_at: Optional[datetime] = Field(default=None, alias="createdAt")
+    updated_at: Optional[datetime] = Field(default=None, alias="updatedAt")
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
 class RemittanceDetailResponse(RemittanceResponse):
     lines: List[RemittanceLineResponse] = []
+    extraction: Optional[RemittanceExtractionResponse] = None
 
     model_config = ConfigDict(from_attributes=True)
 
 
 class RemittanceListResponse(BaseModel):
     remittances: List[RemittanceResponse]
-    total: int
+    total: Optional[int] = None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    has_next: bool = False
+    next_cursor: Optional[str] = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -84,8 +96,48 @@ class FileUploadResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class BulkUploadItem(BaseModel):
+    remittance_id: str
+    filename: str
+
+
+class BulkUploadRejection(BaseModel):
+    filename: str
+    reason: str
+
+
+class BulkUploadResponse(BaseModel):
+    batch_id: str
+    accepted: List[BulkUploadItem] = []
+    rejected: List[BulkUploadRejection] = []
+
+
+class UploadBatchResponse(BaseModel):
+    id: str
+    file_count: int = Field(description="Files received, including rejected ones")
+    created_at: Optional[datetime] = None
+    rejected: List[BulkUploadRejection] = []
+    status_counts: Dict[str, int] = Field(
+        default_factory=dict, description="Accepted remittances by status"
+    )
+    pending: int = Field(0, description="Remittances still queued or processing")
+    complete: bool = False
+
+
 class FileUrlResponse(BaseModel):
     url: str
     expires_in: int = Field(default=3600, description="URL expiry time in seconds")
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class FileUrlBatchRequest(BaseModel):
+    remittance_ids: List[str] = Field(..., min_length=1, max_length=100)
+
+
+class FileUrlBatchResponse(BaseModel):
+    urls: Dict[str, FileUrlResponse] = Field(
+        default_factory=dict,
+        description="File URLs keyed by remittance ID; remittances without a "
+        "file are omitted",
+    )
@@ -1,21 +1,30 @@
-from typing import Optional
+from typing import List, Literal, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, File, Query, UploadFile, status
 from prisma.models import OrganizationMember
 
 from prisma import Prisma
-from src.core.database import get_db
+from src.core.database import get_db, get_read_db
+from src.core.jobs import JobPriority
+from src.domains.remittances.bulk import create_remittances_bulk, get_upload_batch
 from src.domains.remittances.models import (
+    BulkUploadResponse,
     FileUploadResponse,
+    FileUrlBatchRequest,
+    FileUrlBatchResponse,
     FileUrlResponse,
     RemittanceDetailResponse,
+    RemittanceExtractionResponse,
     RemittanceListResponse,
     RemittanceUpdateRequest,
+    UploadBatchResponse,
 )
 from src.domains.remittances.service import (
     create_remittance,
     get_file_url,
+    get_file_urls,
     get_remittance_by_id,
+    get_remittance_extraction,
     get_remittances_by_organization,
     update_remittance,
 )
@@ -62,6 +71,63 @@ async def upload_remittance(
     )
 
 
+@router.post(
+    "/{org_id}/bulk",
+    response_model=BulkUploadResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Bulk upload remittance files",
+    description="Upload many remittance PDFs, or ZIP archives of PDFs, at once",
+)
+async def bulk_upload_remittances(
+    org_id: str,
+    files: List[UploadFile] = File(..., description="PDF or ZIP files to upload"),
+    priority: Literal["high", "normal", "low"] = Query(
+        "low", description="Processing priority relative to other uploads"
+    ),
+    membership: OrganizationMember = Depends(
+        require_permission(Permission.CREATE_REMITTANCES)
+    ),
+    db: Prisma = Depends(get_db),
+) -> BulkUploadResponse:
+    """
+    Upload a batch of remittance files.
+
+    Requires CREATE_REMITTANCES permission.
+    Files that fail validation are listed as rejected. Processing runs in the
+    background; poll the returned batch ID for progress.
+    """
+    return await create_remittances_bulk(
+        db=db,
+        org_id=org_id,
+        user_id=membership.profileId or "",
+        files=files,
+        priority=JobPriority[priority.upper()],
+    )
+
+
+@router.get(
+    "/{org_id}/batches/{batch_id}",
+    response_model=UploadBatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get upload batch progress",
+    description="Get processing progress for a bulk upload",
+)
+async def get_upload_batch_endpoint(
+    org_id: str,
+    batch_id: str,
+    membership: OrganizationMember = Depends(
+        require_permission(Permission.VIEW_REMITTANCES)
+    ),
+    db: Prisma = Depends(get_db),
+) -> UploadBatchResponse:
+    """
+    Get remittance counts by status for a bulk upload.
+
+    Requires VIEW_REMITTANCES permission.
+    """
+    return await get_upload_batch(db=db, org_id=org_id, batch_id=batch_id)
+
+
 @router.get(
     "/{org_id}",
     response_model=RemittanceListResponse,
@@ -83,12 +149,22 @@ async def list_remittances(
         None, description="Filter remittances to this date (ISO format)"
     ),
     search: Optional[str] = Query(
-        None, description="Search in filename or payment reference"
+        None,
+        description=(
+            "Search in filename or payment reference; "
+            "results are ranked by relevance"
+        ),
+    ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from the previous page (overrides page)"
+    ),
+    include_total: bool = Query(
+        True, description="Include the total count in the response"
     ),
     membership: OrganizationMember = Depends(
         require_permission(Permission.VIEW_REMITTANCES)
     ),
-    db: Prisma = Depends(get_db),
+    db: Prisma = Depends(get_read_db),
 ) -> RemittanceListResponse:
     """
     Get a paginated list of remittances for the organization.
@@ -105,6 +181,8 @@ async def list_remittances(
         date_from=date_from,
         date_to=date_to,
         search=search,
+        cursor=cursor,
+        include_total=include_total,
     )
 
 
@@ -120,6 +198,9 @@ async def list_remittances(
 async def get_remittance(
     org_id: str,
     remittance_id: str,
+    include_extraction: bool = Query(
+        False, description="Include the raw AI extraction output"
+    ),
     membership: OrganizationMember = Depends(
         require_permission(Permission.VIEW_REMITTANCES)
     ),
@@ -129,9 +210,15 @@ async def get_remittance(
     Get detailed information about a specific remittance.
 
     Requires VIEW_REMITTANCES permission.
-    Returns remittance data including associated remittance lines.
+    Returns remittance data including associated remittance lines, and the raw
+    extraction output when include_extraction is set.
     """
-    return await get_remittance_by_id(db=db, org_id=org_id, remittance_id=remittance_id)
+    return await get_remittance_by_id(
+        db=db,
+        org_id=org_id,
+        remittance_id=remittance_id,
+        include_extraction=include_extraction,
+    )
 
 
 @router.patch(
@@ -171,6 +258,31 @@ async def update_remittance_endpoint(
     )
 
 
+@router.get(
+    "/{org_id}/{remittance_id}/extraction",
+    response_model=RemittanceExtractionResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get remittance extraction output",
+    description="Get the raw AI extraction output stored for a remittance",
+)
+async def get_remittance_extraction_endpoint(
+    org_id: str,
+    remittance_id: str,
+    membership: OrganizationMember = Depends(
+        require_permission(Permission.VIEW_REMITTANCES)
+    ),
+    db: Prisma = Depends(get_db),
+) -> RemittanceExtractionResponse:
+    """
+    Get the raw AI extraction output for debugging.
+
+    Requires VIEW_REMITTANCES permission.
+    """
+    return await get_remittance_extraction(
+        db=db, org_id=org_id, remittance_id=remittance_id
+    )
+
+
 @router.get(
     "/{org_id}/{remittance_id}/file",
     response_model=FileUrlResponse,
@@ -190,6 +302,32 @@ async def get_remittance_file_url(
     Get a signed URL for accessing the remittance file.
 
     Requires VIEW_REMITTANCES permission.
-    Returns a temporary URL that expires in 1 hour.
+    Returns a temporary URL; expires_in gives its remaining lifetime.
     """
     return await get_file_url(db=db, org_id=org_id, remittance_id=remittance_id)
+
+
+@router.post(
+    "/{org_id}/files",
+    response_model=FileUrlBatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get remittance file URLs",
+    description="Get temporary signed URLs for the files of several remittances",
+)
+async def get_remittance_file_urls(
+    org_id: str,
+    request: FileUrlBatchRequest,
+    membership: OrganizationMember = Depends(
+        require_permission(Permission.VIEW_REMITTANCES)
+    ),
+    db: Prisma = Depends(get_db),
+) -> FileUrlBatchResponse:
+    """
+    Get signed URLs for the files of several remittances in one call.
+
+    Requires VIEW_REMITTANCES permission.
+    Intended for list views; remittances without a file are omitted.
+    """
+    return await get_file_urls(
+        db=db, org_id=org_id, remittance_ids=request.remittance_ids
+    )
@@ -1,45 +1,70 @@
 import asyncio
 import logging
 import uuid
-from datetime import datetime, timezone
-from typing import Any, cast
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Any, Awaitable, Callable, Iterator, cast
 
 from fastapi import BackgroundTasks, HTTPException, UploadFile, status
-from prisma.enums import AuditAction, AuditOutcome, RemittanceStatus
+from prisma.enums import (
+    AuditAction,
+    AuditOutcome,
+    BatchPaymentStatus,
+    RemittanceStatus,
+)
+from prisma.partials import RemittanceListItem, RemittanceStatusFields
 from prisma.types import RemittanceUpdateInput, RemittanceWhereInput
-from supabase import create_client
 
 from prisma import Json, Prisma
+from src.core.audit import audit_log
+from src.core.logs import SAMPLED, log_context
+from src.core.metrics import DB_WRITE_SECONDS, REMITTANCE_PROCESSING_SECONDS
 from src.core.settings import settings
+from src.core.storage import (
+    StorageContent,
+    StorageError,
+    signed_url_cache,
+    storage_service,
+)
+from src.core.tracing import span
 from src.domains.external_accounting.base.data_service import BaseIntegrationDataService
 from src.domains.external_accounting.base.factory import IntegrationFactory
 from src.domains.external_accounting.base.sync_orchestrator import SyncOrchestrator
-from src.domains.external_accounting.base.types import (
-    BaseInvoiceFilters,
-    BatchPaymentData,
-    PaymentItem,
-)
-
-# storage_service import removed - using existing supabase client
+from src.domains.external_accounting.base.types import BatchPaymentData, PaymentItem
+from src.domains.external_accounting.xero.data_service import XeroDataService
+from src.domains.external_accounting.xero.types import BatchPaymentStatusResult
 from src.domains.remittances.ai_extraction import AIExtractionService
 from src.domains.remittances.matching import MatchingService
 from src.domains.remittances.models import (
+    FileUrlBatchResponse,
     FileUrlResponse,
     RemittanceDetailResponse,
+    RemittanceExtractionResponse,
     RemittanceListResponse,
     RemittanceResponse,
     RemittanceUpdateRequest,
 )
+from src.domains.remittances.upload import (
+    MAX_FILE_SIZE,
+    UploadStream,
+    file_too_large_error,
+)
+from src.shared.pagination import (
+    KEYSET_ORDER,
+    count_cache,
+    encode_cursor,
+    keyset_where,
+)
+from src.shared.search import (
+    REMITTANCE_SEARCH,
+    count_search_matches,
+    order_by_rank,
+    search_ranked_ids,
+)
 
 logger = logging.getLogger(__name__)
 
-# Initialize Supabase client
-supabase = create_client(
-    settings.SUPABASE_URL or "", settings.SUPABASE_SERVICE_ROLE_KEY or ""
-)
-
-BUCKET_NAME = "remittances"
-MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 ALLOWED_TYPES = ["application/pdf"]
 
 
@@ -50,14 +75,10 @@ async def validate_file(file: UploadFile) -> None:
             status_code=status.HTTP_400_BAD_REQUEST, detail="Only PDF files are allowed"
         )
 
+    # Reject early when the client declares the size; UploadStream enforces
+    # the limit on the bytes actually received
     if file.size is not None and file.size > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=(
-                f"File size exceeds maximum limit of "
-                f"{MAX_FILE_SIZE / (1024*1024):.0f}MB"
-            ),
-        )
+        raise file_too_large_error(MAX_FILE_SIZE)
 
 
 def generate_file_path(org_id: str) -> tuple[str, str]:
@@ -69,38 +90,85 @@ def generate_file_path(org_id: str) -> tuple[str, str]:
 
 
 async def upload_file_to_storage_with_content(
-    file_content: bytes, file_path: str, content_type: str | None
+    file_content: StorageContent, file_path: str, content_type: str | None
 ) -> str:
-    """Upload file content to Supabase Storage and return the stored path."""
+    """Upload file content to storage and return the stored path."""
     try:
-        # Upload to Supabase Storage
-        response = supabase.storage.from_(BUCKET_NAME).upload(
-            path=file_path,
-            file=file_content,
-            file_options={
-                "content-type": content_type or "application/pdf",
-                "cache-control": "3600",
-            },
+        return await storage_service.upload(
+            file_path, file_content, content_type or "application/pdf"
+        )
+    except StorageError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"File upload failed: {str(e)}",
         )
 
-        if hasattr(response, "error") and response.error:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to upload file: {response.error.message}",
-            )
-        elif isinstance(response, dict) and response.get("error"):
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to upload file: {response['error']['message']}",
-            )
 
-        return file_path
+async def store_file_content(
+    org_id: str,
+    file_content: StorageContent,
+    file_path: str,
+    content_type: str | None,
+) -> tuple[str, bool]:
+    """
+    Store an uploaded file, deduplicating by content when enabled.
+
+    With STORAGE_DEDUPLICATE set, the file is stored under a path derived from
+    its SHA-256 digest, hashed while it streams, so re-uploads of the same
+    document within an organization share one object. Otherwise it is stored
+    at ``file_path``.
 
-    except Exception as e:
+    Returns:
+        The stored path and whether a new object was written
+    """
+    with span("storage.upload", deduplicate=settings.STORAGE_DEDUPLICATE):
+        return await _store_file_content(org_id, file_content, file_path, content_type)
+
+
+async def _store_file_content(
+    org_id: str,
+    file_content: StorageContent,
+    file_path: str,
+    content_type: str | None,
+) -> tuple[str, bool]:
+    if not settings.STORAGE_DEDUPLICATE:
+        stored_path = await upload_file_to_storage_with_content(
+            file_content, file_path, content_type
+        )
+        return stored_path, True
+
+    try:
+        stored = await storage_service.upload_deduplicated(
+            org_id, file_content, content_type or "application/pdf"
+        )
+    except StorageError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"File upload failed: {str(e)}",
         )
+    return stored.path, stored.created
+
+
+async def remove_unreferenced_files(db: Prisma, paths: list[str]) -> None:
+    """
+    Delete stored files that no remittance references.
+
+    Used to clean up after a failed create. Deduplicated files may be shared
+    with a remittance created concurrently, so each path is checked first.
+    Cleanup failures are swallowed.
+    """
+    try:
+        orphaned = [
+            path
+            for path in dict.fromkeys(paths)
+            if not await db.remittance.count(where={"filePath": path})
+        ]
+        if orphaned:
+            await storage_service.remove(orphaned)
+            for path in orphaned:
+                signed_url_cache.invalidate(path)
+    except Exception:
+        pass  # Don't fail if cleanup fails
 
 
 async def create_remittance(
@@ -111,18 +179,17 @@ async def create_remittance(
     background_tasks: BackgroundTasks,
 ) -> RemittanceResponse:
     """Create a new remittance record with file upload."""
-    # Validate file
+    # Validate file type and declared size, then sniff the PDF header
     await validate_file(file)
+    upload = UploadStream(file)
+    await upload.open()
 
     # Generate file path
     file_path, unique_id = generate_file_path(org_id)
 
-    # Read file content once for both upload and processing
-    file_content = await file.read()
-
-    # Upload file to storage
-    stored_path = await upload_file_to_storage_with_content(
-        file_content, file_path, file.content_type
+    # Stream the file to storage, enforcing the size limit as it is read
+    stored_path, created = await store_file_content(
+        org_id, upload.chunks(), file_path, file.content_type
     )
 
     try:
@@ -136,40 +203,41 @@ async def create_remittance(
                 "status": RemittanceStatus.Uploaded,
             }
         )
+        count_cache.invalidate("remittance")
 
         # Create audit log
-        await db.auditlog.create(
-            data={
+        await audit_log.write(
+            db,
+            {
                 "remittanceId": remittance.id,
                 "userId": user_id,
                 "organizationId": org_id,
                 "action": AuditAction.created,
                 "outcome": AuditOutcome.success,
                 "newValue": RemittanceStatus.Uploaded.value,
-            }
+            },
         )
 
         # Start background processing
-        print(f"🎯 Adding background task for remittance {remittance.id}")
-        print(f"📄 File content length: {len(file_content)} bytes")
+        logger.info(
+            f"Queued processing of remittance {remittance.id} ({upload.size} bytes)"
+        )
         background_tasks.add_task(
             process_remittance_background,
             db,
             remittance.id,
-            file_content,
+            stored_path,
             org_id,
             user_id,
         )
-        print("✅ Background task added to queue")
 
         return RemittanceResponse.model_validate(remittance)
 
     except Exception as e:
-        # Clean up uploaded file if database operation fails
-        try:
-            supabase.storage.from_(BUCKET_NAME).remove([stored_path])
-        except Exception:
-            pass  # Don't fail if cleanup fails
+        # Clean up uploaded file if database operation fails, unless the
+        # object already existed
+        if created:
+            await remove_unreferenced_files(db, [stored_path])
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -186,8 +254,19 @@ async def get_remittances_by_organization(
     date_from: str | None = None,
     date_to: str | None = None,
     search: str | None = None,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> RemittanceListResponse:
-    """Get paginated list of remittances with optional filtering."""
+    """
+    Get paginated list of remittances with optional filtering.
+
+    Passing a cursor from a previous page switches to keyset pagination on
+    (createdAt, id), which stays fast at any depth. Totals come from a short
+    lived count cache and can be skipped with include_total=False. A search
+    term returns trigram-ranked matches within the filters, best first, paged
+    by page only; combining it with a cursor is rejected. Rows
+    are fetched as RemittanceListItem, selecting the list columns only.
+    """
     # Build where clause
     where_clause: dict[str, Any] = {"organizationId": org_id}
 
@@ -228,28 +307,82 @@ async def get_remittances_by_organization(
                 detail="Invalid date_to format. Use ISO format.",
             )
 
-    if search:
-        where_clause["OR"] = [
-            {"filename": {"contains": search, "mode": "insensitive"}},
-            {"reference": {"contains": search, "mode": "insensitive"}},
-        ]
-
-    # Calculate offset
-    offset = (page - 1) * page_size
+    count_filters = where_clause
+    count: Callable[[], Awaitable[int]] = partial(
+        db.remittance.count, where=cast(RemittanceWhereInput, where_clause)
+    )
 
-    # Get total count
-    total = await db.remittance.count(where=cast(RemittanceWhereInput, where_clause))
+    if search:
+        if cursor:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor pagination is not supported with search",
+            )
 
-    # Get remittances
-    remittances = await db.remittance.find_many(
-        where=cast(RemittanceWhereInput, where_clause),
-        skip=offset,
-        take=page_size,
-        order={"createdAt": "desc"},
-    )
+        # Trigram-indexed search over filename and reference, ranked within
+        # the listing filters and paged in SQL
+        ranked_ids = await search_ranked_ids(
+            db,
+            REMITTANCE_SEARCH,
+            org_id,
+            search,
+            where=where_clause,
+            limit=page_size if include_total else page_size + 1,
+            offset=(page - 1) * page_size,
+        )
+        remittances = (
+            order_by_rank(
+                await RemittanceListItem.prisma(db).find_many(
+                    where=cast(
+                        RemittanceWhereInput,
+                        {**where_clause, "id": {"in": ranked_ids}},
+                    )
+                ),
+                ranked_ids,
+            )
+            if ranked_ids
+            else []
+        )
+        count_filters = {**where_clause, "search": search}
+        count = partial(
+            count_search_matches, db, REMITTANCE_SEARCH, org_id, search, where_clause
+        )
+    elif cursor:
+        # Keyset pagination: seek past the cursor instead of skipping rows
+        remittances = await RemittanceListItem.prisma(db).find_many(
+            where=cast(
+                RemittanceWhereInput, {"AND": [where_clause, keyset_where(cursor)]}
+            ),
+            take=page_size + 1,
+            order=cast(Any, KEYSET_ORDER),
+        )
+    else:
+        # Offset pagination; fetch one extra row when the total is skipped so
+        # has_next can still be derived
+        remittances = await RemittanceListItem.prisma(db).find_many(
+            where=cast(RemittanceWhereInput, where_clause),
+            skip=(page - 1) * page_size,
+            take=page_size if include_total else page_size + 1,
+            order=cast(Any, KEYSET_ORDER),
+        )
 
     # Calculate pagination info
-    total_pages = (total + page_size - 1) // page_size
+    total: int | None = None
+    total_pages: int | None = None
+    if include_total:
+        total = await count_cache.get_or_count(db, "remittance", count_filters, count)
+        total_pages = (total + page_size - 1) // page_size
+
+    if cursor or not include_total:
+        has_next = len(remittances) > page_size
+        remittances = remittances[:page_size]
+    else:
+        has_next = page * page_size < (total or 0)
+
+    # Relevance-ordered search pages have no keyset position
+    next_cursor = None
+    if has_next and remittances and not search:
+        next_cursor = encode_cursor(remittances[-1].createdAt, remittances[-1].id)
 
     return RemittanceListResponse(
         remittances=[RemittanceResponse.model_validate(r) for r in remittances],
@@ -257,15 +390,22 @@ async def get_remittances_by_organization(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        has_next=has_next,
+        next_cursor=next_cursor,
     )
 
 
 async def get_remittance_by_id(
-    db: Prisma, org_id: str, remittance_id: str
+    db: Prisma, org_id: str, remittance_id: str, include_extraction: bool = False
 ) -> RemittanceDetailResponse:
-    """Get a single remittance with its lines."""
+    """
+    Get a single remittance with its lines.
+
+    The raw AI extraction output is only joined when include_extraction is set.
+    """
     remittance = await db.remittance.find_unique(
-        where={"id": remittance_id}, include={"lines": True}
+        where={"id": remittance_id},
+        include={"lines": True, "extraction": include_extraction},
     )
 
     if not remittance or remittance.organizationId != org_id:
@@ -276,6 +416,26 @@ async def get_remittance_by_id(
     return RemittanceDetailResponse.model_validate(remittance)
 
 
+async def get_remittance_extraction(
+    db: Prisma, org_id: str, remittance_id: str
+) -> RemittanceExtractionResponse:
+    """Get the raw AI extraction output stored for a remittance."""
+    extraction = await db.remittanceextraction.find_first(
+        where={
+            "remittanceId": remittance_id,
+            "remittance": {"is": {"organizationId": org_id}},
+        }
+    )
+
+    if not extraction:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Remittance extraction not found",
+        )
+
+    return RemittanceExtractionResponse.model_validate(extraction)
+
+
 async def update_remittance(
     db: Prisma,
     org_id: str,
@@ -373,13 +533,15 @@ async def update_remittance(
 
     # Create audit log for significant changes
     if "status" in update_dict:
+        count_cache.invalidate("remittance")
         action = (
             AuditAction.approved
             if update_dict["status"] == RemittanceStatus.Awaiting_Approval
             else AuditAction.updated
         )
-        await db.auditlog.create(
-            data={
+        await audit_log.write(
+            db,
+            {
                 "remittanceId": remittance_id,
                 "userId": user_id,
                 "organizationId": org_id,
@@ -392,7 +554,7 @@ async def update_remittance(
                     if isinstance(update_dict["status"], RemittanceStatus)
                     else str(update_dict["status"])
                 ),
-            }
+            },
         )
 
     return RemittanceDetailResponse.model_validate(remittance)
@@ -414,70 +576,107 @@ async def get_file_url(db: Prisma, org_id: str, remittance_id: str) -> FileUrlRe
         )
 
     try:
-        # Generate signed URL (expires in 1 hour)
-        response = supabase.storage.from_(BUCKET_NAME).create_signed_url(
-            path=remittance.filePath, expires_in=3600
+        # Reuse the cached signed URL while it has enough lifetime left
+        url, expires_in = await signed_url_cache.get(remittance.filePath)
+        return FileUrlResponse(url=url, expires_in=expires_in)
+
+    except StorageError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to generate file URL: {str(e)}",
         )
 
-        if response.get("error"):
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to generate file URL: {response['error']['message']}",
-            )
 
-        return FileUrlResponse(url=response["signedURL"], expires_in=3600)
+async def get_file_urls(
+    db: Prisma, org_id: str, remittance_ids: list[str]
+) -> FileUrlBatchResponse:
+    """
+    Get signed URLs for the files of several remittances.
 
-    except Exception as e:
+    Cached URLs are reused and the rest are signed in a single storage
+    request. Remittances that do not exist in the organization or have no
+    file are left out of the response.
+    """
+    remittances = await db.remittance.find_many(
+        where={
+            "id": {"in": remittance_ids},
+            "organizationId": org_id,
+            "filePath": {"not": None},
+        }
+    )
+    paths = {r.id: r.filePath for r in remittances if r.filePath}
+
+    try:
+        signed = await signed_url_cache.get_many(list(paths.values()))
+    except StorageError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate file URL: {str(e)}",
+            detail=f"Failed to generate file URLs: {str(e)}",
         )
 
+    urls = {}
+    for remittance_id, path in paths.items():
+        if path in signed:
+            url, expires_in = signed[path]
+            urls[remittance_id] = FileUrlResponse(url=url, expires_in=expires_in)
+
+    return FileUrlBatchResponse(urls=urls)
+
 
 async def process_remittance_background(
-    db: Prisma, remittance_id: str, file_content: bytes, org_id: str, user_id: str
+    db: Prisma, remittance_id: str, file_path: str, org_id: str, user_id: str
 ) -> None:
     """
     Background task to process remittance: extract data and match invoices.
+
+    The file is read back from storage here rather than kept in memory
+    between the upload request and the task. Everything logged or traced
+    while processing is tagged with the remittance and organization IDs.
     """
-    # Write directly to stderr to ensure visibility
-    import sys
+    with (
+        log_context(remittance_id=remittance_id, org_id=org_id),
+        span("remittance.process"),
+        REMITTANCE_PROCESSING_SECONDS.time(),
+    ):
+        await _process_remittance(db, remittance_id, file_path, org_id, user_id)
 
-    print(
-        f"🚀 BACKGROUND TASK STARTED for remittance {remittance_id}",
-        file=sys.stderr,
-        flush=True,
-    )
-    print(
-        f"📊 File content size: {len(file_content)} bytes", file=sys.stderr, flush=True
-    )
 
-    # Also update status immediately to confirm task is running
-    await db.remittance.update(
-        where={"id": remittance_id}, data={"status": RemittanceStatus.Processing}
-    )
-    print(
-        f"✅ Updated status to Processing for {remittance_id}",
-        file=sys.stderr,
-        flush=True,
+@contextmanager
+def _timed_write(operation: str) -> Iterator[None]:
+    """Trace a processing write and record its duration."""
+    with span(f"db.{operation}"), DB_WRITE_SECONDS.time(operation=operation):
+        yield
+
+
+async def _process_remittance(
+    db: Prisma, remittance_id: str, file_path: str, org_id: str, user_id: str
+) -> None:
+    # Claim the remittance and confirm the task is running; a bulk upload job
+    # re-queued at startup may already have been picked up by another worker
+    claimed = await db.remittance.update_many(
+        where={"id": remittance_id, "status": RemittanceStatus.Uploaded},
+        data={"status": RemittanceStatus.Processing},
     )
+    if not claimed:
+        logger.info("Remittance already picked up, skipping")
+        return
+    count_cache.invalidate("remittance")
+
+    logger.info("Processing remittance")
 
     try:
         logger.info(f"Starting background processing for remittance {remittance_id}")
 
-        print("🔧 Initializing AI extraction service...", file=sys.stderr, flush=True)
+        with span("storage.download"):
+            file_content = await storage_service.download(file_path)
+        logger.debug("Downloaded %d bytes from storage", len(file_content))
+
         # Initialize services
         ai_service = AIExtractionService()
-        print("✅ AI service initialized", file=sys.stderr, flush=True)
-
-        print("🔧 Initializing matching service...", file=sys.stderr, flush=True)
         matching_service = MatchingService(db)
-        print("✅ Matching service initialized", file=sys.stderr, flush=True)
 
         from uuid import UUID
 
-        print("🤖 Starting AI extraction from PDF...", file=sys.stderr, flush=True)
-
         # Create AI client instance to check for thread ID after creation
         from src.shared.ai import openai_client
 
@@ -494,44 +693,23 @@ async def process_remittance_background(
                 else extracted_data.thread_id
             )
             if current_thread_id:
-                print(
-                    f"💾 Saving thread ID {current_thread_id} for debugging",
-                    file=sys.stderr,
-                    flush=True,
-                )
                 await db.remittance.update(
                     where={"id": remittance_id},
                     data={"openaiThreadId": current_thread_id},
                 )
-                print(
-                    f"✅ Thread ID {current_thread_id} saved to database",
-                    file=sys.stderr,
-                    flush=True,
-                )
-
-            print(
-                "🎉 AI extraction completed successfully!", file=sys.stderr, flush=True
-            )
+                logger.debug("Saved thread ID %s", current_thread_id)
         except Exception as ai_error:
             # Try to save thread ID even if extraction fails
             current_thread_id = (
                 openai_client.get_current_thread_id() if openai_client else None
             )
             if current_thread_id:
-                print(
-                    f"💾 Saving thread ID {current_thread_id} despite "
-                    f"extraction failure",
-                    file=sys.stderr,
-                    flush=True,
-                )
                 await db.remittance.update(
                     where={"id": remittance_id},
                     data={"openaiThreadId": current_thread_id},
                 )
-                print(
-                    f"✅ Thread ID {current_thread_id} saved for debugging",
-                    file=sys.stderr,
-                    flush=True,
+                logger.info(
+                    f"Saved thread ID {current_thread_id} despite extraction failure"
                 )
 
             # Re-raise the original error
@@ -545,35 +723,36 @@ async def process_remittance_background(
         )
 
         # Update remittance with basic extracted data
-        await db.remittance.update(
-            where={"id": remittance_id},
-            data={
-                "status": RemittanceStatus.Data_Retrieved,
-                "totalAmount": extracted_data.total_amount,
-                "paymentDate": datetime.combine(
-                    extracted_data.payment_date, datetime.min.time(), timezone.utc
-                ),
-                "reference": extracted_data.payment_reference,
-                "confidenceScore": extracted_data.confidence,
-                # Thread ID already saved above, but include here as backup
-                "openaiThreadId": extracted_data.thread_id,
-                # Store raw extracted JSON for debugging
-                "extractedRawJson": cast(Json, raw_json_string),
-            },
-        )
+        with _timed_write("save_extraction"):
+            await db.remittance.update(
+                where={"id": remittance_id},
+                data={
+                    "status": RemittanceStatus.Data_Retrieved,
+                    "totalAmount": extracted_data.total_amount,
+                    "paymentDate": datetime.combine(
+                        extracted_data.payment_date, datetime.min.time(), timezone.utc
+                    ),
+                    "reference": extracted_data.payment_reference,
+                    "confidenceScore": extracted_data.confidence,
+                    # Thread ID already saved above, but include here as backup
+                    "openaiThreadId": extracted_data.thread_id,
+                    # Store raw extracted JSON for debugging, off the hot row
+                    "extraction": {
+                        "upsert": {
+                            "create": {"rawJson": cast(Json, raw_json_string)},
+                            "update": {"rawJson": cast(Json, raw_json_string)},
+                        }
+                    },
+                },
+            )
+            count_cache.invalidate("remittance")
 
-        print(
-            f"✅ Remittance {remittance_id} updated with extracted data",
-            file=sys.stderr,
-            flush=True,
+        logger.info(
+            "Extracted %d payments, creating remittance lines",
+            len(extracted_data.payments),
         )
 
         # Create remittance lines from extracted payment data
-        print(
-            f"📝 Creating {len(extracted_data.payments)} remittance lines...",
-            file=sys.stderr,
-            flush=True,
-        )
 
         for payment in extracted_data.payments:
             try:
@@ -592,38 +771,22 @@ async def process_remittance_background(
                     "matchType": None,
                 }
 
-                await db.remittanceline.create(data=create_data)
-                print(
-                    f"✅ Created line for invoice {payment.invoice_number} "
-                    f"with amount {payment.paid_amount}",
-                    file=sys.stderr,
-                    flush=True,
+                with _timed_write("create_line"):
+                    await db.remittanceline.create(data=create_data)
+                logger.debug(
+                    "Created line for invoice %s with amount %s",
+                    payment.invoice_number,
+                    payment.paid_amount,
+                    extra=SAMPLED,
                 )
             except Exception as line_error:
-                print(
-                    f"❌ Failed to create line for invoice "
-                    f"{payment.invoice_number}: {line_error}",
-                    file=sys.stderr,
-                    flush=True,
-                )
                 # Log the error but continue with other lines
                 logger.warning(
                     f"Failed to create remittance line for invoice "
                     f"{payment.invoice_number}: {line_error}"
                 )
 
-        print(
-            f"✅ Completed remittance line creation for {remittance_id}",
-            file=sys.stderr,
-            flush=True,
-        )
-
         # Start invoice matching process
-        print(
-            f"🔍 Starting invoice matching for {len(extracted_data.payments)} lines...",
-            file=sys.stderr,
-            flush=True,
-        )
 
         try:
             # Get the created remittance lines to match them
@@ -631,22 +794,11 @@ async def process_remittance_background(
                 where={"remittanceId": remittance_id}, order={"createdAt": "asc"}
             )
 
-            print(
-                f"📋 Found {len(created_lines)} lines to match",
-                file=sys.stderr,
-                flush=True,
-            )
+            logger.debug("Matching %d lines", len(created_lines))
 
             # Process each line for matching
             matched_count = 0
             for i, line in enumerate(created_lines, 1):
-                print(
-                    f"🎯 Matching line {i}/{len(created_lines)}: "
-                    f"Invoice {line.invoiceNumber} (${line.aiPaidAmount})",
-                    file=sys.stderr,
-                    flush=True,
-                )
-
                 try:
                     # Create ExtractedPayment for the matching service
                     from src.domains.remittances.types import ExtractedPayment
@@ -660,25 +812,28 @@ async def process_remittance_background(
                     )
 
                     # Use matching service to find matches
-                    match_results, _ = (
-                        await matching_service.match_payments_to_invoices(
-                            payments=[payment],
-                            organization_id=UUID(org_id),
-                            remittance_id=UUID(remittance_id),
+                    with span("remittance.match", line_id=line.id):
+                        match_results, _ = (
+                            await matching_service.match_payments_to_invoices(
+                                payments=[payment],
+                                organization_id=UUID(org_id),
+                                remittance_id=UUID(remittance_id),
+                            )
                         )
-                    )
 
                     if match_results and len(match_results) > 0:
                         match = match_results[0]
                         match_type_str = (
                             match.match_type.value if match.match_type else "unknown"
                         )
-                        print(
-                            f"  ✅ MATCH FOUND: {line.invoiceNumber} → "
-                            f"{match_type_str} match (confidence: "
-                            f"{match.match_confidence})",
-                            file=sys.stderr,
-                            flush=True,
+                        logger.debug(
+                            "Line %d/%d: %s matched by %s (confidence %s)",
+                            i,
+                            len(created_lines),
+                            line.invoiceNumber,
+                            match_type_str,
+                            match.match_confidence,
+                            extra=SAMPLED,
                         )
 
                         # Update the remittance line with match data using proper
@@ -699,29 +854,22 @@ async def process_remittance_background(
                                 "connect": {"id": str(match.matched_invoice_id)}
                             }
 
-                        await db.remittanceline.update(
-                            where={"id": line.id},
-                            data=update_data,
-                        )
+                        with _timed_write("save_line_match"):
+                            await db.remittanceline.update(
+                                where={"id": line.id},
+                                data=update_data,
+                            )
                         matched_count += 1
-                        print(
-                            "  💾 Updated line with match data",
-                            file=sys.stderr,
-                            flush=True,
-                        )
                     else:
-                        print(
-                            f"  ❌ NO MATCH: {line.invoiceNumber}",
-                            file=sys.stderr,
-                            flush=True,
+                        logger.debug(
+                            "Line %d/%d: %s not matched",
+                            i,
+                            len(created_lines),
+                            line.invoiceNumber,
+                            extra=SAMPLED,
                         )
 
                 except Exception as match_error:
-                    print(
-                        f"  ⚠️ Matching failed for {line.invoiceNumber}: {match_error}",
-                        file=sys.stderr,
-                        flush=True,
-                    )
                     logger.warning(
                         f"Invoice matching failed for line {line.id}: {match_error}"
                     )
@@ -731,11 +879,11 @@ async def process_remittance_background(
                 (matched_count / len(created_lines)) * 100 if created_lines else 0
             )
 
-            print(
-                f"📊 Matching complete: {matched_count}/{len(created_lines)} "
-                f"lines matched ({match_percentage:.1f}%)",
-                file=sys.stderr,
-                flush=True,
+            logger.info(
+                "Matched %d/%d lines (%.1f%%)",
+                matched_count,
+                len(created_lines),
+                match_percentage,
             )
 
             # Determine final status based on match percentage
@@ -750,22 +898,15 @@ async def process_remittance_background(
                 status_msg = "No matches found"
 
             # Update remittance with final status
-            await db.remittance.update(
-                where={"id": remittance_id}, data={"status": final_status}
-            )
+            with _timed_write("save_status"):
+                await db.remittance.update(
+                    where={"id": remittance_id}, data={"status": final_status}
+                )
+                count_cache.invalidate("remittance")
 
-            print(
-                f"🎉 Final status: {final_status.value} - {status_msg}",
-                file=sys.stderr,
-                flush=True,
-            )
+            logger.info(f"Final status: {final_status.value} - {status_msg}")
 
         except Exception as matching_error:
-            print(
-                f"❌ Invoice matching process failed: {matching_error}",
-                file=sys.stderr,
-                flush=True,
-            )
             logger.error(
                 f"Invoice matching failed for remittance {remittance_id}: "
                 f"{matching_error}"
@@ -776,6 +917,7 @@ async def process_remittance_background(
                 where={"id": remittance_id},
                 data={"status": RemittanceStatus.Manual_Review},
             )
+            count_cache.invalidate("remittance")
 
         logger.info(
             f"Completed processing remittance {remittance_id} with thread ID tracking"
@@ -790,17 +932,19 @@ async def process_remittance_background(
         await db.remittance.update(
             where={"id": remittance_id}, data={"status": RemittanceStatus.File_Error}
         )
+        count_cache.invalidate("remittance")
 
         # Create error audit log
-        await db.auditlog.create(
-            data={
+        await audit_log.write(
+            db,
+            {
                 "remittanceId": remittance_id,
                 "userId": user_id,
                 "organizationId": org_id,
                 "action": AuditAction.sync_attempt,
                 "outcome": AuditOutcome.error,
                 "errorMessage": str(e),
-            }
+            },
         )
 
 
@@ -870,21 +1014,23 @@ async def approve_remittance(
         )
 
     # Create audit log for approval start
-    await db.auditlog.create(
-        data={
+    await audit_log.write(
+        db,
+        {
             "remittanceId": remittance_id,
             "userId": user_id,
             "organizationId": org_id,
             "action": AuditAction.approved,
             "outcome": AuditOutcome.pending,
             "reason": "Remittance approval started",
-        }
+        },
     )
 
     # Update status to Exporting
     await db.remittance.update(
         where={"id": remittance_id}, data={"status": RemittanceStatus.Exporting}
     )
+    count_cache.invalidate("remittance")
 
     try:
         # Pre-download file content before batch payment creation
@@ -892,9 +1038,7 @@ async def approve_remittance(
         filename = None
         if remittance.filePath:
             try:
-                file_content = supabase.storage.from_(BUCKET_NAME).download(
-                    remittance.filePath
-                )
+                file_content = await storage_service.download(remittance.filePath)
                 filename = f"Remittance_{remittance.reference or remittance.id}.pdf"
             except Exception as e:
                 logger.warning(f"Failed to download remittance file: {e}")
@@ -930,17 +1074,19 @@ async def approve_remittance(
                     "xeroBatchId": result.batch_id,
                 },
             )
+            count_cache.invalidate("remittance")
 
             # Create success audit log
-            await db.auditlog.create(
-                data={
+            await audit_log.write(
+                db,
+                {
                     "remittanceId": remittance_id,
                     "userId": user_id,
                     "organizationId": org_id,
                     "action": AuditAction.exported,
                     "outcome": AuditOutcome.success,
                     "reason": f"Batch payment created with ID: {result.batch_id}",
-                }
+                },
             )
 
             # Schedule async file upload if file was downloaded successfully
@@ -949,13 +1095,19 @@ async def approve_remittance(
 
                 async def upload_task() -> None:
                     try:
-                        await data_service.upload_attachment(
+                        with span(
+                            "xero.upload_attachment",
+                            remittance_id=remittance_id,
                             org_id=org_id,
-                            entity_id=batch_id,
-                            entity_type="BankTransactions",
-                            file_data=file_content,
-                            filename=filename,
-                        )
+                            batch_id=batch_id,
+                        ):
+                            await data_service.upload_attachment(
+                                org_id=org_id,
+                                entity_id=batch_id,
+                                entity_type="BankTransactions",
+                                file_data=file_content,
+                                filename=filename,
+                            )
                         logger.info(
                             f"Uploaded remittance to batch payment {result.batch_id}"
                         )
@@ -980,10 +1132,12 @@ async def approve_remittance(
                 where={"id": remittance_id},
                 data={"status": RemittanceStatus.Export_Failed, "xeroBatchId": None},
             )
+            count_cache.invalidate("remittance")
 
             # Create failure audit log
-            await db.auditlog.create(
-                data={
+            await audit_log.write(
+                db,
+                {
                     "remittanceId": remittance_id,
                     "userId": user_id,
                     "organizationId": org_id,
@@ -991,7 +1145,7 @@ async def approve_remittance(
                     "outcome": AuditOutcome.error,
                     "errorMessage": result.error_message,
                     "reason": "Batch payment creation failed",
-                }
+                },
             )
 
             logger.error(
@@ -1004,10 +1158,12 @@ async def approve_remittance(
         await db.remittance.update(
             where={"id": remittance_id}, data={"status": RemittanceStatus.Export_Failed}
         )
+        count_cache.invalidate("remittance")
 
         # Create error audit log
-        await db.auditlog.create(
-            data={
+        await audit_log.write(
+            db,
+            {
                 "remittanceId": remittance_id,
                 "userId": user_id,
                 "organizationId": org_id,
@@ -1015,7 +1171,7 @@ async def approve_remittance(
                 "outcome": AuditOutcome.error,
                 "errorMessage": str(e),
                 "reason": "Batch payment processing error",
-            }
+            },
         )
 
         logger.error(f"Error during remittance approval {remittance_id}: {e}")
@@ -1100,6 +1256,9 @@ async def _sync_batch_payment_invoices(
     """
     Sync invoice statuses after batch payment creation (async).
 
+    All touched invoices are fetched in bulk and written back in a single
+    batched upsert, so the cost does not grow with the number of lines.
+
     Args:
         db: Database instance
         org_id: Organization ID
@@ -1108,26 +1267,65 @@ async def _sync_batch_payment_invoices(
     """
     orchestrator = SyncOrchestrator(db)
 
-    for invoice in matched_invoices:
-        try:
-            # Fetch updated invoice from Xero using the invoice_id parameter
-            updated_invoices = await data_service.get_invoices(
-                org_id=org_id,
-                filters=BaseInvoiceFilters(
-                    modified_since=None,
-                    status=None,
-                    date_from=None,
-                    date_to=None,
-                    invoice_id=None,
-                ),
-                invoice_id=invoice.invoiceId,  # Xero invoice ID
-            )
+    # Xero invoice IDs of every invoice touched by the batch payment
+    invoice_ids = [
+        invoice.invoiceId for invoice in matched_invoices if invoice.invoiceId
+    ]
+    if not invoice_ids:
+        return
 
-            if updated_invoices:
-                await orchestrator._upsert_invoices(org_id, updated_invoices)
+    with span(
+        "integration.sync_batch_payment_invoices",
+        org_id=org_id,
+        invoice_count=len(invoice_ids),
+    ):
+        await _refresh_invoices(orchestrator, org_id, invoice_ids, data_service)
 
-        except Exception as e:
-            logger.warning(f"Failed to sync invoice {invoice.invoiceId}: {e}")
+
+async def _refresh_invoices(
+    orchestrator: SyncOrchestrator,
+    org_id: str,
+    invoice_ids: list[str],
+    data_service: BaseIntegrationDataService,
+) -> None:
+    try:
+        updated_invoices = await data_service.get_invoices_by_ids(org_id, invoice_ids)
+    except Exception as e:
+        logger.warning(f"Failed to fetch {len(invoice_ids)} invoices for sync: {e}")
+        return
+
+    if not updated_invoices:
+        return
+
+    try:
+        await orchestrator._batch_upsert_invoices(org_id, updated_invoices)
+    except Exception as e:
+        logger.warning(f"Failed to sync {len(updated_invoices)} invoices: {e}")
+
+
+def _batch_payment_status_update(
+    status_result: BatchPaymentStatusResult,
+) -> RemittanceUpdateInput:
+    """
+    Build the remittance update for a batch payment status fetched from Xero.
+
+    Args:
+        status_result: Batch payment status from Xero
+
+    Returns:
+        Remittance update data with status, reconciliation and check time
+    """
+    batch_status = None
+    if status_result.status == "AUTHORISED":
+        batch_status = BatchPaymentStatus.AUTHORISED
+    elif status_result.status == "DELETED":
+        batch_status = BatchPaymentStatus.DELETED
+
+    return {
+        "batchPaymentStatus": batch_status,
+        "isReconciled": status_result.is_reconciled,
+        "lastStatusCheck": datetime.now(timezone.utc),
+    }
 
 
 async def sync_batch_payment_status(
@@ -1146,17 +1344,15 @@ async def sync_batch_payment_status(
     """
     try:
         # Get the remittance record
-        remittance = await db.remittance.find_unique(where={"id": remittance_id})
+        remittance = await RemittanceStatusFields.prisma(db).find_unique(
+            where={"id": remittance_id}
+        )
 
         if not remittance or not remittance.xeroBatchId:
             logger.warning(f"No batch payment ID found for remittance {remittance_id}")
             return
 
         # Get external accounting data service
-        from src.domains.external_accounting.base.factory import (
-            IntegrationFactory,
-        )
-
         factory = IntegrationFactory(db)
         data_service = await factory.get_data_service(org_id)
 
@@ -1172,10 +1368,6 @@ async def sync_batch_payment_status(
             return
 
         # Get batch payment status from Xero (cast to specific type)
-        from src.domains.external_accounting.xero.data_service import (
-            XeroDataService,
-        )
-
         xero_service = cast(XeroDataService, data_service)
         status_result = await xero_service.get_batch_payment_status(
             org_id, remittance.xeroBatchId
@@ -1185,25 +1377,10 @@ async def sync_batch_payment_status(
             logger.warning(f"Batch payment {remittance.xeroBatchId} not found in Xero")
             return
 
-        # Map Xero status to our enum
-        from prisma.enums import BatchPaymentStatus
-
-        batch_status = None
-        if status_result.status == "AUTHORISED":
-            batch_status = BatchPaymentStatus.AUTHORISED
-        elif status_result.status == "DELETED":
-            batch_status = BatchPaymentStatus.DELETED
-
         # Update remittance with current status
-        from datetime import datetime, timezone
-
         await db.remittance.update(
             where={"id": remittance_id},
-            data={
-                "batchPaymentStatus": batch_status,
-                "isReconciled": status_result.is_reconciled,
-                "lastStatusCheck": datetime.now(timezone.utc),
-            },
+            data=_batch_payment_status_update(status_result),
         )
 
         logger.info(
@@ -1225,43 +1402,80 @@ async def sync_all_pending_batch_payments(db: Prisma, org_id: str) -> None:
 
     This method finds all remittances that have been exported but may
     need status updates, and syncs their batch payment status from Xero.
+    The organization's data service is resolved once, statuses are fetched
+    in bulk and every change is written in a single transaction.
 
     Args:
         org_id: Organization ID
     """
     try:
-        from datetime import datetime, timedelta, timezone
-
-        from prisma.enums import RemittanceStatus
-
         # Find remittances that might need status updates:
         # 1. Have xeroBatchId (batch payment created)
         # 2. Status is Exported_Unreconciled or Exporting
         # 3. Haven't been checked recently (more than 1 hour ago)
         one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
 
-        # Find remittances that might need status updates
-        remittances = await db.remittance.find_many(
+        remittances = await RemittanceStatusFields.prisma(db).find_many(
             where={
                 "organizationId": org_id,
-                "NOT": [{"xeroBatchId": None}],  # Has batch ID
+                "NOT": [{"xeroBatchId": None}],
+                "status": {
+                    "in": [
+                        RemittanceStatus.Exported_Unreconciled,
+                        RemittanceStatus.Exporting,
+                    ]
+                },
+                "OR": [
+                    {"lastStatusCheck": None},
+                    {"lastStatusCheck": {"lt": one_hour_ago}},
+                ],
             }
         )
 
-        # Filter in Python for simplicity (avoiding complex Prisma typing)
-        filtered_remittances = [
-            r
-            for r in remittances
-            if r.status
-            in [RemittanceStatus.Exported_Unreconciled, RemittanceStatus.Exporting]
-            and (r.lastStatusCheck is None or r.lastStatusCheck < one_hour_ago)
-        ]
+        logger.info(f"Found {len(remittances)} remittances to sync status for")
+
+        if not remittances:
+            return
+
+        # Resolve the organization's data service once for every remittance
+        factory = IntegrationFactory(db)
+        data_service = await factory.get_data_service(org_id)
+
+        if not data_service:
+            logger.warning(f"No external accounting integration found for org {org_id}")
+            return
 
-        logger.info(f"Found {len(filtered_remittances)} remittances to sync status for")
+        if not hasattr(data_service, "get_batch_payment_statuses"):
+            logger.warning(
+                "Data service does not support batch payment status checking"
+            )
+            return
 
-        # Sync status for each remittance
-        for remittance in filtered_remittances:
-            await sync_batch_payment_status(db, org_id, remittance.id)
+        xero_service = cast(XeroDataService, data_service)
+        status_results = await xero_service.get_batch_payment_statuses(
+            org_id, [r.xeroBatchId for r in remittances if r.xeroBatchId]
+        )
+
+        updated_count = 0
+        async with db.batch_() as batcher:
+            for remittance in remittances:
+                status_result = status_results.get(remittance.xeroBatchId or "")
+                if not status_result or not status_result.found:
+                    logger.warning(
+                        f"Batch payment {remittance.xeroBatchId} not found in Xero"
+                    )
+                    continue
+
+                batcher.remittance.update(
+                    where={"id": remittance.id},
+                    data=_batch_payment_status_update(status_result),
+                )
+                updated_count += 1
+
+        logger.info(
+            f"Updated batch payment status for {updated_count} remittances "
+            f"in org {org_id}"
+        )
 
     except Exception as e:
         logger.error(f"Failed to sync batch payment statuses for org {org_id}: {e}")
@@ -1327,15 +1541,16 @@ async def unapprove_remittance(
     matched_invoices = await db.invoice.find_many(where={"id": {"in": invoice_ids}})
 
     # Create audit log for unapproval attempt
-    await db.auditlog.create(
-        data={
+    await audit_log.write(
+        db,
+        {
             "remittanceId": remittance_id,
             "organizationId": org_id,
             "userId": user_id,
             "action": AuditAction.updated,
             "outcome": AuditOutcome.pending,
             "reason": "Remittance unapproval started",
-        }
+        },
     )
 
     try:
@@ -1416,10 +1631,12 @@ async def unapprove_remittance(
                 "lastStatusCheck": None,
             },
         )
+        count_cache.invalidate("remittance")
 
         # Create success audit log
-        await db.auditlog.create(
-            data={
+        await audit_log.write(
+            db,
+            {
                 "remittanceId": remittance_id,
                 "organizationId": org_id,
                 "userId": user_id,
@@ -1429,7 +1646,7 @@ async def unapprove_remittance(
                     "Remittance unapproved successfully - batch payment deleted "
                     "and status reverted to awaiting approval"
                 ),
-            }
+            },
         )
 
         logger.info(f"Successfully unapproved remittance {remittance_id}")
@@ -1447,15 +1664,16 @@ async def unapprove_remittance(
             f"Unapproval failed for remittance {remittance_id}: {e}", exc_info=True
         )
 
-        await db.auditlog.create(
-            data={
+        await audit_log.write(
+            db,
+            {
                 "remittanceId": remittance_id,
                 "organizationId": org_id,
                 "userId": user_id,
                 "action": AuditAction.updated,
                 "outcome": AuditOutcome.error,
                 "reason": f"Remittance unapproval failed: {error_msg}",
-            }
+            },
         )
 
         raise HTTPException(
@@ -0,0 +1,152 @@
+"""
+Streaming reads of uploaded remittance files.
+"""
+
+import asyncio
+import zipfile
+from pathlib import PurePosixPath
+from typing import IO, AsyncIterator, List, Optional, Protocol
+
+from fastapi import HTTPException, UploadFile, status
+
+MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Readers accept a PDF header anywhere in the first 1024 bytes
+PDF_MAGIC = b"%PDF-"
+PDF_HEADER_WINDOW = 1024
+
+ZIP_CONTENT_TYPES = {"application/zip", "application/x-zip-compressed"}
+
+
+class AsyncReadable(Protocol):
+    """Anything with an async ``read``, such as an UploadFile."""
+
+    async def read(self, size: int = -1) -> bytes: ...
+
+
+def file_too_large_error(max_size: int = MAX_FILE_SIZE) -> HTTPException:
+    """Error for uploads over the size limit."""
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"File size exceeds maximum limit of {max_size / (1024*1024):.0f}MB",
+    )
+
+
+class UploadStream:
+    """
+    Reads an uploaded file in chunks while enforcing the upload rules.
+
+    ``open`` reads the first chunk and rejects anything without a PDF header
+    before a byte is sent to storage. Iterating ``chunks`` then yields the file
+    piece by piece and aborts with a 400 as soon as more than ``max_size``
+    bytes have been read, so the whole file is never held in memory.
+    """
+
+    def __init__(
+        self,
+        file: AsyncReadable,
+        max_size: int = MAX_FILE_SIZE,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+    ) -> None:
+        self.file = file
+        self.max_size = max_size
+        self.chunk_size = max(chunk_size, PDF_HEADER_WINDOW)
+        self.size = 0
+        self._first_chunk: Optional[bytes] = None
+
+    async def open(self) -> None:
+        """
+        Read the first chunk and check it looks like a PDF.
+
+        Raises:
+            HTTPException: If the file is not a PDF or is already too large
+        """
+        first_chunk = await self.file.read(self.chunk_size)
+        if PDF_MAGIC not in first_chunk[:PDF_HEADER_WINDOW]:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="File is not a valid PDF",
+            )
+
+        self._count(first_chunk)
+        self._first_chunk = first_chunk
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        """
+        Yield the file in chunks, starting with the one read by ``open``.
+
+        Raises:
+            HTTPException: If the file grows past ``max_size``
+        """
+        if self._first_chunk is None:
+            await self.open()
+        first_chunk, self._first_chunk = self._first_chunk or b"", b""
+        if first_chunk:
+            yield first_chunk
+
+        while chunk := await self.file.read(self.chunk_size):
+            self._count(chunk)
+            yield chunk
+
+    def _count(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.size > self.max_size:
+            raise file_too_large_error(self.max_size)
+
+
+class ZipMemberReader:
+    """
+    Async reader over one member of an open ZIP archive.
+
+    Decompression runs in a worker thread. ZipFile serialises reads of the
+    underlying file, so several members of one archive can be read at once.
+    """
+
+    def __init__(self, archive: zipfile.ZipFile, info: zipfile.ZipInfo) -> None:
+        self.archive = archive
+        self.info = info
+        self._handle: Optional[IO[bytes]] = None
+
+    async def read(self, size: int = -1) -> bytes:
+        if self._handle is None:
+            self._handle = await asyncio.to_thread(self.archive.open, self.info)
+        chunk = await asyncio.to_thread(self._handle.read, size)
+        if not chunk:
+            await asyncio.to_thread(self._handle.close)
+        return chunk
+
+
+def is_zip_upload(file: UploadFile) -> bool:
+    """Check whether an upload is a ZIP archive by type or extension."""
+    return file.content_type in ZIP_CONTENT_TYPES or (
+        file.filename or ""
+    ).lower().endswith(".zip")
+
+
+async def open_zip(file: UploadFile) -> zipfile.ZipFile:
+    """
+    Open an uploaded ZIP archive without reading it into memory.
+
+    Raises:
+        HTTPException: If the upload is not a valid ZIP archive
+    """
+    try:
+        return await asyncio.to_thread(zipfile.ZipFile, file.file)
+    except zipfile.BadZipFile:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{file.filename or 'Upload'} is not a valid ZIP archive",
+        )
+
+
+def zip_pdf_members(archive: zipfile.ZipFile) -> List[zipfile.ZipInfo]:
+    """PDF files in an archive, skipping folders and macOS metadata."""
+    members = []
+    for info in archive.infolist():
+        path = PurePosixPath(info.filename)
+        if info.is_dir() or path.parts[0] == "__MACOSX" or path.name.startswith("."):
+            continue
+        if path.suffix.lower() == ".pdf":
+            members.append(info)
+    return members
@@ -1,26 +1,60 @@
+import uuid
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Awaitable, Callable
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from opentelemetry.trace import StatusCode
 
-from src.core.database import prisma
+from src.core.audit import audit_log
+from src.core.database import prisma, read_prisma
+from src.core.jobs import job_queue
+from src.core.logs import configure_logging, log_context, shutdown_logging
+from src.core.metrics import event_loop_monitor
+from src.core.metrics.routes import router as metrics_router
+from src.core.queries import instrument_queries, record_queries, track_queries
+from src.core.settings import settings
+from src.core.storage import storage_service
+from src.core.storage.routes import router as storage_router
+from src.core.tracing import configure_tracing, server_span, shutdown_tracing
+from src.domains.auth.dependencies import start_jwks_refresh, stop_jwks_refresh
 from src.domains.auth.routes import router as auth_router
 from src.domains.bankaccounts.routes import router as bankaccounts_router
 from src.domains.external_accounting.routes import router as external_accounting_router
 from src.domains.external_accounting.xero.auth.routes import router as xero_router
 from src.domains.invoices.routes import router as invoices_router
 from src.domains.organizations.routes import router as organizations_router
+from src.domains.remittances.bulk import requeue_pending_uploads
 from src.domains.remittances.routes import router as remittances_router
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
+    configure_logging()
+    configure_tracing()
     await prisma.connect()
+    instrument_queries(prisma)
+    if read_prisma is not prisma:
+        await read_prisma.connect()
+        instrument_queries(read_prisma)
+    await audit_log.start(prisma)
+    await start_jwks_refresh()
+    await job_queue.start()
+    await requeue_pending_uploads(prisma)
+    await event_loop_monitor.start()
     yield
     # Shutdown
+    await event_loop_monitor.stop()
+    await job_queue.stop()
+    await audit_log.stop()
+    await stop_jwks_refresh()
+    await storage_service.aclose()
+    if read_prisma is not prisma:
+        await read_prisma.disconnect()
     await prisma.disconnect()
+    shutdown_tracing()
+    shutdown_logging()
 
 
 app = FastAPI(
@@ -39,6 +73,57 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def count_queries(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Record the database queries each request sends."""
+    with track_queries() as stats:
+        response = await call_next(request)
+    route = request.scope.get("route")
+    name = f"{request.method} {route.path}" if route is not None else "unmatched"
+    record_queries("request", name, stats)
+    if settings.QUERY_STATS_HEADERS:
+        response.headers["X-DB-Query-Count"] = str(stats.count)
+        response.headers["X-DB-Query-Time-Ms"] = f"{stats.seconds * 1000:.1f}"
+    return response
+
+
+@app.middleware("http")
+async def trace_request(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Run each request in a server span, continuing any incoming trace."""
+    with server_span(
+        f"{request.method} {request.url.path}",
+        request.headers,
+        **{"http.request.method": request.method, "url.path": request.url.path},
+    ) as span:
+        response = await call_next(request)
+        # Name the span after the route template once routing has matched it
+        route = request.scope.get("route")
+        if route is not None:
+            span.update_name(f"{request.method} {route.path}")
+            span.set_attribute("http.route", route.path)
+        span.set_attribute("http.response.status_code", response.status_code)
+        if response.status_code >= 500:
+            span.set_status(StatusCode.ERROR)
+    return response
+
+
+@app.middleware("http")
+async def bind_request_id(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Tag logs for the request with its X-Request-ID, generating one if absent."""
+    request_id = request.headers.get("x-request-id") or uuid.uuid4().hex
+    with log_context(request_id=request_id):
+        response = await call_next(request)
+    response.headers["X-Request-ID"] = request_id
+    return response
+
+
 # Include routers
 app.include_router(auth_router, prefix="/api/v1")
 app.include_router(bankaccounts_router, prefix="/api/v1")
@@ -46,8 +131,12 @@ app.include_router(external_accounting_router)
 app.include_router(invoices_router, prefix="/api/v1")
 app.include_router(organizations_router, prefix="/api/v1")
 app.include_router(remittances_router, prefix="/api/v1")
+app.include_router(storage_router, prefix="/api/v1")
 app.include_router(xero_router, prefix="/api/v1")
 
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router)
+
 
 @app.get("/")
 async def root() -> dict[str, str]:
@@ -4,6 +4,7 @@ OpenAI client wrapper with retry logic and error handling.
 
 import asyncio
 import json
+import logging
 import time
 
 from openai import AsyncOpenAI
@@ -21,6 +22,8 @@ from src.shared.ai.types import AIExtractionDict, AIExtractionResult
 
 # Using Python 3.12+ type hints instead of typing
 
+logger = logging.getLogger(__name__)
+
 
 class OpenAIClient:
     """
@@ -65,66 +68,45 @@ class OpenAIClient:
         """
         thread_id = None
         try:
-            import sys
-
-            print(
-                f"🤖 Starting AI extraction for org {organization_id}",
-                file=sys.stderr,
-                flush=True,
-            )
-            print(
-                f"📄 PDF text length: {len(pdf_text)} characters",
-                file=sys.stderr,
-                flush=True,
+            logger.info(
+                "Starting AI extraction of %d characters for org %s",
+                len(pdf_text),
+                organization_id,
             )
 
             # Get or create assistant
-            print("🔧 Getting/creating assistant...", file=sys.stderr, flush=True)
             assistant_id = await self._get_or_create_assistant()
-            print(f"✅ Assistant ID: {assistant_id}", file=sys.stderr, flush=True)
+            logger.debug("Using assistant %s", assistant_id)
 
             # Create thread
-            print("🧵 Creating thread...", file=sys.stderr, flush=True)
             thread = await self.client.beta.threads.create()
             thread_id = thread.id
-            print(f"✅ Thread created: {thread_id}", file=sys.stderr, flush=True)
+            logger.debug("Created thread %s", thread_id)
 
             # Return thread ID immediately for early storage
             self._current_thread_id = thread_id
 
             # Add message to thread
-            print("💬 Adding message to thread...", file=sys.stderr, flush=True)
             await self.client.beta.threads.messages.create(
                 thread_id=thread_id, role="user", content=pdf_text
             )
-            print("✅ Message added", file=sys.stderr, flush=True)
 
             # Run assistant
-            print("🏃 Starting assistant run...", file=sys.stderr, flush=True)
             run = await self.client.beta.threads.runs.create(
                 thread_id=thread_id,
                 assistant_id=assistant_id,
             )
-            print(f"✅ Run started: {run.id}", file=sys.stderr, flush=True)
+            logger.debug("Started run %s on thread %s", run.id, thread_id)
 
             # Wait for completion
-            print("⏳ Waiting for completion...", file=sys.stderr, flush=True)
             run_result = await self._wait_for_run_completion(thread_id, run.id)
 
             # Check if we already have extracted data from function call
             if isinstance(run_result, dict) and "extracted_data" in run_result:
-                print(
-                    "📦 Using extracted data from function call",
-                    file=sys.stderr,
-                    flush=True,
-                )
+                logger.debug("Using extracted data from function call")
                 data = run_result["extracted_data"]
             else:
-                print(
-                    "📥 Extracting data from thread messages",
-                    file=sys.stderr,
-                    flush=True,
-                )
+                logger.debug("Extracting data from thread messages")
                 # Extract and validate response from thread messages
                 data = await self._extract_response_data(thread_id)
 
@@ -133,11 +115,7 @@ class OpenAIClient:
         except Exception as e:
             # If we have a thread_id, still return it in the exception for debugging
             if thread_id:
-                print(
-                    f"🔍 Thread ID for debugging: {thread_id}",
-                    file=sys.stderr,
-                    flush=True,
-                )
+                logger.warning(f"AI extraction failed on thread {thread_id}: {e}")
                 # Create a custom exception that includes the thread_id
                 enhanced_error = AIException(f"{str(e)} (Thread ID: {thread_id})")
                 enhanced_error.thread_id = thread_id  # type: ignore
@@ -209,48 +187,27 @@ class OpenAIClient:
         start_time = time.time()
         check_count = 0
 
-        import sys
-
         while time.time() - start_time < timeout:
             check_count += 1
-            print(
-                f"🔄 Check #{check_count}: Polling run status...",
-                file=sys.stderr,
-                flush=True,
-            )
-
             run = await self.client.beta.threads.runs.retrieve(
                 thread_id=thread_id, run_id=run_id
             )
-
-            print(f"📊 Run status: {run.status}", file=sys.stderr, flush=True)
+            logger.debug(
+                "Run %s status after check %d: %s", run_id, check_count, run.status
+            )
 
             if run.status == "completed":
-                print("✅ Run completed successfully!", file=sys.stderr, flush=True)
                 return run
             elif run.status in ["failed", "cancelled", "expired"]:
-                print(
-                    f"❌ Run failed with status: {run.status}",
-                    file=sys.stderr,
-                    flush=True,
+                logger.error(
+                    "Run %s failed with status %s: %s",
+                    run_id,
+                    run.status,
+                    getattr(run, "last_error", None),
                 )
-                if hasattr(run, "last_error") and run.last_error:
-                    print(
-                        f"💥 Error details: {run.last_error}",
-                        file=sys.stderr,
-                        flush=True,
-                    )
                 raise AIException(f"Assistant run failed with status: {run.status}")
-            elif run.status in ["in_progress", "queued"]:
-                print(
-                    f"⏳ Run is {run.status}, waiting...", file=sys.stderr, flush=True
-                )
             elif run.status == "requires_action":
-                print(
-                    "🎯 Run requires action - extracting function call data",
-                    file=sys.stderr,
-                    flush=True,
-                )
+                logger.debug("Run %s requires action, reading function call", run_id)
 
                 # Extract function call arguments (this is where our JSON data is!)
                 required_action = getattr(run, "required_action", None)
@@ -264,11 +221,7 @@ class OpenAIClient:
                         if function_call:
                             function_name = getattr(function_call, "name", "")
 
-                            print(
-                                f"📞 Found function call: {function_name}",
-                                file=sys.stderr,
-                                flush=True,
-                            )
+                            logger.debug("Found function call %s", function_name)
 
                             # Look for our remittance extraction function
                             if function_name in [
@@ -280,23 +233,8 @@ class OpenAIClient:
                                     arguments_json = getattr(
                                         function_call, "arguments", "{}"
                                     )
-                                    print(
-                                        f"📄 Function arguments JSON: "
-                                        f"{arguments_json[:200]}...",
-                                        file=sys.stderr,
-                                        flush=True,
-                                    )
-
-                                    import json
-
                                     function_args = json.loads(arguments_json)
 
-                                    print(
-                                        "✅ Successfully extracted function arguments",
-                                        file=sys.stderr,
-                                        flush=True,
-                                    )
-
                                     # Return extracted data - simulates
                                     # completed run
                                     return {
@@ -305,33 +243,23 @@ class OpenAIClient:
                                     }
 
                                 except json.JSONDecodeError as e:
-                                    print(
-                                        f"❌ Failed to parse function arguments: {e}",
-                                        file=sys.stderr,
-                                        flush=True,
+                                    logger.warning(
+                                        f"Failed to parse function arguments: {e}"
                                     )
                                     continue
 
                 # If no valid function call found, treat as error
-                print(
-                    "❌ No valid function call found in requires_action",
-                    file=sys.stderr,
-                    flush=True,
-                )
                 raise AIException(
                     "Assistant requires action but no valid function call found"
                 )
-            else:
-                print(f"❓ Unknown status: {run.status}", file=sys.stderr, flush=True)
+            elif run.status not in ["in_progress", "queued"]:
+                logger.warning(f"Unknown run status: {run.status}")
 
             # Wait before checking again
-            print("💤 Sleeping 2 seconds...", file=sys.stderr, flush=True)
             await asyncio.sleep(2)
 
         # Timeout reached
-        print(
-            f"⏰ Timeout reached after {timeout} seconds", file=sys.stderr, flush=True
-        )
+        logger.error(f"Run {run_id} timed out after {timeout} seconds")
         raise AITimeoutException(f"Assistant run timed out after {timeout} seconds")
 
     async def _extract_response_data(self, thread_id: str) -> AIExtractionDict:
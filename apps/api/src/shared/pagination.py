@@ -0,0 +1,152 @@
+# apps/api/src/shared/pagination.py
+import base64
+import json
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from prisma import Prisma
+from src.core.metrics import record_cache_lookup
+from src.core.settings import settings
+from src.shared.exceptions import InvalidDataError
+
+# Newest first, with id as a tie-breaker so the order is total. createdAt is
+# nullable and Postgres sorts NULLs first in descending order, so records
+# without a creation time lead the listing, ordered by id.
+KEYSET_ORDER: list[dict[str, str]] = [{"createdAt": "desc"}, {"id": "desc"}]
+
+
+def encode_cursor(created_at: Optional[datetime], record_id: str) -> str:
+    """
+    Encode the (createdAt, id) position of a record as an opaque cursor.
+
+    Args:
+        created_at: Record creation time, if it has one
+        record_id: Record ID
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{created_at.isoformat() if created_at else ''}|{record_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], str]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        Tuple of (createdAt, id) of the last record on the previous page,
+        with createdAt None if that record has no creation time
+
+    Raises:
+        InvalidDataError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, record_id = raw.split("|", 1)
+        return (datetime.fromisoformat(created_at) if created_at else None), record_id
+    except ValueError:
+        raise InvalidDataError("Invalid pagination cursor")
+
+
+def keyset_where(cursor: str) -> Dict[str, Any]:
+    """
+    Build the where condition selecting records after a cursor in KEYSET_ORDER.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        Prisma where condition to AND with the listing filters
+    """
+    created_at, record_id = decode_cursor(cursor)
+    if created_at is None:
+        # The rest of the NULL createdAt records, then every dated record
+        return {
+            "OR": [
+                {"createdAt": None, "id": {"lt": record_id}},
+                {"NOT": [{"createdAt": None}]},
+            ]
+        }
+    return {
+        "OR": [
+            {"createdAt": {"lt": created_at}},
+            {"createdAt": created_at, "id": {"lt": record_id}},
+        ]
+    }
+
+
+class CountCache:
+    """
+    Short-lived cache of listing counts keyed by model and filters.
+
+    Counts are exact when computed but may lag behind writes by up to
+    LIST_COUNT_CACHE_TTL_SECONDS, which is acceptable for pagination totals.
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None, max_entries: int = 1024):
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else settings.LIST_COUNT_CACHE_TTL_SECONDS
+        )
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple[str, str], Tuple[Prisma, int, float]] = {}
+
+    async def get_or_count(
+        self,
+        db: Prisma,
+        model: str,
+        where: Dict[str, Any],
+        count: Callable[[], Awaitable[int]],
+    ) -> int:
+        """
+        Get a cached count, running the count query on a miss.
+
+        Args:
+            db: Database instance the count belongs to
+            model: Model name, used to namespace the key
+            where: Filters the count was taken with
+            count: Coroutine factory running the count query
+
+        Returns:
+            Number of matching records
+        """
+        key = (model, json.dumps(where, sort_keys=True, default=str))
+        now = time.monotonic()
+
+        cached = self._entries.get(key)
+        hit = cached is not None and cached[0] is db and cached[2] > now
+        record_cache_lookup("list_count", hit)
+        if cached and hit:
+            return cached[1]
+
+        total = await count()
+
+        if self.ttl_seconds > 0:
+            if len(self._entries) >= self.max_entries:
+                self._entries.clear()
+            self._entries[key] = (db, total, now + self.ttl_seconds)
+
+        return total
+
+    def invalidate(self, model: str) -> None:
+        """
+        Drop every cached count for a model.
+
+        Args:
+            model: Model name the counts were cached under
+        """
+        for key in [key for key in self._entries if key[0] == model]:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached count."""
+        self._entries.clear()
+
+
+count_cache = CountCache()
@@ -0,0 +1,246 @@
+# apps/api/src/shared/search.py
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, List, Mapping, Optional, Protocol, Tuple, TypeVar
+
+from prisma import Prisma
+from src.core.settings import settings
+
+
+class _Identified(Protocol):
+    id: str
+
+
+T = TypeVar("T", bound=_Identified)
+
+
+@dataclass(frozen=True)
+class SearchTarget:
+    """Table and text columns covered by a trigram search."""
+
+    table: str
+    columns: Tuple[str, ...]
+
+
+# Each column has a gin_trgm_ops index (see the add_trigram_search_indexes
+# migration), so ILIKE '%term%' on these is an index scan, not a sequential scan
+INVOICE_SEARCH = SearchTarget("Invoice", ("invoiceNumber", "contactName", "reference"))
+REMITTANCE_SEARCH = SearchTarget("Remittance", ("filename", "reference"))
+
+
+def escape_like(term: str) -> str:
+    """
+    Escape LIKE wildcards so a search term is matched literally.
+
+    Args:
+        term: Raw search term
+
+    Returns:
+        Term with backslash, percent and underscore escaped
+    """
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# Listing filter operators that can be applied inside the search query
+_RANGE_OPERATORS = {"gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+
+
+def _sql_value(value: Any) -> Tuple[Any, str]:
+    """Query parameter for a filter value and the cast it needs in SQL."""
+    if isinstance(value, Enum):
+        return value.value, ""
+    if isinstance(value, datetime):
+        return value.isoformat(), "::timestamptz"
+    return value, ""
+
+
+def build_search_filters(
+    where: Optional[Mapping[str, Any]], first_param: int
+) -> Tuple[str, List[Any]]:
+    """
+    Translate listing filters into SQL conditions for the search query.
+
+    Supports the filters the listings build: equality on a column and
+    gt/gte/lt/lte ranges. organizationId is skipped, as the search query
+    always filters on it.
+
+    Args:
+        where: Prisma where filters of the listing
+        first_param: Number of the first placeholder to use
+
+    Returns:
+        Tuple of the conditions, each prefixed with AND, and their parameters
+
+    Raises:
+        ValueError: If a filter has an unsupported shape
+    """
+    conditions: List[str] = []
+    params: List[Any] = []
+    for column, condition in (where or {}).items():
+        if column == "organizationId":
+            continue
+
+        if isinstance(condition, dict):
+            for operator, value in condition.items():
+                if operator not in _RANGE_OPERATORS:
+                    raise ValueError(f"Unsupported search filter {column}.{operator}")
+                param, cast = _sql_value(value)
+                params.append(param)
+                conditions.append(
+                    f'"{column}" {_RANGE_OPERATORS[operator]} '
+                    f"${first_param + len(params) - 1}{cast}"
+                )
+        elif condition is None:
+            conditions.append(f'"{column}" IS NULL')
+        else:
+            param, cast = _sql_value(condition)
+            params.append(param)
+            # Compare as text so enum and uuid columns need no type-specific cast
+            column_sql = f'"{column}"' if cast else f'"{column}"::text'
+            conditions.append(f"{column_sql} = ${first_param + len(params) - 1}{cast}")
+
+    return "".join(f" AND {condition}" for condition in conditions), params
+
+
+def _search_where(target: SearchTarget, filters: str) -> str:
+    matches = " OR ".join(f'"{column}" ILIKE $2' for column in target.columns)
+    return (
+        f'FROM "{target.table}" '
+        f'WHERE "organizationId" = $1::uuid AND ({matches}){filters}'
+    )
+
+
+def build_search_query(target: SearchTarget, filters: str = "", params: int = 0) -> str:
+    """
+    Build the ranked trigram search SQL for a target.
+
+    Parameters are $1 organization ID, $2 ILIKE pattern, then ``params``
+    filter parameters, then the raw term, result limit and offset. Rows are
+    ranked by their best word similarity to the term, newest first on ties.
+
+    Args:
+        target: Table and columns to search
+        filters: Conditions from build_search_filters
+        params: Number of parameters the conditions use
+
+    Returns:
+        SQL text for query_raw
+    """
+    term, limit, offset = (f"${3 + params + index}" for index in range(3))
+    ranks = ", ".join(
+        f"""word_similarity({term}, coalesce("{column}", ''))"""
+        for column in target.columns
+    )
+    return (
+        f'SELECT "id" {_search_where(target, filters)} '
+        f'ORDER BY GREATEST({ranks}) DESC, "createdAt" DESC NULLS LAST, "id" DESC '
+        f"LIMIT {limit} OFFSET {offset}"
+    )
+
+
+def build_search_count_query(target: SearchTarget, filters: str = "") -> str:
+    """
+    Build the SQL counting every match of a trigram search.
+
+    Parameters are $1 organization ID, $2 ILIKE pattern, then the filter
+    parameters.
+
+    Args:
+        target: Table and columns to search
+        filters: Conditions from build_search_filters
+
+    Returns:
+        SQL text for query_raw
+    """
+    return f"SELECT count(*)::int AS total {_search_where(target, filters)}"
+
+
+async def search_ranked_ids(
+    db: Prisma,
+    target: SearchTarget,
+    organization_id: str,
+    term: str,
+    where: Optional[Mapping[str, Any]] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> List[str]:
+    """
+    Find records of an organization matching a search term, best match first.
+
+    Args:
+        db: Prisma database connection
+        target: Table and columns to search
+        organization_id: Organization the records belong to
+        term: Case-insensitive substring to search for
+        where: Listing filters the matches must also satisfy
+        limit: Maximum number of IDs, defaults to SEARCH_MAX_RESULTS
+        offset: Number of ranked matches to skip
+
+    Returns:
+        Matching record IDs ordered by relevance
+    """
+    term = term.strip()
+    if not term:
+        return []
+
+    filters, params = build_search_filters(where, 3)
+    rows = await db.query_raw(
+        build_search_query(target, filters, len(params)),
+        organization_id,
+        f"%{escape_like(term)}%",
+        *params,
+        term,
+        limit if limit is not None else settings.SEARCH_MAX_RESULTS,
+        offset,
+    )
+    return [str(row["id"]) for row in rows]
+
+
+async def count_search_matches(
+    db: Prisma,
+    target: SearchTarget,
+    organization_id: str,
+    term: str,
+    where: Optional[Mapping[str, Any]] = None,
+) -> int:
+    """
+    Count the records search_ranked_ids can return for a term and filters.
+
+    Args:
+        db: Prisma database connection
+        target: Table and columns to search
+        organization_id: Organization the records belong to
+        term: Case-insensitive substring to search for
+        where: Listing filters the matches must also satisfy
+
+    Returns:
+        Number of matching records
+    """
+    term = term.strip()
+    if not term:
+        return 0
+
+    filters, params = build_search_filters(where, 3)
+    rows = await db.query_raw(
+        build_search_count_query(target, filters),
+        organization_id,
+        f"%{escape_like(term)}%",
+        *params,
+    )
+    return int(rows[0]["total"]) if rows else 0
+
+
+def order_by_rank(records: List[T], ranked_ids: List[str]) -> List[T]:
+    """
+    Order records fetched with an ``id in ranked_ids`` filter by search rank.
+
+    Args:
+        records: Records with an ``id`` attribute, in any order
+        ranked_ids: IDs returned by search_ranked_ids
+
+    Returns:
+        Records in relevance order
+    """
+    rank = {record_id: position for position, record_id in enumerate(ranked_ids)}
+    return sorted(records, key=lambda record: rank.get(record.id, len(rank)))
@@ -0,0 +1 @@
+# benchmark tests package
@@ -0,0 +1,265 @@
+"""
+Fixtures for the remittance pipeline benchmarks.
+
+Benchmarks run against the database at TEST_DATABASE_URL with OpenAI and
+Xero replaced by the fakes in ``fakes.py`` and remittance files kept in
+local disk storage instead of Supabase. Seeded organizations are deleted
+when the module finishes.
+
+Environment:
+    TEST_DATABASE_URL: Database to benchmark against; benchmarks are skipped
+        when it is not set
+    BENCHMARK_RUNS: Timed runs per case (default 5)
+    BENCHMARK_TOLERANCE: Allowed relative growth in latency and memory
+        before a case fails (default 0.5)
+    BENCHMARK_UPDATE_BASELINE: Set to 1 to record results as the new
+        baselines instead of comparing against them
+    BENCHMARK_RESULTS_PATH: Optional file to write all results to as JSON
+"""
+
+import asyncio
+import json
+import os
+import uuid
+from dataclasses import asdict, dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, Generator, List
+from unittest.mock import patch
+
+import httpx
+import pytest
+import pytest_asyncio
+from prisma.enums import RemittanceStatus
+
+import src.domains.remittances.ai_extraction.service as ai_extraction_service
+import src.domains.remittances.service as remittance_service
+from prisma import Prisma
+from src.core.storage import LocalStorage
+from src.domains.remittances.service import (
+    approve_remittance,
+    generate_file_path,
+    process_remittance_background,
+)
+
+from .fakes import FakeOpenAIClient, FakeXero
+from .harness import (
+    BenchmarkResult,
+    QueryCounter,
+    load_baselines,
+    regressions,
+    save_baselines,
+)
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+BENCHMARK_RUNS = int(os.environ.get("BENCHMARK_RUNS", "5"))
+BENCHMARK_TOLERANCE = float(os.environ.get("BENCHMARK_TOLERANCE", "0.5"))
+UPDATE_BASELINE = os.environ.get("BENCHMARK_UPDATE_BASELINE") == "1"
+RESULTS_PATH = os.environ.get("BENCHMARK_RESULTS_PATH")
+
+ORG_NAME_PREFIX = "Benchmark org"
+SAMPLE_PDF = Path(__file__).resolve().parents[2] / "example-remittance.pdf"
+PAID_AMOUNT = 110.0
+
+
+@dataclass
+class BenchmarkOrg:
+    """A seeded organization with a ledger of open invoices."""
+
+    id: str
+    invoice_numbers: List[str]
+    xero_invoice_ids: Dict[str, str]
+
+
+@pytest.fixture
+def route_partial_queries() -> Generator[None, None, None]:
+    """Let partial model queries reach the real database."""
+    yield
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def benchmark_db() -> AsyncGenerator[Prisma, None]:
+    """Connected client for the benchmark database."""
+    db = Prisma(datasource={"url": TEST_DATABASE_URL or ""})
+    await db.connect()
+    yield db
+
+    # Invoices, remittances and connections cascade with the organization
+    await db.execute_raw(
+        "DELETE FROM \"Organization\" WHERE name LIKE $1 || '%'", ORG_NAME_PREFIX
+    )
+    await db.disconnect()
+
+
+async def seed_org(db: Prisma, ledger_size: int) -> BenchmarkOrg:
+    """
+    Create an organization with ``ledger_size`` authorised invoices, a
+    default bank account and a connected Xero tenant.
+    """
+    org_id = str(uuid.uuid4())
+    await db.execute_raw(
+        'INSERT INTO "Organization" ("id", "name") VALUES ($1::uuid, $2)',
+        org_id,
+        f"{ORG_NAME_PREFIX} {ledger_size}",
+    )
+    await db.execute_raw(
+        'INSERT INTO "Invoice" ("id", "organizationId", "invoiceId", '
+        '"invoiceNumber", "status", "total", "amountDue", "currencyCode") '
+        "SELECT gen_random_uuid(), $1::uuid, 'bench-' || $1 || '-' || g, "
+        "'INV-' || lpad(g::text, 6, '0'), 'AUTHORISED'::\"InvoiceStatus\", "
+        "110, 110, 'AUD' FROM generate_series(1, $2) g",
+        org_id,
+        ledger_size,
+    )
+    await db.bankaccount.create(
+        data={
+            "organizationId": org_id,
+            "xeroAccountId": f"bench-account-{org_id}",
+            "xeroName": "Benchmark account",
+            "isDefault": True,
+        }
+    )
+    await db.execute_raw(
+        'INSERT INTO "XeroConnection" ("organizationId", "xeroTenantId", '
+        '"accessToken", "refreshToken", "expiresAt") '
+        "VALUES ($1::uuid, 'bench-tenant-' || $1, 'token', 'refresh', "
+        "now() + interval '1 day')",
+        org_id,
+    )
+    await db.execute_raw('ANALYZE "Invoice"')
+
+    rows = await db.query_raw(
+        'SELECT "invoiceId", "invoiceNumber" FROM "Invoice" '
+        'WHERE "organizationId" = $1::uuid ORDER BY "invoiceNumber"',
+        org_id,
+    )
+    return BenchmarkOrg(
+        id=org_id,
+        invoice_numbers=[row["invoiceNumber"] for row in rows],
+        xero_invoice_ids={row["invoiceId"]: row["invoiceNumber"] for row in rows},
+    )
+
+
+class Pipeline:
+    """Runs the remittance pipeline against the benchmark database and fakes."""
+
+    def __init__(
+        self,
+        db: Prisma,
+        openai: FakeOpenAIClient,
+        xero: FakeXero,
+        storage: LocalStorage,
+    ) -> None:
+        self.db = db
+        self.openai = openai
+        self.xero = xero
+        self.storage = storage
+        self.counter = QueryCounter(db)
+        self.user_id = str(uuid.uuid4())
+        self._orgs: Dict[int, BenchmarkOrg] = {}
+
+    async def org(self, ledger_size: int) -> BenchmarkOrg:
+        """The organization with a ledger of ``ledger_size`` invoices."""
+        if ledger_size not in self._orgs:
+            org = await seed_org(self.db, ledger_size)
+            self.xero.invoice_numbers.update(org.xero_invoice_ids)
+            self._orgs[ledger_size] = org
+        return self._orgs[ledger_size]
+
+    def extract_lines(self, org: BenchmarkOrg, line_count: int) -> None:
+        """Have the fake assistant return lines for invoices across the ledger."""
+        step = max(len(org.invoice_numbers) // line_count, 1)
+        self.openai.payments = [
+            {"invoice_number": number, "paid_amount": PAID_AMOUNT}
+            for number in org.invoice_numbers[::step][:line_count]
+        ]
+
+    async def uploaded_remittance(self, org: BenchmarkOrg) -> Dict[str, str]:
+        """Store the sample PDF and create a remittance waiting to be processed."""
+        file_path, _ = generate_file_path(org.id)
+        await self.storage.upload(file_path, SAMPLE_PDF.read_bytes())
+        remittance = await self.db.remittance.create(
+            data={
+                "organizationId": org.id,
+                "filename": SAMPLE_PDF.name,
+                "filePath": file_path,
+                "status": RemittanceStatus.Uploaded,
+            }
+        )
+        return {"id": remittance.id, "file_path": file_path, "org_id": org.id}
+
+    async def process(self, remittance: Dict[str, str]) -> None:
+        """Run background processing of an uploaded remittance."""
+        await process_remittance_background(
+            self.db,
+            remittance["id"],
+            remittance["file_path"],
+            remittance["org_id"],
+            self.user_id,
+        )
+
+    async def approve(self, remittance: Dict[str, str]) -> None:
+        """Approve a remittance and wait for the tasks approval schedules."""
+        before = asyncio.all_tasks()
+        await approve_remittance(
+            self.db, remittance["org_id"], self.user_id, remittance["id"]
+        )
+        spawned = asyncio.all_tasks() - before
+        await asyncio.gather(*spawned)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def pipeline(
+    benchmark_db: Prisma, tmp_path_factory: pytest.TempPathFactory
+) -> AsyncGenerator[Pipeline, None]:
+    """The pipeline wired to local fakes, counting database queries."""
+    openai = FakeOpenAIClient()
+    xero = FakeXero({})
+    storage = LocalStorage(
+        str(tmp_path_factory.mktemp("storage")), "http://benchmark.local/files"
+    )
+    runner = Pipeline(benchmark_db, openai, xero, storage)
+
+    # The database client connected before httpx was patched, so only the
+    # clients created per request by the Xero integration reach the fake
+    with (
+        patch.object(ai_extraction_service, "openai_client", openai),
+        patch("src.shared.ai.openai_client", openai),
+        patch.object(remittance_service, "storage_service", storage),
+        patch.object(
+            httpx, "AsyncClient", partial(httpx.AsyncClient, transport=xero.transport())
+        ),
+    ):
+        runner.counter.install()
+        yield runner
+        runner.counter.uninstall()
+
+
+@pytest.fixture(scope="module")
+def benchmark_results() -> Generator[List[BenchmarkResult], None, None]:
+    """Results of every case in the module, saved when it finishes."""
+    results: List[BenchmarkResult] = []
+    yield results
+
+    if UPDATE_BASELINE and results:
+        save_baselines(results)
+    if RESULTS_PATH:
+        Path(RESULTS_PATH).write_text(
+            json.dumps([asdict(result) for result in results], indent=2) + "\n"
+        )
+
+
+@pytest.fixture
+def check_baseline(benchmark_results: List[BenchmarkResult]) -> Any:
+    """Record a result and fail if it regressed against its baseline."""
+    baselines = load_baselines()
+
+    def check(result: BenchmarkResult) -> None:
+        benchmark_results.append(result)
+        print(result.describe())
+        if UPDATE_BASELINE:
+            return
+        problems = regressions(result, baselines.get(result.name), BENCHMARK_TOLERANCE)
+        assert not problems, f"{result.name} regressed: " + "; ".join(problems)
+
+    return check
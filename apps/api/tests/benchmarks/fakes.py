@@ -0,0 +1,115 @@
+"""
+Local stand-ins for the external services the remittance pipeline calls.
+
+The fakes answer instantly unless given a latency, so the benchmarks measure
+the application's own work: PDF parsing, matching, database round trips and
+request handling.
+"""
+
+import asyncio
+import uuid
+from collections import Counter
+from datetime import date
+from typing import Dict, List, Optional
+
+import httpx
+
+from src.shared.ai.types import AIExtractionResult, AIPaymentDict
+
+
+class FakeOpenAIClient:
+    """
+    Replaces the OpenAI assistant client, returning a fixed extraction.
+
+    Set ``payments`` to the lines the "assistant" should find before each run.
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.payments: List[AIPaymentDict] = []
+        self._thread_id: Optional[str] = None
+
+    def get_current_thread_id(self) -> Optional[str]:
+        return self._thread_id
+
+    async def extract_remittance_data(
+        self, pdf_text: str, organization_id: str
+    ) -> AIExtractionResult:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self._thread_id = f"thread_{uuid.uuid4().hex}"
+        return AIExtractionResult(
+            data={
+                "payment_date": date.today().isoformat(),
+                "total_amount": sum(p["paid_amount"] for p in self.payments),
+                "payment_reference": "BENCHMARK",
+                "payments": list(self.payments),
+                "confidence": 0.95,
+            },
+            thread_id=self._thread_id,
+        )
+
+
+class FakeXero:
+    """
+    In-process Xero API for an ``httpx.MockTransport``.
+
+    Serves the calls made when a remittance is approved: creating a batch
+    payment, attaching the remittance PDF and reading back the paid invoices.
+    """
+
+    def __init__(self, invoice_numbers: Dict[str, str], latency: float = 0.0):
+        """
+        Args:
+            invoice_numbers: Invoice numbers keyed by Xero invoice ID
+            latency: Seconds to wait before answering each request
+        """
+        self.invoice_numbers = invoice_numbers
+        self.latency = latency
+        self.requests: Counter[str] = Counter()
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        path = request.url.path
+        resource = path.split("/api.xro/2.0/", 1)[-1]
+        self.requests[f"{request.method} {resource.split('/')[0]}"] += 1
+
+        if request.method == "PUT" and resource == "BatchPayments":
+            return httpx.Response(
+                200, json={"BatchPayments": [{"BatchPaymentID": str(uuid.uuid4())}]}
+            )
+        if request.method == "POST" and "/Attachments/" in resource:
+            return httpx.Response(200)
+        if request.method == "GET" and resource == "Invoices":
+            ids = request.url.params.get("IDs", "").split(",")
+            return httpx.Response(
+                200, json={"Invoices": [self._invoice(id_) for id_ in ids if id_]}
+            )
+        return httpx.Response(404, json={"Message": f"Not faked: {path}"})
+
+    def _invoice(self, invoice_id: str) -> Dict[str, object]:
+        return {
+            "InvoiceID": invoice_id,
+            "InvoiceNumber": self.invoice_numbers.get(invoice_id),
+            "Type": "ACCREC",
+            "Contact": {
+                "ContactID": "benchmark-contact",
+                "Name": "Benchmark Customer",
+                "ContactStatus": "ACTIVE",
+            },
+            "Date": "/Date(1748476800000+0000)/",
+            "Status": "PAID",
+            "LineAmountTypes": "Exclusive",
+            "SubTotal": 100.0,
+            "TotalTax": 10.0,
+            "Total": 110.0,
+            "AmountDue": 0.0,
+            "AmountPaid": 110.0,
+            "CurrencyCode": "AUD",
+            "LineItems": [],
+        }
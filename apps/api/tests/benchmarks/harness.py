@@ -0,0 +1,223 @@
+"""
+Measurement and baseline helpers for the pipeline benchmarks.
+
+Each benchmark case is run several times to collect latency percentiles and
+the number of queries sent to the Prisma query engine, plus one extra run
+under tracemalloc for the Python memory high-water mark (tracing allocations
+slows code down, so it is kept out of the timed runs).
+
+Results are compared against the committed baselines in ``baselines.json``.
+Query counts are deterministic and must not grow; latency and memory may
+drift by BENCHMARK_TOLERANCE before a case counts as a regression. A case
+without a baseline fails too, so new cases must have theirs recorded.
+"""
+
+import json
+import math
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+)
+
+if TYPE_CHECKING:
+    from prisma import Prisma
+
+BASELINES_PATH = Path(__file__).with_name("baselines.json")
+
+# Timings below this are treated as noise when comparing against a baseline
+LATENCY_SLACK_MS = 5.0
+
+
+class QueryCounter:
+    """
+    Counts queries a Prisma client sends to its query engine.
+
+    Every model action, raw query and batch goes through the engine's
+    ``query`` method, so wrapping it on a connected client counts them all,
+    including queries from transactions sharing the engine.
+    """
+
+    def __init__(self, db: "Prisma") -> None:
+        self.count = 0
+        self.seconds = 0.0
+        self._engine = db._engine
+        self._query = self._engine.query
+
+    async def _counted(self, *args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return await self._query(*args, **kwargs)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - started
+
+    def install(self) -> None:
+        """Start counting queries."""
+        self._engine.query = self._counted  # type: ignore[method-assign]
+
+    def uninstall(self) -> None:
+        """Stop counting queries."""
+        self._engine.query = self._query  # type: ignore[method-assign]
+
+    def reset(self) -> None:
+        """Zero the counters."""
+        self.count = 0
+        self.seconds = 0.0
+
+
+@dataclass
+class BenchmarkResult:
+    """Summary of one benchmark case."""
+
+    name: str
+    runs: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    queries: int
+    query_ms: float
+    peak_memory_kib: float
+
+    def describe(self) -> str:
+        return (
+            f"{self.name}: p50 {self.p50_ms:.1f}ms p95 {self.p95_ms:.1f}ms "
+            f"p99 {self.p99_ms:.1f}ms, {self.queries} queries "
+            f"({self.query_ms:.1f}ms), peak {self.peak_memory_kib:.0f}KiB"
+        )
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Percentile of the samples, interpolating between closest ranks."""
+    ordered = sorted(samples)
+    if not ordered:
+        raise ValueError("No samples")
+    rank = (len(ordered) - 1) * pct / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+@contextmanager
+def _traced_memory() -> Iterator[List[int]]:
+    peak: List[int] = []
+    tracemalloc.start()
+    try:
+        yield peak
+    finally:
+        peak.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+
+async def measure(
+    name: str,
+    counter: QueryCounter,
+    setup: Callable[[], Awaitable[Any]],
+    operation: Callable[[Any], Awaitable[None]],
+    runs: int,
+) -> BenchmarkResult:
+    """
+    Time an operation over several runs.
+
+    Args:
+        name: Case name, used as the baseline key
+        counter: Query counter installed on the client under test
+        setup: Prepares the input for one run; not measured
+        operation: The code under test, called with the setup result
+        runs: Number of timed runs
+
+    Returns:
+        Latency percentiles, queries per run and peak traced memory
+    """
+    latencies: List[float] = []
+    queries: List[int] = []
+    query_seconds: List[float] = []
+
+    for _ in range(runs):
+        state = await setup()
+        counter.reset()
+        started = time.perf_counter()
+        await operation(state)
+        latencies.append((time.perf_counter() - started) * 1000)
+        queries.append(counter.count)
+        query_seconds.append(counter.seconds)
+
+    state = await setup()
+    with _traced_memory() as peak:
+        await operation(state)
+
+    return BenchmarkResult(
+        name=name,
+        runs=runs,
+        p50_ms=percentile(latencies, 50),
+        p95_ms=percentile(latencies, 95),
+        p99_ms=percentile(latencies, 99),
+        queries=max(queries),
+        query_ms=percentile(query_seconds, 50) * 1000,
+        peak_memory_kib=peak[0] / 1024,
+    )
+
+
+def load_baselines(path: Path = BASELINES_PATH) -> Dict[str, Dict[str, Any]]:
+    """Committed baseline results keyed by case name."""
+    if not path.exists():
+        return {}
+    return dict(json.loads(path.read_text()))
+
+
+def save_baselines(results: List[BenchmarkResult], path: Path = BASELINES_PATH) -> None:
+    """Merge results into the baseline file."""
+    baselines = load_baselines(path)
+    baselines.update({result.name: asdict(result) for result in results})
+    path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+
+
+def regressions(
+    result: BenchmarkResult,
+    baseline: Optional[Dict[str, Any]],
+    tolerance: float,
+) -> List[str]:
+    """
+    Describe how a result is worse than its baseline.
+
+    Args:
+        result: Measured result
+        baseline: Baseline for the same case, if one was recorded
+        tolerance: Allowed relative growth in latency and memory
+
+    Returns:
+        One message per regressed measure, or one for a missing baseline;
+        empty if none regressed
+    """
+    if baseline is None:
+        return ["no baseline recorded (run make benchmark-baseline)"]
+
+    problems = []
+    if result.queries > baseline["queries"]:
+        problems.append(f"queries {baseline['queries']} -> {result.queries}")
+
+    latency_limit = max(
+        baseline["p95_ms"] * (1 + tolerance), baseline["p95_ms"] + LATENCY_SLACK_MS
+    )
+    if result.p95_ms > latency_limit:
+        problems.append(
+            f"p95 {baseline['p95_ms']:.1f}ms -> {result.p95_ms:.1f}ms "
+            f"(limit {latency_limit:.1f}ms)"
+        )
+
+    memory_limit = baseline["peak_memory_kib"] * (1 + tolerance)
+    if result.peak_memory_kib > memory_limit:
+        problems.append(
+            f"peak memory {baseline['peak_memory_kib']:.0f}KiB -> "
+            f"{result.peak_memory_kib:.0f}KiB (limit {memory_limit:.0f}KiB)"
+        )
+    return problems
@@ -0,0 +1,134 @@
+"""
+Tests for the benchmark measurement and baseline helpers.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from .harness import (
+    BenchmarkResult,
+    QueryCounter,
+    load_baselines,
+    measure,
+    percentile,
+    regressions,
+    save_baselines,
+)
+
+
+def _result(**overrides) -> BenchmarkResult:
+    values = dict(
+        name="process[lines=5,ledger=1000]",
+        runs=5,
+        p50_ms=40.0,
+        p95_ms=50.0,
+        p99_ms=55.0,
+        queries=12,
+        query_ms=20.0,
+        peak_memory_kib=800.0,
+    )
+    values.update(overrides)
+    return BenchmarkResult(**values)
+
+
+class TestPercentile:
+    """Test percentiles interpolate between samples."""
+
+    def test_interpolates(self):
+        """Test values between ranks are interpolated."""
+        samples = [10.0, 20.0, 30.0, 40.0, 50.0]
+
+        assert percentile(samples, 50) == 30.0
+        assert percentile(samples, 95) == pytest.approx(48.0)
+        assert percentile(samples, 100) == 50.0
+
+    def test_single_sample(self):
+        """Test one sample is every percentile."""
+        assert percentile([7.0], 99) == 7.0
+
+
+class TestRegressions:
+    """Test results are compared against their baselines."""
+
+    def test_missing_baseline_fails(self):
+        """Test a case without a baseline cannot pass unnoticed."""
+        problems = regressions(_result(), None, tolerance=0.5)
+
+        assert problems == ["no baseline recorded (run make benchmark-baseline)"]
+
+    def test_within_tolerance_passes(self):
+        """Test latency and memory may grow within the tolerance."""
+        baseline = vars(_result())
+
+        result = _result(p95_ms=70.0, peak_memory_kib=1100.0)
+
+        assert regressions(result, baseline, tolerance=0.5) == []
+
+    def test_extra_query_fails(self):
+        """Test any growth in the query count is a regression."""
+        baseline = vars(_result())
+
+        problems = regressions(_result(queries=13), baseline, tolerance=0.5)
+
+        assert problems == ["queries 12 -> 13"]
+
+    def test_slow_and_large_results_fail(self):
+        """Test latency and memory beyond the tolerance are regressions."""
+        baseline = vars(_result())
+
+        problems = regressions(
+            _result(p95_ms=90.0, peak_memory_kib=1300.0), baseline, tolerance=0.5
+        )
+
+        assert len(problems) == 2
+        assert problems[0].startswith("p95 50.0ms -> 90.0ms")
+        assert problems[1].startswith("peak memory 800KiB -> 1300KiB")
+
+    def test_small_timings_get_absolute_slack(self):
+        """Test jitter on very fast cases is not reported."""
+        baseline = vars(_result(p95_ms=2.0))
+
+        assert regressions(_result(p95_ms=6.0), baseline, tolerance=0.5) == []
+
+    def test_saved_baselines_round_trip(self, tmp_path):
+        """Test saved results are merged into the baseline file."""
+        path = tmp_path / "baselines.json"
+        save_baselines([_result(name="a")], path)
+        save_baselines([_result(name="b", queries=3)], path)
+
+        baselines = load_baselines(path)
+
+        assert sorted(baselines) == ["a", "b"]
+        assert baselines["b"]["queries"] == 3
+
+
+class TestMeasure:
+    """Test measurement counts queries per run."""
+
+    @pytest.mark.asyncio
+    async def test_counts_queries_per_run(self):
+        """Test queries from setup are excluded from the count."""
+        # Arrange
+        query = AsyncMock(return_value={})
+        engine = SimpleNamespace(query=query)
+        counter = QueryCounter(SimpleNamespace(_engine=engine))
+        counter.install()
+
+        async def setup() -> None:
+            await engine.query("setup", tx_id=None)
+
+        async def operation(_: None) -> None:
+            await engine.query("first", tx_id=None)
+            await engine.query("second", tx_id=None)
+
+        # Act
+        result = await measure("case", counter, setup, operation, runs=3)
+        counter.uninstall()
+
+        # Assert
+        assert result.runs == 3
+        assert result.queries == 2
+        assert result.peak_memory_kib >= 0
+        assert query.await_count == 12  # 3 timed runs and the memory run
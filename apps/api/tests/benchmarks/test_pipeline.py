@@ -0,0 +1,109 @@
+"""
+End-to-end benchmarks of remittance processing and approval.
+
+Each case processes or approves a remittance of ``line_count`` lines for an
+organization with ``ledger_size`` open invoices, and fails when it is slower,
+uses more memory or sends more queries than its recorded baseline.
+
+    TEST_DATABASE_URL=... poetry run pytest tests/benchmarks -m benchmark -s
+"""
+
+from typing import Dict
+
+import pytest
+from prisma.enums import RemittanceStatus
+
+from .conftest import BENCHMARK_RUNS, TEST_DATABASE_URL, Pipeline
+from .harness import measure
+
+LINE_COUNTS = [5, 50, 200]
+LEDGER_SIZES = [1_000, 20_000]
+
+# Processing sends about three queries per line (create, match, update)
+BUDGET_LINE_COUNT = 100
+PROCESS_QUERY_BUDGET = 350
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.skipif(
+        not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not configured"
+    ),
+]
+
+
+@pytest.mark.parametrize("ledger_size", LEDGER_SIZES)
+@pytest.mark.parametrize("line_count", LINE_COUNTS)
+class TestPipelineBenchmarks:
+    """Benchmark the pipeline across remittance and ledger sizes."""
+
+    async def test_process_remittance(
+        self, pipeline: Pipeline, check_baseline, line_count: int, ledger_size: int
+    ):
+        """Benchmark extraction, line creation and matching of an upload."""
+        # Arrange
+        org = await pipeline.org(ledger_size)
+        pipeline.extract_lines(org, line_count)
+
+        async def setup() -> Dict[str, str]:
+            return await pipeline.uploaded_remittance(org)
+
+        # Act
+        result = await measure(
+            f"process[lines={line_count},ledger={ledger_size}]",
+            pipeline.counter,
+            setup,
+            pipeline.process,
+            BENCHMARK_RUNS,
+        )
+
+        # Assert
+        check_baseline(result)
+
+    async def test_approve_remittance(
+        self, pipeline: Pipeline, check_baseline, line_count: int, ledger_size: int
+    ):
+        """Benchmark approval, including the attachment and invoice sync tasks."""
+        # Arrange
+        org = await pipeline.org(ledger_size)
+        pipeline.extract_lines(org, line_count)
+
+        async def setup() -> Dict[str, str]:
+            remittance = await pipeline.uploaded_remittance(org)
+            await pipeline.process(remittance)
+            processed = await pipeline.db.remittance.find_unique(
+                where={"id": remittance["id"]}
+            )
+            assert processed and processed.status == RemittanceStatus.Awaiting_Approval
+            return remittance
+
+        # Act
+        result = await measure(
+            f"approve[lines={line_count},ledger={ledger_size}]",
+            pipeline.counter,
+            setup,
+            pipeline.approve,
+            BENCHMARK_RUNS,
+        )
+
+        # Assert
+        check_baseline(result)
+        assert pipeline.xero.requests["PUT BatchPayments"] >= BENCHMARK_RUNS
+
+
+class TestQueryBudgets:
+    """Guard the number of queries the pipeline sends."""
+
+    async def test_process_remittance_within_budget(
+        self, pipeline: Pipeline, query_budget
+    ):
+        """Test processing a 100-line remittance stays within its query budget."""
+        # Arrange
+        org = await pipeline.org(LEDGER_SIZES[0])
+        pipeline.extract_lines(org, BUDGET_LINE_COUNT)
+        remittance = await pipeline.uploaded_remittance(org)
+
+        # Act / Assert
+        with query_budget(pipeline.db, PROCESS_QUERY_BUDGET) as stats:
+            await pipeline.process(remittance)
+        assert stats.count > BUDGET_LINE_COUNT
@@ -4,16 +4,23 @@ Global pytest configuration and fixtures for the RemitMatch API test suite.
 
 import asyncio
 import os
-from typing import Any, Dict, Generator
-from unittest.mock import AsyncMock, Mock
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, ContextManager, Dict, Generator, Iterator
+from unittest.mock import AsyncMock, Mock, patch
 
 import jwt
 import pytest
 from fastapi.testclient import TestClient
 from prisma.enums import InvoiceStatus, MemberStatus, OrganizationRole
 from prisma.models import AuthLink, Invoice, OrganizationMember, Profile
+from prisma.partials import (
+    InvoiceMatchFields,
+    RemittanceListItem,
+    RemittanceStatusFields,
+)
 
 from prisma import Prisma
+from src.core.queries import QueryStats, instrument_queries, track_queries
 from src.main import app
 
 # Import fixtures from fixture modules
@@ -50,6 +57,7 @@ def mock_prisma() -> Mock:
     mock_db.profile.find_unique = AsyncMock()
     mock_db.invoice.find_many = AsyncMock()
     mock_db.invoice.count = AsyncMock()
+    mock_db.query_raw = AsyncMock(return_value=[])
 
     # Xero integration mocks
     mock_db.xeroconnection.find_first = AsyncMock()
@@ -66,6 +74,51 @@ def mock_prisma() -> Mock:
     return mock_db
 
 
+@pytest.fixture(autouse=True)
+def route_partial_queries() -> Generator[None, None, None]:
+    """
+    Route partial model queries to the client's model actions.
+
+    ``Partial.prisma(db)`` talks to the query engine directly; in unit tests it
+    returns the matching model actions on ``db`` (e.g. ``db.remittance``) so
+    the usual ``mock_prisma`` mocks apply.
+    """
+    with ExitStack() as stack:
+        for partial in (InvoiceMatchFields, RemittanceListItem, RemittanceStatusFields):
+            model = partial.__prisma_model__.lower()
+            stack.enter_context(
+                patch.object(
+                    partial,
+                    "prisma",
+                    side_effect=lambda client=None, model=model: getattr(client, model),
+                )
+            )
+        yield
+
+
+@pytest.fixture
+def query_budget() -> Callable[[Prisma, int], ContextManager[QueryStats]]:
+    """
+    Fail the test if a block sends more database queries than its budget.
+
+    Needs a client connected to a real database::
+
+        with query_budget(db, 250) as stats:
+            await process_remittance_background(db, ...)
+    """
+
+    @contextmanager
+    def budget(db: Prisma, limit: int) -> Iterator[QueryStats]:
+        instrument_queries(db)
+        with track_queries() as stats:
+            yield stats
+        assert (
+            stats.count <= limit
+        ), f"Sent {stats.count} queries, over the budget of {limit}"
+
+    return budget
+
+
 @pytest.fixture
 def test_jwt_secret() -> str:
     """JWT secret for generating test tokens."""
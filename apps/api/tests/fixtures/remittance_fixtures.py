@@ -32,7 +32,7 @@ def mock_remittance_uploaded() -> Mock:
     remittance.reference = None
     remittance.confidenceScore = None
     remittance.confidence_score = None  # For Pydantic model
-    remittance.extractedRawJson = None
+    remittance.extraction = None  # Raw extraction output is loaded on demand
     remittance.xeroBatchId = None
     remittance.xero_batch_id = None  # For Pydantic model
     remittance.createdAt = datetime(2024, 1, 15, 9, 0, 0)
@@ -61,7 +61,7 @@ def mock_remittance_processed() -> Mock:
     remittance.reference = "REF-12345"
     remittance.confidenceScore = Decimal("0.95")
     remittance.confidence_score = Decimal("0.95")  # For Pydantic model
-    remittance.extractedRawJson = {"invoices": []}
+    remittance.extraction = None  # Raw extraction output is loaded on demand
     remittance.xeroBatchId = None
     remittance.xero_batch_id = None  # For Pydantic model
     remittance.createdAt = datetime(2024, 1, 15, 9, 0, 0)
@@ -0,0 +1,225 @@
+"""
+In-memory stand-ins for the Supabase storage and S3 REST APIs.
+"""
+
+import json
+import re
+from typing import Dict, List
+from urllib.parse import unquote
+
+import httpx
+
+from src.core.storage import S3Storage, SupabaseStorage
+
+# Supabase reports missing objects as a 400 carrying a 404 status code
+NOT_FOUND = {"statusCode": "404", "error": "not_found", "message": "Object not found"}
+
+
+def _object_response(request: httpx.Request, content: bytes) -> httpx.Response:
+    """Serve an object, honouring a single-range Range header."""
+    match = re.match(r"bytes=(\d+)-(\d*)", request.headers.get("range", ""))
+    if not match:
+        return httpx.Response(200, content=content)
+
+    start = int(match.group(1))
+    end = int(match.group(2)) if match.group(2) else len(content) - 1
+    return httpx.Response(
+        206,
+        content=content[start : end + 1],
+        headers={"Content-Range": f"bytes {start}-{end}/{len(content)}"},
+    )
+
+
+class InMemoryStorage:
+    """
+    Serves the storage endpoints used by SupabaseStorage from a dict.
+
+    Plug ``transport`` into a SupabaseStorage (or use ``service()``) to run the
+    real backend code without network access.
+    """
+
+    def __init__(self, bucket_name: str = "remittances") -> None:
+        self.bucket_name = bucket_name
+        self.objects: Dict[str, bytes] = {}
+        self.sign_requests = 0
+        self.transport = httpx.MockTransport(self._handle)
+
+    def service(self) -> SupabaseStorage:
+        """Create a SupabaseStorage backed by this stand-in."""
+        return SupabaseStorage(
+            "http://storage.test",
+            "test-service-key",
+            bucket_name=self.bucket_name,
+            transport=self.transport,
+        )
+
+    async def _handle(self, request: httpx.Request) -> httpx.Response:
+        path = unquote(request.url.path).removeprefix("/storage/v1")
+        object_prefix = f"/object/{self.bucket_name}/"
+        sign_prefix = f"/object/sign/{self.bucket_name}/"
+
+        if request.method == "POST" and path.startswith(sign_prefix):
+            key = path.removeprefix(sign_prefix)
+            if key not in self.objects:
+                return httpx.Response(400, json=NOT_FOUND)
+            expires_in = json.loads(await request.aread())["expiresIn"]
+            self.sign_requests += 1
+            return httpx.Response(
+                200, json={"signedURL": f"{sign_prefix}{key}?token=t{expires_in}"}
+            )
+
+        if request.method == "POST" and path == f"/object/sign/{self.bucket_name}":
+            body = json.loads(await request.aread())
+            self.sign_requests += 1
+            return httpx.Response(
+                200,
+                json=[
+                    {
+                        "path": key,
+                        "signedURL": (
+                            f"{sign_prefix}{key}?token=t{body['expiresIn']}"
+                            if key in self.objects
+                            else None
+                        ),
+                        "error": None if key in self.objects else "Object not found",
+                    }
+                    for key in body["paths"]
+                ],
+            )
+
+        if request.method == "POST" and path == "/object/move":
+            body = json.loads(await request.aread())
+            if body["sourceKey"] not in self.objects:
+                return httpx.Response(400, json=NOT_FOUND)
+            if body["destinationKey"] in self.objects:
+                return httpx.Response(409, json={"error": "Duplicate"})
+            self.objects[body["destinationKey"]] = self.objects.pop(body["sourceKey"])
+            return httpx.Response(200, json={"message": "Successfully moved"})
+
+        if request.method == "DELETE" and path == f"/object/{self.bucket_name}":
+            for key in json.loads(await request.aread())["prefixes"]:
+                self.objects.pop(key, None)
+            return httpx.Response(200, json=[])
+
+        if not path.startswith(object_prefix):
+            return httpx.Response(404, json={"error": "not_found"})
+
+        key = path.removeprefix(object_prefix)
+        if request.method == "POST":
+            upsert = request.headers.get("x-upsert") == "true"
+            if key in self.objects and not upsert:
+                return httpx.Response(409, json={"error": "Duplicate"})
+            self.objects[key] = await request.aread()
+            return httpx.Response(200, json={"Key": f"{self.bucket_name}/{key}"})
+
+        if key not in self.objects:
+            # Like the real API, HEAD gets the status without the error body
+            if request.method == "HEAD":
+                return httpx.Response(400)
+            return httpx.Response(400, json=NOT_FOUND)
+
+        if request.method == "HEAD":
+            return httpx.Response(
+                200, headers={"Content-Length": str(len(self.objects[key]))}
+            )
+
+        if request.method == "GET":
+            return _object_response(request, self.objects[key])
+
+        return httpx.Response(405)
+
+
+class InMemoryS3:
+    """
+    Serves the S3 object and multipart upload endpoints from a dict.
+
+    Requests without a SigV4 Authorization header are rejected, as are
+    conditional writes to existing objects.
+    """
+
+    def __init__(self, bucket_name: str = "remittances") -> None:
+        self.bucket_name = bucket_name
+        self.objects: Dict[str, bytes] = {}
+        self.uploads: Dict[str, List[bytes]] = {}
+        self.requests: List[httpx.Request] = []
+        self.transport = httpx.MockTransport(self._handle)
+
+    def service(self, part_size: int = 0) -> S3Storage:
+        """Create an S3Storage backed by this stand-in."""
+        return S3Storage(
+            "http://minio.test:9000",
+            self.bucket_name,
+            "test-access-key",
+            "test-secret-key",
+            part_size=part_size,
+            transport=self.transport,
+        )
+
+    async def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        authorization = request.headers.get("authorization", "")
+        if not authorization.startswith("AWS4-HMAC-SHA256 Credential="):
+            return httpx.Response(403)
+
+        key = unquote(request.url.path).removeprefix(f"/{self.bucket_name}/")
+        params = request.url.params
+        body = await request.aread()
+
+        if request.method == "POST" and "uploads" in params:
+            upload_id = f"upload-{len(self.uploads) + 1}"
+            self.uploads[upload_id] = []
+            return httpx.Response(
+                200,
+                content=(
+                    "<InitiateMultipartUploadResult>"
+                    f"<UploadId>{upload_id}</UploadId>"
+                    "</InitiateMultipartUploadResult>"
+                ).encode(),
+            )
+
+        if request.method == "PUT" and "partNumber" in params:
+            self.uploads[params["uploadId"]].append(body)
+            return httpx.Response(
+                200, headers={"ETag": f'"etag-{params["partNumber"]}"'}
+            )
+
+        if request.method == "POST" and "uploadId" in params:
+            if request.headers.get("if-none-match") == "*" and key in self.objects:
+                return httpx.Response(412)
+            self.objects[key] = b"".join(self.uploads.pop(params["uploadId"]))
+            return httpx.Response(200, content=b"<CompleteMultipartUploadResult/>")
+
+        if request.method == "DELETE" and "uploadId" in params:
+            self.uploads.pop(params["uploadId"], None)
+            return httpx.Response(204)
+
+        if request.method == "PUT" and "x-amz-copy-source" in request.headers:
+            source = unquote(request.headers["x-amz-copy-source"])
+            source = source.removeprefix(f"/{self.bucket_name}/")
+            if source not in self.objects:
+                return httpx.Response(404)
+            self.objects[key] = self.objects[source]
+            return httpx.Response(200, content=b"<CopyObjectResult/>")
+
+        if request.method == "PUT":
+            if request.headers.get("if-none-match") == "*" and key in self.objects:
+                return httpx.Response(412)
+            self.objects[key] = body
+            return httpx.Response(200)
+
+        if request.method == "DELETE":
+            self.objects.pop(key, None)
+            return httpx.Response(204)
+
+        if key not in self.objects:
+            return httpx.Response(404)
+
+        if request.method == "HEAD":
+            return httpx.Response(
+                200, headers={"Content-Length": str(len(self.objects[key]))}
+            )
+
+        if request.method == "GET":
+            return _object_response(request, self.objects[key])
+
+        return httpx.Response(405)
@@ -0,0 +1 @@
+# integration tests package
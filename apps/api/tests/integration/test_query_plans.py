@@ -0,0 +1,184 @@
+"""
+Query plan regression tests for the hot listing, matching and sync queries.
+
+Seeds a throwaway set of organizations into the database at TEST_DATABASE_URL,
+runs EXPLAIN on the SQL each access path issues and asserts the planner picks
+the composite index added for it. Skipped when TEST_DATABASE_URL is not set.
+"""
+
+import json
+import os
+from typing import Any, AsyncGenerator, Dict, Iterator, List
+
+import pytest
+
+from prisma import Prisma
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+ORG_NAME_PREFIX = "Query plan test org"
+ORG_COUNT = 50
+ROWS_PER_ORG = 400
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(
+        not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not configured"
+    ),
+]
+
+
+def _plan_nodes(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Walk an EXPLAIN (FORMAT JSON) plan tree."""
+    yield node
+    for child in node.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+async def _explain(db: Prisma, sql: str, *args: Any) -> List[Dict[str, Any]]:
+    """Return every node of the plan chosen for a query."""
+    rows = await db.query_raw(f"EXPLAIN (FORMAT JSON) {sql}", *args)
+    plan = rows[0]["QUERY PLAN"]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return list(_plan_nodes(plan[0]["Plan"]))
+
+
+def _index_names(nodes: List[Dict[str, Any]]) -> List[str]:
+    return [node["Index Name"] for node in nodes if "Index Name" in node]
+
+
+def _seq_scanned(nodes: List[Dict[str, Any]]) -> List[str]:
+    return [
+        node.get("Relation Name", "")
+        for node in nodes
+        if node.get("Node Type") == "Seq Scan"
+    ]
+
+
+@pytest.fixture(scope="module")
+async def seeded_db() -> AsyncGenerator[Prisma, None]:
+    """Connect to the test database and seed many organizations."""
+    db = Prisma(datasource={"url": TEST_DATABASE_URL or ""})
+    await db.connect()
+
+    await db.execute_raw(
+        'INSERT INTO "Organization" ("id", "name") '
+        "SELECT gen_random_uuid(), $1 || ' ' || g FROM generate_series(1, $2) g",
+        ORG_NAME_PREFIX,
+        ORG_COUNT,
+    )
+    await db.execute_raw(
+        'INSERT INTO "Invoice" ("id", "organizationId", "invoiceId", '
+        '"invoiceNumber", "status", "createdAt", "lastSyncedAt") '
+        "SELECT gen_random_uuid(), o.id, 'plan-' || o.id || '-' || g, "
+        "'INV-' || g, "
+        "(CASE WHEN g % 3 = 0 THEN 'PAID' ELSE 'AUTHORISED' END)::\"InvoiceStatus\", "
+        "now() - g * interval '1 minute', now() - g * interval '1 minute' "
+        'FROM "Organization" o, generate_series(1, $2) g '
+        "WHERE o.name LIKE $1 || '%'",
+        ORG_NAME_PREFIX,
+        ROWS_PER_ORG,
+    )
+    await db.execute_raw(
+        'INSERT INTO "Remittance" ("id", "organizationId", "filename", "status", '
+        '"createdAt") '
+        "SELECT gen_random_uuid(), o.id, 'remittance-' || g || '.pdf', "
+        "(CASE WHEN g % 4 = 0 THEN 'Awaiting_Approval' ELSE 'Reconciled' END)"
+        "::\"RemittanceStatus\", now() - g * interval '1 minute' "
+        'FROM "Organization" o, generate_series(1, $2) g '
+        "WHERE o.name LIKE $1 || '%'",
+        ORG_NAME_PREFIX,
+        ROWS_PER_ORG,
+    )
+    await db.execute_raw('ANALYZE "Invoice"')
+    await db.execute_raw('ANALYZE "Remittance"')
+
+    yield db
+
+    # Invoices and remittances cascade with their organization
+    await db.execute_raw(
+        "DELETE FROM \"Organization\" WHERE name LIKE $1 || '%'", ORG_NAME_PREFIX
+    )
+    await db.disconnect()
+
+
+@pytest.fixture(scope="module")
+async def org_id(seeded_db: Prisma) -> str:
+    """ID of one of the seeded organizations."""
+    rows = await seeded_db.query_raw(
+        "SELECT id FROM \"Organization\" WHERE name LIKE $1 || '%' LIMIT 1",
+        ORG_NAME_PREFIX,
+    )
+    return str(rows[0]["id"])
+
+
+class TestHotQueryPlans:
+    """Test each hot access path is served by its composite index."""
+
+    @pytest.mark.asyncio
+    async def test_matching_invoice_lookup(self, seeded_db: Prisma, org_id: str):
+        """Test MatchingService._get_organization_invoices uses the index."""
+        nodes = await _explain(
+            seeded_db,
+            'SELECT * FROM "Invoice" WHERE "organizationId" = $1::uuid '
+            "AND \"status\" = 'AUTHORISED' AND \"invoiceNumber\" <> ''",
+            org_id,
+        )
+
+        assert "Invoice" not in _seq_scanned(nodes)
+        assert "idx_invoices_org_status_number" in _index_names(nodes)
+
+    @pytest.mark.asyncio
+    async def test_invoice_listing(self, seeded_db: Prisma, org_id: str):
+        """Test invoice listings read in index order without sorting."""
+        nodes = await _explain(
+            seeded_db,
+            'SELECT * FROM "Invoice" WHERE "organizationId" = $1::uuid '
+            'ORDER BY "createdAt" DESC, "id" DESC LIMIT 51',
+            org_id,
+        )
+
+        assert "Invoice" not in _seq_scanned(nodes)
+        assert "idx_invoices_org_created_at" in _index_names(nodes)
+        assert not any(node["Node Type"] == "Sort" for node in nodes)
+
+    @pytest.mark.asyncio
+    async def test_last_sync_time(self, seeded_db: Prisma, org_id: str):
+        """Test SyncOrchestrator._get_last_sync_time uses the index."""
+        nodes = await _explain(
+            seeded_db,
+            'SELECT * FROM "Invoice" WHERE "organizationId" = $1::uuid '
+            'ORDER BY "lastSyncedAt" DESC LIMIT 1',
+            org_id,
+        )
+
+        assert "Invoice" not in _seq_scanned(nodes)
+        assert "idx_invoices_org_last_synced_at" in _index_names(nodes)
+
+    @pytest.mark.asyncio
+    async def test_remittance_listing(self, seeded_db: Prisma, org_id: str):
+        """Test remittance listings read in index order without sorting."""
+        nodes = await _explain(
+            seeded_db,
+            'SELECT * FROM "Remittance" WHERE "organizationId" = $1::uuid '
+            'ORDER BY "createdAt" DESC, "id" DESC LIMIT 51',
+            org_id,
+        )
+
+        assert "Remittance" not in _seq_scanned(nodes)
+        assert "idx_remittances_org_created_at" in _index_names(nodes)
+        assert not any(node["Node Type"] == "Sort" for node in nodes)
+
+    @pytest.mark.asyncio
+    async def test_remittance_listing_by_status(self, seeded_db: Prisma, org_id: str):
+        """Test status-filtered remittance listings use the index."""
+        nodes = await _explain(
+            seeded_db,
+            'SELECT * FROM "Remittance" WHERE "organizationId" = $1::uuid '
+            "AND \"status\" = 'Awaiting_Approval' "
+            'ORDER BY "createdAt" DESC LIMIT 51',
+            org_id,
+        )
+
+        assert "Remittance" not in _seq_scanned(nodes)
+        assert "idx_remittances_org_status_created_at" in _index_names(nodes)
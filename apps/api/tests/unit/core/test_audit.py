@@ -0,0 +1,267 @@
+"""
+Tests for the batched audit log writer in src/core/audit.py
+"""
+
+import asyncio
+import json
+import os
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from prisma.errors import ForeignKeyViolationError
+from prisma.fields import Json
+
+from src.core.audit import AuditLogWriter
+
+
+def _client(in_transaction: bool = False) -> Mock:
+    db = Mock()
+    db.is_transaction = Mock(return_value=in_transaction)
+    db.auditlog.create = AsyncMock()
+    db.auditlog.create_many = AsyncMock(return_value=1)
+    return db
+
+
+def _running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _row(reason: str = "Remittance approval started") -> dict:
+    return {
+        "remittanceId": "remittance-123",
+        "organizationId": "org-123",
+        "action": "approved",
+        "outcome": "pending",
+        "reason": reason,
+    }
+
+
+class TestAuditLogWriter:
+    """Test audit rows are enlisted in transactions or written in batches."""
+
+    @pytest.mark.asyncio
+    async def test_writes_immediately_before_start(self):
+        """Test rows are created directly when the writer is not running."""
+        db = _client()
+        writer = AuditLogWriter(batch_size=10, flush_interval=60)
+
+        await writer.write(db, _row())
+
+        db.auditlog.create.assert_awaited_once()
+        assert isinstance(
+            db.auditlog.create.call_args[1]["data"]["timestamp"], datetime
+        )
+
+    @pytest.mark.asyncio
+    async def test_enlists_in_transaction(self, tmp_path):
+        """Test a transaction client creates the row within its transaction."""
+        # Arrange
+        db = _client()
+        transaction = _client(in_transaction=True)
+        writer = AuditLogWriter(10, 60, str(tmp_path / "fallback.jsonl"))
+        await writer.start(db)
+
+        # Act
+        await writer.write(transaction, _row())
+        await writer.stop()
+
+        # Assert
+        transaction.auditlog.create.assert_awaited_once()
+        db.auditlog.create_many.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_flushes_full_batches(self, tmp_path):
+        """Test buffered rows are inserted together once a batch fills."""
+        # Arrange
+        db = _client()
+        writer = AuditLogWriter(3, 60, str(tmp_path / "fallback.jsonl"))
+        await writer.start(db)
+
+        # Act
+        for number in range(3):
+            await writer.write(db, _row(f"row {number}"))
+        await asyncio.sleep(0.01)
+
+        # Assert
+        db.auditlog.create.assert_not_awaited()
+        db.auditlog.create_many.assert_awaited_once()
+        batch = db.auditlog.create_many.call_args[1]["data"]
+        assert [row["reason"] for row in batch] == ["row 0", "row 1", "row 2"]
+        assert writer.pending == 0
+        await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_unwritten_rows_survive_shutdown(self, tmp_path):
+        """Test rows the database rejects at shutdown are inserted on restart."""
+        # Arrange
+        fallback = tmp_path / "fallback.jsonl"
+        db = _client()
+        db.auditlog.create_many.side_effect = ConnectionError("database down")
+        writer = AuditLogWriter(10, 60, str(fallback))
+        await writer.start(db)
+        row = {**_row(), "metadata": Json({"uploadBatchId": "batch-1"})}
+        await writer.write(db, row)
+
+        # Act
+        await writer.stop()
+        restarted = _client()
+        await writer.start(restarted)
+        await writer.stop()
+
+        # Assert
+        assert list(tmp_path.iterdir()) == []
+        restored = restarted.auditlog.create_many.call_args[1]["data"]
+        assert restored[0]["reason"] == "Remittance approval started"
+        assert restored[0]["metadata"].data == {"uploadBatchId": "batch-1"}
+        assert isinstance(restored[0]["timestamp"], datetime)
+
+    @pytest.mark.asyncio
+    async def test_rejected_row_is_dead_lettered(self, tmp_path):
+        """Test a row the database rejects does not block the rows around it."""
+        # Arrange
+        db = _client()
+        db.auditlog.create_many.side_effect = ForeignKeyViolationError({})
+        db.auditlog.create.side_effect = [None, ForeignKeyViolationError({}), None]
+        writer = AuditLogWriter(
+            10,
+            60,
+            str(tmp_path / "fallback.jsonl"),
+            dead_letter_path=str(tmp_path / "dead.jsonl"),
+        )
+        await writer.start(db)
+        for number in range(3):
+            await writer.write(db, _row(f"row {number}"))
+
+        # Act
+        await writer.flush()
+
+        # Assert
+        assert writer.pending == 0
+        assert db.auditlog.create.await_count == 3
+        dead = tmp_path / f"dead.{os.getpid()}.jsonl"
+        lines = dead.read_text().splitlines()
+        assert [json.loads(line)["reason"] for line in lines] == ["row 1"]
+        await writer.stop()
+        assert not (tmp_path / f"fallback.{os.getpid()}.jsonl").exists()
+
+    @pytest.mark.asyncio
+    async def test_database_outage_keeps_rows(self, tmp_path):
+        """Test rows are kept, not dead-lettered, while the database is down."""
+        # Arrange
+        db = _client()
+        db.auditlog.create_many.side_effect = ConnectionError("database down")
+        db.auditlog.create.side_effect = ConnectionError("database down")
+        writer = AuditLogWriter(
+            10,
+            60,
+            str(tmp_path / "fallback.jsonl"),
+            dead_letter_path=str(tmp_path / "dead.jsonl"),
+        )
+        await writer.start(db)
+        await writer.write(db, _row())
+
+        # Act
+        await writer.flush()
+
+        # Assert
+        assert writer.pending == 1
+        assert list(tmp_path.iterdir()) == []
+        await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_spills_to_process_file(self, tmp_path):
+        """Test rows beyond the buffer cap are kept in this process's file."""
+        # Arrange
+        db = _client()
+        db.auditlog.create_many.side_effect = ConnectionError("database down")
+        db.auditlog.create.side_effect = ConnectionError("database down")
+        writer = AuditLogWriter(
+            10, 60, str(tmp_path / "fallback.jsonl"), max_buffered=2
+        )
+        await writer.start(db)
+
+        # Act
+        for number in range(3):
+            await writer.write(db, _row(f"row {number}"))
+
+        # Assert
+        assert writer.pending == 2
+        spilled = tmp_path / f"fallback.{os.getpid()}.jsonl"
+        assert json.loads(spilled.read_text())["reason"] == "row 2"
+
+        # Shutdown adds the buffered rows to the same file
+        await writer.stop()
+        reasons = [
+            json.loads(line)["reason"] for line in spilled.read_text().splitlines()
+        ]
+        assert reasons == ["row 2", "row 0", "row 1"]
+
+    @pytest.mark.asyncio
+    async def test_restores_files_of_every_process(self, tmp_path):
+        """Test rows saved by other worker processes are restored once."""
+        # Arrange
+        record = {**_row(), "timestamp": "2025-01-01T00:00:00+00:00"}
+        for name in ["fallback.jsonl", "fallback.101.jsonl", "fallback.102.jsonl"]:
+            (tmp_path / name).write_text(json.dumps(record) + "\n")
+        db = _client()
+        writer = AuditLogWriter(10, 60, str(tmp_path / "fallback.jsonl"))
+
+        # Act
+        await writer.start(db)
+        await writer.stop()
+
+        # Assert
+        assert list(tmp_path.iterdir()) == []
+        assert len(db.auditlog.create_many.call_args[1]["data"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_restores_files_claimed_by_exited_process(self, tmp_path):
+        """Test a file left mid-restore by a dead worker is restored again."""
+        # Arrange
+        record = {**_row(), "timestamp": "2025-01-01T00:00:00+00:00"}
+        dead_pid = next(pid for pid in range(99999, 1, -1) if not _running(pid))
+        abandoned = tmp_path / f"fallback.101.jsonl.{dead_pid}.restoring"
+        in_progress = tmp_path / f"fallback.102.jsonl.{os.getppid()}.restoring"
+        for path in [abandoned, in_progress]:
+            path.write_text(json.dumps(record) + "\n")
+        db = _client()
+        writer = AuditLogWriter(10, 60, str(tmp_path / "fallback.jsonl"))
+
+        # Act
+        await writer.start(db)
+        await writer.stop()
+
+        # Assert
+        assert list(tmp_path.iterdir()) == [in_progress]
+        assert len(db.auditlog.create_many.call_args[1]["data"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_restored_file_kept_until_inserted(self, tmp_path):
+        """Test a restored file survives until its rows reach the database."""
+        # Arrange
+        record = {**_row(), "timestamp": "2025-01-01T00:00:00+00:00"}
+        (tmp_path / "fallback.101.jsonl").write_text(json.dumps(record) + "\n")
+        db = _client()
+        db.auditlog.create_many.side_effect = ConnectionError("database down")
+        db.auditlog.create.side_effect = ConnectionError("database down")
+        writer = AuditLogWriter(10, 60, str(tmp_path / "fallback.jsonl"))
+
+        # Act
+        await writer.start(db)
+        claimed = list(tmp_path.iterdir())
+        db.auditlog.create_many.side_effect = None
+        await writer.flush()
+
+        # Assert
+        assert [path.name for path in claimed] == [
+            f"fallback.101.jsonl.{os.getpid()}.restoring"
+        ]
+        assert list(tmp_path.iterdir()) == []
+        await writer.stop()
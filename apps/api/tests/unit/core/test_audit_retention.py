@@ -0,0 +1,185 @@
+"""
+Tests for AuditLog partition management in src/core/audit_retention.py
+"""
+
+import gzip
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import List
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.core.audit_retention import (
+    add_months,
+    apply_retention,
+    ensure_partitions,
+    month_start,
+    partition_for,
+)
+from src.core.storage.local import LocalStorage
+
+NOW = datetime(2025, 11, 14, 9, 30, tzinfo=timezone.utc)
+
+
+def _utc(year: int, month: int) -> datetime:
+    return datetime(year, month, 1, tzinfo=timezone.utc)
+
+
+def _client(
+    partitions: List[str], rows: List[dict] = (), default_rows: List[dict] = ()
+) -> Mock:
+    """
+    A client with the given partitions attached, each holding ``rows``, and
+    ``default_rows`` past retention in the default partition.
+    """
+    db = Mock()
+    db.executed = []
+
+    async def query_raw(query: str, *args):
+        if "pg_inherits" in query:
+            return [{"name": name} for name in partitions]
+        if "to_regclass" in query:
+            return [{"name": None}]
+        if "count(*)" in query:
+            return [{"count": len(default_rows)}]
+        if "row_to_json" in query:
+            page = default_rows if '"AuditLog_default"' in query else rows
+            return [{"row": json.dumps(row)} for row in page]
+        return []
+
+    transaction = Mock()
+    transaction.query_raw = AsyncMock(side_effect=query_raw)
+    transaction.execute_raw = AsyncMock(
+        side_effect=lambda query, *args: db.executed.append(query)
+    )
+
+    @asynccontextmanager
+    async def tx():
+        yield transaction
+
+    db.query_raw = AsyncMock(side_effect=query_raw)
+    db.execute_raw = AsyncMock(
+        side_effect=lambda query, *args: db.executed.append(query)
+    )
+    db.tx = tx
+    return db
+
+
+class TestMonths:
+    """Test month arithmetic for partition ranges."""
+
+    def test_month_start_truncates_to_utc_month(self):
+        """Test a timestamp maps to the first instant of its UTC month."""
+        assert month_start(NOW) == _utc(2025, 11)
+
+    def test_add_months_wraps_years(self):
+        """Test adding and subtracting months across year boundaries."""
+        assert add_months(_utc(2025, 11), 3) == _utc(2026, 2)
+        assert add_months(_utc(2025, 1), -1) == _utc(2024, 12)
+        assert add_months(_utc(2025, 6), -24) == _utc(2023, 6)
+
+    def test_partition_for_names_month(self):
+        """Test partitions are named by year and zero-padded month."""
+        partition = partition_for(_utc(2025, 3))
+
+        assert partition.name == "AuditLog_2025_03"
+        assert partition.end == _utc(2025, 4)
+        assert partition.archive_path == "audit-archive/AuditLog_2025_03.jsonl.gz"
+
+
+class TestEnsurePartitions:
+    """Test upcoming partitions are created ahead of inserts."""
+
+    @pytest.mark.asyncio
+    async def test_creates_only_missing_partitions(self):
+        """Test existing partitions are left alone and gaps are filled."""
+        # Arrange
+        db = _client(["AuditLog_2025_11", "AuditLog_2025_12", "AuditLog_default"])
+
+        # Act
+        created = await ensure_partitions(db, months_ahead=3, now=NOW)
+
+        # Assert
+        assert [partition.name for partition in created] == [
+            "AuditLog_2026_01",
+            "AuditLog_2026_02",
+        ]
+        attached = [query for query in db.executed if "ATTACH PARTITION" in query]
+        assert len(attached) == 2
+        assert "FROM ('2026-01-01T00:00:00+00:00')" in attached[0]
+        assert "TO ('2026-02-01T00:00:00+00:00')" in attached[0]
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_create(self):
+        """Test no statements are run when every partition exists."""
+        db = _client(["AuditLog_2025_11", "AuditLog_2025_12"])
+
+        created = await ensure_partitions(db, months_ahead=1, now=NOW)
+
+        assert created == []
+        assert db.executed == []
+
+
+class TestApplyRetention:
+    """Test old partitions are archived to storage and dropped."""
+
+    @pytest.mark.asyncio
+    async def test_archives_partitions_past_retention(self, tmp_path):
+        """Test only partitions before the cutoff are exported and dropped."""
+        # Arrange
+        rows = [
+            {"id": "a", "timestamp": "2023-09-03T10:00:00+00:00", "action": "approved"},
+            {"id": "b", "timestamp": "2023-09-04T11:00:00+00:00", "action": "exported"},
+        ]
+        db = _client(
+            ["AuditLog_2023_11", "AuditLog_2023_09", "AuditLog_2023_10", "other"],
+            rows,
+        )
+        storage = LocalStorage(str(tmp_path), "http://localhost")
+
+        # Act
+        archived = await apply_retention(db, storage, retention_months=24, now=NOW)
+
+        # Assert
+        assert [partition.name for partition in archived] == [
+            "AuditLog_2023_09",
+            "AuditLog_2023_10",
+        ]
+        archive = tmp_path / "audit-archive" / "AuditLog_2023_09.jsonl.gz"
+        lines = gzip.decompress(archive.read_bytes()).decode().splitlines()
+        assert [json.loads(line) for line in lines] == rows
+        assert db.executed == [
+            'ALTER TABLE "AuditLog" DETACH PARTITION "AuditLog_2023_09"',
+            'DROP TABLE "AuditLog_2023_09"',
+            'ALTER TABLE "AuditLog" DETACH PARTITION "AuditLog_2023_10"',
+            'DROP TABLE "AuditLog_2023_10"',
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sweeps_default_partition_past_retention(self, tmp_path):
+        """Test old rows in the default partition are archived and deleted."""
+        # Arrange
+        default_rows = [
+            {"id": "c", "timestamp": "2019-01-05T08:00:00+00:00", "action": "created"},
+        ]
+        db = _client(["AuditLog_2025_11", "AuditLog_default"], [], default_rows)
+        storage = LocalStorage(str(tmp_path), "http://localhost")
+
+        # Act
+        archived = await apply_retention(db, storage, retention_months=24, now=NOW)
+
+        # Assert
+        assert archived == []
+        archive = (
+            tmp_path
+            / "audit-archive"
+            / "AuditLog_default_before_2023_11_20251114T093000Z.jsonl.gz"
+        )
+        lines = gzip.decompress(archive.read_bytes()).decode().splitlines()
+        assert [json.loads(line) for line in lines] == default_rows
+        assert db.executed == [
+            'DELETE FROM "AuditLog_default" WHERE "timestamp" < $1::timestamptz'
+        ]
+        assert db.execute_raw.await_args.args[1] == "2023-11-01T00:00:00+00:00"
@@ -0,0 +1,115 @@
+"""
+Tests for database clients and read routing in src/core/database.py
+"""
+
+from typing import Callable, List
+
+import pytest
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute
+
+from src.core.database import get_db, get_read_db, pooled_url
+from src.main import app
+
+
+def _dependency_calls(dependant: Dependant) -> List[Callable]:
+    """Every dependency a route resolves, including nested ones."""
+    calls = []
+    for dependency in dependant.dependencies:
+        calls.append(dependency.call)
+        calls.extend(_dependency_calls(dependency))
+    return calls
+
+
+def _route(method: str, path: str) -> APIRoute:
+    for route in app.routes:
+        if (
+            isinstance(route, APIRoute)
+            and route.path == path
+            and method in route.methods
+        ):
+            return route
+    raise AssertionError(f"No route {method} {path}")
+
+
+class TestPooledUrl:
+    """Test pool settings are added to database URLs."""
+
+    def test_adds_pool_parameters(self):
+        """Test connection limit and pool timeout become query parameters."""
+        url = pooled_url("postgresql://user:pw@db:5432/app", 20, 5)
+
+        assert url == (
+            "postgresql://user:pw@db:5432/app?connection_limit=20&pool_timeout=5"
+        )
+
+    def test_keeps_existing_parameters(self):
+        """Test parameters already on the URL are kept or overridden."""
+        url = pooled_url(
+            "postgresql://db/app?schema=public&connection_limit=3", 10, None
+        )
+
+        assert url == "postgresql://db/app?schema=public&connection_limit=10"
+
+    def test_unset_values_leave_url_unchanged(self):
+        """Test the URL is untouched without pool settings."""
+        assert pooled_url("postgresql://db/app", None, None) == "postgresql://db/app"
+
+
+class TestReadRouting:
+    """Test read-only endpoints use the read replica client."""
+
+    @pytest.mark.parametrize(
+        "method,path",
+        [
+            ("GET", "/api/v1/remittances/{org_id}"),
+            ("GET", "/api/v1/bankaccounts/{org_id}"),
+        ],
+    )
+    def test_read_only_endpoints_use_replica(self, method: str, path: str):
+        """Test listings and bank account reads use the replica."""
+        route = _route(method, path)
+
+        calls = [dependency.call for dependency in route.dependant.dependencies]
+
+        assert get_read_db in calls
+        assert get_db not in calls
+
+    @pytest.mark.parametrize(
+        "method,path",
+        [
+            ("POST", "/api/v1/remittances/{org_id}"),
+            ("GET", "/api/v1/remittances/{org_id}/{remittance_id}"),
+            ("PATCH", "/api/v1/remittances/{org_id}/{remittance_id}"),
+            ("POST", "/api/v1/bankaccounts/{org_id}"),
+            ("GET", "/api/v1/session"),
+        ],
+    )
+    def test_writes_and_detail_reads_use_primary(self, method: str, path: str):
+        """Test writes, and reads that must see them, stay on the primary."""
+        route = _route(method, path)
+
+        assert get_read_db not in _dependency_calls(route.dependant)
+
+    def test_auth_checks_use_primary(self):
+        """Test membership and profile lookups for replica routes hit the primary."""
+        route = _route("GET", "/api/v1/remittances/{org_id}")
+
+        assert get_db in _dependency_calls(route.dependant)
+
+    def test_invoice_listing_checks_access_on_primary(self):
+        """Test invoice listings read the replica but check access on the primary."""
+        route = _route("GET", "/api/v1/invoices/{org_id}")
+
+        dependencies = {
+            dependency.name: dependency.call
+            for dependency in route.dependant.dependencies
+        }
+
+        assert dependencies["db"] is get_read_db
+        assert dependencies["primary_db"] is get_db
+
+    @pytest.mark.asyncio
+    async def test_read_client_defaults_to_primary(self):
+        """Test reads use the primary client when no replica is configured."""
+        assert await get_read_db() is await get_db()
@@ -0,0 +1,101 @@
+"""
+Tests for the background job queue in src/core/jobs.py
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.jobs import JobPriority, JobQueue
+from src.core.logs import get_log_context, log_context
+
+
+class TestJobQueue:
+    """Test jobs run by priority on a worker pool."""
+
+    @pytest.mark.asyncio
+    async def test_runs_higher_priority_jobs_first(self):
+        """Test queued jobs run by priority, then in submission order."""
+        # Arrange
+        queue = JobQueue(workers=1)
+        ran = []
+
+        async def job(name: str) -> None:
+            ran.append(name)
+
+        queue.enqueue(job, "low-1", priority=JobPriority.LOW)
+        queue.enqueue(job, "normal", priority=JobPriority.NORMAL)
+        queue.enqueue(job, "low-2", priority=JobPriority.LOW)
+        queue.enqueue(job, name="high", priority=JobPriority.HIGH)
+
+        # Act
+        await queue.start()
+        await asyncio.wait_for(queue.join(), timeout=1)
+        await queue.stop()
+
+        # Assert
+        assert ran == ["high", "normal", "low-1", "low-2"]
+
+    @pytest.mark.asyncio
+    async def test_failing_job_does_not_stop_worker(self):
+        """Test a job that raises is logged and later jobs still run."""
+        # Arrange
+        queue = JobQueue(workers=1)
+        ran = []
+
+        async def failing() -> None:
+            raise RuntimeError("boom")
+
+        async def job() -> None:
+            ran.append("ok")
+
+        queue.enqueue(failing)
+        queue.enqueue(job)
+
+        # Act
+        await queue.start()
+        await asyncio.wait_for(queue.join(), timeout=1)
+        await queue.stop()
+
+        # Assert
+        assert ran == ["ok"]
+
+    @pytest.mark.asyncio
+    async def test_job_keeps_log_context_of_caller(self):
+        """Test jobs see the correlation fields bound when they were queued."""
+        # Arrange
+        queue = JobQueue(workers=1)
+        seen = []
+
+        async def job() -> None:
+            seen.append(get_log_context())
+
+        with log_context(request_id="req-123"):
+            queue.enqueue(job)
+
+        # Act
+        await queue.start()
+        await asyncio.wait_for(queue.join(), timeout=1)
+        await queue.stop()
+
+        # Assert
+        assert seen == [{"request_id": "req-123"}]
+
+    @pytest.mark.asyncio
+    async def test_stop_drops_queued_jobs(self):
+        """Test stopping leaves unstarted jobs unrun."""
+        # Arrange
+        queue = JobQueue(workers=1)
+        ran = []
+
+        async def job() -> None:
+            ran.append("ran")
+
+        queue.enqueue(job)
+
+        # Act
+        await queue.stop()
+
+        # Assert
+        assert ran == []
+        assert queue.pending == 1
@@ -0,0 +1,125 @@
+"""
+Tests for structured logging in src/core/logs.py
+"""
+
+import json
+import logging
+import queue
+
+import pytest
+
+from src.core.logs import (
+    SAMPLED,
+    ContextQueueHandler,
+    JsonFormatter,
+    TextFormatter,
+    log_context,
+)
+
+
+@pytest.fixture
+def captured():
+    """Logger routed through a ContextQueueHandler into an inspectable queue."""
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    handler = ContextQueueHandler(log_queue, sample_rate=0.0)
+    logger = logging.getLogger("tests.logs")
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+
+    def records():
+        items = []
+        while not log_queue.empty():
+            items.append(log_queue.get_nowait())
+        return items
+
+    yield logger, handler, records
+
+    logger.removeHandler(handler)
+    logger.propagate = True
+
+
+class TestContextQueueHandler:
+    """Test records are queued with their correlation context."""
+
+    def test_captures_bound_context(self, captured):
+        """Test fields bound with log_context are attached to the record."""
+        # Arrange
+        logger, _, records = captured
+
+        # Act
+        with log_context(remittance_id="rem-123", org_id="org-456"):
+            with log_context(request_id="req-789"):
+                logger.info("inside %s", "block")
+        logger.info("outside")
+
+        # Assert
+        inside, outside = records()
+        assert inside.getMessage() == "inside block"
+        assert inside.context == {
+            "remittance_id": "rem-123",
+            "org_id": "org-456",
+            "request_id": "req-789",
+        }
+        assert outside.context == {}
+
+    def test_drops_sampled_events_below_rate(self, captured):
+        """Test sampled events are kept only at the configured rate."""
+        # Arrange
+        logger, handler, records = captured
+
+        # Act
+        logger.debug("dropped", extra=SAMPLED)
+        handler.sample_rate = 1.0
+        logger.debug("kept", extra=SAMPLED)
+        handler.sample_rate = 0.0
+        logger.debug("unsampled events are always kept")
+
+        # Assert
+        assert [r.getMessage() for r in records()] == [
+            "kept",
+            "unsampled events are always kept",
+        ]
+
+    def test_renders_exception_before_queueing(self, captured):
+        """Test tracebacks are rendered so the record is safe to hand off."""
+        logger, _, records = captured
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+
+        (record,) = records()
+        assert record.exc_info is None
+        assert "ValueError: boom" in record.exc_text
+
+
+class TestFormatters:
+    """Test queued records are written in structured form."""
+
+    def test_json_formatter_includes_context(self, captured):
+        """Test JSON lines carry level, message and correlation fields."""
+        # Arrange
+        logger, _, records = captured
+        with log_context(remittance_id="rem-123"):
+            logger.warning("slow match")
+
+        # Act
+        entry = json.loads(JsonFormatter().format(records()[0]))
+
+        # Assert
+        assert entry["level"] == "WARNING"
+        assert entry["logger"] == "tests.logs"
+        assert entry["message"] == "slow match"
+        assert entry["remittance_id"] == "rem-123"
+
+    def test_text_formatter_appends_context(self, captured):
+        """Test text lines end with key=value correlation fields."""
+        logger, _, records = captured
+        with log_context(org_id="org-456"):
+            logger.info("synced")
+
+        line = TextFormatter().format(records()[0])
+
+        assert line.endswith("synced org_id=org-456")
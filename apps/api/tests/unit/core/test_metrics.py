@@ -0,0 +1,224 @@
+"""
+Tests for the metrics registry in src/core/metrics
+"""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.core.metrics import CACHE_REQUESTS, record_cache_lookup, registry
+from src.core.metrics.event_loop import EventLoopMonitor
+from src.core.metrics.registry import MetricsRegistry
+from src.core.metrics.routes import router
+from src.core.settings import settings
+
+
+class TestCounter:
+    """Test counters accumulate per label set."""
+
+    def test_counts_per_label_set(self):
+        """Test increments are tracked separately for each label set."""
+        # Arrange
+        metrics = MetricsRegistry()
+        counter = metrics.counter("matches_total", "Matches", ["match_type"])
+
+        # Act
+        counter.inc(match_type="exact")
+        counter.inc(2, match_type="exact")
+        counter.inc(match_type="numeric")
+
+        # Assert
+        assert counter.value(match_type="exact") == 3
+        assert counter.value(match_type="numeric") == 1
+        assert counter.value(match_type="relaxed") == 0
+
+    def test_rejects_wrong_labels(self):
+        """Test label names must match those the counter was declared with."""
+        counter = MetricsRegistry().counter("hits_total", "Hits", ["cache"])
+
+        with pytest.raises(ValueError):
+            counter.inc(result="hit")
+
+    def test_rejects_negative_increment(self):
+        """Test counters cannot go down."""
+        counter = MetricsRegistry().counter("hits_total", "Hits")
+
+        with pytest.raises(ValueError):
+            counter.inc(-1)
+
+
+class TestHistogram:
+    """Test histograms bucket observations."""
+
+    def test_renders_cumulative_buckets(self):
+        """Test the exposition has cumulative buckets, sum and count."""
+        # Arrange
+        metrics = MetricsRegistry()
+        histogram = metrics.histogram(
+            "xero_seconds", "Xero calls", ["status"], buckets=[0.1, 1.0]
+        )
+
+        # Act
+        histogram.observe(0.05, status="200")
+        histogram.observe(0.5, status="200")
+        histogram.observe(3.0, status="200")
+        output = metrics.render()
+
+        # Assert
+        assert "# TYPE xero_seconds histogram" in output
+        assert 'xero_seconds_bucket{le="0.1",status="200"} 1.0' in output
+        assert 'xero_seconds_bucket{le="1.0",status="200"} 2.0' in output
+        assert 'xero_seconds_bucket{le="+Inf",status="200"} 3.0' in output
+        assert 'xero_seconds_sum{status="200"} 3.55' in output
+        assert 'xero_seconds_count{status="200"} 3.0' in output
+        assert histogram.count(status="200") == 3
+        assert histogram.sum(status="200") == pytest.approx(3.55)
+
+    def test_time_observes_block_that_raises(self):
+        """Test the timer records a duration even when the block fails."""
+        histogram = MetricsRegistry().histogram("parse_seconds", "PDF parse")
+
+        with pytest.raises(RuntimeError):
+            with histogram.time():
+                raise RuntimeError("bad pdf")
+
+        assert histogram.count() == 1
+
+    def test_escapes_label_values(self):
+        """Test quotes and backslashes in label values are escaped."""
+        metrics = MetricsRegistry()
+        counter = metrics.counter("errors_total", "Errors", ["reason"])
+
+        counter.inc(reason='say "hi"\\')
+
+        assert 'errors_total{reason="say \\"hi\\"\\\\"} 1.0' in metrics.render()
+
+
+class TestMetricsRegistry:
+    """Test metrics are registered once and served for scraping."""
+
+    def test_rejects_duplicate_names(self):
+        """Test a metric name can only be registered once."""
+        metrics = MetricsRegistry()
+        metrics.counter("requests_total", "Requests")
+
+        with pytest.raises(ValueError):
+            metrics.histogram("requests_total", "Requests")
+
+    def test_metrics_endpoint_serves_text_format(self):
+        """Test /metrics returns the registry in the Prometheus text format."""
+        # Arrange
+        registry.clear()
+        record_cache_lookup("signed_url", hit=True)
+        record_cache_lookup("signed_url", hit=False)
+        app = FastAPI()
+        app.include_router(router)
+
+        # Act
+        response = TestClient(app).get("/metrics")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert (
+            'cache_requests_total{cache="signed_url",result="hit"} 1.0' in response.text
+        )
+        assert CACHE_REQUESTS.value(cache="signed_url", result="miss") == 1
+
+    def test_metrics_endpoint_requires_configured_token(self, monkeypatch):
+        """Test /metrics rejects scrapes without the configured bearer token."""
+        # Arrange
+        monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+
+        # Act
+        missing = client.get("/metrics")
+        wrong = client.get("/metrics", headers={"Authorization": "Bearer nope"})
+        valid = client.get(
+            "/metrics", headers={"Authorization": "Bearer scrape-secret"}
+        )
+
+        # Assert
+        assert missing.status_code == 401
+        assert wrong.status_code == 401
+        assert valid.status_code == 200
+
+    def test_clear_resets_values(self):
+        """Test clearing drops recorded values but keeps the metric usable."""
+        metrics = MetricsRegistry()
+        counter = metrics.counter("hits_total", "Hits", ["cache"])
+        counter.inc(cache="jwks")
+
+        metrics.clear()
+        counter.inc(cache="jwks")
+
+        assert counter.value(cache="jwks") == 1
+
+
+class TestEventLoopMonitor:
+    """Test the monitor samples event loop lag."""
+
+    @pytest.mark.asyncio
+    async def test_records_lag_from_blocking_call(self):
+        """Test a blocking call shows up as lag at the next sample."""
+        # Arrange
+        histogram = MetricsRegistry().histogram(
+            "lag_seconds", "Lag", buckets=[0.01, 0.05, 1.0]
+        )
+        monitor = EventLoopMonitor(histogram, interval=0.01)
+        await monitor.start()
+        await asyncio.sleep(0.02)
+
+        # Act
+        time.sleep(0.1)
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+        # Assert
+        assert histogram.count() >= 1
+        assert histogram.sum() >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_disabled_with_zero_interval(self):
+        """Test a zero interval starts no sampling task."""
+        histogram = MetricsRegistry().histogram("lag_seconds", "Lag")
+        monitor = EventLoopMonitor(histogram, interval=0)
+
+        await monitor.start()
+        await asyncio.sleep(0.01)
+        await monitor.stop()
+
+        assert histogram.count() == 0
+
+    @pytest.mark.asyncio
+    async def test_captures_blocking_call_location(self, caplog):
+        """Test a call blocking past the threshold is counted where it blocked."""
+        # Arrange
+        metrics = MetricsRegistry()
+        blocked = metrics.counter("blocked_total", "Blocked", ["location"])
+        monitor = EventLoopMonitor(
+            metrics.histogram("lag_seconds", "Lag"),
+            interval=0,
+            blocked=blocked,
+            blocking_threshold=0.05,
+        )
+        await monitor.start()
+
+        def parse_pdf_synchronously() -> None:
+            time.sleep(0.3)
+
+        # Act
+        parse_pdf_synchronously()
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+
+        # Assert
+        location = "test_metrics.py:parse_pdf_synchronously"
+        assert blocked.value(location=location) == 1
+        assert "Event loop blocked for" in caplog.text
+        assert "time.sleep(0.3)" in caplog.text
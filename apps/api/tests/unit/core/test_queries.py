@@ -0,0 +1,90 @@
+"""
+Tests for database query tracking in src/core/queries.py
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.metrics import DB_QUERIES, registry
+from src.core.queries import instrument_queries, record_queries, track_queries
+
+
+def _client() -> SimpleNamespace:
+    """A stand-in client whose engine answers every query."""
+    return SimpleNamespace(_engine=SimpleNamespace(query=AsyncMock(return_value={})))
+
+
+class TestTrackQueries:
+    """Test queries are counted for the blocks tracking them."""
+
+    @pytest.mark.asyncio
+    async def test_counts_queries_in_block(self):
+        """Test only queries sent inside the block are counted."""
+        # Arrange
+        db = _client()
+        instrument_queries(db)
+
+        # Act
+        await db._engine.query("before", tx_id=None)
+        with track_queries() as stats:
+            await db._engine.query("first", tx_id=None)
+            await db._engine.query("second", tx_id="tx-1")
+
+        # Assert
+        assert stats.count == 2
+        assert stats.seconds >= 0
+
+    @pytest.mark.asyncio
+    async def test_nested_blocks_and_child_tasks(self):
+        """Test queries count towards every enclosing block, across tasks."""
+        # Arrange
+        db = _client()
+        instrument_queries(db)
+
+        # Act
+        with track_queries() as outer:
+            await db._engine.query("outer", tx_id=None)
+            with track_queries() as inner:
+                await asyncio.create_task(db._engine.query("inner", tx_id=None))
+
+        # Assert
+        assert outer.count == 2
+        assert inner.count == 1
+
+    @pytest.mark.asyncio
+    async def test_instrumenting_twice_counts_once(self):
+        """Test instrumenting a client again does not double count."""
+        db = _client()
+        instrument_queries(db)
+        instrument_queries(db)
+
+        with track_queries() as stats:
+            await db._engine.query("only", tx_id=None)
+
+        assert stats.count == 1
+
+
+class TestRecordQueries:
+    """Test tracked queries are recorded as metrics."""
+
+    @pytest.mark.asyncio
+    async def test_records_and_warns_over_budget(self, caplog):
+        """Test counts are observed per unit of work and large ones logged."""
+        # Arrange
+        registry.clear()
+        db = _client()
+        instrument_queries(db)
+        with track_queries() as stats:
+            for _ in range(101):
+                await db._engine.query("line", tx_id=None)
+
+        # Act
+        record_queries("job", "process_remittance_background", stats)
+
+        # Assert
+        assert DB_QUERIES.count(kind="job", name="process_remittance_background") == 1
+        assert DB_QUERIES.sum(kind="job", name="process_remittance_background") == 101
+        assert "over the budget of 100" in caplog.text
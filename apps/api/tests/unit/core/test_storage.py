@@ -0,0 +1,296 @@
+"""
+Tests for the Supabase storage backend and signed URL cache in src/core/storage/
+"""
+
+from typing import AsyncIterator
+from unittest.mock import patch
+
+import pytest
+
+from src.core.settings import Settings
+from src.core.storage import (
+    LocalStorage,
+    S3Storage,
+    SignedUrlCache,
+    StorageError,
+    StorageObjectNotFound,
+    SupabaseStorage,
+    content_address,
+    create_storage_backend,
+)
+from tests.helpers.storage import InMemoryStorage
+
+
+class TestCreateStorageBackend:
+    """Test the backend is chosen by STORAGE_BACKEND."""
+
+    @pytest.mark.parametrize(
+        "backend, expected",
+        [("supabase", SupabaseStorage), ("local", LocalStorage), ("s3", S3Storage)],
+    )
+    def test_backend_selection(self, backend, expected):
+        """Test each setting value creates its backend."""
+        config = Settings(
+            STORAGE_BACKEND=backend,
+            STORAGE_S3_ENDPOINT_URL="http://minio.test:9000",
+            JWT_SECRET="secret",
+        )
+
+        assert isinstance(create_storage_backend(config), expected)
+
+    def test_local_signing_key_falls_back_to_jwt_secret(self):
+        """Test local URLs are signed with JWT_SECRET by default."""
+        config = Settings(STORAGE_BACKEND="local", JWT_SECRET="secret")
+
+        storage = create_storage_backend(config)
+
+        assert isinstance(storage, LocalStorage)
+        assert storage.signing_key == "secret"
+
+
+class TestSupabaseStorage:
+    """Test the Supabase backend against the in-memory storage stand-in."""
+
+    @pytest.mark.asyncio
+    async def test_upload_and_download_round_trip(self):
+        """Test uploaded bytes are downloaded unchanged."""
+        storage = InMemoryStorage()
+        service = storage.service()
+
+        path = await service.upload("org-1/2024/01/file", b"%PDF-1.4 content")
+
+        assert path == "org-1/2024/01/file"
+        assert await service.download(path) == b"%PDF-1.4 content"
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_streaming_upload_and_download(self):
+        """Test uploads accept async chunks and downloads stream in chunks."""
+        storage = InMemoryStorage()
+        service = storage.service()
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield b"%PDF-"
+            yield b"1.4 streamed"
+
+        await service.upload("org-1/file", chunks())
+        received = [chunk async for chunk in service.stream("org-1/file", 4)]
+
+        assert b"".join(received) == b"%PDF-1.4 streamed"
+        assert all(len(chunk) <= 4 for chunk in received)
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_existing_object_is_not_overwritten(self):
+        """Test uploads fail on conflicts unless upsert is set."""
+        storage = InMemoryStorage()
+        service = storage.service()
+        await service.upload("org-1/file", b"first")
+
+        with pytest.raises(StorageError):
+            await service.upload("org-1/file", b"second")
+
+        await service.upload("org-1/file", b"second", upsert=True)
+        assert storage.objects["org-1/file"] == b"second"
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_remove_and_missing_download(self):
+        """Test removed objects can no longer be downloaded."""
+        storage = InMemoryStorage()
+        service = storage.service()
+        await service.upload("org-1/file", b"content")
+
+        await service.remove(["org-1/file"])
+
+        with pytest.raises(StorageObjectNotFound):
+            await service.download("org-1/file")
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_range_read_and_size(self):
+        """Test byte ranges are requested from the API and sizes read via HEAD."""
+        storage = InMemoryStorage()
+        service = storage.service()
+        await service.upload("org-1/file", b"0123456789")
+
+        assert await service.read_range("org-1/file", 2, 4) == b"2345"
+        assert await service.read_range("org-1/file", 8, 10) == b"89"
+        assert await service.get_size("org-1/file") == 10
+        assert not await service.exists("org-1/missing")
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_upload_deduplicated(self):
+        """Test identical content is stored once under its digest."""
+        storage = InMemoryStorage()
+        service = storage.service()
+
+        first = await service.upload_deduplicated("org-1", b"%PDF-1.4 same")
+        second = await service.upload_deduplicated("org-1", b"%PDF-1.4 same")
+        other_org = await service.upload_deduplicated("org-2", b"%PDF-1.4 same")
+
+        assert first.created and not second.created and other_org.created
+        assert first.path == second.path == content_address("org-1", first.sha256)
+        assert other_org.path != first.path
+        assert len(storage.objects) == 2
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_upload_deduplicated_new_file(self):
+        """Test a first upload stores the file when HEAD reports it missing."""
+        # Arrange
+        storage = InMemoryStorage()
+        service = storage.service()
+
+        # Act
+        stored = await service.upload_deduplicated("org-1", b"%PDF-1.4 new")
+
+        # Assert
+        assert stored.created
+        assert storage.objects == {stored.path: b"%PDF-1.4 new"}
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_upload_deduplicated_stream(self):
+        """Test streamed content is hashed while staged, then deduplicated."""
+        storage = InMemoryStorage()
+        service = storage.service()
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield b"%PDF-1.4 "
+            yield b"same"
+
+        first = await service.upload_deduplicated("org-1", chunks())
+        second = await service.upload_deduplicated("org-1", chunks())
+        from_bytes = await service.upload_deduplicated("org-1", b"%PDF-1.4 same")
+
+        assert first.created and not second.created and not from_bytes.created
+        assert first.path == second.path == from_bytes.path
+        assert first.size == 13
+        assert list(storage.objects) == [first.path]
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_removes_staging_object(self):
+        """Test a stream that fails mid-upload leaves nothing behind."""
+        storage = InMemoryStorage()
+        service = storage.service()
+
+        async def failing() -> AsyncIterator[bytes]:
+            yield b"%PDF-1.4 "
+            raise ValueError("too large")
+
+        with pytest.raises(ValueError):
+            await service.upload_deduplicated("org-1", failing())
+
+        assert storage.objects == {}
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_create_signed_url(self):
+        """Test signed URLs are returned as absolute URLs."""
+        storage = InMemoryStorage()
+        service = storage.service()
+        await service.upload("org-1/file", b"content")
+
+        url = await service.create_signed_url("org-1/file", expires_in=60)
+
+        assert url == (
+            "http://storage.test/storage/v1"
+            "/object/sign/remittances/org-1/file?token=t60"
+        )
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_create_signed_urls_skips_missing_objects(self):
+        """Test batch signing returns URLs for existing objects only."""
+        storage = InMemoryStorage()
+        service = storage.service()
+        await service.upload("org-1/a", b"a")
+        await service.upload("org-1/b", b"b")
+
+        urls = await service.create_signed_urls(
+            ["org-1/a", "org-1/b", "org-1/missing"], expires_in=60
+        )
+
+        assert set(urls) == {"org-1/a", "org-1/b"}
+        assert storage.sign_requests == 1
+        await service.aclose()
+
+
+class TestSignedUrlCache:
+    """Test signed URLs are reused until shortly before they expire."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_url_until_refresh_margin(self):
+        """Test a cached URL is returned until the refresh margin is reached."""
+        storage = InMemoryStorage()
+        service = storage.service()
+        await service.upload("org-1/file", b"content")
+        cache = SignedUrlCache(service, expires_in=3600, refresh_margin=300)
+
+        with patch("src.core.storage.signed_urls.time.monotonic") as mock_monotonic:
+            mock_monotonic.return_value = 1000.0
+            first = await cache.get("org-1/file")
+
+            mock_monotonic.return_value = 2000.0
+            second = await cache.get("org-1/file")
+
+            mock_monotonic.return_value = 4400.0
+            third = await cache.get("org-1/file")
+
+        assert first[1] == 3600
+        assert second == (first[0], 2600)
+        assert third[1] == 3600
+        assert storage.sign_requests == 2
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_get_many_signs_only_missing_paths(self):
+        """Test batch lookups sign uncached paths in a single request."""
+        storage = InMemoryStorage()
+        service = storage.service()
+        for name in ("a", "b", "c"):
+            await service.upload(f"org-1/{name}", name.encode())
+        cache = SignedUrlCache(service, expires_in=3600, refresh_margin=300)
+        await cache.get("org-1/a")
+
+        urls = await cache.get_many(["org-1/a", "org-1/b", "org-1/c", "org-1/x"])
+
+        assert set(urls) == {"org-1/a", "org-1/b", "org-1/c"}
+        assert storage.sign_requests == 2
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_size_zero_disables_cache(self):
+        """Test every lookup is signed when the cache size is 0."""
+        storage = InMemoryStorage()
+        service = storage.service()
+        await service.upload("org-1/file", b"content")
+        cache = SignedUrlCache(service, max_size=0)
+
+        await cache.get("org-1/file")
+        await cache.get("org-1/file")
+
+        assert storage.sign_requests == 2
+        await service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """Test the oldest path is evicted once the cache is full."""
+        storage = InMemoryStorage()
+        service = storage.service()
+        for name in ("a", "b", "c"):
+            await service.upload(f"org-1/{name}", name.encode())
+        cache = SignedUrlCache(service, max_size=2)
+
+        await cache.get("org-1/a")
+        await cache.get("org-1/b")
+        await cache.get("org-1/a")
+        await cache.get("org-1/c")
+        await cache.get("org-1/a")
+        await cache.get("org-1/b")
+
+        assert storage.sign_requests == 4
+        await service.aclose()
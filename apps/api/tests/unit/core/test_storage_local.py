@@ -0,0 +1,152 @@
+"""
+Tests for the local disk storage backend and its file route
+"""
+
+from pathlib import Path
+from typing import AsyncIterator
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from fastapi import HTTPException
+
+from src.core.storage import LocalStorage, StorageError, StorageObjectNotFound
+from src.core.storage.routes import get_local_file, parse_range
+
+
+@pytest.fixture
+def local_storage(tmp_path: Path) -> LocalStorage:
+    """Local storage rooted in a temporary directory."""
+    return LocalStorage(
+        str(tmp_path), "http://api.test/api/v1/storage/files", "signing-key"
+    )
+
+
+class TestLocalStorage:
+    """Test the local disk backend."""
+
+    @pytest.mark.asyncio
+    async def test_streaming_round_trip(self, local_storage: LocalStorage):
+        """Test streamed uploads are readable in chunks and by range."""
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield b"0123"
+            yield b"456789"
+
+        await local_storage.upload("org-1/2024/file", chunks())
+
+        received = [c async for c in local_storage.stream("org-1/2024/file", 3)]
+        assert received == [b"012", b"345", b"678", b"9"]
+        assert await local_storage.read_range("org-1/2024/file", 3, 4) == b"3456"
+        assert await local_storage.get_size("org-1/2024/file") == 10
+
+    @pytest.mark.asyncio
+    async def test_failed_upload_leaves_no_file(
+        self, local_storage: LocalStorage, tmp_path: Path
+    ):
+        """Test an interrupted stream does not leave a partial object."""
+
+        async def failing() -> AsyncIterator[bytes]:
+            yield b"partial"
+            raise RuntimeError("client disconnected")
+
+        with pytest.raises(RuntimeError):
+            await local_storage.upload("org-1/file", failing())
+
+        assert not await local_storage.exists("org-1/file")
+        assert list((tmp_path / "org-1").iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_conflict_and_remove(self, local_storage: LocalStorage):
+        """Test uploads do not overwrite without upsert and removal works."""
+        await local_storage.upload("org-1/file", b"first")
+
+        with pytest.raises(StorageError):
+            await local_storage.upload("org-1/file", b"second")
+
+        await local_storage.remove(["org-1/file", "org-1/missing"])
+        with pytest.raises(StorageObjectNotFound):
+            await local_storage.download("org-1/file")
+
+    @pytest.mark.asyncio
+    async def test_streamed_deduplicated_upload(
+        self, local_storage: LocalStorage, tmp_path: Path
+    ):
+        """Test staged streams are renamed to their content address."""
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield b"%PDF-1.4 content"
+
+        first = await local_storage.upload_deduplicated("org-1", chunks())
+        second = await local_storage.upload_deduplicated("org-1", chunks())
+
+        assert first.created and not second.created
+        assert (tmp_path / first.path).read_bytes() == b"%PDF-1.4 content"
+        assert list((tmp_path / "org-1" / "staging").iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_rejects_paths_outside_root(self, local_storage: LocalStorage):
+        """Test paths cannot escape the storage root."""
+        with pytest.raises(StorageError):
+            await local_storage.upload("../outside", b"content")
+
+    @pytest.mark.asyncio
+    async def test_signed_url_round_trip(self, local_storage: LocalStorage):
+        """Test signed URLs verify and tampered signatures do not."""
+        url = await local_storage.create_signed_url("org-1/file", expires_in=60)
+        query = parse_qs(urlparse(url).query)
+        expires, signature = int(query["expires"][0]), query["signature"][0]
+
+        assert url.startswith("http://api.test/api/v1/storage/files/org-1/file?")
+        assert local_storage.verify_signature("org-1/file", expires, signature)
+        assert not local_storage.verify_signature("org-1/other", expires, signature)
+        assert not local_storage.verify_signature("org-1/file", 0, signature)
+
+
+class TestLocalFileRoute:
+    """Test the signed local file route."""
+
+    def test_parse_range(self):
+        """Test single byte ranges are parsed and clamped."""
+        assert parse_range("bytes=0-3", 10) == (0, 3)
+        assert parse_range("bytes=5-", 10) == (5, 9)
+        assert parse_range("bytes=-4", 10) == (6, 9)
+        assert parse_range("bytes=8-100", 10) == (8, 9)
+        assert parse_range("bytes=10-", 10) is None
+        assert parse_range("bytes=0-1,4-5", 10) is None
+
+    @pytest.mark.asyncio
+    async def test_serves_range(self, local_storage: LocalStorage, monkeypatch):
+        """Test a signed request for a range returns partial content."""
+        # Arrange
+        monkeypatch.setattr("src.core.storage.routes.storage_service", local_storage)
+        await local_storage.upload("org-1/file", b"0123456789")
+        url = await local_storage.create_signed_url("org-1/file", expires_in=60)
+        query = parse_qs(urlparse(url).query)
+
+        # Act
+        response = await get_local_file(
+            "org-1/file",
+            expires=int(query["expires"][0]),
+            signature=query["signature"][0],
+            range_header="bytes=2-5",
+        )
+        body = b"".join([chunk async for chunk in response.body_iterator])
+
+        # Assert
+        assert response.status_code == 206
+        assert response.headers["content-range"] == "bytes 2-5/10"
+        assert body == b"2345"
+
+    @pytest.mark.asyncio
+    async def test_rejects_bad_signature(
+        self, local_storage: LocalStorage, monkeypatch
+    ):
+        """Test requests with an invalid signature are forbidden."""
+        monkeypatch.setattr("src.core.storage.routes.storage_service", local_storage)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_local_file(
+                "org-1/file", expires=2**31, signature="bad", range_header=None
+            )
+
+        assert exc_info.value.status_code == 403
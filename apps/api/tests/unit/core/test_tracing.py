@@ -0,0 +1,176 @@
+"""
+Tests for OpenTelemetry tracing in src/core/tracing
+"""
+
+import asyncio
+import json
+import logging
+import queue
+
+import pytest
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import SpanKind, StatusCode
+
+from src.core.jobs import JobQueue
+from src.core.logs import ContextQueueHandler, log_context
+from src.core.tracing import configure_tracing, server_span, shutdown_tracing, span
+from src.core.tracing.exporters import FileSpanExporter
+
+
+@pytest.fixture
+def exporter():
+    """Record finished spans in memory."""
+    exporter = InMemorySpanExporter()
+    configure_tracing(exporter, batch=False)
+    yield exporter
+    shutdown_tracing()
+
+
+def _by_name(exporter: InMemorySpanExporter):
+    return {s.name: s for s in exporter.get_finished_spans()}
+
+
+class TestSpan:
+    """Test spans carry correlation fields and failures."""
+
+    def test_tags_span_with_log_context(self, exporter):
+        """Test bound log fields and attributes are set, skipping None."""
+        # Act
+        with log_context(remittance_id="rem-123", org_id="org-456"):
+            with span("storage.download", bytes=42, filename=None):
+                pass
+
+        # Assert
+        (finished,) = exporter.get_finished_spans()
+        assert finished.attributes == {
+            "remittance_id": "rem-123",
+            "org_id": "org-456",
+            "bytes": 42,
+        }
+
+    def test_records_exception(self, exporter):
+        """Test an exception in the block marks the span as failed."""
+        with pytest.raises(ValueError):
+            with span("openai.extract"):
+                raise ValueError("bad response")
+
+        (finished,) = exporter.get_finished_spans()
+        assert finished.status.status_code == StatusCode.ERROR
+        assert finished.events[0].name == "exception"
+
+    def test_no_spans_recorded_when_not_configured(self):
+        """Test spans are no-ops until tracing is configured."""
+        with span("remittance.process") as current:
+            assert not current.is_recording()
+
+
+class TestContextPropagation:
+    """Test background work continues the trace it was started from."""
+
+    @pytest.mark.asyncio
+    async def test_create_task_continues_trace(self, exporter):
+        """Test a task created inside a span is traced as its child."""
+
+        async def upload() -> None:
+            with span("xero.upload_attachment"):
+                await asyncio.sleep(0)
+
+        # Act
+        with span("remittance.approve"):
+            task = asyncio.create_task(upload())
+        await task
+
+        # Assert
+        spans = _by_name(exporter)
+        parent = spans["remittance.approve"]
+        child = spans["xero.upload_attachment"]
+        assert child.context.trace_id == parent.context.trace_id
+        assert child.parent.span_id == parent.context.span_id
+
+    @pytest.mark.asyncio
+    async def test_queued_job_continues_trace(self, exporter):
+        """Test a job queued inside a span is traced as its child."""
+        # Arrange
+        jobs = JobQueue(workers=1)
+        await jobs.start()
+
+        async def process() -> None:
+            with span("remittance.process"):
+                pass
+
+        # Act
+        with span("POST /remittances"):
+            jobs.enqueue(process)
+        await jobs.join()
+        await jobs.stop()
+
+        # Assert
+        spans = _by_name(exporter)
+        request = spans["POST /remittances"]
+        assert spans["remittance.process"].parent.span_id == request.context.span_id
+
+    def test_server_span_continues_incoming_trace(self, exporter):
+        """Test a traceparent header makes the request span a remote child."""
+        # Arrange
+        trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+        headers = {"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"}
+
+        # Act
+        with server_span("GET /remittances", headers):
+            pass
+
+        # Assert
+        (finished,) = exporter.get_finished_spans()
+        assert finished.kind == SpanKind.SERVER
+        assert format(finished.context.trace_id, "032x") == trace_id
+        assert finished.parent.span_id == 0x00F067AA0BA902B7
+
+
+class TestTraceCorrelation:
+    """Test logs and exported spans can be matched up."""
+
+    def test_log_records_carry_trace_id(self, exporter):
+        """Test records logged inside a span include its trace and span IDs."""
+        # Arrange
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        handler = ContextQueueHandler(log_queue, sample_rate=0.0)
+        logger = logging.getLogger("tests.tracing")
+        logger.addHandler(handler)
+        logger.propagate = False
+
+        # Act
+        try:
+            with span("remittance.process") as current:
+                logger.warning("inside")
+        finally:
+            logger.removeHandler(handler)
+            logger.propagate = True
+
+        # Assert
+        record = log_queue.get_nowait()
+        context = current.get_span_context()
+        assert record.context["trace_id"] == format(context.trace_id, "032x")
+        assert record.context["span_id"] == format(context.span_id, "016x")
+
+    def test_file_exporter_writes_json_lines(self, tmp_path):
+        """Test the file exporter appends one JSON span per line."""
+        # Arrange
+        path = tmp_path / "traces.jsonl"
+        configure_tracing(FileSpanExporter(str(path)), batch=False)
+
+        # Act
+        try:
+            with log_context(remittance_id="rem-123"):
+                with span("remittance.process"):
+                    with span("pdf.parse"):
+                        pass
+        finally:
+            shutdown_tracing()
+
+        # Assert
+        lines = path.read_text().splitlines()
+        spans = [json.loads(line) for line in lines]
+        assert [s["name"] for s in spans] == ["pdf.parse", "remittance.process"]
+        assert spans[0]["attributes"]["remittance_id"] == "rem-123"
@@ -0,0 +1,94 @@
+"""
+Tests for the profile and membership access cache in src/domains/auth/access_cache.py
+"""
+
+from unittest.mock import Mock, patch
+
+from src.domains.auth.access_cache import AccessCache
+
+
+class TestAccessCache:
+    """Test expiry, database binding and invalidation of cached access."""
+
+    def test_membership_expires_after_ttl(self):
+        """Test memberships are only served until their TTL passes."""
+        cache = AccessCache(ttl_seconds=30)
+        db = Mock()
+        membership = Mock()
+
+        with patch("src.domains.auth.access_cache.time.monotonic") as mock_monotonic:
+            mock_monotonic.return_value = 100.0
+            cache.set_membership(db, "profile-1", "org-1", membership)
+
+            mock_monotonic.return_value = 129.0
+            assert cache.get_membership(db, "profile-1", "org-1") is membership
+
+            mock_monotonic.return_value = 130.0
+            assert cache.get_membership(db, "profile-1", "org-1") is None
+
+    def test_entries_are_bound_to_database_client(self):
+        """Test entries loaded with one client are not served to another."""
+        cache = AccessCache(ttl_seconds=30)
+        cache.set_membership(Mock(), "profile-1", "org-1", Mock())
+
+        assert cache.get_membership(Mock(), "profile-1", "org-1") is None
+
+    def test_invalidate_membership(self):
+        """Test a membership update drops the cached membership."""
+        cache = AccessCache(ttl_seconds=30)
+        db = Mock()
+        cache.set_membership(db, "profile-1", "org-1", Mock())
+        cache.set_membership(db, "profile-1", "org-2", Mock())
+
+        cache.invalidate_membership("profile-1", "org-1")
+
+        assert cache.get_membership(db, "profile-1", "org-1") is None
+        assert cache.get_membership(db, "profile-1", "org-2") is not None
+
+    def test_invalidate_profile_by_profile_id(self):
+        """Test profile changes drop every auth ID linked to the profile."""
+        cache = AccessCache(ttl_seconds=30)
+        db = Mock()
+        profile = Mock()
+        profile.id = "profile-1"
+        cache.set_profile(db, "auth-1", profile)
+
+        cache.invalidate_profile("profile-1")
+
+        assert cache.get_profile(db, "auth-1") is None
+
+    def test_zero_ttl_disables_caching(self):
+        """Test a TTL of zero never stores entries."""
+        cache = AccessCache(ttl_seconds=0)
+        db = Mock()
+        cache.set_profile(db, "auth-1", Mock())
+
+        assert cache.get_profile(db, "auth-1") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test each map is bounded, dropping the least recently used entry."""
+        cache = AccessCache(ttl_seconds=30, max_size=2)
+        db = Mock()
+        cache.set_membership(db, "profile-1", "org-1", Mock())
+        cache.set_membership(db, "profile-2", "org-1", Mock())
+
+        cache.get_membership(db, "profile-1", "org-1")
+        cache.set_membership(db, "profile-3", "org-1", Mock())
+
+        assert cache.get_membership(db, "profile-1", "org-1") is not None
+        assert cache.get_membership(db, "profile-2", "org-1") is None
+        assert len(cache._memberships) == 2
+
+    def test_expired_entries_are_dropped(self):
+        """Test an expired entry is removed rather than kept until replaced."""
+        cache = AccessCache(ttl_seconds=30)
+        db = Mock()
+
+        with patch("src.domains.auth.access_cache.time.monotonic") as mock_monotonic:
+            mock_monotonic.return_value = 100.0
+            cache.set_profile(db, "auth-1", Mock())
+
+            mock_monotonic.return_value = 131.0
+            assert cache.get_profile(db, "auth-1") is None
+
+        assert cache._profiles == {}
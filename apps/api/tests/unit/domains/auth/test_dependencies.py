@@ -4,24 +4,30 @@ Tests for authentication dependencies in src/domains/auth/dependencies.py
 Tests the core JWT validation and profile resolution functionality.
 """
 
-from unittest.mock import Mock, patch
+import time
+from unittest.mock import AsyncMock, Mock, patch
 
 import jwt
 import pytest
 from fastapi import HTTPException
+from prisma.enums import MemberStatus
+from prisma.models import OrganizationMember
 
 from src.domains.auth.dependencies import (
     decode_supabase_jwt,
     get_auth_id,
     get_current_profile,
 )
+from src.domains.auth.jwks import TokenClaimsCache
+from src.domains.auth.service import validate_organization_access
 from src.shared.exceptions import UnlinkedProfileError
 
 
 class TestDecodeSupabaseJWT:
     """Test JWT token validation with both development and production modes."""
 
-    def test_valid_development_jwt_token(
+    @pytest.mark.asyncio
+    async def test_valid_development_jwt_token(
         self, test_jwt_secret: str, valid_jwt_payload: dict
     ):
         """Test successful JWT validation in development mode (JWT_SECRET)."""
@@ -32,14 +38,15 @@ class TestDecodeSupabaseJWT:
         with patch(
             "src.domains.auth.dependencies.settings.JWT_SECRET", test_jwt_secret
         ):
-            result = decode_supabase_jwt(token)
+            result = await decode_supabase_jwt(token)
 
         assert result.sub == "test-user-id-123"
         assert result.email == "test@example.com"
         assert result.aud == "authenticated"
         assert result.iss == "supabase"
 
-    def test_invalid_token_signature_raises_401(self, test_jwt_secret: str):
+    @pytest.mark.asyncio
+    async def test_invalid_token_signature_raises_401(self, test_jwt_secret: str):
         """Test that invalid token signature raises 401."""
         # Create token with wrong secret
         invalid_token = jwt.encode({"sub": "test"}, "wrong-secret", algorithm="HS256")
@@ -48,12 +55,13 @@ class TestDecodeSupabaseJWT:
             "src.domains.auth.dependencies.settings.JWT_SECRET", test_jwt_secret
         ):
             with pytest.raises(HTTPException) as exc_info:
-                decode_supabase_jwt(invalid_token)
+                await decode_supabase_jwt(invalid_token)
 
         assert exc_info.value.status_code == 401
         assert "Invalid or expired token" in exc_info.value.detail
 
-    def test_malformed_jwt_raises_401(self, test_jwt_secret: str):
+    @pytest.mark.asyncio
+    async def test_malformed_jwt_raises_401(self, test_jwt_secret: str):
         """Test that malformed JWT raises 401."""
         malformed_token = "not.a.valid.jwt.token"
 
@@ -61,35 +69,63 @@ class TestDecodeSupabaseJWT:
             "src.domains.auth.dependencies.settings.JWT_SECRET", test_jwt_secret
         ):
             with pytest.raises(HTTPException) as exc_info:
-                decode_supabase_jwt(malformed_token)
+                await decode_supabase_jwt(malformed_token)
 
         assert exc_info.value.status_code == 401
         assert "Invalid or expired token" in exc_info.value.detail
 
-    def test_fallback_to_jwks_when_no_secret(self):
+    @pytest.mark.asyncio
+    async def test_fallback_to_jwks_when_no_secret(self):
         """Test fallback to JWKS mode when JWT_SECRET not available."""
         token = "test.jwt.token"
 
         # Mock no JWT_SECRET and no JWKS client
         with (
             patch("src.domains.auth.dependencies.settings.JWT_SECRET", None),
-            patch("src.domains.auth.dependencies._jwks_client", None),
+            patch("src.domains.auth.dependencies._jwks_cache", None),
         ):
             with pytest.raises(HTTPException) as exc_info:
-                decode_supabase_jwt(token)
+                await decode_supabase_jwt(token)
 
         assert exc_info.value.status_code == 500
         assert "Supabase not configured" in exc_info.value.detail
 
+    @pytest.mark.asyncio
+    async def test_verified_claims_are_cached_until_exp(
+        self, test_jwt_secret: str, valid_jwt_payload: dict
+    ):
+        """Test a token with exp is only verified once."""
+        token = jwt.encode(
+            {**valid_jwt_payload, "exp": int(time.time()) + 3600},
+            test_jwt_secret,
+            algorithm="HS256",
+        )
+
+        with (
+            patch("src.domains.auth.dependencies.settings.JWT_SECRET", test_jwt_secret),
+            patch("src.domains.auth.dependencies._claims_cache", TokenClaimsCache()),
+            patch(
+                "src.domains.auth.dependencies.jwt.decode", wraps=jwt.decode
+            ) as mock_decode,
+        ):
+            first = await decode_supabase_jwt(token)
+            second = await decode_supabase_jwt(token)
+
+        assert first.sub == second.sub == "test-user-id-123"
+        mock_decode.assert_called_once()
+
 
 class TestGetAuthId:
     """Test auth ID extraction from Authorization header."""
 
-    def test_extract_auth_id_from_valid_bearer_token(self, valid_jwt_token: str):
+    @pytest.mark.asyncio
+    async def test_extract_auth_id_from_valid_bearer_token(self, valid_jwt_token: str):
         """Test successful auth ID extraction from valid Bearer token."""
         authorization = f"Bearer {valid_jwt_token}"
 
-        with patch("src.domains.auth.dependencies.decode_supabase_jwt") as mock_decode:
+        with patch(
+            "src.domains.auth.dependencies.decode_supabase_jwt", new_callable=AsyncMock
+        ) as mock_decode:
             from src.domains.auth.types import SupabaseJwtPayload
 
             mock_decode.return_value = SupabaseJwtPayload(
@@ -97,20 +133,22 @@ class TestGetAuthId:
                 email="test@example.com",
             )
 
-            result = get_auth_id(authorization)
+            result = await get_auth_id(authorization)
 
         assert result == "test-user-id-123"
-        mock_decode.assert_called_once_with(valid_jwt_token)
+        mock_decode.assert_awaited_once_with(valid_jwt_token)
 
-    def test_missing_authorization_header_raises_401(self):
+    @pytest.mark.asyncio
+    async def test_missing_authorization_header_raises_401(self):
         """Test that missing Authorization header raises 401."""
         with pytest.raises(HTTPException) as exc_info:
-            get_auth_id(None)
+            await get_auth_id(None)
 
         assert exc_info.value.status_code == 401
         assert "Missing token" in exc_info.value.detail
 
-    def test_invalid_bearer_format_raises_401(self):
+    @pytest.mark.asyncio
+    async def test_invalid_bearer_format_raises_401(self):
         """Test that invalid Bearer format raises 401."""
         invalid_headers = [
             "InvalidFormat token",
@@ -121,23 +159,26 @@ class TestGetAuthId:
 
         for invalid_header in invalid_headers:
             with pytest.raises(HTTPException) as exc_info:
-                get_auth_id(invalid_header)
+                await get_auth_id(invalid_header)
 
             assert exc_info.value.status_code == 401
             assert "Missing token" in exc_info.value.detail
 
-    def test_empty_sub_claim_returns_empty_string(self, valid_jwt_token: str):
+    @pytest.mark.asyncio
+    async def test_empty_sub_claim_returns_empty_string(self, valid_jwt_token: str):
         """Test handling of empty sub claim."""
         authorization = f"Bearer {valid_jwt_token}"
 
-        with patch("src.domains.auth.dependencies.decode_supabase_jwt") as mock_decode:
+        with patch(
+            "src.domains.auth.dependencies.decode_supabase_jwt", new_callable=AsyncMock
+        ) as mock_decode:
             from src.domains.auth.types import SupabaseJwtPayload
 
             mock_decode.return_value = SupabaseJwtPayload(
                 sub=None, email="test@example.com"
             )
 
-            result = get_auth_id(authorization)
+            result = await get_auth_id(authorization)
 
         assert result == ""
 
@@ -163,7 +204,31 @@ class TestGetCurrentProfile:
         # Verify the where clause was constructed correctly
         call_args = mock_prisma.authlink.find_first.call_args
         assert call_args[1]["where"]["authId"] == auth_id
-        assert call_args[1]["include"]["profile"] is True
+        assert call_args[1]["include"]["profile"]["include"]["memberships"] == {
+            "where": {"status": MemberStatus.active}
+        }
+
+    @pytest.mark.asyncio
+    async def test_profile_and_memberships_are_cached(
+        self, mock_auth_link_with_profile: Mock, mock_prisma: Mock
+    ):
+        """Test a warm lookup needs no queries for profile or membership."""
+        auth_id = "test-user-id-123"
+        org_id = "test-org-id-456"
+
+        membership = Mock(spec=OrganizationMember)
+        membership.organizationId = org_id
+        mock_auth_link_with_profile.profile.memberships = [membership]
+        mock_prisma.authlink.find_first.return_value = mock_auth_link_with_profile
+
+        first = await get_current_profile(auth_id, mock_prisma)
+        second = await get_current_profile(auth_id, mock_prisma)
+        access = await validate_organization_access(first.id, org_id, mock_prisma)
+
+        assert second is first
+        assert access is membership
+        mock_prisma.authlink.find_first.assert_called_once()
+        mock_prisma.organizationmember.find_first.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_nonexistent_auth_id_raises_unlinked_profile_error(
@@ -0,0 +1,123 @@
+"""
+Tests for JWKS signing key and verified claims caching in src/domains/auth/jwks.py
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import jwt
+import pytest
+
+from src.domains.auth.jwks import JwksKeyCache, TokenClaimsCache
+from src.domains.auth.types import SupabaseJwtPayload
+
+
+class TestJwksKeyCache:
+    """Test signing key lookup, kid-miss refetch and refetch throttling."""
+
+    @pytest.mark.asyncio
+    async def test_cached_key_skips_network(self):
+        """Test a known kid is served without fetching the JWKS."""
+        cache = JwksKeyCache("https://example.supabase.co/auth/v1/jwks")
+        cache._keys = {"key-1": "public-key"}
+
+        with patch.object(cache, "refresh", new_callable=AsyncMock) as mock_refresh:
+            key = await cache.get_signing_key("key-1")
+
+        assert key == "public-key"
+        mock_refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unknown_kid_triggers_refetch(self):
+        """Test a kid miss refetches the JWKS once and retries the lookup."""
+        cache = JwksKeyCache("https://example.supabase.co/auth/v1/jwks")
+
+        async def refresh_side_effect() -> None:
+            cache._keys = {"rotated-key": "new-public-key"}
+            cache._last_fetch = 1.0
+
+        with patch.object(
+            cache, "refresh", new=AsyncMock(side_effect=refresh_side_effect)
+        ) as mock_refresh:
+            key = await cache.get_signing_key("rotated-key")
+
+        assert key == "new-public-key"
+        mock_refresh.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_refetch_is_throttled(self):
+        """Test repeated kid misses do not hammer the JWKS endpoint."""
+        cache = JwksKeyCache(
+            "https://example.supabase.co/auth/v1/jwks", min_refetch_interval=30
+        )
+
+        with (
+            patch("src.domains.auth.jwks.time.monotonic", return_value=100.0),
+            patch.object(cache, "refresh", new_callable=AsyncMock) as mock_refresh,
+        ):
+            cache._last_fetch = 90.0
+
+            with pytest.raises(jwt.PyJWKClientError):
+                await cache.get_signing_key("unknown-key")
+
+        mock_refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_throttles_refetch(self):
+        """Test an unreachable JWKS endpoint is not retried on every kid miss."""
+        # Arrange
+        cache = JwksKeyCache(
+            "https://example.supabase.co/auth/v1/jwks", min_refetch_interval=30
+        )
+        mock_get = AsyncMock(side_effect=httpx.ConnectError("unreachable"))
+
+        with (
+            patch("src.domains.auth.jwks.time.monotonic", return_value=100.0),
+            patch("src.domains.auth.jwks.httpx.AsyncClient.get", new=mock_get),
+        ):
+            # Act
+            await cache.start()
+            await cache.stop()
+            for _ in range(3):
+                with pytest.raises(jwt.PyJWKClientError):
+                    await cache.get_signing_key("unknown-key")
+
+        # Assert
+        mock_get.assert_awaited_once()
+
+
+class TestTokenClaimsCache:
+    """Test the bounded LRU of verified token claims."""
+
+    def test_returns_claims_until_exp(self):
+        """Test cached claims expire at the token's exp claim."""
+        cache = TokenClaimsCache()
+        payload = SupabaseJwtPayload(sub="user-1", exp=1000)
+
+        with patch("src.domains.auth.jwks.time.time", return_value=999.0):
+            cache.set("token", payload)
+            assert cache.get("token") == payload
+
+        with patch("src.domains.auth.jwks.time.time", return_value=1000.0):
+            assert cache.get("token") is None
+
+    def test_tokens_without_exp_are_not_cached(self):
+        """Test tokens that never expire are always re-verified."""
+        cache = TokenClaimsCache()
+        cache.set("token", SupabaseJwtPayload(sub="user-1"))
+
+        assert cache.get("token") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test the cache stays within its size bound."""
+        cache = TokenClaimsCache(max_size=2)
+
+        with patch("src.domains.auth.jwks.time.time", return_value=0.0):
+            cache.set("token-1", SupabaseJwtPayload(sub="user-1", exp=1000))
+            cache.set("token-2", SupabaseJwtPayload(sub="user-2", exp=1000))
+            cache.get("token-1")
+            cache.set("token-3", SupabaseJwtPayload(sub="user-3", exp=1000))
+
+            assert cache.get("token-1") is not None
+            assert cache.get("token-2") is None
+            assert cache.get("token-3") is not None
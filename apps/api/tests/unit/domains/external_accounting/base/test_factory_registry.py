@@ -0,0 +1,113 @@
+"""
+Tests for per-organization caching of integration data services.
+"""
+
+from typing import Generator
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.domains.external_accounting.base.factory import IntegrationFactory
+from src.domains.external_accounting.base.registry import (
+    IntegrationServiceRegistry,
+    integration_registry,
+)
+from src.domains.external_accounting.xero.data_service import XeroDataService
+from src.shared.exceptions import IntegrationConnectionError
+
+
+@pytest.fixture(autouse=True)
+def clear_registry() -> Generator[None, None, None]:
+    """Start and finish every test with an empty registry."""
+    integration_registry.clear()
+    yield
+    integration_registry.clear()
+
+
+class TestIntegrationFactoryCaching:
+    """Test suite for IntegrationFactory service caching."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_lookups_reuse_service(self, mock_prisma: Mock) -> None:
+        """Test the connection query runs once for repeated lookups."""
+        # Arrange
+        mock_prisma.xeroconnection.find_first.return_value = Mock()
+        factory = IntegrationFactory(mock_prisma)
+
+        # Act
+        first = await factory.get_data_service("test-org-123")
+        second = await IntegrationFactory(mock_prisma).get_data_service("test-org-123")
+
+        # Assert
+        assert isinstance(first, XeroDataService)
+        assert second is first
+        mock_prisma.xeroconnection.find_first.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_new_lookup(self, mock_prisma: Mock) -> None:
+        """Test invalidation makes the next lookup hit the database."""
+        # Arrange
+        mock_prisma.xeroconnection.find_first.return_value = Mock()
+        factory = IntegrationFactory(mock_prisma)
+        first = await factory.get_data_service("test-org-123")
+
+        # Act
+        integration_registry.invalidate("test-org-123")
+        second = await factory.get_data_service("test-org-123")
+
+        # Assert
+        assert second is not first
+        assert mock_prisma.xeroconnection.find_first.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_connection_is_not_cached(self, mock_prisma: Mock) -> None:
+        """Test a failed lookup is retried on the next call."""
+        # Arrange
+        mock_prisma.xeroconnection.find_first.return_value = None
+        factory = IntegrationFactory(mock_prisma)
+
+        # Act & Assert
+        for _ in range(2):
+            with pytest.raises(IntegrationConnectionError):
+                await factory.get_data_service("test-org-123")
+
+        assert mock_prisma.xeroconnection.find_first.call_count == 2
+
+
+class TestIntegrationServiceRegistry:
+    """Test suite for IntegrationServiceRegistry expiry rules."""
+
+    def test_entry_expires_after_ttl(self) -> None:
+        """Test entries are dropped once their TTL has passed."""
+        # Arrange
+        registry = IntegrationServiceRegistry(ttl_seconds=10)
+        db = Mock()
+        service = Mock()
+
+        with patch(
+            "src.domains.external_accounting.base.registry.time.monotonic"
+        ) as mock_monotonic:
+            mock_monotonic.return_value = 100.0
+            registry.set(db, "test-org-123", "xero", service)
+
+            # Act & Assert
+            mock_monotonic.return_value = 105.0
+            assert registry.get(db, "test-org-123") is service
+
+            mock_monotonic.return_value = 111.0
+            assert registry.get(db, "test-org-123") is None
+
+    def test_entry_bound_to_database_client(self) -> None:
+        """Test services are not shared across database clients."""
+        registry = IntegrationServiceRegistry(ttl_seconds=10)
+        registry.set(Mock(), "test-org-123", "xero", Mock())
+
+        assert registry.get(Mock(), "test-org-123") is None
+
+    def test_zero_ttl_disables_caching(self) -> None:
+        """Test a TTL of zero never stores entries."""
+        registry = IntegrationServiceRegistry(ttl_seconds=0)
+        db = Mock()
+        registry.set(db, "test-org-123", "xero", Mock())
+
+        assert registry.get(db, "test-org-123") is None
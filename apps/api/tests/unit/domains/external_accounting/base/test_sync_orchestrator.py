@@ -0,0 +1,95 @@
+"""
+Tests for invoice upserts in the sync orchestrator.
+"""
+
+from contextlib import asynccontextmanager
+from typing import Generator
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.domains.external_accounting.base.sync_orchestrator import SyncOrchestrator
+from src.domains.external_accounting.xero.types import XeroContact, XeroInvoice
+from src.shared.pagination import count_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_count_cache() -> Generator[None, None, None]:
+    """Start and finish every test with no cached counts."""
+    count_cache.clear()
+    yield
+    count_cache.clear()
+
+
+def _invoice(invoice_id: str) -> XeroInvoice:
+    return XeroInvoice(
+        InvoiceID=invoice_id,
+        InvoiceNumber=f"INV-{invoice_id}",
+        Type="ACCREC",
+        Contact=XeroContact(
+            ContactID="contact-1", Name="Acme Ltd", ContactStatus="ACTIVE"
+        ),
+        Date="/Date(1748476800000+0000)/",
+        Status="AUTHORISED",
+        LineAmountTypes="Exclusive",
+        SubTotal=100.0,
+        TotalTax=10.0,
+        Total=110.0,
+        AmountDue=110.0,
+        CurrencyCode="AUD",
+        LineItems=[],
+    )
+
+
+class TestBatchUpsertInvoices:
+    """Test batched invoice upserts and their row-by-row fallback."""
+
+    @pytest.mark.asyncio
+    async def test_fallback_skips_failing_invoice(self, mock_prisma: Mock) -> None:
+        """Test one bad row in the fallback is skipped, not fatal."""
+
+        # Arrange
+        @asynccontextmanager
+        async def failing_batch():
+            yield Mock()
+            raise RuntimeError("batch rejected")
+
+        mock_prisma.batch_ = failing_batch
+
+        async def upsert(where, data):
+            if where["organizationId_invoiceId"]["invoiceId"] == "inv-2":
+                raise RuntimeError("bad row")
+            return Mock()
+
+        mock_prisma.invoice.upsert = AsyncMock(side_effect=upsert)
+        orchestrator = SyncOrchestrator(mock_prisma)
+        invoices = [_invoice("inv-1"), _invoice("inv-2"), _invoice("inv-3")]
+
+        # Act
+        count = await orchestrator._batch_upsert_invoices("org-1", invoices)
+
+        # Assert
+        assert count == 2
+        assert mock_prisma.invoice.upsert.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_invalidates_invoice_counts(self, mock_prisma: Mock) -> None:
+        """Test cached invoice totals are dropped after a sync upsert."""
+
+        # Arrange
+        @asynccontextmanager
+        async def batch():
+            yield Mock()
+
+        mock_prisma.batch_ = batch
+        count = AsyncMock(return_value=5)
+        await count_cache.get_or_count(mock_prisma, "invoice", {}, count)
+
+        # Act
+        await SyncOrchestrator(mock_prisma)._batch_upsert_invoices(
+            "org-1", [_invoice("inv-1")]
+        )
+        await count_cache.get_or_count(mock_prisma, "invoice", {}, count)
+
+        # Assert
+        assert count.await_count == 2
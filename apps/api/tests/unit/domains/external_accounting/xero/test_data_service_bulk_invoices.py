@@ -0,0 +1,240 @@
+"""
+Tests for XeroDataService bulk invoice fetch functionality.
+"""
+
+import asyncio
+import gc
+from typing import Any, Dict
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.domains.external_accounting.xero.data_service import (
+    XERO_MAX_CONCURRENT_REQUESTS,
+    XeroDataService,
+    _chunk_ids,
+    _tenant_semaphores,
+)
+
+
+def _invoice_dict(invoice_id: str) -> Dict[str, Any]:
+    """Build a minimal Xero invoice payload."""
+    return {
+        "InvoiceID": invoice_id,
+        "InvoiceNumber": f"INV-{invoice_id}",
+        "Type": "ACCREC",
+        "Contact": {
+            "ContactID": "test-contact-123",
+            "Name": "Test Customer",
+            "ContactStatus": "ACTIVE",
+        },
+        "Date": "/Date(1704067200000+0000)/",
+        "Status": "PAID",
+        "LineAmountTypes": "Exclusive",
+        "SubTotal": 100.00,
+        "TotalTax": 10.00,
+        "Total": 110.00,
+        "AmountDue": 0.00,
+        "AmountPaid": 110.00,
+        "AmountCredited": 0.00,
+        "CurrencyCode": "AUD",
+        "LineItems": [],
+    }
+
+
+class TestChunkIds:
+    """Test suite for splitting IDs into request-sized chunks."""
+
+    def test_small_list_is_single_chunk(self) -> None:
+        """Test IDs that fit in one parameter stay together."""
+        assert _chunk_ids(["a", "b", "c"]) == [["a", "b", "c"]]
+
+    def test_respects_max_chunk_size(self) -> None:
+        """Test chunks never exceed the maximum number of IDs."""
+        chunks = _chunk_ids([str(i) for i in range(5)], max_chunk_size=2)
+
+        assert chunks == [["0", "1"], ["2", "3"], ["4"]]
+
+    def test_respects_encoded_param_length(self) -> None:
+        """Test separators are counted in their URL-encoded form."""
+        # "aaaa%2Cbbbb" is 11 characters, one over the limit
+        chunks = _chunk_ids(["aaaa", "bbbb", "cccc"], max_param_length=10)
+
+        assert chunks == [["aaaa"], ["bbbb"], ["cccc"]]
+
+    def test_empty_list(self) -> None:
+        """Test no chunks are produced for no IDs."""
+        assert _chunk_ids([]) == []
+
+
+class TestXeroDataServiceBulkInvoices:
+    """Test suite for XeroDataService.get_invoices_by_ids."""
+
+    @pytest.fixture
+    def xero_data_service(self, mock_prisma: Mock) -> XeroDataService:
+        """Create XeroDataService instance with mocked database."""
+        return XeroDataService(mock_prisma)
+
+    @pytest.mark.asyncio
+    async def test_fetches_ids_in_single_request(
+        self, xero_data_service: XeroDataService
+    ) -> None:
+        """Test invoices are fetched with one IDs-filtered request."""
+        # Arrange
+        org_id = "test-org-123"
+        invoice_ids = ["inv-1", "inv-2", "inv-1"]
+        response = {"Invoices": [_invoice_dict("inv-1"), _invoice_dict("inv-2")]}
+
+        with patch.object(
+            xero_data_service, "_make_xero_request", new=AsyncMock()
+        ) as mock_request:
+            mock_request.return_value = response
+
+            # Act
+            result = await xero_data_service.get_invoices_by_ids(org_id, invoice_ids)
+
+            # Assert
+            assert [invoice.InvoiceID for invoice in result] == ["inv-1", "inv-2"]
+            mock_request.assert_awaited_once()
+            call_args = mock_request.call_args
+            assert call_args[0][0] == "GET"
+            assert call_args[0][1] == "https://api.xero.com/api.xro/2.0/Invoices"
+            params = call_args[1]["params"]
+            assert params.IDs == "inv-1,inv-2"
+            assert params.page == 1
+
+    @pytest.mark.asyncio
+    async def test_large_id_sets_are_chunked(
+        self, xero_data_service: XeroDataService
+    ) -> None:
+        """Test more IDs than fit in one page are split across requests."""
+        # Arrange
+        org_id = "test-org-123"
+        invoice_ids = [f"inv-{i:03d}" for i in range(150)]
+
+        async def request_side_effect(method, url, org_id, params=None):
+            return {"Invoices": [_invoice_dict(id_) for id_ in params.IDs.split(",")]}
+
+        with patch.object(
+            xero_data_service,
+            "_make_xero_request",
+            new=AsyncMock(side_effect=request_side_effect),
+        ) as mock_request:
+            # Act
+            result = await xero_data_service.get_invoices_by_ids(org_id, invoice_ids)
+
+            # Assert
+            assert mock_request.await_count == 2
+            assert sorted(invoice.InvoiceID for invoice in result) == invoice_ids
+
+    @pytest.mark.asyncio
+    async def test_no_ids_makes_no_request(
+        self, xero_data_service: XeroDataService
+    ) -> None:
+        """Test an empty ID list returns without calling Xero."""
+        with patch.object(
+            xero_data_service, "_make_xero_request", new=AsyncMock()
+        ) as mock_request:
+            result = await xero_data_service.get_invoices_by_ids("test-org-123", [])
+
+            assert result == []
+            mock_request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_keeps_other_chunks(
+        self, xero_data_service: XeroDataService
+    ) -> None:
+        """Test a failed chunk is skipped and the other chunks still return."""
+        # Arrange
+        org_id = "test-org-123"
+        invoice_ids = [f"inv-{i:03d}" for i in range(150)]
+
+        async def request_side_effect(method, url, org_id, params=None):
+            if params.IDs.startswith("inv-100"):
+                raise Exception("Xero API error: 429 Too Many Requests")
+            return {"Invoices": [_invoice_dict(id_) for id_ in params.IDs.split(",")]}
+
+        with (
+            patch.object(
+                xero_data_service,
+                "_make_xero_request",
+                new=AsyncMock(side_effect=request_side_effect),
+            ),
+            patch(
+                "src.domains.external_accounting.xero.data_service.logger"
+            ) as mock_logger,
+        ):
+            # Act
+            result = await xero_data_service.get_invoices_by_ids(org_id, invoice_ids)
+
+            # Assert
+            assert [invoice.InvoiceID for invoice in result] == invoice_ids[:100]
+            warning = mock_logger.warning.call_args[0][0]
+            assert "Failed to fetch 50 invoices" in warning
+            assert "inv-149" in warning
+
+    @pytest.mark.asyncio
+    async def test_every_chunk_failing_raises(
+        self, xero_data_service: XeroDataService
+    ) -> None:
+        """Test the error is raised when no chunk could be fetched."""
+        with patch.object(
+            xero_data_service,
+            "_make_xero_request",
+            new=AsyncMock(side_effect=Exception("Xero API error: timeout")),
+        ):
+            with pytest.raises(Exception, match="timeout"):
+                await xero_data_service.get_invoices_by_ids("test-org-123", ["inv-1"])
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_shared_per_organization(
+        self, xero_data_service: XeroDataService
+    ) -> None:
+        """Test concurrent calls for one organization share a request limit."""
+        # Arrange
+        in_flight = 0
+        peak = 0
+
+        async def request_side_effect(method, url, org_id, params=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"Invoices": []}
+
+        with patch.object(
+            xero_data_service,
+            "_make_xero_request",
+            new=AsyncMock(side_effect=request_side_effect),
+        ):
+            # Act
+            await asyncio.gather(
+                *(
+                    xero_data_service.get_invoices_by_ids(
+                        "test-org-shared", [f"inv-{call}-{i:03d}" for i in range(300)]
+                    )
+                    for call in range(3)
+                )
+            )
+
+        # Assert
+        assert peak == XERO_MAX_CONCURRENT_REQUESTS
+
+    @pytest.mark.asyncio
+    async def test_idle_organization_semaphore_is_dropped(
+        self, xero_data_service: XeroDataService
+    ) -> None:
+        """Test an organization's request limit is not kept once it is idle."""
+        # Arrange
+        with patch.object(
+            xero_data_service,
+            "_make_xero_request",
+            new=AsyncMock(return_value={"Invoices": []}),
+        ):
+            # Act
+            await xero_data_service.get_invoices_by_ids("test-org-idle", ["inv-1"])
+        gc.collect()
+
+        # Assert
+        assert "test-org-idle" not in _tenant_semaphores
@@ -0,0 +1,82 @@
+"""
+Tests for Xero request metrics in XeroDataService.
+"""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from src.core.metrics import XERO_REQUEST_SECONDS
+from src.domains.external_accounting.xero.data_service import (
+    XeroDataService,
+    _endpoint_label,
+)
+
+
+class TestEndpointLabel:
+    """Test Xero URLs are reduced to low-cardinality endpoint names."""
+
+    def test_collection_endpoint(self) -> None:
+        """Test a collection URL keeps its resource name."""
+        url = "https://api.xero.com/api.xro/2.0/BatchPayments"
+
+        assert _endpoint_label(url) == "BatchPayments"
+
+    def test_record_ids_are_replaced(self) -> None:
+        """Test IDs and filenames in the path are replaced by a placeholder."""
+        url = "https://api.xero.com/api.xro/2.0/Invoices/abc-123/Attachments/a.pdf"
+
+        assert _endpoint_label(url) == "Invoices/{id}/Attachments/{id}"
+
+
+class TestXeroRequestMetrics:
+    """Test each Xero request attempt is timed by endpoint and status."""
+
+    @pytest.fixture
+    def xero_data_service(self, mock_prisma: Mock) -> XeroDataService:
+        """Create XeroDataService instance with mocked database."""
+        return XeroDataService(mock_prisma)
+
+    @pytest.mark.asyncio
+    async def test_observes_status_of_each_attempt(
+        self,
+        xero_data_service: XeroDataService,
+        mock_prisma: Mock,
+        mock_xero_connection: Mock,
+    ) -> None:
+        """Test a failed attempt and its retry are recorded separately."""
+        # Arrange
+        labels = {"method": "GET", "endpoint": "Accounts"}
+        before_500 = XERO_REQUEST_SECONDS.count(status="500", **labels)
+        before_200 = XERO_REQUEST_SECONDS.count(status="200", **labels)
+        mock_prisma.xeroconnection.find_first.return_value = mock_xero_connection
+
+        failed = Mock(status_code=500, text="error")
+        failed.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "server error", request=Mock(), response=failed
+        )
+        succeeded = Mock(status_code=200)
+        succeeded.json.return_value = {"Accounts": []}
+
+        with (
+            patch.object(
+                xero_data_service.xero_service,
+                "get_valid_access_token",
+                AsyncMock(return_value="token"),
+            ),
+            patch("httpx.AsyncClient") as mock_client,
+            patch("asyncio.sleep", AsyncMock()),
+        ):
+            client = AsyncMock()
+            mock_client.return_value.__aenter__.return_value = client
+            client.request.side_effect = [failed, succeeded]
+
+            # Act
+            await xero_data_service._make_xero_request(
+                "GET", f"{xero_data_service.base_url}/Accounts", "test-org-123"
+            )
+
+        # Assert
+        assert XERO_REQUEST_SECONDS.count(status="500", **labels) == before_500 + 1
+        assert XERO_REQUEST_SECONDS.count(status="200", **labels) == before_200 + 1
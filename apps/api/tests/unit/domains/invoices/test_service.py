@@ -8,9 +8,22 @@ from datetime import date, datetime
 from unittest.mock import Mock
 
 import pytest
+from fastapi import HTTPException
 from prisma.enums import InvoiceStatus
 
 from src.domains.invoices.service import get_invoices_by_organization
+from src.shared.pagination import encode_cursor
+
+
+def _search_rows(ids: list, total: int):
+    """query_raw side effect answering the ranked and count search queries."""
+
+    async def query_raw(sql: str, *args):
+        if sql.startswith("SELECT count("):
+            return [{"total": total}]
+        return [{"id": record_id} for record_id in ids]
+
+    return query_raw
 
 
 class TestGetInvoicesByOrganization:
@@ -117,30 +130,110 @@ class TestGetInvoicesByOrganization:
     async def test_search_functionality(
         self, mock_prisma: Mock, mock_invoice_list: list, test_organization_id: str
     ):
-        """Test text search across multiple fields."""
-        mock_prisma.invoice.find_many.return_value = mock_invoice_list
-        mock_prisma.invoice.count.return_value = 3
+        """Test search returns trigram-ranked matches in relevance order."""
+        # Arrange: rank the last invoice first
+        mock_prisma.query_raw.side_effect = _search_rows(
+            ["test-invoice-id-2", "test-invoice-id-0"], 2
+        )
+        mock_prisma.invoice.find_many.return_value = [
+            mock_invoice_list[0],
+            mock_invoice_list[2],
+        ]
 
-        search_term = "Test"
+        # Act
+        result = await get_invoices_by_organization(
+            organization_id=test_organization_id, db=mock_prisma, search="Test"
+        )
 
-        await get_invoices_by_organization(
-            organization_id=test_organization_id, db=mock_prisma, search=search_term
+        # Assert: matches are narrowed by ID and returned best first
+        sql, org_id, pattern, term, limit, offset = (
+            mock_prisma.query_raw.call_args_list[0][0]
         )
+        assert '"invoiceNumber" ILIKE $2' in sql
+        assert '"contactName" ILIKE $2' in sql
+        assert '"reference" ILIKE $2' in sql
+        assert org_id == test_organization_id
+        assert pattern == "%Test%"
+        assert term == "Test"
+        assert (limit, offset) == (50, 0)
+
+        where_clause = mock_prisma.invoice.find_many.call_args[1]["where"]
+        assert where_clause["id"] == {"in": ["test-invoice-id-2", "test-invoice-id-0"]}
+        assert "OR" not in where_clause
+        mock_prisma.invoice.count.assert_not_called()
+
+        assert [invoice.id for invoice in result.invoices] == [
+            "test-invoice-id-2",
+            "test-invoice-id-0",
+        ]
+        assert result.pagination.total == 2
+        assert result.pagination.pages == 1
+        assert result.pagination.next_cursor is None
 
-        # Verify search filter was applied with OR conditions
-        find_many_call = mock_prisma.invoice.find_many.call_args
-        where_clause = find_many_call[1]["where"]
-        or_conditions = where_clause["OR"]
+    @pytest.mark.asyncio
+    async def test_search_pages_in_sql(
+        self, mock_prisma: Mock, mock_invoice_list: list, test_organization_id: str
+    ):
+        """Test search pages with LIMIT/OFFSET and derives has_next without a total."""
+        # Arrange: one row beyond the page signals another page
+        mock_prisma.query_raw.side_effect = _search_rows(
+            [invoice.id for invoice in mock_invoice_list], 3
+        )
+        mock_prisma.invoice.find_many.return_value = mock_invoice_list
+
+        # Act
+        result = await get_invoices_by_organization(
+            organization_id=test_organization_id,
+            db=mock_prisma,
+            search="Test",
+            page=3,
+            limit=2,
+            include_total=False,
+        )
+
+        # Assert
+        *_, limit, offset = mock_prisma.query_raw.call_args[0]
+        assert (limit, offset) == (3, 4)
+        assert mock_prisma.query_raw.await_count == 1  # No count query
+        assert len(result.invoices) == 2
+        assert result.pagination.total is None
+        assert result.pagination.has_next is True
+        assert result.pagination.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_search_rejects_cursor(
+        self, mock_prisma: Mock, test_organization_id: str
+    ):
+        """Test a cursor cannot be combined with relevance-ordered search."""
+        cursor = encode_cursor(datetime(2024, 1, 1), "test-invoice-id-0")
 
-        assert len(or_conditions) == 3
-        assert or_conditions[0]["invoiceNumber"]["contains"] == search_term
-        assert or_conditions[1]["contactName"]["contains"] == search_term
-        assert or_conditions[2]["reference"]["contains"] == search_term
+        with pytest.raises(HTTPException) as exc_info:
+            await get_invoices_by_organization(
+                organization_id=test_organization_id,
+                db=mock_prisma,
+                search="Test",
+                cursor=cursor,
+            )
 
-        # Verify case insensitive search
-        for condition in or_conditions:
-            field_condition = list(condition.values())[0]
-            assert field_condition["mode"] == "insensitive"
+        assert exc_info.value.status_code == 400
+        mock_prisma.query_raw.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_search_without_matches_skips_fetch(
+        self, mock_prisma: Mock, test_organization_id: str
+    ):
+        """Test a search with no ranked matches does not query invoices."""
+        mock_prisma.query_raw.side_effect = _search_rows([], 0)
+
+        result = await get_invoices_by_organization(
+            organization_id=test_organization_id, db=mock_prisma, search="nothing"
+        )
+
+        mock_prisma.invoice.find_many.assert_not_called()
+        assert result.invoices == []
+        assert result.pagination.total == 0
+        assert result.pagination.pages == 1  # Same shape as an empty listing
+        assert result.pagination.has_next is False
 
     @pytest.mark.asyncio
     async def test_modified_since_filtering(
@@ -182,7 +275,7 @@ class TestGetInvoicesByOrganization:
         find_many_call = mock_prisma.invoice.find_many.call_args
         assert find_many_call[1]["skip"] == 10  # (page - 1) * limit
         assert find_many_call[1]["take"] == 10
-        assert find_many_call[1]["order"] == {"createdAt": "desc"}
+        assert find_many_call[1]["order"] == [{"createdAt": "desc"}, {"id": "desc"}]
 
         # Verify pagination metadata
         assert result.pagination.page == 2
@@ -199,6 +292,9 @@ class TestGetInvoicesByOrganization:
         """Test multiple filters applied together."""
         mock_prisma.invoice.find_many.return_value = mock_invoice_list
         mock_prisma.invoice.count.return_value = 3
+        mock_prisma.query_raw.side_effect = _search_rows(
+            [invoice.id for invoice in mock_invoice_list], 3
+        )
 
         await get_invoices_by_organization(
             organization_id=test_organization_id,
@@ -219,7 +315,18 @@ class TestGetInvoicesByOrganization:
             date(2024, 1, 1), datetime.min.time()
         )
         assert where_clause["contactId"] == "contact-123"
-        assert "OR" in where_clause  # Search conditions
+        assert "id" in where_clause  # Ranked search matches
+
+        # The same filters narrow the ranked search itself
+        sql, *args = mock_prisma.query_raw.call_args_list[0][0]
+        assert '"status"::text = $3' in sql
+        assert '"invoiceDate" >= $4::timestamptz' in sql
+        assert '"contactId"::text = $5' in sql
+        assert args[2:5] == [
+            "AUTHORISED",
+            datetime.combine(date(2024, 1, 1), datetime.min.time()).isoformat(),
+            "contact-123",
+        ]
 
     @pytest.mark.asyncio
     async def test_empty_result_handling(
@@ -238,3 +345,54 @@ class TestGetInvoicesByOrganization:
         assert result.pagination.pages == 1  # Always at least 1 page
         assert result.pagination.has_next is False
         assert result.pagination.has_prev is False
+
+    @pytest.mark.asyncio
+    async def test_cursor_pagination_seeks_past_cursor(
+        self, mock_prisma: Mock, mock_invoice_list: list, test_organization_id: str
+    ):
+        """Test a cursor switches to keyset pagination without a count."""
+        mock_prisma.invoice.find_many.return_value = mock_invoice_list
+        cursor = encode_cursor(datetime(2024, 1, 20, 9, 0, 0), "test-invoice-id-9")
+
+        result = await get_invoices_by_organization(
+            organization_id=test_organization_id,
+            db=mock_prisma,
+            limit=2,
+            cursor=cursor,
+            include_total=False,
+        )
+
+        find_many_call = mock_prisma.invoice.find_many.call_args
+        assert "skip" not in find_many_call[1]
+        assert find_many_call[1]["take"] == 3  # One extra row to detect has_next
+        assert find_many_call[1]["order"] == [{"createdAt": "desc"}, {"id": "desc"}]
+        filters, keyset = find_many_call[1]["where"]["AND"]
+        assert filters["organizationId"] == test_organization_id
+        assert keyset["OR"][1] == {
+            "createdAt": datetime(2024, 1, 20, 9, 0, 0),
+            "id": {"lt": "test-invoice-id-9"},
+        }
+        mock_prisma.invoice.count.assert_not_called()
+
+        # Extra row is trimmed and used to build the next cursor
+        assert len(result.invoices) == 2
+        assert result.pagination.total is None
+        assert result.pagination.has_next is True
+        assert result.pagination.has_prev is True
+        assert result.pagination.next_cursor == encode_cursor(
+            mock_invoice_list[1].createdAt, mock_invoice_list[1].id
+        )
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_raises_400(
+        self, mock_prisma: Mock, test_organization_id: str
+    ):
+        """Test a malformed cursor is rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            await get_invoices_by_organization(
+                organization_id=test_organization_id,
+                db=mock_prisma,
+                cursor="not-a-cursor",
+            )
+
+        assert exc_info.value.status_code == 400
@@ -0,0 +1,286 @@
+"""
+Tests for bulk remittance uploads in src/domains/remittances/bulk.py
+"""
+
+import zipfile
+from datetime import datetime
+from io import BytesIO
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from prisma.enums import RemittanceStatus
+
+from src.core.jobs import JobPriority
+from src.domains.remittances.bulk import (
+    create_remittances_bulk,
+    get_upload_batch,
+    requeue_pending_uploads,
+)
+from src.domains.remittances.service import process_remittance_background
+
+PDF = b"%PDF-1.4\n" + b"x" * 100
+
+
+def _pdf(filename: str, content: bytes = PDF) -> UploadFile:
+    return UploadFile(
+        filename=filename,
+        file=BytesIO(content),
+        headers={"content-type": "application/pdf"},
+    )
+
+
+def _zip(filename: str, members: dict[str, bytes]) -> UploadFile:
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    buffer.seek(0)
+    return UploadFile(
+        filename=filename, file=buffer, headers={"content-type": "application/zip"}
+    )
+
+
+def _mock_batch(mock_prisma: Mock) -> MagicMock:
+    batcher = MagicMock()
+    batcher.__aenter__.return_value = batcher
+    batcher.__aexit__.return_value = False
+    mock_prisma.batch_ = Mock(return_value=batcher)
+    return batcher
+
+
+async def _store(org_id, content, file_path, content_type):
+    async for _ in content:
+        pass
+    return file_path, True
+
+
+class TestCreateRemittancesBulk:
+    """Test many files are stored and recorded in one batch."""
+
+    @pytest.mark.asyncio
+    @patch("src.domains.remittances.bulk.job_queue")
+    @patch("src.domains.remittances.bulk.store_file_content")
+    async def test_writes_rows_in_one_batch(self, mock_store, mock_queue, mock_prisma):
+        """Test remittances and audit logs are written with create_many."""
+        # Arrange
+        mock_store.side_effect = _store
+        batcher = _mock_batch(mock_prisma)
+        files = [_pdf("a.pdf"), _pdf("b.pdf")]
+
+        # Act
+        result = await create_remittances_bulk(
+            mock_prisma, "test-org-123", "test-user-123", files
+        )
+
+        # Assert
+        assert [item.filename for item in result.accepted] == ["a.pdf", "b.pdf"]
+        assert result.rejected == []
+        mock_prisma.batch_.assert_called_once()
+
+        batch_data = batcher.uploadbatch.create.call_args.kwargs["data"]
+        assert batch_data["id"] == result.batch_id
+        assert batch_data["fileCount"] == 2
+
+        remittances = batcher.remittance.create_many.call_args.kwargs["data"]
+        assert [r["id"] for r in remittances] == [
+            item.remittance_id for item in result.accepted
+        ]
+        assert all(r["uploadBatchId"] == result.batch_id for r in remittances)
+        assert all(r["status"] == RemittanceStatus.Uploaded for r in remittances)
+        assert len(batcher.auditlog.create_many.call_args.kwargs["data"]) == 2
+
+        assert mock_queue.enqueue.call_count == 2
+        call = mock_queue.enqueue.call_args_list[0]
+        assert call.args[0] is process_remittance_background
+        assert call.kwargs["priority"] == JobPriority.LOW
+
+    @pytest.mark.asyncio
+    @patch("src.domains.remittances.bulk.job_queue")
+    @patch("src.domains.remittances.bulk.store_file_content")
+    async def test_expands_zip_and_reports_rejections(
+        self, mock_store, mock_queue, mock_prisma
+    ):
+        """Test ZIP members are uploaded and invalid files are rejected."""
+        # Arrange
+        mock_store.side_effect = _store
+        batcher = _mock_batch(mock_prisma)
+        files = [
+            _zip("bundle.zip", {"one.pdf": PDF, "two.pdf": b"not a pdf"}),
+            _pdf("three.pdf"),
+            UploadFile(
+                filename="notes.txt",
+                file=BytesIO(b"hello"),
+                headers={"content-type": "text/plain"},
+            ),
+        ]
+
+        # Act
+        result = await create_remittances_bulk(
+            mock_prisma,
+            "test-org-123",
+            "test-user-123",
+            files,
+            priority=JobPriority.HIGH,
+        )
+
+        # Assert
+        assert sorted(item.filename for item in result.accepted) == [
+            "one.pdf",
+            "three.pdf",
+        ]
+        assert {r.filename for r in result.rejected} == {"notes.txt", "two.pdf"}
+        assert batcher.uploadbatch.create.call_args.kwargs["data"]["fileCount"] == 4
+        assert all(
+            call.kwargs["priority"] == JobPriority.HIGH
+            for call in mock_queue.enqueue.call_args_list
+        )
+
+    @pytest.mark.asyncio
+    @patch("src.domains.remittances.bulk.settings")
+    async def test_rejects_too_many_files(self, mock_settings, mock_prisma):
+        """Test requests over the file limit fail before anything is stored."""
+        mock_settings.BULK_UPLOAD_MAX_FILES = 1
+        _mock_batch(mock_prisma)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await create_remittances_bulk(
+                mock_prisma, "test-org-123", "user", [_pdf("a.pdf"), _pdf("b.pdf")]
+            )
+
+        assert exc_info.value.status_code == 400
+        mock_prisma.batch_.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("src.domains.remittances.bulk.remove_unreferenced_files")
+    @patch("src.domains.remittances.bulk.job_queue")
+    @patch("src.domains.remittances.bulk.store_file_content")
+    async def test_cleans_up_files_when_batch_fails(
+        self, mock_store, mock_queue, mock_cleanup, mock_prisma
+    ):
+        """Test stored files are removed and no jobs queued if the write fails."""
+        # Arrange
+        mock_store.side_effect = _store
+        batcher = _mock_batch(mock_prisma)
+        batcher.__aexit__.side_effect = Exception("Database error")
+
+        # Act
+        with pytest.raises(HTTPException) as exc_info:
+            await create_remittances_bulk(
+                mock_prisma, "test-org-123", "user", [_pdf("a.pdf")]
+            )
+
+        # Assert
+        assert exc_info.value.status_code == 500
+        mock_cleanup.assert_awaited_once()
+        assert len(mock_cleanup.call_args.args[1]) == 1
+        mock_queue.enqueue.assert_not_called()
+
+
+class TestGetUploadBatch:
+    """Test bulk upload progress polling."""
+
+    @pytest.mark.asyncio
+    async def test_counts_remittances_by_status(self, mock_prisma):
+        """Test progress reports status counts and pending work."""
+        # Arrange
+        mock_prisma.uploadbatch.find_first = AsyncMock(
+            return_value=Mock(
+                id="batch-123",
+                fileCount=4,
+                createdAt=datetime(2024, 1, 15, 9, 0, 0),
+                rejected=[{"filename": "x.txt", "reason": "Not a PDF"}],
+            )
+        )
+        mock_prisma.remittance.group_by = AsyncMock(
+            return_value=[
+                {"status": "Processing", "_count": {"_all": 1}},
+                {"status": "Awaiting_Approval", "_count": {"_all": 2}},
+            ]
+        )
+
+        # Act
+        result = await get_upload_batch(mock_prisma, "test-org-123", "batch-123")
+
+        # Assert
+        assert result.status_counts == {"Processing": 1, "Awaiting_Approval": 2}
+        assert result.pending == 1
+        assert result.complete is False
+        assert result.rejected[0].filename == "x.txt"
+        mock_prisma.uploadbatch.find_first.assert_called_once_with(
+            where={"id": "batch-123", "organizationId": "test-org-123"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_missing_batch_returns_404(self, mock_prisma):
+        """Test batches from other organizations are not found."""
+        mock_prisma.uploadbatch.find_first = AsyncMock(return_value=None)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_upload_batch(mock_prisma, "test-org-123", "batch-123")
+
+        assert exc_info.value.status_code == 404
+
+
+class TestRequeuePendingUploads:
+    """Test bulk uploads lost from the in-memory queue are re-queued."""
+
+    @pytest.mark.asyncio
+    @patch("src.domains.remittances.bulk.job_queue")
+    async def test_requeues_uploaded_batch_remittances(self, mock_queue, mock_prisma):
+        """Test every unprocessed bulk remittance gets a low priority job."""
+        # Arrange
+        mock_prisma.remittance.find_many = AsyncMock(
+            return_value=[
+                Mock(
+                    id="rem-1",
+                    filePath="org/rem-1.pdf",
+                    organizationId="test-org-123",
+                    uploadBatch=Mock(createdBy="user-1"),
+                ),
+                Mock(
+                    id="rem-2",
+                    filePath="org/rem-2.pdf",
+                    organizationId="test-org-123",
+                    uploadBatch=Mock(createdBy=None),
+                ),
+            ]
+        )
+
+        # Act
+        queued = await requeue_pending_uploads(mock_prisma)
+
+        # Assert
+        assert queued == 2
+        where = mock_prisma.remittance.find_many.call_args[1]["where"]
+        assert where["status"] == RemittanceStatus.Uploaded
+        assert where["uploadBatchId"] == {"not": None}
+        first, second = mock_queue.enqueue.call_args_list
+        assert first.args == (
+            process_remittance_background,
+            mock_prisma,
+            "rem-1",
+            "org/rem-1.pdf",
+            "test-org-123",
+            "user-1",
+        )
+        assert first.kwargs == {"priority": JobPriority.LOW}
+        assert second.args[-1] == ""
+
+    @pytest.mark.asyncio
+    async def test_claimed_remittance_is_skipped(self, mock_prisma):
+        """Test a job whose remittance another worker claimed does nothing."""
+        mock_prisma.remittance.update_many = AsyncMock(return_value=0)
+        mock_prisma.remittance.update = AsyncMock()
+
+        with patch("src.domains.remittances.service.storage_service") as storage:
+            await process_remittance_background(
+                mock_prisma, "rem-1", "org/rem-1.pdf", "test-org-123", "user-1"
+            )
+
+        mock_prisma.remittance.update_many.assert_called_once_with(
+            where={"id": "rem-1", "status": RemittanceStatus.Uploaded},
+            data={"status": RemittanceStatus.Processing},
+        )
+        storage.download.assert_not_called()
+        mock_prisma.remittance.update.assert_not_called()
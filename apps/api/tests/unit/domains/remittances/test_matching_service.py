@@ -0,0 +1,44 @@
+"""
+Tests for invoice loading in the remittance MatchingService.
+"""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from prisma.enums import InvoiceStatus
+from prisma.partials import InvoiceMatchFields
+
+from src.domains.remittances.matching.service import MatchingService
+
+
+class TestGetOrganizationInvoices:
+    """Test the matcher loads a lean invoice projection."""
+
+    @pytest.mark.asyncio
+    async def test_selects_match_fields_only(self, mock_prisma: Mock):
+        """Test invoices are fetched through the InvoiceMatchFields partial."""
+        # Arrange
+        organization_id = uuid4()
+        invoice = InvoiceMatchFields(
+            id=str(uuid4()), invoiceNumber="INV-001", total=Decimal("100.00")
+        )
+        mock_prisma.invoice.find_many = AsyncMock(return_value=[invoice])
+
+        # Act
+        invoices = await MatchingService(mock_prisma)._get_organization_invoices(
+            organization_id
+        )
+
+        # Assert
+        assert invoices == [invoice]
+        InvoiceMatchFields.prisma.assert_called_with(mock_prisma)
+        assert set(InvoiceMatchFields.model_fields) == {
+            "id",
+            "invoiceNumber",
+            "total",
+        }
+        where = mock_prisma.invoice.find_many.call_args[1]["where"]
+        assert where["organizationId"] == str(organization_id)
+        assert where["status"] == InvoiceStatus.AUTHORISED
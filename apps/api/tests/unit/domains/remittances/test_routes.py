@@ -150,6 +150,8 @@ class TestListRemittancesRoute:
             date_from=None,
             date_to=None,
             search=None,
+            cursor=None,
+            include_total=True,
             membership=mock_organization_member_admin,
             db=mock_prisma,
         )
@@ -170,6 +172,8 @@ class TestListRemittancesRoute:
             date_from=None,
             date_to=None,
             search=None,
+            cursor=None,
+            include_total=True,
         )
 
     @pytest.mark.asyncio
@@ -196,6 +200,8 @@ class TestListRemittancesRoute:
             date_from="2024-01-01",
             date_to="2024-01-31",
             search="test",
+            cursor=None,
+            include_total=True,
             membership=mock_organization_member_admin,
             db=mock_prisma,
         )
@@ -213,6 +219,8 @@ class TestListRemittancesRoute:
             date_from="2024-01-01",
             date_to="2024-01-31",
             search="test",
+            cursor=None,
+            include_total=True,
         )
 
     @pytest.mark.asyncio
@@ -260,6 +268,7 @@ class TestGetRemittanceRoute:
         result = await get_remittance(
             org_id="test-org-123",
             remittance_id="test-remittance-id-456",
+            include_extraction=False,
             membership=mock_organization_member_admin,
             db=mock_prisma,
         )
@@ -274,6 +283,7 @@ class TestGetRemittanceRoute:
             db=mock_prisma,
             org_id="test-org-123",
             remittance_id="test-remittance-id-456",
+            include_extraction=False,
         )
 
     @pytest.mark.asyncio
@@ -296,6 +306,7 @@ class TestGetRemittanceRoute:
             await get_remittance(
                 org_id="test-org-123",
                 remittance_id="nonexistent-id",
+                include_extraction=False,
                 membership=mock_organization_member_admin,
                 db=mock_prisma,
             )
@@ -4,6 +4,7 @@ Tests for remittance service functions in src/domains/remittances/service.py
 Tests file upload, validation, CRUD operations, and business logic.
 """
 
+from datetime import datetime
 from decimal import Decimal
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -11,8 +12,12 @@ import pytest
 from fastapi import HTTPException
 from prisma.enums import RemittanceStatus
 from prisma.errors import PrismaError
+from prisma.partials import RemittanceListItem
 
+from src.core.settings import settings
+from src.core.storage import StorageError, StoredObject
 from src.domains.remittances.models import (
+    FileUrlBatchResponse,
     FileUrlResponse,
     RemittanceDetailResponse,
     RemittanceListResponse,
@@ -23,12 +28,16 @@ from src.domains.remittances.service import (
     create_remittance,
     generate_file_path,
     get_file_url,
+    get_file_urls,
     get_remittance_by_id,
+    get_remittance_extraction,
     get_remittances_by_organization,
+    store_file_content,
     update_remittance,
     upload_file_to_storage_with_content,
     validate_file,
 )
+from src.shared.pagination import encode_cursor
 
 # Fixtures are passed as parameters to test methods
 
@@ -91,35 +100,30 @@ class TestFileUpload:
     """Test file upload to Supabase Storage."""
 
     @pytest.mark.asyncio
-    @patch("src.domains.remittances.service.supabase")
+    @patch("src.domains.remittances.service.storage_service")
     async def test_upload_file_to_storage_with_content_success(
-        self, mock_supabase, mock_pdf_file
+        self, mock_storage, mock_pdf_file
     ):
         """Test successful file upload to storage."""
-        # Mock Supabase response
-        mock_response = Mock()
-        mock_response.error = None
-        mock_supabase.storage.from_.return_value.upload.return_value = mock_response
-
         file_path = "test-org/2024/01/test-uuid"
+        mock_storage.upload = AsyncMock(return_value=file_path)
+
         result = await upload_file_to_storage_with_content(
             b"pdf content", file_path, "application/pdf"
         )
 
         assert result == file_path
-        mock_supabase.storage.from_.assert_called_with("remittances")
+        mock_storage.upload.assert_awaited_once_with(
+            file_path, b"pdf content", "application/pdf"
+        )
 
     @pytest.mark.asyncio
-    @patch("src.domains.remittances.service.supabase")
+    @patch("src.domains.remittances.service.storage_service")
     async def test_upload_file_to_storage_with_content_error(
-        self, mock_supabase, mock_pdf_file
+        self, mock_storage, mock_pdf_file
     ):
         """Test file upload error handling."""
-        # Mock Supabase error
-        mock_response = Mock()
-        mock_response.error = Mock()
-        mock_response.error.message = "Storage error"
-        mock_supabase.storage.from_.return_value.upload.return_value = mock_response
+        mock_storage.upload = AsyncMock(side_effect=StorageError("Storage error"))
 
         with pytest.raises(HTTPException) as exc_info:
             await upload_file_to_storage_with_content(
@@ -127,19 +131,19 @@ class TestFileUpload:
             )
 
         assert exc_info.value.status_code == 500
-        assert "Failed to upload file" in str(exc_info.value.detail)
+        assert "File upload failed" in str(exc_info.value.detail)
 
 
 class TestCreateRemittance:
     """Test remittance creation."""
 
     @pytest.mark.asyncio
-    @patch("src.domains.remittances.service.upload_file_to_storage_with_content")
+    @patch("src.domains.remittances.service.store_file_content")
     @patch("src.domains.remittances.service.generate_file_path")
     async def test_create_remittance_success(
         self,
         mock_generate_path,
-        mock_upload,
+        mock_store,
         mock_prisma,
         mock_pdf_file,
         mock_remittance_uploaded,
@@ -149,7 +153,7 @@ class TestCreateRemittance:
         mock_generate_path.return_value = ("test-path", "test-uuid")
 
         # Mock file upload
-        mock_upload.return_value = "test-path"
+        mock_store.return_value = ("test-path", True)
 
         # Mock database operations
         mock_prisma.remittance.create = AsyncMock(return_value=mock_remittance_uploaded)
@@ -176,22 +180,23 @@ class TestCreateRemittance:
         mock_prisma.auditlog.create.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch("src.domains.remittances.service.upload_file_to_storage_with_content")
+    @patch("src.domains.remittances.service.store_file_content")
     @patch("src.domains.remittances.service.generate_file_path")
-    @patch("src.domains.remittances.service.supabase")
+    @patch("src.domains.remittances.service.storage_service")
     async def test_create_remittance_db_error_cleanup(
-        self, mock_supabase, mock_generate_path, mock_upload, mock_prisma, mock_pdf_file
+        self, mock_storage, mock_generate_path, mock_store, mock_prisma, mock_pdf_file
     ):
         """Test database error with file cleanup."""
         # Mock path generation and upload
         mock_generate_path.return_value = ("test-path", "test-uuid")
-        mock_upload.return_value = "test-path"
+        mock_store.return_value = ("test-path", True)
 
         # Mock database error
         mock_prisma.remittance.create = AsyncMock(side_effect=PrismaError("DB error"))
+        mock_prisma.remittance.count = AsyncMock(return_value=0)
 
-        # Mock supabase cleanup
-        mock_supabase.storage.from_.return_value.remove.return_value = None
+        # Mock storage cleanup
+        mock_storage.remove = AsyncMock()
 
         # Mock background tasks
         from fastapi import BackgroundTasks
@@ -211,7 +216,143 @@ class TestCreateRemittance:
         assert "Failed to create remittance record" in str(exc_info.value.detail)
 
         # Verify cleanup was attempted
-        mock_supabase.storage.from_.assert_called_with("remittances")
+        mock_storage.remove.assert_awaited_once_with(["test-path"])
+
+    @pytest.mark.asyncio
+    @patch("src.domains.remittances.service.store_file_content")
+    @patch("src.domains.remittances.service.storage_service")
+    async def test_create_remittance_db_error_keeps_shared_file(
+        self, mock_storage, mock_store, mock_prisma, mock_pdf_file
+    ):
+        """Test a deduplicated file that already existed is not cleaned up."""
+        # Arrange
+        mock_store.return_value = ("test-org-123/sha256/ab/abcd", False)
+        mock_prisma.remittance.create = AsyncMock(side_effect=PrismaError("DB error"))
+        mock_storage.remove = AsyncMock()
+
+        from fastapi import BackgroundTasks
+
+        # Act
+        with pytest.raises(HTTPException):
+            await create_remittance(
+                mock_prisma,
+                "test-org-123",
+                "test-user-123",
+                mock_pdf_file,
+                BackgroundTasks(),
+            )
+
+        # Assert
+        mock_storage.remove.assert_not_awaited()
+
+
+class TestCreateRemittanceStreaming:
+    """Test uploads are sniffed and streamed to storage."""
+
+    @pytest.mark.asyncio
+    @patch("src.domains.remittances.service.storage_service")
+    async def test_rejects_non_pdf_content(self, mock_storage, mock_prisma):
+        """Test a file labelled as PDF without a PDF header is not stored."""
+        # Arrange
+        from io import BytesIO
+
+        from fastapi import BackgroundTasks, UploadFile
+
+        file = UploadFile(
+            filename="fake.pdf",
+            file=BytesIO(b"MZ\x90\x00 not a pdf"),
+            headers={"content-type": "application/pdf"},
+        )
+        mock_storage.upload_deduplicated = AsyncMock()
+
+        # Act
+        with pytest.raises(HTTPException) as exc_info:
+            await create_remittance(
+                mock_prisma, "test-org-123", "test-user-123", file, BackgroundTasks()
+            )
+
+        # Assert
+        assert exc_info.value.status_code == 400
+        mock_storage.upload_deduplicated.assert_not_awaited()
+        mock_prisma.remittance.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("src.domains.remittances.service.store_file_content")
+    async def test_streams_file_and_queues_stored_path(
+        self, mock_store, mock_prisma, mock_pdf_file, mock_remittance_uploaded
+    ):
+        """Test the file is passed to storage as chunks, not read up front."""
+        # Arrange
+        from fastapi import BackgroundTasks
+
+        received = bytearray()
+
+        async def store(org_id, content, file_path, content_type):
+            async for chunk in content:
+                received.extend(chunk)
+            return "test-org-123/sha256/ab/abcd", True
+
+        mock_store.side_effect = store
+        mock_prisma.remittance.create = AsyncMock(return_value=mock_remittance_uploaded)
+        mock_prisma.auditlog.create = AsyncMock()
+        background_tasks = BackgroundTasks()
+
+        # Act
+        await create_remittance(
+            mock_prisma,
+            "test-org-123",
+            "test-user-123",
+            mock_pdf_file,
+            background_tasks,
+        )
+
+        # Assert
+        assert bytes(received).startswith(b"%PDF-1.4")
+        assert background_tasks.tasks[0].args[2] == "test-org-123/sha256/ab/abcd"
+
+
+class TestStoreFileContent:
+    """Test uploads are stored content-addressed when deduplication is on."""
+
+    @pytest.mark.asyncio
+    @patch("src.domains.remittances.service.storage_service")
+    async def test_deduplicated_upload(self, mock_storage):
+        """Test the content-addressed path is used when enabled."""
+        # Arrange
+        mock_storage.upload_deduplicated = AsyncMock(
+            return_value=StoredObject("org/sha256/ab/abcd", "abcd", 3, created=False)
+        )
+
+        # Act
+        with patch.object(settings, "STORAGE_DEDUPLICATE", True):
+            result = await store_file_content(
+                "org", b"pdf", "org/2024/01/uuid", "application/pdf"
+            )
+
+        # Assert
+        assert result == ("org/sha256/ab/abcd", False)
+        mock_storage.upload_deduplicated.assert_awaited_once_with(
+            "org", b"pdf", "application/pdf"
+        )
+
+    @pytest.mark.asyncio
+    @patch("src.domains.remittances.service.storage_service")
+    async def test_plain_upload_when_disabled(self, mock_storage):
+        """Test the generated path is used when deduplication is off."""
+        # Arrange
+        mock_storage.upload = AsyncMock(return_value="org/2024/01/uuid")
+
+        # Act
+        with patch.object(settings, "STORAGE_DEDUPLICATE", False):
+            result = await store_file_content(
+                "org", b"pdf", "org/2024/01/uuid", "application/pdf"
+            )
+
+        # Assert
+        assert result == ("org/2024/01/uuid", True)
+        mock_storage.upload.assert_awaited_once_with(
+            "org/2024/01/uuid", b"pdf", "application/pdf"
+        )
 
 
 class TestGetRemittancesList:
@@ -235,6 +376,22 @@ class TestGetRemittancesList:
         assert result.page_size == 50
         assert len(result.remittances) == 1
 
+    @pytest.mark.asyncio
+    async def test_get_remittances_skips_extracted_json(
+        self, mock_prisma, mock_remittance_uploaded
+    ):
+        """Test listings select list columns only, never the extraction."""
+        mock_prisma.remittance.count = AsyncMock(return_value=1)
+        mock_prisma.remittance.find_many = AsyncMock(
+            return_value=[mock_remittance_uploaded]
+        )
+
+        await get_remittances_by_organization(mock_prisma, "test-org-123")
+
+        RemittanceListItem.prisma.assert_called_with(mock_prisma)
+        assert "extraction" not in RemittanceListItem.model_fields
+        assert "lines" not in RemittanceListItem.model_fields
+
     @pytest.mark.asyncio
     async def test_get_remittances_with_status_filter(
         self, mock_prisma, mock_remittance_uploaded
@@ -304,12 +461,91 @@ class TestGetRemittancesList:
         mock_prisma.remittance.find_many = AsyncMock(
             return_value=[mock_remittance_uploaded]
         )
+        mock_prisma.query_raw = AsyncMock(
+            side_effect=lambda sql, *args: (
+                [{"total": 1}]
+                if sql.startswith("SELECT count(")
+                else [{"id": mock_remittance_uploaded.id}]
+            )
+        )
 
         result = await get_remittances_by_organization(
-            mock_prisma, "test-org-123", search="test"
+            mock_prisma, "test-org-123", status_filter="Uploaded", search="test"
         )
 
+        sql, *args = mock_prisma.query_raw.call_args_list[0][0]
+        assert '"filename" ILIKE $2' in sql
+        assert '"reference" ILIKE $2' in sql
+        assert '"status"::text = $3' in sql
+        assert args == ["test-org-123", "%test%", "Uploaded", "test", 50, 0]
+        where_clause = mock_prisma.remittance.find_many.call_args[1]["where"]
+        assert where_clause["id"] == {"in": [mock_remittance_uploaded.id]}
+        mock_prisma.remittance.count.assert_not_called()
         assert result.total == 1
+        assert result.total_pages == 1
+        assert result.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_get_remittances_search_rejects_cursor(self, mock_prisma):
+        """Test a cursor cannot be combined with relevance-ordered search."""
+        mock_prisma.query_raw = AsyncMock()
+        cursor = encode_cursor(datetime(2024, 1, 1), "rem-1")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_remittances_by_organization(
+                mock_prisma, "test-org-123", search="test", cursor=cursor
+            )
+
+        assert exc_info.value.status_code == 400
+        mock_prisma.query_raw.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_remittances_without_total(
+        self, mock_prisma, mock_remittance_uploaded
+    ):
+        """Test skipping the total derives has_next from one extra row."""
+        mock_prisma.remittance.count = AsyncMock(return_value=2)
+        mock_prisma.remittance.find_many = AsyncMock(
+            return_value=[mock_remittance_uploaded, mock_remittance_uploaded]
+        )
+
+        result = await get_remittances_by_organization(
+            mock_prisma, "test-org-123", page_size=1, include_total=False
+        )
+
+        call_args = mock_prisma.remittance.find_many.call_args[1]
+        assert call_args["take"] == 2
+        # Offset pages hand out a keyset cursor, so they use the same order
+        assert call_args["order"] == [{"createdAt": "desc"}, {"id": "desc"}]
+        mock_prisma.remittance.count.assert_not_called()
+        assert result.total is None
+        assert result.total_pages is None
+        assert result.has_next is True
+        assert result.next_cursor is not None
+        assert len(result.remittances) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_remittances_next_page_by_cursor(
+        self, mock_prisma, mock_remittance_uploaded
+    ):
+        """Test following next_cursor uses keyset pagination."""
+        mock_prisma.remittance.count = AsyncMock(return_value=1)
+        mock_prisma.remittance.find_many = AsyncMock(
+            return_value=[mock_remittance_uploaded]
+        )
+
+        result = await get_remittances_by_organization(
+            mock_prisma,
+            "test-org-123",
+            cursor=encode_cursor(datetime(2024, 2, 1), "last-remittance-id"),
+        )
+
+        call_args = mock_prisma.remittance.find_many.call_args[1]
+        assert "skip" not in call_args
+        assert call_args["order"] == [{"createdAt": "desc"}, {"id": "desc"}]
+        assert call_args["where"]["AND"][0]["organizationId"] == "test-org-123"
+        assert result.has_next is False
+        assert result.next_cursor is None
 
 
 class TestGetRemittanceById:
@@ -362,6 +598,87 @@ class TestGetRemittanceById:
         assert exc_info.value.status_code == 404
         assert "Remittance not found" in str(exc_info.value.detail)
 
+    @pytest.mark.asyncio
+    async def test_get_remittance_skips_extraction_by_default(
+        self, mock_prisma, mock_remittance_processed
+    ):
+        """Test the extraction output is only joined when requested."""
+        mock_prisma.remittance.find_unique = AsyncMock(
+            return_value=mock_remittance_processed
+        )
+
+        result = await get_remittance_by_id(
+            mock_prisma, "test-org-123", "test-remittance-id-456"
+        )
+
+        include = mock_prisma.remittance.find_unique.call_args[1]["include"]
+        assert include == {"lines": True, "extraction": False}
+        assert result.extraction is None
+
+    @pytest.mark.asyncio
+    async def test_get_remittance_with_extraction(
+        self, mock_prisma, mock_remittance_processed
+    ):
+        """Test include_extraction joins the raw extraction output."""
+        extraction = Mock()
+        extraction.remittanceId = "test-remittance-id-456"
+        extraction.rawJson = {"payments": []}
+        extraction.createdAt = datetime(2024, 1, 15, 9, 0, 0)
+        extraction.updatedAt = datetime(2024, 1, 15, 9, 0, 0)
+        mock_remittance_processed.extraction = extraction
+        mock_prisma.remittance.find_unique = AsyncMock(
+            return_value=mock_remittance_processed
+        )
+
+        result = await get_remittance_by_id(
+            mock_prisma,
+            "test-org-123",
+            "test-remittance-id-456",
+            include_extraction=True,
+        )
+
+        include = mock_prisma.remittance.find_unique.call_args[1]["include"]
+        assert include["extraction"] is True
+        assert result.extraction is not None
+        assert result.extraction.raw_json == {"payments": []}
+
+
+class TestGetRemittanceExtraction:
+    """Test loading the raw extraction output on demand."""
+
+    @pytest.mark.asyncio
+    async def test_get_extraction_scoped_to_organization(self, mock_prisma):
+        """Test the extraction is looked up through the owning organization."""
+        extraction = Mock()
+        extraction.remittanceId = "test-remittance-id-456"
+        extraction.rawJson = {"payments": []}
+        extraction.createdAt = None
+        extraction.updatedAt = None
+        mock_prisma.remittanceextraction.find_first = AsyncMock(return_value=extraction)
+
+        result = await get_remittance_extraction(
+            mock_prisma, "test-org-123", "test-remittance-id-456"
+        )
+
+        where = mock_prisma.remittanceextraction.find_first.call_args[1]["where"]
+        assert where == {
+            "remittanceId": "test-remittance-id-456",
+            "remittance": {"is": {"organizationId": "test-org-123"}},
+        }
+        assert result.remittance_id == "test-remittance-id-456"
+
+    @pytest.mark.asyncio
+    async def test_get_extraction_not_found(self, mock_prisma):
+        """Test a missing extraction returns 404."""
+        mock_prisma.remittanceextraction.find_first = AsyncMock(return_value=None)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_remittance_extraction(
+                mock_prisma, "test-org-123", "test-remittance-id-456"
+            )
+
+        assert exc_info.value.status_code == 404
+
 
 class TestUpdateRemittance:
     """Test remittance update operations."""
@@ -398,6 +715,33 @@ class TestUpdateRemittance:
         mock_prisma.remittance.update.assert_called_once()
         mock_prisma.auditlog.create.assert_called_once()
 
+    @pytest.mark.asyncio
+    @patch("src.domains.remittances.service.count_cache")
+    async def test_status_change_invalidates_counts(
+        self,
+        mock_count_cache,
+        mock_prisma,
+        mock_remittance_uploaded,
+        mock_remittance_processed,
+    ):
+        """Test a status change drops cached listing totals."""
+        mock_prisma.remittance.find_unique = AsyncMock(
+            return_value=mock_remittance_uploaded
+        )
+        mock_prisma.remittance.update = AsyncMock(
+            return_value=mock_remittance_processed
+        )
+
+        await update_remittance(
+            mock_prisma,
+            "test-org-123",
+            "test-user-123",
+            "test-remittance-id-123",
+            RemittanceUpdateRequest(status=RemittanceStatus.Data_Retrieved),
+        )
+
+        mock_count_cache.invalidate.assert_called_once_with("remittance")
+
     @pytest.mark.asyncio
     async def test_update_remittance_not_found(self, mock_prisma):
         """Test update of non-existent remittance."""
@@ -447,20 +791,19 @@ class TestGetFileUrl:
     """Test getting signed URL for remittance files."""
 
     @pytest.mark.asyncio
-    @patch("src.domains.remittances.service.supabase")
+    @patch("src.domains.remittances.service.signed_url_cache")
     async def test_get_file_url_success(
-        self, mock_supabase, mock_prisma, mock_remittance_uploaded
+        self, mock_cache, mock_prisma, mock_remittance_uploaded
     ):
         """Test successful signed URL generation."""
         mock_prisma.remittance.find_unique = AsyncMock(
             return_value=mock_remittance_uploaded
         )
 
-        # Mock Supabase response
-        mock_supabase.storage.from_.return_value.create_signed_url.return_value = {
-            "signedURL": "https://supabase.co/signed-url",
-            "error": None,
-        }
+        # Mock cached signed URL with its remaining lifetime
+        mock_cache.get = AsyncMock(
+            return_value=("https://supabase.co/signed-url", 1800)
+        )
 
         result = await get_file_url(
             mock_prisma, "test-org-123", "test-remittance-id-123"
@@ -468,7 +811,8 @@ class TestGetFileUrl:
 
         assert isinstance(result, FileUrlResponse)
         assert result.url == "https://supabase.co/signed-url"
-        assert result.expires_in == 3600
+        assert result.expires_in == 1800
+        mock_cache.get.assert_called_once_with(mock_remittance_uploaded.filePath)
 
     @pytest.mark.asyncio
     async def test_get_file_url_remittance_not_found(self, mock_prisma):
@@ -498,20 +842,17 @@ class TestGetFileUrl:
         assert "File not found" in str(exc_info.value.detail)
 
     @pytest.mark.asyncio
-    @patch("src.domains.remittances.service.supabase")
+    @patch("src.domains.remittances.service.signed_url_cache")
     async def test_get_file_url_supabase_error(
-        self, mock_supabase, mock_prisma, mock_remittance_uploaded
+        self, mock_cache, mock_prisma, mock_remittance_uploaded
     ):
         """Test signed URL generation with Supabase error."""
         mock_prisma.remittance.find_unique = AsyncMock(
             return_value=mock_remittance_uploaded
         )
 
-        # Mock Supabase error
-        mock_supabase.storage.from_.return_value.create_signed_url.return_value = {
-            "signedURL": None,
-            "error": {"message": "Storage error"},
-        }
+        # Mock storage error
+        mock_cache.get = AsyncMock(side_effect=StorageError("Storage error"))
 
         with pytest.raises(HTTPException) as exc_info:
             await get_file_url(mock_prisma, "test-org-123", "test-remittance-id-123")
@@ -520,6 +861,53 @@ class TestGetFileUrl:
         assert "Failed to generate file URL" in str(exc_info.value.detail)
 
 
+class TestGetFileUrls:
+    """Test batch signed URL generation for list views."""
+
+    @pytest.mark.asyncio
+    @patch("src.domains.remittances.service.signed_url_cache")
+    async def test_get_file_urls_success(self, mock_cache, mock_prisma):
+        """Test URLs are returned per remittance from one batch lookup."""
+        # Arrange
+        first = Mock(id="rem-1", filePath="org/2024/01/a")
+        second = Mock(id="rem-2", filePath="org/2024/01/b")
+        mock_prisma.remittance.find_many = AsyncMock(return_value=[first, second])
+        mock_cache.get_many = AsyncMock(
+            return_value={"org/2024/01/a": ("https://signed/a", 3600)}
+        )
+
+        # Act
+        result = await get_file_urls(
+            mock_prisma, "test-org-123", ["rem-1", "rem-2", "rem-3"]
+        )
+
+        # Assert
+        assert isinstance(result, FileUrlBatchResponse)
+        assert list(result.urls) == ["rem-1"]
+        assert result.urls["rem-1"].url == "https://signed/a"
+        mock_cache.get_many.assert_called_once_with(["org/2024/01/a", "org/2024/01/b"])
+        where = mock_prisma.remittance.find_many.call_args[1]["where"]
+        assert where["organizationId"] == "test-org-123"
+        assert where["id"] == {"in": ["rem-1", "rem-2", "rem-3"]}
+
+    @pytest.mark.asyncio
+    @patch("src.domains.remittances.service.signed_url_cache")
+    async def test_get_file_urls_storage_error(self, mock_cache, mock_prisma):
+        """Test storage failures surface as a 500."""
+        # Arrange
+        mock_prisma.remittance.find_many = AsyncMock(
+            return_value=[Mock(id="rem-1", filePath="org/2024/01/a")]
+        )
+        mock_cache.get_many = AsyncMock(side_effect=StorageError("Storage error"))
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            await get_file_urls(mock_prisma, "test-org-123", ["rem-1"])
+
+        assert exc_info.value.status_code == 500
+        assert "Failed to generate file URLs" in str(exc_info.value.detail)
+
+
 class TestApproveRemittance:
     """Test remittance approval functionality with batch payment creation."""
 
@@ -103,10 +103,8 @@ class TestRemittanceApprovalWithUpload:
         mock_prisma.auditlog.create.return_value = Mock()
 
         # Mock Supabase file download
-        with patch("src.domains.remittances.service.supabase") as mock_supabase:
-            mock_supabase.storage.from_.return_value.download.return_value = (
-                mock_file_content
-            )
+        with patch("src.domains.remittances.service.storage_service") as mock_storage:
+            mock_storage.download = AsyncMock(return_value=mock_file_content)
 
             # Mock integration factory and data service
             with patch(
@@ -162,12 +160,8 @@ class TestRemittanceApprovalWithUpload:
                         # Assert
                         assert result == mock_final_remittance
 
-                        # Verify file was downloaded from Supabase
-                        mock_supabase.storage.from_.assert_called_with("remittances")
-                        download_call = (
-                            mock_supabase.storage.from_.return_value.download
-                        )
-                        download_call.assert_called_with(
+                        # Verify file was downloaded from storage
+                        mock_storage.download.assert_awaited_with(
                             "test-org-123/2024/01/test-file.pdf"
                         )
 
@@ -236,10 +230,8 @@ class TestRemittanceApprovalWithUpload:
         mock_prisma.auditlog.create.return_value = Mock()
 
         # Mock Supabase file download failure
-        with patch("src.domains.remittances.service.supabase") as mock_supabase:
-            mock_supabase.storage.from_.return_value.download.side_effect = Exception(
-                "File not found"
-            )
+        with patch("src.domains.remittances.service.storage_service") as mock_storage:
+            mock_storage.download = AsyncMock(side_effect=Exception("File not found"))
 
             # Mock integration factory and data service
             with patch(
@@ -325,10 +317,8 @@ class TestRemittanceApprovalWithUpload:
         mock_prisma.auditlog.create.return_value = Mock()
 
         # Mock successful file download
-        with patch("src.domains.remittances.service.supabase") as mock_supabase:
-            mock_supabase.storage.from_.return_value.download.return_value = (
-                mock_file_content
-            )
+        with patch("src.domains.remittances.service.storage_service") as mock_storage:
+            mock_storage.download = AsyncMock(return_value=mock_file_content)
 
             # Mock integration factory and data service
             with patch(
@@ -501,6 +491,8 @@ class TestRemittanceApprovalWithUpload:
                     # Verify upload_attachment was NOT called
                     mock_data_service.upload_attachment.assert_not_called()
 
-                    # Verify Supabase download was NOT attempted
-                    with patch("src.domains.remittances.service.supabase") as mock_sb:
-                        mock_sb.storage.from_.return_value.download.assert_not_called()
+                    # Verify storage download was NOT attempted
+                    with patch(
+                        "src.domains.remittances.service.storage_service"
+                    ) as mock_storage:
+                        mock_storage.download.assert_not_called()
@@ -0,0 +1,150 @@
+"""
+Tests for batch payment status reconciliation across an organization.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from prisma.enums import BatchPaymentStatus, RemittanceStatus
+
+from src.domains.external_accounting.xero.types import BatchPaymentStatusResult
+from src.domains.remittances.service import sync_all_pending_batch_payments
+
+
+def _status_result(
+    batch_id: str, status: str, found: bool = True
+) -> BatchPaymentStatusResult:
+    """Build a batch payment status result."""
+    return BatchPaymentStatusResult(
+        batch_id=batch_id,
+        status=status,
+        is_reconciled=status == "AUTHORISED",
+        last_updated="",
+        found=found,
+    )
+
+
+class TestSyncAllPendingBatchPayments:
+    """Test suite for sync_all_pending_batch_payments."""
+
+    @pytest.fixture
+    def mock_batcher(self, mock_prisma: Mock) -> Mock:
+        """Batch context returned by db.batch_()."""
+        batcher = Mock()
+        batch_context = MagicMock()
+        batch_context.__aenter__ = AsyncMock(return_value=batcher)
+        batch_context.__aexit__ = AsyncMock(return_value=None)
+        mock_prisma.batch_ = Mock(return_value=batch_context)
+        return batcher
+
+    @pytest.fixture
+    def pending_remittances(self) -> list:
+        """Remittances awaiting a status check."""
+        remittances = []
+        for index in range(3):
+            remittance = Mock()
+            remittance.id = f"remittance-{index}"
+            remittance.xeroBatchId = f"batch-{index}"
+            remittances.append(remittance)
+        return remittances
+
+    @pytest.mark.asyncio
+    async def test_filters_pending_remittances_in_query(
+        self, mock_prisma: Mock
+    ) -> None:
+        """Test status and staleness filters are applied by the database."""
+        # Arrange
+        mock_prisma.remittance.find_many = AsyncMock(return_value=[])
+
+        with patch(
+            "src.domains.remittances.service.IntegrationFactory"
+        ) as mock_factory_class:
+            # Act
+            await sync_all_pending_batch_payments(mock_prisma, "test-org-123")
+
+            # Assert
+            where = mock_prisma.remittance.find_many.call_args[1]["where"]
+            assert where["organizationId"] == "test-org-123"
+            assert where["status"] == {
+                "in": [
+                    RemittanceStatus.Exported_Unreconciled,
+                    RemittanceStatus.Exporting,
+                ]
+            }
+            assert {"lastStatusCheck": None} in where["OR"]
+
+            # Nothing pending, so no integration lookup
+            mock_factory_class.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fetches_statuses_once_and_writes_in_one_batch(
+        self,
+        mock_prisma: Mock,
+        mock_batcher: Mock,
+        pending_remittances: list,
+    ) -> None:
+        """Test the data service is resolved once and updates are batched."""
+        # Arrange
+        mock_prisma.remittance.find_many = AsyncMock(return_value=pending_remittances)
+
+        mock_data_service = Mock()
+        mock_data_service.get_batch_payment_statuses = AsyncMock(
+            return_value={
+                "batch-0": _status_result("batch-0", "AUTHORISED"),
+                "batch-1": _status_result("batch-1", "DELETED"),
+                "batch-2": _status_result("batch-2", "", found=False),
+            }
+        )
+
+        with patch(
+            "src.domains.remittances.service.IntegrationFactory"
+        ) as mock_factory_class:
+            mock_factory = Mock()
+            mock_factory.get_data_service = AsyncMock(return_value=mock_data_service)
+            mock_factory_class.return_value = mock_factory
+
+            # Act
+            await sync_all_pending_batch_payments(mock_prisma, "test-org-123")
+
+            # Assert
+            mock_factory.get_data_service.assert_awaited_once_with("test-org-123")
+            mock_data_service.get_batch_payment_statuses.assert_awaited_once_with(
+                "test-org-123", ["batch-0", "batch-1", "batch-2"]
+            )
+
+            # Only found batch payments are written, all in one batch
+            mock_prisma.batch_.assert_called_once()
+            assert mock_batcher.remittance.update.call_count == 2
+            mock_prisma.remittance.update.assert_not_called()
+
+            first_update = mock_batcher.remittance.update.call_args_list[0][1]
+            assert first_update["where"] == {"id": "remittance-0"}
+            assert (
+                first_update["data"]["batchPaymentStatus"]
+                == BatchPaymentStatus.AUTHORISED
+            )
+            assert first_update["data"]["isReconciled"] is True
+
+    @pytest.mark.asyncio
+    async def test_no_integration_skips_sync(
+        self,
+        mock_prisma: Mock,
+        mock_batcher: Mock,
+        pending_remittances: list,
+    ) -> None:
+        """Test nothing is written when the org has no integration."""
+        # Arrange
+        mock_prisma.remittance.find_many = AsyncMock(return_value=pending_remittances)
+
+        with patch(
+            "src.domains.remittances.service.IntegrationFactory"
+        ) as mock_factory_class:
+            mock_factory = Mock()
+            mock_factory.get_data_service = AsyncMock(return_value=None)
+            mock_factory_class.return_value = mock_factory
+
+            # Act
+            await sync_all_pending_batch_payments(mock_prisma, "test-org-123")
+
+            # Assert
+            mock_prisma.batch_.assert_not_called()
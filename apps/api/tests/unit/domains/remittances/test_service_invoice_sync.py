@@ -137,38 +137,36 @@ class TestInvoiceSyncAfterBatchPayment:
             },
         }
 
+    @pytest.fixture
+    def mock_updated_invoices(self, mock_xero_invoice_responses: dict) -> list:
+        """All updated invoices as returned by a single bulk fetch."""
+        return [
+            invoice
+            for response in mock_xero_invoice_responses.values()
+            for invoice in response["Invoices"]
+        ]
+
     @pytest.mark.asyncio
     async def test_sync_batch_payment_invoices_success(
         self,
         mock_prisma: Mock,
         mock_matched_invoices: list,
-        mock_xero_invoice_responses: dict,
+        mock_updated_invoices: list,
     ) -> None:
-        """Test successful invoice sync for all invoices."""
+        """Test all invoices are fetched and upserted in a single batch."""
         # Arrange
         org_id = "test-org-123"
 
-        # Mock data service
         mock_data_service = AsyncMock()
+        mock_data_service.get_invoices_by_ids.return_value = mock_updated_invoices
 
-        # Configure data service to return updated invoices
-        async def get_invoices_side_effect(org_id, filters, invoice_id=None):
-            if invoice_id in mock_xero_invoice_responses:
-                return mock_xero_invoice_responses[invoice_id]["Invoices"]
-            return []
-
-        mock_data_service.get_invoices.side_effect = get_invoices_side_effect
-
-        # Mock SyncOrchestrator
         with patch(
             "src.domains.remittances.service.SyncOrchestrator"
         ) as mock_orchestrator_class:
             mock_orchestrator = Mock()
+            mock_orchestrator._batch_upsert_invoices = AsyncMock(return_value=3)
             mock_orchestrator_class.return_value = mock_orchestrator
 
-            # Mock successful upsert
-            mock_orchestrator._upsert_invoices.return_value = AsyncMock()
-
             # Act
             await _sync_batch_payment_invoices(
                 db=mock_prisma,
@@ -178,72 +176,40 @@ class TestInvoiceSyncAfterBatchPayment:
             )
 
             # Assert
-            # Verify get_invoices was called for each invoice
-            assert mock_data_service.get_invoices.call_count == 3
-
-            # Verify each invoice was fetched with correct parameters
-            get_invoices_calls = mock_data_service.get_invoices.call_args_list
-            expected_invoice_ids = [
-                "xero-invoice-1",
-                "xero-invoice-2",
-                "xero-invoice-3",
-            ]
-
-            for i, call in enumerate(get_invoices_calls):
-                args, kwargs = call
-                assert kwargs.get("org_id") == org_id  # org_id passed as keyword
-                assert kwargs.get("invoice_id") == expected_invoice_ids[i]
-
-            # Verify SyncOrchestrator was created
-            mock_orchestrator_class.assert_called_once_with(mock_prisma)
-
-            # Verify _upsert_invoices was called for each successful fetch
-            assert mock_orchestrator._upsert_invoices.call_count == 3
+            # One bulk fetch covering every touched invoice
+            mock_data_service.get_invoices_by_ids.assert_awaited_once_with(
+                org_id, ["xero-invoice-1", "xero-invoice-2", "xero-invoice-3"]
+            )
+            mock_data_service.get_invoices.assert_not_called()
 
-            # Verify each upsert call had correct parameters
-            upsert_calls = mock_orchestrator._upsert_invoices.call_args_list
-            for call in upsert_calls:
-                args, kwargs = call
-                assert args[0] == org_id  # org_id parameter
-                assert len(args[1]) == 1  # Single invoice in list
+            # One batched upsert with every returned invoice
+            mock_orchestrator_class.assert_called_once_with(mock_prisma)
+            mock_orchestrator._batch_upsert_invoices.assert_awaited_once_with(
+                org_id, mock_updated_invoices
+            )
 
     @pytest.mark.asyncio
-    async def test_sync_partial_failure(
+    async def test_sync_fetch_failure(
         self,
         mock_prisma: Mock,
         mock_matched_invoices: list,
-        mock_xero_invoice_responses: dict,
     ) -> None:
-        """Test when some invoices fail to sync."""
+        """Test a failed bulk fetch is logged and nothing is upserted."""
         # Arrange
         org_id = "test-org-123"
 
-        # Mock data service with mixed success/failure
         mock_data_service = AsyncMock()
+        mock_data_service.get_invoices_by_ids.side_effect = Exception(
+            "Xero API error: Invoice not found"
+        )
 
-        async def get_invoices_side_effect(org_id, filters, invoice_id=None):
-            if invoice_id == "xero-invoice-1":
-                # First invoice succeeds
-                return mock_xero_invoice_responses[invoice_id]["Invoices"]
-            elif invoice_id == "xero-invoice-2":
-                # Second invoice fails
-                raise Exception("Xero API error: Invoice not found")
-            elif invoice_id == "xero-invoice-3":
-                # Third invoice succeeds
-                return mock_xero_invoice_responses[invoice_id]["Invoices"]
-            return []
-
-        mock_data_service.get_invoices.side_effect = get_invoices_side_effect
-
-        # Mock SyncOrchestrator
         with patch(
             "src.domains.remittances.service.SyncOrchestrator"
         ) as mock_orchestrator_class:
             mock_orchestrator = Mock()
+            mock_orchestrator._batch_upsert_invoices = AsyncMock()
             mock_orchestrator_class.return_value = mock_orchestrator
-            mock_orchestrator._upsert_invoices.return_value = AsyncMock()
 
-            # Mock logger to capture warnings
             with patch("src.domains.remittances.service.logger") as mock_logger:
                 # Act
                 await _sync_batch_payment_invoices(
@@ -254,22 +220,10 @@ class TestInvoiceSyncAfterBatchPayment:
                 )
 
                 # Assert
-                # Verify all invoices were attempted
-                assert mock_data_service.get_invoices.call_count == 3
-
-                # Verify only successful invoices were upserted (2 out of 3)
-                assert mock_orchestrator._upsert_invoices.call_count == 2
-
-                # Verify error was logged for failed invoice (exactly one failure)
-                warning_calls = mock_logger.warning.call_args_list
-                failure_warnings = [
-                    call
-                    for call in warning_calls
-                    if "Xero API error: Invoice not found" in str(call)
-                ]
-                assert len(failure_warnings) == 1
-                warning_call = failure_warnings[0][0][0]
-                assert "Failed to sync invoice xero-invoice-2" in warning_call
+                mock_orchestrator._batch_upsert_invoices.assert_not_called()
+                mock_logger.warning.assert_called_once()
+                warning_call = mock_logger.warning.call_args[0][0]
+                assert "Failed to fetch 3 invoices for sync" in warning_call
                 assert "Xero API error: Invoice not found" in warning_call
 
     @pytest.mark.asyncio
@@ -278,21 +232,19 @@ class TestInvoiceSyncAfterBatchPayment:
         mock_prisma: Mock,
         mock_matched_invoices: list,
     ) -> None:
-        """Test handling when Xero returns empty responses for invoices."""
+        """Test handling when Xero returns no invoices."""
         # Arrange
         org_id = "test-org-123"
 
-        # Mock data service returning empty responses
         mock_data_service = AsyncMock()
-        mock_data_service.get_invoices.return_value = []  # Empty response
+        mock_data_service.get_invoices_by_ids.return_value = []
 
-        # Mock SyncOrchestrator
         with patch(
             "src.domains.remittances.service.SyncOrchestrator"
         ) as mock_orchestrator_class:
             mock_orchestrator = Mock()
+            mock_orchestrator._batch_upsert_invoices = AsyncMock()
             mock_orchestrator_class.return_value = mock_orchestrator
-            mock_orchestrator._upsert_invoices.return_value = AsyncMock()
 
             # Act
             await _sync_batch_payment_invoices(
@@ -303,11 +255,8 @@ class TestInvoiceSyncAfterBatchPayment:
             )
 
             # Assert
-            # Verify all invoices were attempted
-            assert mock_data_service.get_invoices.call_count == 3
-
-            # Verify no upserts were performed (all responses were empty)
-            mock_orchestrator._upsert_invoices.assert_not_called()
+            mock_data_service.get_invoices_by_ids.assert_awaited_once()
+            mock_orchestrator._batch_upsert_invoices.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_sync_no_matched_invoices(
@@ -339,47 +288,37 @@ class TestInvoiceSyncAfterBatchPayment:
 
             # Assert
             # Verify no API calls were made
-            mock_data_service.get_invoices.assert_not_called()
+            mock_data_service.get_invoices_by_ids.assert_not_called()
 
             # Verify orchestrator was still created
             mock_orchestrator_class.assert_called_once_with(mock_prisma)
 
             # Verify no upserts were performed
-            mock_orchestrator._upsert_invoices.assert_not_called()
+            mock_orchestrator._batch_upsert_invoices.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_sync_orchestrator_upsert_failure(
         self,
         mock_prisma: Mock,
         mock_matched_invoices: list,
-        mock_xero_invoice_responses: dict,
+        mock_updated_invoices: list,
     ) -> None:
-        """Test handling when orchestrator upsert fails."""
+        """Test handling when the batched upsert fails."""
         # Arrange
         org_id = "test-org-123"
 
-        # Mock successful data service
         mock_data_service = AsyncMock()
-        mock_data_service.get_invoices.return_value = mock_xero_invoice_responses[
-            "xero-invoice-1"
-        ]["Invoices"]
+        mock_data_service.get_invoices_by_ids.return_value = mock_updated_invoices
 
-        # Mock SyncOrchestrator with failing upsert
         with patch(
             "src.domains.remittances.service.SyncOrchestrator"
         ) as mock_orchestrator_class:
             mock_orchestrator = Mock()
+            mock_orchestrator._batch_upsert_invoices = AsyncMock(
+                side_effect=Exception("Database error: Constraint violation")
+            )
             mock_orchestrator_class.return_value = mock_orchestrator
 
-            # Mock upsert failure for first invoice, success for others
-            upsert_side_effects = [
-                Exception("Database error: Constraint violation"),  # First call fails
-                AsyncMock(),  # Second call succeeds
-                AsyncMock(),  # Third call succeeds
-            ]
-            mock_orchestrator._upsert_invoices.side_effect = upsert_side_effects
-
-            # Mock logger to capture warnings
             with patch("src.domains.remittances.service.logger") as mock_logger:
                 # Act
                 await _sync_batch_payment_invoices(
@@ -390,22 +329,14 @@ class TestInvoiceSyncAfterBatchPayment:
                 )
 
                 # Assert
-                # Verify all invoices were fetched
-                assert mock_data_service.get_invoices.call_count == 3
-
-                # Verify all upserts were attempted
-                assert mock_orchestrator._upsert_invoices.call_count == 3
-
-                # Verify database error was logged
-                assert mock_logger.warning.call_count >= 1
+                mock_orchestrator._batch_upsert_invoices.assert_awaited_once()
                 warning_calls = [
                     call[0][0] for call in mock_logger.warning.call_args_list
                 ]
-                database_error_logged = any(
+                assert any(
                     "Database error: Constraint violation" in call
                     for call in warning_calls
                 )
-                assert database_error_logged
 
     @pytest.mark.asyncio
     async def test_sync_with_different_invoice_statuses(
@@ -503,19 +434,17 @@ class TestInvoiceSyncAfterBatchPayment:
 
         # Mock data service
         mock_data_service = AsyncMock()
-
-        async def get_invoices_side_effect(org_id, filters, invoice_id=None):
-            return mock_responses.get(invoice_id, [])
-
-        mock_data_service.get_invoices.side_effect = get_invoices_side_effect
+        mock_data_service.get_invoices_by_ids.return_value = [
+            invoice for response in mock_responses.values() for invoice in response
+        ]
 
         # Mock SyncOrchestrator
         with patch(
             "src.domains.remittances.service.SyncOrchestrator"
         ) as mock_orchestrator_class:
             mock_orchestrator = Mock()
+            mock_orchestrator._batch_upsert_invoices = AsyncMock(return_value=3)
             mock_orchestrator_class.return_value = mock_orchestrator
-            mock_orchestrator._upsert_invoices.return_value = AsyncMock()
 
             # Act
             await _sync_batch_payment_invoices(
@@ -526,21 +455,46 @@ class TestInvoiceSyncAfterBatchPayment:
             )
 
             # Assert
-            # Verify all invoices were processed
-            assert mock_data_service.get_invoices.call_count == 3
-            assert mock_orchestrator._upsert_invoices.call_count == 3
-
-            # Verify the different invoice types were all processed
-            upsert_calls = mock_orchestrator._upsert_invoices.call_args_list
-            processed_invoices = []
-            for call in upsert_calls:
-                args, kwargs = call
-                invoices_list = args[1]  # Second argument is the invoices list
-                if invoices_list:
-                    processed_invoices.extend(invoices_list)
+            # Verify all invoices were fetched together and upserted together
+            mock_data_service.get_invoices_by_ids.assert_awaited_once_with(
+                org_id, ["paid-invoice", "partially-paid-invoice", "overpaid-invoice"]
+            )
+            mock_orchestrator._batch_upsert_invoices.assert_awaited_once()
 
             # Verify we processed invoices with different statuses
+            args, kwargs = mock_orchestrator._batch_upsert_invoices.call_args
+            processed_invoices = args[1]
             invoice_ids = [inv["InvoiceID"] for inv in processed_invoices]
             assert "paid-invoice" in invoice_ids
             assert "partially-paid-invoice" in invoice_ids
             assert "overpaid-invoice" in invoice_ids
+            statuses = {inv["InvoiceID"]: inv["Status"] for inv in processed_invoices}
+            assert statuses["partially-paid-invoice"] == "AUTHORISED"
+
+    @pytest.mark.asyncio
+    async def test_sync_skips_invoices_without_external_id(
+        self,
+        mock_prisma: Mock,
+        mock_matched_invoices: list,
+    ) -> None:
+        """Test invoices without a Xero ID are left out of the bulk fetch."""
+        # Arrange
+        org_id = "test-org-123"
+        mock_matched_invoices[1].invoiceId = None
+
+        mock_data_service = AsyncMock()
+        mock_data_service.get_invoices_by_ids.return_value = []
+
+        with patch("src.domains.remittances.service.SyncOrchestrator"):
+            # Act
+            await _sync_batch_payment_invoices(
+                db=mock_prisma,
+                org_id=org_id,
+                matched_invoices=mock_matched_invoices,
+                data_service=mock_data_service,
+            )
+
+        # Assert
+        mock_data_service.get_invoices_by_ids.assert_awaited_once_with(
+            org_id, ["xero-invoice-1", "xero-invoice-3"]
+        )
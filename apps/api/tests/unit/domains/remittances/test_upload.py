@@ -0,0 +1,149 @@
+"""
+Tests for streaming upload validation in src/domains/remittances/upload.py
+"""
+
+import zipfile
+from io import BytesIO
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from src.domains.remittances.upload import (
+    UploadStream,
+    ZipMemberReader,
+    open_zip,
+    zip_pdf_members,
+)
+
+
+def _upload(content: bytes, size: int | None = None) -> UploadFile:
+    return UploadFile(
+        filename="remittance.pdf",
+        file=BytesIO(content),
+        size=size,
+        headers={"content-type": "application/pdf"},
+    )
+
+
+def _zip(members: dict[str, bytes]) -> UploadFile:
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    buffer.seek(0)
+    return UploadFile(
+        filename="remittances.zip",
+        file=buffer,
+        headers={"content-type": "application/zip"},
+    )
+
+
+class TestUploadStream:
+    """Test uploads are validated while they stream."""
+
+    @pytest.mark.asyncio
+    async def test_yields_whole_file_in_chunks(self):
+        """Test every byte is yielded, starting with the sniffed chunk."""
+        # Arrange
+        content = b"%PDF-1.4\n" + b"x" * 5000
+        upload = UploadStream(_upload(content), chunk_size=1024)
+
+        # Act
+        await upload.open()
+        chunks = [chunk async for chunk in upload.chunks()]
+
+        # Assert
+        assert b"".join(chunks) == content
+        assert all(len(chunk) <= 1024 for chunk in chunks)
+        assert upload.size == len(content)
+
+    @pytest.mark.asyncio
+    async def test_rejects_missing_pdf_header(self):
+        """Test content without a PDF header is rejected on open."""
+        upload = UploadStream(_upload(b"<html>not a pdf</html>"))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await upload.open()
+
+        assert exc_info.value.status_code == 400
+        assert "not a valid PDF" in str(exc_info.value.detail)
+
+    @pytest.mark.asyncio
+    async def test_accepts_header_after_leading_bytes(self):
+        """Test a PDF header within the first 1024 bytes is accepted."""
+        upload = UploadStream(_upload(b"\r\n" * 10 + b"%PDF-1.7\n"))
+
+        await upload.open()
+
+        assert upload.size == 29
+
+    @pytest.mark.asyncio
+    async def test_size_cutoff_without_declared_size(self):
+        """Test the size limit stops the stream when no size was declared."""
+        # Arrange
+        content = b"%PDF-1.4\n" + b"x" * 10_000
+        upload = UploadStream(_upload(content), max_size=4096, chunk_size=1024)
+        await upload.open()
+        received = 0
+
+        # Act
+        with pytest.raises(HTTPException) as exc_info:
+            async for chunk in upload.chunks():
+                received += len(chunk)
+
+        # Assert
+        assert exc_info.value.status_code == 400
+        assert "File size exceeds maximum limit" in str(exc_info.value.detail)
+        assert received <= 4096
+
+
+class TestZipUploads:
+    """Test PDFs are read out of uploaded ZIP archives."""
+
+    @pytest.mark.asyncio
+    async def test_lists_only_pdf_members(self):
+        """Test folders, metadata and non-PDF members are skipped."""
+        # Arrange
+        upload = _zip(
+            {
+                "a.pdf": b"%PDF-1.4 a",
+                "nested/B.PDF": b"%PDF-1.4 b",
+                "notes.txt": b"hello",
+                "__MACOSX/._a.pdf": b"meta",
+                ".hidden.pdf": b"%PDF-1.4 hidden",
+            }
+        )
+
+        # Act
+        archive = await open_zip(upload)
+        members = [info.filename for info in zip_pdf_members(archive)]
+
+        # Assert
+        assert members == ["a.pdf", "nested/B.PDF"]
+
+    @pytest.mark.asyncio
+    async def test_member_streams_through_upload_stream(self):
+        """Test a ZIP member can be validated and streamed like an upload."""
+        # Arrange
+        content = b"%PDF-1.4\n" + b"x" * 5000
+        archive = await open_zip(_zip({"a.pdf": content}))
+        reader = ZipMemberReader(archive, archive.getinfo("a.pdf"))
+        upload = UploadStream(reader, chunk_size=1024)
+
+        # Act
+        await upload.open()
+        chunks = [chunk async for chunk in upload.chunks()]
+
+        # Assert
+        assert b"".join(chunks) == content
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_archive(self):
+        """Test an upload that is not a ZIP archive is rejected."""
+        upload = UploadFile(filename="broken.zip", file=BytesIO(b"not a zip"))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await open_zip(upload)
+
+        assert exc_info.value.status_code == 400
+        assert "not a valid ZIP archive" in str(exc_info.value.detail)
@@ -0,0 +1,99 @@
+"""
+Tests for shared pagination helpers in src/shared/pagination.py
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import HTTPException
+
+from src.shared.pagination import (
+    CountCache,
+    decode_cursor,
+    encode_cursor,
+    keyset_where,
+)
+
+
+class TestCursorEncoding:
+    """Test cursor round trips and validation."""
+
+    def test_round_trip(self):
+        """Test a cursor decodes back to the same position."""
+        created_at = datetime(2024, 1, 15, 9, 30, tzinfo=timezone.utc)
+
+        cursor = encode_cursor(created_at, "record-1")
+
+        assert cursor is not None
+        assert decode_cursor(cursor) == (created_at, "record-1")
+
+    def test_missing_created_at_round_trip(self):
+        """Test records without a creation time still produce a cursor."""
+        cursor = encode_cursor(None, "record-1")
+
+        assert decode_cursor(cursor) == (None, "record-1")
+
+    def test_malformed_cursor_raises_400(self):
+        """Test garbage cursors are rejected as bad input."""
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor("not-a-cursor")
+
+        assert exc_info.value.status_code == 400
+
+    def test_keyset_where_breaks_ties_on_id(self):
+        """Test records sharing the cursor's createdAt are split on id."""
+        created_at = datetime(2024, 1, 15, 9, 30)
+        cursor = encode_cursor(created_at, "record-1")
+        assert cursor is not None
+
+        where = keyset_where(cursor)
+
+        assert where == {
+            "OR": [
+                {"createdAt": {"lt": created_at}},
+                {"createdAt": created_at, "id": {"lt": "record-1"}},
+            ]
+        }
+
+    def test_keyset_where_after_missing_created_at(self):
+        """Test a NULL createdAt cursor continues through the NULLs, then dates."""
+        where = keyset_where(encode_cursor(None, "record-1"))
+
+        assert where == {
+            "OR": [
+                {"createdAt": None, "id": {"lt": "record-1"}},
+                {"NOT": [{"createdAt": None}]},
+            ]
+        }
+
+
+class TestCountCache:
+    """Test cached listing totals."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_count_for_same_filters(self):
+        """Test the count query runs once per filter set within the TTL."""
+        cache = CountCache(ttl_seconds=30)
+        db = Mock()
+        count = AsyncMock(return_value=42)
+
+        first = await cache.get_or_count(db, "invoice", {"organizationId": "o"}, count)
+        second = await cache.get_or_count(db, "invoice", {"organizationId": "o"}, count)
+        await cache.get_or_count(db, "invoice", {"organizationId": "other"}, count)
+
+        assert first == second == 42
+        assert count.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_model(self):
+        """Test invalidating a model forces a fresh count."""
+        cache = CountCache(ttl_seconds=30)
+        db = Mock()
+        count = AsyncMock(return_value=1)
+
+        await cache.get_or_count(db, "remittance", {"organizationId": "o"}, count)
+        cache.invalidate("remittance")
+        await cache.get_or_count(db, "remittance", {"organizationId": "o"}, count)
+
+        assert count.await_count == 2
@@ -0,0 +1,146 @@
+"""
+Tests for trigram search helpers in src/shared/search.py
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from prisma.enums import InvoiceStatus
+
+from src.shared.search import (
+    INVOICE_SEARCH,
+    REMITTANCE_SEARCH,
+    build_search_filters,
+    build_search_query,
+    count_search_matches,
+    escape_like,
+    order_by_rank,
+    search_ranked_ids,
+)
+
+
+class TestSearchQuery:
+    """Test the generated SQL and LIKE escaping."""
+
+    def test_escape_like_wildcards(self):
+        """Test wildcards in the term are matched literally."""
+        assert escape_like("50%_off\\") == "50\\%\\_off\\\\"
+
+    def test_query_matches_and_ranks_every_column(self):
+        """Test each searched column is filtered and ranked."""
+        sql = build_search_query(INVOICE_SEARCH)
+
+        assert 'FROM "Invoice"' in sql
+        assert '"organizationId" = $1::uuid' in sql
+        for column in INVOICE_SEARCH.columns:
+            assert f'"{column}" ILIKE $2' in sql
+            assert f"""word_similarity($3, coalesce("{column}", ''))""" in sql
+        assert "ORDER BY GREATEST(" in sql
+        assert sql.endswith("LIMIT $4 OFFSET $5")
+
+    def test_filters_shift_term_and_paging_parameters(self):
+        """Test filter parameters come before the term, limit and offset."""
+        sql = build_search_query(INVOICE_SEARCH, ' AND "status"::text = $3', 1)
+
+        assert ' AND "status"::text = $3 ORDER BY' in sql
+        assert "word_similarity($4, " in sql
+        assert sql.endswith("LIMIT $5 OFFSET $6")
+
+
+class TestSearchFilters:
+    """Test listing filters are translated into search SQL."""
+
+    def test_equality_and_ranges(self):
+        """Test enum equality and datetime ranges become parameterized SQL."""
+        # Arrange
+        since = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        until = datetime(2025, 2, 1, tzinfo=timezone.utc)
+        where = {
+            "organizationId": "org-1",
+            "status": InvoiceStatus.PAID,
+            "updatedAt": {"gte": since, "lte": until},
+            "contactId": None,
+        }
+
+        # Act
+        sql, params = build_search_filters(where, 3)
+
+        # Assert
+        assert sql == (
+            ' AND "status"::text = $3'
+            ' AND "updatedAt" >= $4::timestamptz'
+            ' AND "updatedAt" <= $5::timestamptz'
+            ' AND "contactId" IS NULL'
+        )
+        assert params == ["PAID", since.isoformat(), until.isoformat()]
+
+    def test_unsupported_operator_rejected(self):
+        """Test filters the search query cannot express raise."""
+        with pytest.raises(ValueError):
+            build_search_filters({"status": {"in": ["PAID"]}}, 3)
+
+
+class TestSearchRankedIds:
+    """Test ranked ID lookup."""
+
+    @pytest.mark.asyncio
+    async def test_returns_ids_in_rank_order(self):
+        """Test IDs are returned in the order the database ranked them."""
+        db = Mock()
+        db.query_raw = AsyncMock(return_value=[{"id": "rem-2"}, {"id": "rem-1"}])
+
+        ids = await search_ranked_ids(
+            db, REMITTANCE_SEARCH, "org-1", " acme ", limit=10, offset=20
+        )
+
+        assert ids == ["rem-2", "rem-1"]
+        args = db.query_raw.call_args[0]
+        assert args[1:] == ("org-1", "%acme%", "acme", 10, 20)
+
+    @pytest.mark.asyncio
+    async def test_filters_are_passed_before_term(self):
+        """Test listing filters are applied inside the ranked query."""
+        db = Mock()
+        db.query_raw = AsyncMock(return_value=[])
+
+        await search_ranked_ids(
+            db, INVOICE_SEARCH, "org-1", "acme", where={"contactId": "c-1"}, limit=5
+        )
+
+        sql, *args = db.query_raw.call_args[0]
+        assert ' AND "contactId"::text = $3' in sql
+        assert args == ["org-1", "%acme%", "c-1", "acme", 5, 0]
+
+    @pytest.mark.asyncio
+    async def test_count_search_matches(self):
+        """Test the match count uses the same filters as the ranked query."""
+        db = Mock()
+        db.query_raw = AsyncMock(return_value=[{"total": 7}])
+
+        total = await count_search_matches(
+            db, INVOICE_SEARCH, "org-1", "acme", where={"contactId": "c-1"}
+        )
+
+        assert total == 7
+        sql, *args = db.query_raw.call_args[0]
+        assert sql.startswith("SELECT count(*)::int AS total")
+        assert ' AND "contactId"::text = $3' in sql
+        assert args == ["org-1", "%acme%", "c-1"]
+
+    @pytest.mark.asyncio
+    async def test_blank_term_skips_query(self):
+        """Test a whitespace-only term matches nothing without a query."""
+        db = Mock()
+        db.query_raw = AsyncMock()
+
+        assert await search_ranked_ids(db, INVOICE_SEARCH, "org-1", "   ") == []
+        db.query_raw.assert_not_called()
+
+    def test_order_by_rank(self):
+        """Test fetched records are reordered by search rank."""
+        records = [Mock(id="a"), Mock(id="b"), Mock(id="c")]
+
+        ordered = order_by_rank(records, ["c", "a", "b"])
+
+        assert [record.id for record in ordered] == ["c", "a", "b"]